@@ -0,0 +1,238 @@
+import logging
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Final, TypedDict
+
+from app.application.common.exceptions.bulk import BulkSelectionError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.transaction_manager import (
+    TransactionManager,
+)
+from app.application.common.ports.user_command_gateway import (
+    UserCommandGateway,
+    UserSelection,
+)
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    CanManageSubordinate,
+    RoleManagementContext,
+    UserManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.user import (
+    ActivationChangeNotPermittedError,
+    RoleChangeNotPermittedError,
+)
+from app.domain.services.user import UserService
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.user_id import UserId
+
+log = logging.getLogger(__name__)
+
+# Bounds the number of rows locked by one request.
+BULK_USERS_LIMIT: Final[int] = 1000
+
+
+class BulkUserAction(StrEnum):
+    ACTIVATE = "activate"
+    DEACTIVATE = "deactivate"
+    GRANT_ADMIN = "grant_admin"
+    REVOKE_ADMIN = "revoke_admin"
+
+
+class BulkUserOutcome(StrEnum):
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BulkUpdateUsersRequest:
+    action: BulkUserAction
+    emails: list[str] | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+
+
+class BulkUserResult(TypedDict):
+    email: str
+    outcome: BulkUserOutcome
+
+
+class BulkUpdateUsersResponse(TypedDict):
+    results: list[BulkUserResult]
+    has_more: bool
+
+
+class BulkUpdateUsersInteractor:
+    """
+    - Open to admins.
+    - Activates, deactivates, grants or revokes admin rights for a list of
+      users and/or the users matching a filter, in one transaction.
+    - The same rules apply as for a single user; users they exclude are
+      reported as forbidden, the others are still updated.
+    - Deactivated users' sessions are deleted.
+    - At most 1000 users per request; `has_more` tells whether a filter
+      matched more.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_command_gateway: UserCommandGateway,
+        user_service: UserService,
+        transaction_manager: TransactionManager,
+        access_revoker: AccessRevoker,
+    ):
+        self._current_user_service = current_user_service
+        self._user_command_gateway = user_command_gateway
+        self._user_service = user_service
+        self._transaction_manager = transaction_manager
+        self._access_revoker = access_revoker
+
+    async def execute(
+        self,
+        request_data: BulkUpdateUsersRequest,
+    ) -> BulkUpdateUsersResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        :raises DomainFieldError:
+        :raises BulkSelectionError:
+        """
+        action = request_data.action
+        log.info("Bulk update users: started. Action: '%s'.", action)
+
+        current_user = await self._current_user_service.get_current_user()
+
+        changes_role = action in (
+            BulkUserAction.GRANT_ADMIN,
+            BulkUserAction.REVOKE_ADMIN,
+        )
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.ADMIN if changes_role else UserRole.USER,
+            ),
+        )
+
+        selection = self._selection(request_data)
+        users = await self._user_command_gateway.read_many(
+            selection,
+            limit=BULK_USERS_LIMIT + 1,
+            for_update=True,
+        )
+        has_more = len(users) > BULK_USERS_LIMIT
+        users = users[:BULK_USERS_LIMIT]
+
+        results: list[BulkUserResult] = []
+        updated: list[UserId] = []
+        for user in users:
+            outcome = self._apply(action, current_user, user)
+            if outcome is BulkUserOutcome.UPDATED:
+                updated.append(user.id_)
+            results.append({"email": user.email.value, "outcome": outcome})
+        if selection.emails is not None:
+            found = {user.email.value for user in users}
+            results.extend(
+                {"email": email.value, "outcome": BulkUserOutcome.NOT_FOUND}
+                for email in selection.emails
+                if email.value not in found
+            )
+
+        if updated:
+            await self._user_command_gateway.update_many(
+                updated,
+                is_active=self._target_activation(action),
+                role=self._target_role(action),
+            )
+        await self._transaction_manager.commit()
+        if updated and action is BulkUserAction.DEACTIVATE:
+            await self._access_revoker.remove_all_access_for_users(updated)
+
+        log.info(
+            "Bulk update users: done. Action: '%s'. Updated: %d of %d.",
+            action,
+            len(updated),
+            len(results),
+        )
+        return BulkUpdateUsersResponse(results=results, has_more=has_more)
+
+    @staticmethod
+    def _selection(request_data: BulkUpdateUsersRequest) -> UserSelection:
+        """
+        :raises DomainFieldError:
+        :raises BulkSelectionError:
+        """
+        emails: list[Email] | None = None
+        if request_data.emails is not None:
+            # Deduplicated, in the order given.
+            emails = list(dict.fromkeys(Email(email) for email in request_data.emails))
+            if not emails:
+                raise BulkSelectionError("The list of emails is empty.")
+            if len(emails) > BULK_USERS_LIMIT:
+                raise BulkSelectionError(
+                    f"At most {BULK_USERS_LIMIT} emails can be given at once."
+                )
+        selection = UserSelection(
+            emails=emails,
+            role=request_data.role,
+            is_active=request_data.is_active,
+        )
+        if selection.is_empty:
+            raise BulkSelectionError("Give a list of emails or a filter.")
+        return selection
+
+    def _apply(
+        self,
+        action: BulkUserAction,
+        subject: User,
+        user: User,
+    ) -> BulkUserOutcome:
+        """Changes `user` in memory, following the single-user interactors."""
+        if action in (BulkUserAction.ACTIVATE, BulkUserAction.DEACTIVATE):
+            is_active = action is BulkUserAction.ACTIVATE
+            if not CanManageSubordinate().is_satisfied_by(
+                UserManagementContext(subject=subject, target=user)
+            ):
+                return BulkUserOutcome.FORBIDDEN
+            if user.is_active.value is is_active:
+                return BulkUserOutcome.UNCHANGED
+            try:
+                self._user_service.toggle_user_activation(user, is_active=is_active)
+            except ActivationChangeNotPermittedError:
+                return BulkUserOutcome.FORBIDDEN
+            return BulkUserOutcome.UPDATED
+
+        is_admin = action is BulkUserAction.GRANT_ADMIN
+        if (user.role is UserRole.ADMIN) is is_admin:
+            return BulkUserOutcome.UNCHANGED
+        try:
+            self._user_service.toggle_user_admin_role(user, is_admin=is_admin)
+        except RoleChangeNotPermittedError:
+            return BulkUserOutcome.FORBIDDEN
+        return BulkUserOutcome.UPDATED
+
+    @staticmethod
+    def _target_activation(action: BulkUserAction) -> bool | None:
+        if action is BulkUserAction.ACTIVATE:
+            return True
+        if action is BulkUserAction.DEACTIVATE:
+            return False
+        return None
+
+    @staticmethod
+    def _target_role(action: BulkUserAction) -> UserRole | None:
+        if action is BulkUserAction.GRANT_ADMIN:
+            return UserRole.ADMIN
+        if action is BulkUserAction.REVOKE_ADMIN:
+            return UserRole.USER
+        return None
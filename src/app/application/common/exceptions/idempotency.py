@@ -0,0 +1,9 @@
+from app.application.common.exceptions.base import ApplicationError
+
+
+class IdempotencyKeyInUseError(ApplicationError):
+    pass
+
+
+class IdempotencyKeyMismatchError(ApplicationError):
+    pass
@@ -7,3 +7,7 @@ class PaginationError(ApplicationError):
 
 class SortingError(ApplicationError):
     pass
+
+
+class FilteringError(ApplicationError):
+    pass
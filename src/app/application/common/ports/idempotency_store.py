@@ -0,0 +1,60 @@
+from abc import abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class IdempotencyClaim:
+    """
+    `claimed`: the caller now owns the key and must complete or release it.
+    Otherwise the key was used before: `fingerprint` is that request's, and
+    `result` its stored outcome, or `None` while it is still in flight.
+    """
+
+    claimed: bool
+    fingerprint: str | None = None
+    result: Mapping[str, Any] | None = None
+
+
+class IdempotencyStore(Protocol):
+    @abstractmethod
+    async def claim(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        fingerprint: str,
+    ) -> IdempotencyClaim:
+        """
+        Claims the key, or reports how it was used before. A new claim is
+        committed right away, so concurrent repeats see it.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def complete(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        result: Mapping[str, Any],
+    ) -> None:
+        """
+        Stores the result as part of the current transaction; the caller
+        commits it together with the operation's own writes.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def release(self, *, user_id: int, scope: str, key: str) -> None:
+        """
+        Rolls back the current transaction and gives the key up, so the
+        request can be retried with it.
+
+        :raises DataMapperError:
+        """
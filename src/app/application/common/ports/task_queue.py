@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+
+class TaskQueue(Protocol):
+    @abstractmethod
+    async def enqueue(self, task_name: str, kwargs: Mapping[str, Any]) -> None:
+        """
+        Hands a task over to background workers.
+        """
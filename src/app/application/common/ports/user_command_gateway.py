@@ -1,11 +1,27 @@
 from abc import abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Protocol
 
 from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.email import Email
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserSelection:
+    """Users matching every criterion given; `None` leaves it out."""
+
+    emails: Sequence[Email] | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self.emails is None and self.role is None and self.is_active is None
+
+
 class UserCommandGateway(Protocol):
     @abstractmethod
     async def add(self, user: User) -> None:
@@ -34,3 +50,31 @@ class UserCommandGateway(Protocol):
         """
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    async def read_many(
+        self,
+        selection: UserSelection,
+        *,
+        limit: int,
+        for_update: bool = False,
+    ) -> list[User]:
+        """
+        Ordered by id, so concurrent callers lock rows in the same order.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def update_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool | None = None,
+        role: UserRole | None = None,
+    ) -> None:
+        """
+        Sets the given fields on all `user_ids` in one statement.
+
+        :raises DataMapperError:
+        """
@@ -1,8 +1,9 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from app.application.common.query_models.user import UserQueryModel
-from app.application.common.query_params.user import UserListParams
+from app.application.common.query_params.user import UserListFilters, UserListParams
 
 
 class UserQueryGateway(Protocol):
@@ -14,3 +15,11 @@ class UserQueryGateway(Protocol):
         """
         :raises ReaderError:
         """
+
+    @abstractmethod
+    def stream_all(self, filters: UserListFilters) -> AsyncIterator[UserQueryModel]:
+        """
+        Every matching user, in id order, read from a server-side cursor.
+
+        :raises ReaderError:
+        """
@@ -0,0 +1,13 @@
+from datetime import UTC, datetime
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """
+    Query bounds are compared as aware UTC: a value given without an offset
+    is taken to be UTC already, like the naive timestamps the app stores.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
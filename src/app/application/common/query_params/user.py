@@ -1,7 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Final
 
+from app.application.common.exceptions.query import FilteringError
 from app.application.common.query_params.pagination import Pagination
 from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.time_range import as_utc
+from app.domain.enums.user_role import UserRole
+
+# Trigram search needs at least one whole trigram to use its index.
+NAME_SEARCH_MIN_LENGTH: Final[int] = 3
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -10,7 +18,52 @@ class UserListSorting:
     sorting_order: SortingOrder
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserListFilters:
+    """
+    raises FilteringError
+
+    Every filter given must match. `email_prefix` is matched case-insensitively
+    from the start of the email, `name` anywhere in "first_name last_name";
+    ranges include their start and exclude their end, and are held in UTC.
+    """
+
+    email_prefix: str | None = None
+    name: str | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    is_blocked: bool | None = None
+    is_verified: bool | None = None
+    country_id: int | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    last_login_from: datetime | None = None
+    last_login_to: datetime | None = None
+
+    def __post_init__(self):
+        for name in (
+            "created_from",
+            "created_to",
+            "last_login_from",
+            "last_login_to",
+        ):
+            object.__setattr__(self, name, as_utc(getattr(self, name)))
+        if self.email_prefix is not None and not self.email_prefix:
+            raise FilteringError("Email prefix must not be empty.")
+        if self.name is not None and len(self.name.strip()) < NAME_SEARCH_MIN_LENGTH:
+            raise FilteringError(
+                f"Name search needs at least {NAME_SEARCH_MIN_LENGTH} characters."
+            )
+        for start, end in (
+            (self.created_from, self.created_to),
+            (self.last_login_from, self.last_login_to),
+        ):
+            if start is not None and end is not None and start >= end:
+                raise FilteringError("Range start must be before its end.")
+
+
 @dataclass(frozen=True, slots=True)
 class UserListParams:
     pagination: Pagination
     sorting: UserListSorting
+    filters: UserListFilters = field(default_factory=UserListFilters)
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from app.application.common.exceptions.idempotency import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+)
+from app.application.common.ports.idempotency_store import IdempotencyStore
+from app.application.common.ports.transaction_manager import TransactionManager
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class IdempotentRequest:
+    user_id: int
+    scope: str
+    key: str
+    # Identifies the request payload; a key may not be reused for another.
+    fingerprint: str
+
+
+def request_fingerprint(scope: str, payload: Mapping[str, Any]) -> str:
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(f"{scope}:{canonical}".encode()).hexdigest()
+
+
+class IdempotencyService:
+    """
+    Runs an operation at most once per idempotency key and replays its
+    result to repeats. The operation should not commit: its writes are
+    committed together with the stored result, so a crash cannot leave
+    one without the other. Failed operations give the key up again.
+    """
+
+    def __init__(
+        self,
+        idempotency_store: IdempotencyStore,
+        transaction_manager: TransactionManager,
+    ):
+        self._store = idempotency_store
+        self._transaction_manager = transaction_manager
+
+    async def run(
+        self,
+        request: IdempotentRequest | None,
+        operation: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Without a request (no key sent) the operation simply runs.
+
+        :raises DataMapperError:
+        :raises IdempotencyKeyInUseError:
+        :raises IdempotencyKeyMismatchError:
+        """
+        if request is None:
+            result = await operation()
+            await self._transaction_manager.commit()
+            return result
+
+        claim = await self._store.claim(
+            user_id=request.user_id,
+            scope=request.scope,
+            key=request.key,
+            fingerprint=request.fingerprint,
+        )
+        if not claim.claimed:
+            if claim.fingerprint not in (None, request.fingerprint):
+                raise IdempotencyKeyMismatchError(
+                    "Idempotency key was already used with a different request."
+                )
+            if claim.result is None:
+                raise IdempotencyKeyInUseError(
+                    "A request with this idempotency key is still in progress."
+                )
+            log.debug(
+                "Replaying result of %s for key '%s'.",
+                request.scope,
+                request.key,
+            )
+            return dict(claim.result)
+
+        try:
+            result = await operation()
+        except BaseException:
+            await self._store.release(
+                user_id=request.user_id,
+                scope=request.scope,
+                key=request.key,
+            )
+            raise
+        await self._store.complete(
+            user_id=request.user_id,
+            scope=request.scope,
+            key=request.key,
+            result=result,
+        )
+        await self._transaction_manager.commit()
+        return result
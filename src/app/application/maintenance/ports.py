@@ -1,17 +1,29 @@
 from abc import abstractmethod
 from datetime import datetime
+from enum import StrEnum
 from typing import Protocol
 
-from app.domain.value_objects.user_id import UserId
 
-
-class AuthSessionRepository(Protocol):
-    @abstractmethod
-    async def delete_expired(self, now: datetime) -> int: ...
+class CleanupTarget(StrEnum):
+    AUTH_SESSIONS = "auth_sessions"
+    SESSIONS = "sessions"
+    PASSWORD_RESETS = "password_resets"
+    EMAIL_VERIFICATIONS = "email_verifications"
+    IDEMPOTENCY_KEYS = "idempotency_keys"
+    STRIPE_EVENTS = "stripe_events"
 
 
-class PasswordResetRepository(Protocol):
+class ExpiredRecordsPurger(Protocol):
     @abstractmethod
-    async def delete_expired(self, now: datetime) -> int: ...
-
+    async def delete_expired_batch(
+        self,
+        target: CleanupTarget,
+        now: datetime,
+        limit: int,
+    ) -> int:
+        """
+        Deletes at most `limit` rows of `target` that expired before `now`
+        in a transaction of their own and returns how many were deleted.
 
+        :raises DataMapperError:
+        """
@@ -1,26 +1,93 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from app.application.maintenance.ports import (
-    AuthSessionRepository,
-    PasswordResetRepository,
-)
+from app.application.maintenance.ports import CleanupTarget, ExpiredRecordsPurger
 
+log = logging.getLogger(__name__)
 
-class CleanupExpiredSessionsTask:
-    def __init__(self, repo: AuthSessionRepository):
-        self._repo = repo
 
-    async def run(self) -> int:
-        now = datetime.now(tz=timezone.utc)
-        return await self._repo.delete_expired(now)
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CleanupReport:
+    target: CleanupTarget
+    deleted: int
+    batches: int
+    elapsed_s: float
+    finished: bool
 
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed_s if self.elapsed_s > 0 else 0.0
 
-class CleanupExpiredPasswordResetsTask:
-    def __init__(self, repo: PasswordResetRepository):
-        self._repo = repo
 
-    async def run(self) -> int:
-        now = datetime.now(tz=timezone.utc)
-        return await self._repo.delete_expired(now)
+class PurgeExpiredRecordsTask:
+    """
+    Deletes expired rows in short, separately committed batches, pausing
+    between them so row locks and WAL bursts stay small. A run stops once a
+    batch comes back short or the time budget is spent; whatever is left
+    is picked up by the next run.
+    """
 
+    def __init__(
+        self,
+        purger: ExpiredRecordsPurger,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._purger = purger
+        self._sleep = sleep
+        self._clock = clock
+
+    async def run(
+        self,
+        target: CleanupTarget,
+        *,
+        batch_size: int,
+        time_budget_s: float,
+        pause_s: float,
+    ) -> CleanupReport:
+        """
+        :raises DataMapperError:
+        """
+        # A fixed cutoff keeps rows that expire mid-run out of this run.
+        now = datetime.now(tz=timezone.utc)
+        started = self._clock()
+        deadline = started + time_budget_s
+        deleted = batches = 0
+        finished = False
+        while True:
+            batch_deleted = await self._purger.delete_expired_batch(
+                target,
+                now,
+                batch_size,
+            )
+            deleted += batch_deleted
+            batches += 1
+            if batch_deleted < batch_size:
+                finished = True
+                break
+            if self._clock() + pause_s >= deadline:
+                break
+            await self._sleep(pause_s)
 
+        report = CleanupReport(
+            target=target,
+            deleted=deleted,
+            batches=batches,
+            elapsed_s=self._clock() - started,
+            finished=finished,
+        )
+        log.info(
+            "Cleanup of %s: deleted %d row(s) in %d batch(es), %.2fs, %.0f rows/s%s.",
+            target,
+            report.deleted,
+            report.batches,
+            report.elapsed_s,
+            report.rows_per_second,
+            "" if finished else ", time budget spent",
+        )
+        return report
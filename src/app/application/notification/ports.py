@@ -1,5 +1,26 @@
 from abc import abstractmethod
-from typing import Protocol
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NotificationAudience:
+    """
+    Users a notification is fanned out to; filters left unset match everyone.
+    `subscription_id` selects users with an active subscription to that plan.
+    """
+
+    country_id: int | None = None
+    subscription_id: int | None = None
+    active_only: bool = True
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NotificationTemplate:
+    title: str
+    action: str
+    data_json: Mapping[str, Any] | None = None
 
 
 class NotificationRepository(Protocol):
@@ -12,4 +33,97 @@ class NotificationRepository(Protocol):
         limit: int,
     ) -> list[dict]: ...
 
+    @abstractmethod
+    async def add(
+        self,
+        *,
+        user_id: int,
+        title: str,
+        action: str,
+        data_json: Mapping[str, Any] | None = None,
+    ) -> dict:
+        """
+        Also increments the user's unread counter. The new row is pushed to
+        the user's live streams once the surrounding transaction commits.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def read_unread_count(self, user_id: int) -> int:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def mark_read(
+        self,
+        *,
+        user_id: int,
+        notification_ids: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Marks the given notifications of the user (all of them if `None`)
+        as read and returns the remaining unread count.
+
+        :raises DataMapperError:
+        """
+
 
+class NotificationFanOutWriter(Protocol):
+    @abstractmethod
+    def stream_recipients(
+        self,
+        audience: NotificationAudience,
+        *,
+        chunk_size: int,
+    ) -> AsyncIterator[Sequence[int]]:
+        """
+        Yields the audience's user ids in ascending chunks without holding
+        the whole audience in memory.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def write_chunk(
+        self,
+        user_ids: Sequence[int],
+        template: NotificationTemplate,
+    ) -> int:
+        """
+        Creates one notification per user, increments their unread counters
+        and commits; returns the number written. The new rows are pushed to
+        live streams after the commit.
+
+        :raises DataMapperError:
+        """
+
+
+class NotificationPublisher(Protocol):
+    @abstractmethod
+    def publish(self, user_id: int, notification: Mapping[str, Any]) -> None:
+        """
+        Fire-and-forget: delivery is best effort, and clients that miss a
+        push catch up through the paginated listing.
+        """
+
+
+class NotificationStream(Protocol):
+    @abstractmethod
+    def __aiter__(self) -> AsyncIterator[Mapping[str, Any]]:
+        """
+        Ends when the stream is closed, including by the feed itself
+        when the consumer falls too far behind.
+        """
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class NotificationFeed(Protocol):
+    @abstractmethod
+    def subscribe(self, user_id: int) -> NotificationStream:
+        """
+        :raises NotificationFeedFullError:
+        """
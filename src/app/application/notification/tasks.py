@@ -0,0 +1,87 @@
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.application.notification.ports import (
+    NotificationAudience,
+    NotificationFanOutWriter,
+    NotificationTemplate,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FanOutReport:
+    written: int
+    chunks: int
+    elapsed_s: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.written / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class FanOutNotificationsTask:
+    """
+    Sends one notification to every user of an audience. Recipient ids are
+    streamed and written chunk by chunk, each chunk in a transaction of its
+    own, so memory stays flat and no lock is held for the whole broadcast.
+    A failure stops the run; the chunks written before it stay committed.
+    """
+
+    def __init__(
+        self,
+        writer: NotificationFanOutWriter,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._writer = writer
+        self._clock = clock
+
+    async def run(
+        self,
+        audience: NotificationAudience,
+        template: NotificationTemplate,
+        *,
+        chunk_size: int,
+        on_progress: Callable[[FanOutReport], None] | None = None,
+    ) -> FanOutReport:
+        """
+        `on_progress` is called after every committed chunk.
+
+        :raises DataMapperError:
+        """
+        started = self._clock()
+        written = chunks = 0
+        async for user_ids in self._writer.stream_recipients(
+            audience,
+            chunk_size=chunk_size,
+        ):
+            written += await self._writer.write_chunk(user_ids, template)
+            chunks += 1
+            if on_progress is not None:
+                on_progress(
+                    FanOutReport(
+                        written=written,
+                        chunks=chunks,
+                        elapsed_s=self._clock() - started,
+                    )
+                )
+
+        report = FanOutReport(
+            written=written,
+            chunks=chunks,
+            elapsed_s=self._clock() - started,
+        )
+        log.info(
+            "Fan-out of '%s': wrote %d notification(s) in %d chunk(s), %.2fs, "
+            "%.0f rows/s.",
+            template.action,
+            report.written,
+            report.chunks,
+            report.elapsed_s,
+            report.rows_per_second,
+        )
+        return report
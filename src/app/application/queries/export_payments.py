@@ -0,0 +1,87 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.application.common.exceptions.query import FilteringError
+from app.application.common.query_params.time_range import as_utc
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.application.subscription.ports import PaymentExportRow, PaymentRepository
+from app.domain.enums.user_role import UserRole
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportPaymentsRequest:
+    """
+    raises FilteringError
+
+    Bounds are normalized to UTC up front, before any row is streamed.
+    """
+
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    status: str | None = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "created_from", as_utc(self.created_from))
+        object.__setattr__(self, "created_to", as_utc(self.created_to))
+        if (
+            self.created_from is not None
+            and self.created_to is not None
+            and self.created_from >= self.created_to
+        ):
+            raise FilteringError("Range start must be before its end.")
+
+
+class ExportPaymentsQueryService:
+    """
+    - Open to admins.
+    - Streams every payment created in the given range (start included,
+      end excluded), optionally of one status, in creation order.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        payments: PaymentRepository,
+    ):
+        self._current_user_service = current_user_service
+        self._payments = payments
+
+    async def execute(
+        self,
+        request_data: ExportPaymentsRequest,
+    ) -> AsyncIterator[PaymentExportRow]:
+        """
+        Authorizes up front; the rows are read as the iterator is consumed.
+
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info("Export payments: started.")
+
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        return self._payments.stream_all(
+            created_from=request_data.created_from,
+            created_to=request_data.created_to,
+            status=request_data.status,
+        )
@@ -0,0 +1,63 @@
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from app.application.common.ports.user_query_gateway import UserQueryGateway
+from app.application.common.query_models.user import UserQueryModel
+from app.application.common.query_params.user import UserListFilters
+from app.application.common.services.authorization.authorize import (
+    authorize,
+)
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_role import UserRole
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportUsersRequest:
+    filters: UserListFilters = field(default_factory=UserListFilters)
+
+
+class ExportUsersQueryService:
+    """
+    - Open to admins.
+    - Streams every user matching the listing filters, in id order.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        user_query_gateway: UserQueryGateway,
+    ):
+        self._current_user_service = current_user_service
+        self._user_query_gateway = user_query_gateway
+
+    async def execute(
+        self,
+        request_data: ExportUsersRequest,
+    ) -> AsyncIterator[UserQueryModel]:
+        """
+        Authorizes up front; the rows are read as the iterator is consumed.
+
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        log.info("Export users: started.")
+
+        current_user = await self._current_user_service.get_current_user()
+
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        return self._user_query_gateway.stream_all(request_data.filters)
@@ -1,5 +1,6 @@
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TypedDict
 
 from app.application.common.exceptions.query import SortingError
@@ -8,6 +9,7 @@ from app.application.common.query_models.user import UserQueryModel
 from app.application.common.query_params.pagination import Pagination
 from app.application.common.query_params.sorting import SortingOrder
 from app.application.common.query_params.user import (
+    UserListFilters,
     UserListParams,
     UserListSorting,
 )
@@ -30,6 +32,17 @@ class ListUsersRequest:
     offset: int
     sorting_field: str
     sorting_order: SortingOrder
+    email_prefix: str | None = None
+    name: str | None = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    is_blocked: bool | None = None
+    is_verified: bool | None = None
+    country_id: int | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    last_login_from: datetime | None = None
+    last_login_to: datetime | None = None
 
 
 class ListUsersResponse(TypedDict):
@@ -40,6 +53,8 @@ class ListUsersQueryService:
     """
     - Open to admins.
     - Retrieves a paginated list of existing users with relevant information.
+    - Filters by email prefix, name substring, role, status flags, country
+      and creation or last login time.
     """
 
     def __init__(
@@ -58,6 +73,7 @@ class ListUsersQueryService:
         :raises ReaderError:
         :raises PaginationError:
         :raises SortingError:
+        :raises FilteringError:
         """
         log.info("List users: started.")
 
@@ -81,6 +97,19 @@ class ListUsersQueryService:
                 sorting_field=request_data.sorting_field,
                 sorting_order=request_data.sorting_order,
             ),
+            filters=UserListFilters(
+                email_prefix=request_data.email_prefix,
+                name=request_data.name,
+                role=request_data.role,
+                is_active=request_data.is_active,
+                is_blocked=request_data.is_blocked,
+                is_verified=request_data.is_verified,
+                country_id=request_data.country_id,
+                created_from=request_data.created_from,
+                created_to=request_data.created_to,
+                last_login_from=request_data.last_login_from,
+                last_login_to=request_data.last_login_to,
+            ),
         )
 
         users: list[UserQueryModel] | None = await self._user_query_gateway.read_all(
@@ -1,12 +1,34 @@
 from abc import abstractmethod
-from typing import Protocol
+from dataclasses import dataclass
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Mapping, Protocol, TypedDict
 from datetime import datetime
 
 
+@dataclass(frozen=True, slots=True)
+class PlanCatalog:
+    """
+    All subscription plans, ordered by id. `version` changes whenever any
+    plan does, so it can serve as a validator for cached copies.
+    """
+
+    plans: tuple[Mapping[str, Any], ...]
+    version: str
+
+
 class SubscriptionRepository(Protocol):
     @abstractmethod
     async def read_by_name(self, name: str) -> dict | None: ...
 
+    @abstractmethod
+    async def read_catalog(self) -> PlanCatalog:
+        """
+        May be served from a cache that lags plan writes made by other
+        processes for a short while.
+
+        :raises DataMapperError:
+        """
+
     @abstractmethod
     async def read_all(self) -> list[dict]: ...
 
@@ -66,6 +88,22 @@ class SubscriptionUserRepository(Protocol):
     ) -> dict | None: ...
 
 
+class PaymentExportRow(TypedDict):
+    id: int
+    user_id: int
+    subscription_id: int | None
+    subscription_user_id: int | None
+    amount: float | None
+    currency: str | None
+    status: str
+    stripe_payment_intent_id: str | None
+    stripe_customer_id: str | None
+    payment_method: str | None
+    payment_type: str | None
+    created_at: datetime
+    updated_at: datetime | None
+
+
 class PaymentRepository(Protocol):
     @abstractmethod
     async def add(
@@ -106,4 +144,126 @@ class PaymentRepository(Protocol):
         description: str,
     ) -> dict: ...
 
+    @abstractmethod
+    def stream_all(
+        self,
+        *,
+        created_from: datetime | None,
+        created_to: datetime | None,
+        status: str | None,
+    ) -> AsyncIterator[PaymentExportRow]:
+        """
+        Matching payments in (created_at, id) order, read from a
+        server-side cursor.
+
+        :raises DataMapperError:
+        """
+
+
+class BillingGateway(Protocol):
+    @property
+    @abstractmethod
+    def is_configured(self) -> bool: ...
+
+    @abstractmethod
+    async def create_checkout_session(
+        self,
+        *,
+        price_id: str,
+        success_url: str,
+        cancel_url: str,
+    ) -> str:
+        """
+        Returns the checkout session id.
+        """
+
+    @abstractmethod
+    async def retrieve_checkout_session(self, session_id: str) -> dict: ...
+
+    @abstractmethod
+    async def cancel_subscription(self, stripe_subscription_id: str) -> None: ...
+
+    @abstractmethod
+    async def create_recurring_price(
+        self,
+        *,
+        product_name: str,
+        unit_amount: int,
+        currency: str,
+    ) -> tuple[str, str]:
+        """
+        Returns `(product_id, price_id)`.
+        """
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BillingEvent:
+    """
+    A verified webhook event from the billing provider, as stored in the
+    inbox. `object` is the resource the event is about, `created` the event
+    time (unix seconds) and `attempts` the failed tries to apply it so far.
+    """
+
+    id: int
+    type: str
+    customer_id: str | None
+    created: int
+    object: Mapping[str, Any]
+    attempts: int = 0
+
+
+class BillingEventInbox(Protocol):
+    @abstractmethod
+    async def append(self, event: Mapping[str, Any]) -> bool:
+        """
+        Stores a raw event unless one with its id was stored before, as
+        part of the current transaction. Returns whether it was new.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def claim_batch(self, limit: int) -> Sequence[BillingEvent]:
+        """
+        Returns up to `limit` unapplied events ordered by event time, so
+        each customer's events come out in the order they happened. Events
+        waiting out a retry backoff and dead-lettered ones are left out.
+        Only one consumer holds a batch at a time; the others get nothing
+        until the current transaction ends.
+
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def mark_processed(self, ids: Sequence[int]) -> None:
+        """
+        :raises DataMapperError:
+        """
+
+    @abstractmethod
+    async def mark_failed(self, failures: Sequence[tuple[BillingEvent, str]]) -> None:
+        """
+        Records each `(event, error)`: the event is retried after a backoff,
+        or dead-lettered once it has run out of attempts.
+
+        :raises DataMapperError:
+        """
+
+
+class BillingStateWriter(Protocol):
+    @abstractmethod
+    async def apply(
+        self,
+        events: Sequence[BillingEvent],
+    ) -> Sequence[tuple[BillingEvent, str]]:
+        """
+        Applies the events, in the order given, to subscriptions and
+        payments as part of the current transaction. Event types that
+        carry no state change are skipped, and so are status changes older
+        than the one a subscription already has.
+
+        Events that cannot be applied are returned with their error; the
+        others are applied regardless.
 
+        :raises DataMapperError:
+        """
@@ -0,0 +1,94 @@
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.subscription.ports import BillingEventInbox, BillingStateWriter
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BillingEventsReport:
+    applied: int
+    failed: int
+    batches: int
+    elapsed_s: float
+    finished: bool
+
+
+class ApplyBillingEventsTask:
+    """
+    Drains the webhook inbox. Each batch is applied, marked processed and
+    committed in one transaction, so a crash mid-batch leaves the events
+    to be applied again rather than half-applied. Events the writer could
+    not apply are committed as failed alongside the rest, for a retry
+    later, instead of holding the whole batch back.
+    """
+
+    def __init__(
+        self,
+        inbox: BillingEventInbox,
+        writer: BillingStateWriter,
+        transaction_manager: TransactionManager,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._inbox = inbox
+        self._writer = writer
+        self._transaction_manager = transaction_manager
+        self._clock = clock
+
+    async def run(
+        self,
+        *,
+        batch_size: int,
+        time_budget_s: float,
+    ) -> BillingEventsReport:
+        """
+        Stops once the inbox is drained (or held by another consumer) or
+        the time budget is spent.
+
+        :raises DataMapperError:
+        """
+        started = self._clock()
+        applied = failed = batches = 0
+        finished = False
+        while self._clock() - started < time_budget_s:
+            events = await self._inbox.claim_batch(batch_size)
+            if not events:
+                finished = True
+                break
+            failures = await self._writer.apply(events)
+            failed_ids = {event.id for event, _ in failures}
+            processed = [event.id for event in events if event.id not in failed_ids]
+            if processed:
+                await self._inbox.mark_processed(processed)
+            if failures:
+                await self._inbox.mark_failed(failures)
+            await self._transaction_manager.commit()
+            applied += len(processed)
+            failed += len(failures)
+            batches += 1
+            if len(events) < batch_size:
+                finished = True
+                break
+
+        report = BillingEventsReport(
+            applied=applied,
+            failed=failed,
+            batches=batches,
+            elapsed_s=self._clock() - started,
+            finished=finished,
+        )
+        if report.applied:
+            log.info(
+                "Billing events: applied %d event(s) in %d batch(es), %.2fs.",
+                report.applied,
+                report.batches,
+                report.elapsed_s,
+            )
+        if report.failed:
+            log.warning("Billing events: %d event(s) failed.", report.failed)
+        return report
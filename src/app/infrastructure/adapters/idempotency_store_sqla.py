@@ -0,0 +1,261 @@
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Final
+
+import orjson
+from sqlalchemy import (
+    CompoundSelect,
+    Table,
+    exists,
+    false,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.idempotency_store import (
+    IdempotencyClaim,
+    IdempotencyStore,
+)
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.idempotency.cache import IdempotencyCache
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
+from app.infrastructure.persistence_sqla.mappings.idempotency_key import (
+    map_idempotency_keys_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+# How long a completed result is replayed (Stripe keeps keys for 24 hours).
+IDEMPOTENCY_KEY_TTL: Final[timedelta] = timedelta(hours=24)
+# A pending claim not completed within this window is considered abandoned.
+IDEMPOTENCY_LOCK_TTL: Final[timedelta] = timedelta(seconds=60)
+
+PENDING: Final[str] = "pending"
+COMPLETED: Final[str] = "completed"
+
+
+def build_claim(
+    table: Table,
+    *,
+    user_id: int,
+    scope: str,
+    key: str,
+    fingerprint: str,
+    now: datetime,
+) -> CompoundSelect:
+    """
+    One round trip: `INSERT ... ON CONFLICT DO NOTHING` in a CTE, plus a
+    read of the existing row when the insert was skipped. A repeat is
+    therefore a lookup, not a write. No row at all means the conflicting
+    claim is not committed yet, i.e. still in flight.
+    """
+    inserted = (
+        pg_insert(table)
+        .values(
+            user_id=user_id,
+            scope=scope,
+            key=key,
+            fingerprint=fingerprint,
+            status=PENDING,
+            locked_until=now + IDEMPOTENCY_LOCK_TTL,
+            expires_at=now + IDEMPOTENCY_KEY_TTL,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[table.c.user_id, table.c.scope, table.c.key],
+        )
+        .returning(
+            table.c.fingerprint,
+            table.c.status,
+            table.c.result,
+            table.c.locked_until,
+            table.c.expires_at,
+        )
+        .cte("inserted")
+    )
+    claimed = select(
+        inserted.c.fingerprint,
+        inserted.c.status,
+        inserted.c.result,
+        inserted.c.locked_until,
+        inserted.c.expires_at,
+        true().label("claimed"),
+    )
+    existing = select(
+        table.c.fingerprint,
+        table.c.status,
+        table.c.result,
+        table.c.locked_until,
+        table.c.expires_at,
+        false().label("claimed"),
+    ).where(
+        table.c.user_id == user_id,
+        table.c.scope == scope,
+        table.c.key == key,
+        ~exists(select(literal_column("1")).select_from(inserted)),
+    )
+    return claimed.union_all(existing)
+
+
+class SqlaIdempotencyStore(IdempotencyStore):
+    def __init__(self, session: MainAsyncSession, cache: IdempotencyCache):
+        map_idempotency_keys_table()
+        self._session = session
+        self._cache = cache
+
+    def _table(self) -> Table:
+        return mapping_registry.metadata.tables["idempotency_keys"]  # type: ignore
+
+    async def claim(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        fingerprint: str,
+    ) -> IdempotencyClaim:
+        cached = self._cache.get((user_id, scope, key))
+        if cached is not None:
+            return IdempotencyClaim(
+                claimed=False,
+                fingerprint=cached.fingerprint,
+                result=cached.result,
+            )
+
+        table = self._table()
+        now = datetime.now(tz=timezone.utc)
+        try:
+            row = (
+                await self._session.execute(
+                    build_claim(
+                        table,
+                        user_id=user_id,
+                        scope=scope,
+                        key=key,
+                        fingerprint=fingerprint,
+                        now=now,
+                    )
+                )
+            ).mappings().first()
+            # Ends the claim's transaction either way: a new claim must be
+            # visible to repeats before the operation starts.
+            await self._session.commit()
+            if row is None:
+                return IdempotencyClaim(claimed=False)
+            if row["claimed"]:
+                return IdempotencyClaim(claimed=True)
+            if row["status"] == COMPLETED:
+                self._cache.put(
+                    (user_id, scope, key),
+                    fingerprint=row["fingerprint"],
+                    result=row["result"],
+                    ttl_s=(row["expires_at"] - now).total_seconds(),
+                )
+                return IdempotencyClaim(
+                    claimed=False,
+                    fingerprint=row["fingerprint"],
+                    result=row["result"],
+                )
+            if row["locked_until"] < now and await self._take_over(
+                table,
+                user_id=user_id,
+                scope=scope,
+                key=key,
+                fingerprint=fingerprint,
+                now=now,
+            ):
+                return IdempotencyClaim(claimed=True)
+            return IdempotencyClaim(claimed=False, fingerprint=row["fingerprint"])
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def _take_over(
+        self,
+        table: Table,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        now: datetime,
+    ) -> bool:
+        """
+        Claims a key whose previous owner died before completing or releasing
+        it; the lease check makes only one of several racing takers win.
+        """
+        result = await self._session.execute(
+            table.update()
+            .where(
+                table.c.user_id == user_id,
+                table.c.scope == scope,
+                table.c.key == key,
+                table.c.status == PENDING,
+                table.c.locked_until < now,
+            )
+            .values(
+                fingerprint=fingerprint,
+                locked_until=now + IDEMPOTENCY_LOCK_TTL,
+                expires_at=now + IDEMPOTENCY_KEY_TTL,
+            )
+            .returning(table.c.id)
+        )
+        taken = result.first() is not None
+        await self._session.commit()
+        return taken
+
+    async def complete(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        result: Mapping[str, Any],
+    ) -> None:
+        table = self._table()
+        # Stored the way it is rendered, so replays are byte-for-byte equal.
+        stored = orjson.loads(orjson.dumps(result, default=str))
+        try:
+            fingerprint = (
+                await self._session.execute(
+                    table.update()
+                    .where(
+                        table.c.user_id == user_id,
+                        table.c.scope == scope,
+                        table.c.key == key,
+                    )
+                    .values(status=COMPLETED, result=stored)
+                    .returning(table.c.fingerprint)
+                )
+            ).scalar_one()
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        call_after_commit(
+            self._session,
+            partial(
+                self._cache.put,
+                (user_id, scope, key),
+                fingerprint=fingerprint,
+                result=stored,
+                ttl_s=IDEMPOTENCY_KEY_TTL.total_seconds(),
+            ),
+        )
+
+    async def release(self, *, user_id: int, scope: str, key: str) -> None:
+        table = self._table()
+        try:
+            await self._session.rollback()
+            await self._session.execute(
+                table.delete().where(
+                    table.c.user_id == user_id,
+                    table.c.scope == scope,
+                    table.c.key == key,
+                    table.c.status == PENDING,
+                )
+            )
+            await self._session.commit()
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
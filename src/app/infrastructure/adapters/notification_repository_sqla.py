@@ -1,18 +1,104 @@
-from sqlalchemy import Select, select
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from sqlalchemy import (
+    ARRAY,
+    Insert,
+    Integer,
+    Table,
+    TableValuedAlias,
+    Update,
+    bindparam,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.application.notification.ports import NotificationRepository
+from app.application.notification.ports import (
+    NotificationPublisher,
+    NotificationRepository,
+)
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
 from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.user_history import build_user_history_page
 from app.infrastructure.persistence_sqla.mappings.notification import map_notifications_table
+from app.infrastructure.persistence_sqla.mappings.notification_counter import (
+    map_notification_counters_table,
+)
+
+
+def unnest_user_ids(user_ids: Sequence[int]) -> TableValuedAlias:
+    """
+    The ids travel as one array parameter, so the statement (and its plan)
+    is the same whatever the number of users.
+    """
+    user_ids_param = bindparam("user_ids", list(user_ids), type_=ARRAY(Integer))
+    return func.unnest(user_ids_param).table_valued("user_id")
+
+
+def build_increment_unread(counters: Table, user_ids: Sequence[int]) -> Insert:
+    """
+    `user_ids` must be distinct; ascending order makes concurrent callers
+    lock the counter rows in the same order.
+    """
+    recipients = unnest_user_ids(user_ids)
+    stmt = pg_insert(counters).from_select(
+        ["user_id", "unread"],
+        select(recipients.c.user_id, literal(1)),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[counters.c.user_id],
+        set_={"unread": counters.c.unread + 1},
+    )
+
+
+def build_mark_read(
+    notifications: Table,
+    counters: Table,
+    *,
+    user_id: int,
+    notification_ids: Sequence[int] | None,
+    now: datetime,
+) -> Update:
+    """
+    One statement: a data-modifying CTE flips the rows, and the outer
+    UPDATE subtracts exactly the number it flipped from the counter.
+    """
+    conditions = [
+        notifications.c.user_id == user_id,
+        notifications.c.is_read.is_not(True),
+    ]
+    if notification_ids is not None:
+        conditions.append(notifications.c.id.in_(notification_ids))
+    marked = (
+        notifications.update()
+        .where(*conditions)
+        .values(is_read=True, updated_at=now)
+        .returning(notifications.c.id)
+        .cte("marked")
+    )
+    marked_count = select(func.count()).select_from(marked).scalar_subquery()
+    return (
+        counters.update()
+        .where(counters.c.user_id == user_id)
+        .values(unread=func.greatest(counters.c.unread - marked_count, 0))
+        .returning(counters.c.unread)
+    )
 
 
 class SqlaNotificationRepository(NotificationRepository):
-    def __init__(self, session: MainAsyncSession):
+    def __init__(self, session: MainAsyncSession, publisher: NotificationPublisher):
         map_notifications_table()
+        map_notification_counters_table()
         self._session = session
+        self._publisher = publisher
 
     async def read_by_user_paginated(
         self,
@@ -23,16 +109,80 @@ class SqlaNotificationRepository(NotificationRepository):
     ) -> list[dict]:
         try:
             table = mapping_registry.metadata.tables["notifications"]  # type: ignore
-            stmt: Select = (
-                select(table)
-                .where(table.c.user_id == user_id)
-                .order_by(table.c.created_at.desc())
-                .offset(offset)
-                .limit(limit)
+            stmt = build_user_history_page(
+                table,
+                user_id=user_id,
+                offset=offset,
+                limit=limit,
             )
             rows = (await self._session.execute(stmt)).mappings().all()
             return [dict(r) for r in rows]
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def add(
+        self,
+        *,
+        user_id: int,
+        title: str,
+        action: str,
+        data_json: Mapping[str, Any] | None = None,
+    ) -> dict:
+        try:
+            table = mapping_registry.metadata.tables["notifications"]  # type: ignore
+            now = datetime.utcnow()
+            stmt: Insert = (
+                table.insert()
+                .values(
+                    user_id=user_id,
+                    title=title,
+                    action=action,
+                    data_json=dict(data_json) if data_json is not None else None,
+                    is_read=False,
+                    created_at=now,
+                    updated_at=now,
+                )
+                .returning(*table.c)
+            )
+            notification = dict((await self._session.execute(stmt)).mappings().one())
+            counters = mapping_registry.metadata.tables["notification_counters"]  # type: ignore
+            await self._session.execute(build_increment_unread(counters, [user_id]))
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        call_after_commit(
+            self._session,
+            partial(self._publisher.publish, user_id, notification),
+        )
+        return notification
+
+    async def read_unread_count(self, user_id: int) -> int:
+        try:
+            counters = mapping_registry.metadata.tables["notification_counters"]  # type: ignore
+            unread = await self._session.scalar(
+                select(counters.c.unread).where(counters.c.user_id == user_id)
+            )
+            return int(unread or 0)
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def mark_read(
+        self,
+        *,
+        user_id: int,
+        notification_ids: Sequence[int] | None = None,
+    ) -> int:
+        try:
+            table = mapping_registry.metadata.tables["notifications"]  # type: ignore
+            counters = mapping_registry.metadata.tables["notification_counters"]  # type: ignore
+            unread = await self._session.scalar(
+                build_mark_read(
+                    table,
+                    counters,
+                    user_id=user_id,
+                    notification_ids=notification_ids,
+                    now=datetime.utcnow(),
+                )
+            )
+            return int(unread or 0)
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
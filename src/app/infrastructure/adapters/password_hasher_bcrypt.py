@@ -7,6 +7,8 @@ import bcrypt
 
 from app.domain.ports.password_hasher import PasswordHasher
 from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.metrics.registry import PASSWORD_HASH_DURATION
+from app.infrastructure.tracing.tracer import get_tracer
 
 PasswordPepper = NewType("PasswordPepper", str)
 
@@ -28,7 +30,11 @@ class BcryptPasswordHasher(PasswordHasher):
         """
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
         salt: bytes = bcrypt.gensalt()
-        return bcrypt.hashpw(base64_hmac_password, salt)
+        with (
+            get_tracer().span("BcryptPasswordHasher.hash"),
+            PASSWORD_HASH_DURATION.labels("hash").time(),
+        ):
+            return bcrypt.hashpw(base64_hmac_password, salt)
 
     @staticmethod
     def _add_pepper(raw_password: RawPassword, pepper: PasswordPepper) -> bytes:
@@ -41,4 +47,8 @@ class BcryptPasswordHasher(PasswordHasher):
 
     def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool:
         base64_hmac_password: bytes = self._add_pepper(raw_password, self._pepper)
-        return bcrypt.checkpw(base64_hmac_password, hashed_password)
+        with (
+            get_tracer().span("BcryptPasswordHasher.verify"),
+            PASSWORD_HASH_DURATION.labels("verify").time(),
+        ):
+            return bcrypt.checkpw(base64_hmac_password, hashed_password)
@@ -1,14 +1,46 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Final
 
-from sqlalchemy import Select, and_, select
+from sqlalchemy import Select, Table, and_, select
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.application.subscription.ports import PaymentRepository
+from app.application.subscription.ports import PaymentExportRow, PaymentRepository
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.infrastructure.persistence_sqla.mappings.payment import map_payments_table
 from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.timestamps import utc_for
+from app.infrastructure.persistence_sqla.user_history import build_user_history_page
+
+# Rows fetched per round trip when streaming from a server-side cursor.
+STREAM_BATCH_SIZE: Final[int] = 1000
+EXPORTED_COLUMNS: Final[tuple[str, ...]] = tuple(PaymentExportRow.__annotations__)
+
+
+def build_payment_export(
+    payments: Table,
+    *,
+    created_from: datetime | None,
+    created_to: datetime | None,
+    status: str | None,
+) -> Select:
+    """The range on `created_at` prunes the monthly partitions."""
+    stmt = select(*(payments.c[name] for name in EXPORTED_COLUMNS))
+    if created_from is not None:
+        stmt = stmt.where(
+            payments.c.created_at >= utc_for(payments.c.created_at, created_from)
+        )
+    if created_to is not None:
+        stmt = stmt.where(
+            payments.c.created_at < utc_for(payments.c.created_at, created_to)
+        )
+    if status is not None:
+        stmt = stmt.where(payments.c.status == status)
+    return stmt.order_by(payments.c.created_at, payments.c.id).execution_options(
+        yield_per=STREAM_BATCH_SIZE
+    )
 
 
 class SqlaPaymentRepository(PaymentRepository):
@@ -94,12 +126,11 @@ class SqlaPaymentRepository(PaymentRepository):
     async def read_by_user_paginated(self, *, user_id: int, offset: int, limit: int) -> list[dict]:
         try:
             table = mapping_registry.metadata.tables["payments"]  # type: ignore
-            stmt: Select = (
-                select(table)
-                .where(table.c.user_id == user_id)
-                .order_by(table.c.created_at.desc())
-                .offset(offset)
-                .limit(limit)
+            stmt = build_user_history_page(
+                table,
+                user_id=user_id,
+                offset=offset,
+                limit=limit,
             )
             rows = (await self._session.execute(stmt)).mappings().all()
             return [dict(r) for r in rows]
@@ -116,7 +147,8 @@ class SqlaPaymentRepository(PaymentRepository):
     ) -> dict:
         try:
             table = mapping_registry.metadata.tables["payments"]  # type: ignore
-            # naive approach: always create; in real case, would check idempotency key
+            # Always creates; retries are deduplicated by the Idempotency-Key
+            # the route runs this under.
             result = await self._session.execute(
                 table.insert()
                 .values(
@@ -136,4 +168,23 @@ class SqlaPaymentRepository(PaymentRepository):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
-
+    async def stream_all(
+        self,
+        *,
+        created_from: datetime | None,
+        created_to: datetime | None,
+        status: str | None,
+    ) -> AsyncIterator[PaymentExportRow]:
+        table = mapping_registry.metadata.tables["payments"]  # type: ignore
+        stmt = build_payment_export(
+            table,
+            created_from=created_from,
+            created_to=created_to,
+            status=status,
+        )
+        try:
+            result = await self._session.stream(stmt)
+            async for row in result.mappings():
+                yield PaymentExportRow(**row)  # type: ignore[typeddict-item]
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
@@ -3,20 +3,28 @@ from datetime import datetime
 from sqlalchemy import Select, select
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.application.subscription.ports import SubscriptionRepository
+from app.application.subscription.ports import PlanCatalog, SubscriptionRepository
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
 from app.infrastructure.persistence_sqla.mappings.subscription import (
     map_subscriptions_table,
 )
 from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.subscription.plan_catalog import PlanCatalogCache
 
 
 class SqlaSubscriptionRepository(SubscriptionRepository):
-    def __init__(self, session: MainAsyncSession):
+    """
+    Catalog reads go through the process-wide cache; writes invalidate it
+    once their transaction commits.
+    """
+
+    def __init__(self, session: MainAsyncSession, catalog_cache: PlanCatalogCache):
         map_subscriptions_table()
         self._session = session
+        self._catalog_cache = catalog_cache
 
     async def read_by_name(self, name: str) -> dict | None:
         try:
@@ -27,23 +35,28 @@ class SqlaSubscriptionRepository(SubscriptionRepository):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
-    async def read_all(self) -> list[dict]:
+    async def read_catalog(self) -> PlanCatalog:
+        return await self._catalog_cache.get(self._load_catalog)
+
+    async def _load_catalog(self) -> list[dict]:
         try:
             table = mapping_registry.metadata.tables["subscriptions"]  # type: ignore
-            stmt: Select = select(table)
+            stmt: Select = select(table).order_by(table.c.id)
             rows = (await self._session.execute(stmt)).mappings().all()
             return [dict(r) for r in rows]
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def read_all(self) -> list[dict]:
+        catalog = await self.read_catalog()
+        return [dict(plan) for plan in catalog.plans]
+
     async def read_by_id(self, id_: int) -> dict | None:
-        try:
-            table = mapping_registry.metadata.tables["subscriptions"]  # type: ignore
-            stmt: Select = select(table).where(table.c.id == id_)
-            row = (await self._session.execute(stmt)).mappings().first()
-            return dict(row) if row else None
-        except SQLAlchemyError as error:
-            raise DataMapperError(DB_QUERY_FAILED) from error
+        catalog = await self.read_catalog()
+        for plan in catalog.plans:
+            if plan["id"] == id_:
+                return dict(plan)
+        return None
 
     async def add(
         self,
@@ -79,6 +92,7 @@ class SqlaSubscriptionRepository(SubscriptionRepository):
                 )
                 .returning(table.c.id)
             )
+            call_after_commit(self._session, self._catalog_cache.invalidate)
             return int(result.scalar_one())
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
@@ -91,6 +105,7 @@ class SqlaSubscriptionRepository(SubscriptionRepository):
                 .where(table.c.id == id_)
                 .values(stripe_price_id=stripe_price_id, stripe_product_id=stripe_product_id)
             )
+            call_after_commit(self._session, self._catalog_cache.invalidate)
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
@@ -7,6 +7,7 @@ from app.application.subscription.ports import SubscriptionUserRepository
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.json_keys import json_text
 from app.infrastructure.persistence_sqla.mappings.subscription_user import (
     map_subscription_users_table,
 )
@@ -78,9 +79,9 @@ class SqlaSubscriptionUserRepository(SubscriptionUserRepository):
     async def read_by_checkout_session_id(self, *, session_id: str) -> dict | None:
         try:
             table = mapping_registry.metadata.tables["subscription_users"]  # type: ignore
-            # Postgres JSON ->> operator via SQLAlchemy: data_json['checkout_session_id'].astext
+            # Same expression as ix_subscription_users_checkout_session_id.
             stmt: Select = select(table).where(
-                table.c.data_json["checkout_session_id"].astext == session_id  # type: ignore[attr-defined]
+                json_text(table.c.data_json, "checkout_session_id") == session_id
             )
             row = (await self._session.execute(stmt)).mappings().first()
             return dict(row) if row else None
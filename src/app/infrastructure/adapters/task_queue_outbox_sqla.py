@@ -0,0 +1,44 @@
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.common.ports.task_queue import TaskQueue
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.outbox import (
+    map_outbox_messages_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.tracing.tracer import current_span_context, format_traceparent
+
+
+class SqlaOutboxTaskQueue(TaskQueue):
+    """
+    Writes the task into the outbox in the caller's transaction: it becomes
+    visible to the relay only if the business change commits. The current
+    trace goes along, so the task joins the request's trace however late
+    the relay publishes it.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        map_outbox_messages_table()
+        self._session = session
+
+    async def enqueue(self, task_name: str, kwargs: Mapping[str, Any]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        context = current_span_context()
+        try:
+            table = mapping_registry.metadata.tables["outbox_messages"]  # type: ignore
+            await self._session.execute(
+                table.insert().values(
+                    task_name=task_name,
+                    payload=dict(kwargs),
+                    traceparent=format_traceparent(context) if context else None,
+                )
+            )
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
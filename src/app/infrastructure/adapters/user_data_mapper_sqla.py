@@ -1,7 +1,23 @@
-from sqlalchemy import Select, select
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Select,
+    String,
+    Table,
+    Update,
+    any_,
+    bindparam,
+    select,
+)
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from app.application.common.ports.user_command_gateway import UserCommandGateway
+from app.application.common.ports.user_command_gateway import (
+    UserCommandGateway,
+    UserSelection,
+)
 from app.domain.entities.user import User
 from app.domain.value_objects.user_id import UserId
 from app.domain.value_objects.email import Email
@@ -30,6 +46,57 @@ from app.infrastructure.persistence_sqla.registry import mapping_registry
 from app.domain.exceptions.user import EmailAlreadyExistsError
 
 
+def build_select_users(
+    users: Table,
+    selection: UserSelection,
+    *,
+    limit: int,
+    for_update: bool = False,
+) -> Select:
+    stmt = select(users)
+    if selection.emails is not None:
+        stmt = stmt.where(
+            users.c.email
+            == any_(
+                bindparam(
+                    "emails",
+                    [email.value for email in selection.emails],
+                    type_=ARRAY(String),
+                )
+            )
+        )
+    if selection.role is not None:
+        stmt = stmt.where(users.c.role == selection.role)
+    if selection.is_active is not None:
+        stmt = stmt.where(users.c.is_active == selection.is_active)
+    stmt = stmt.order_by(users.c.id).limit(limit)
+    if for_update:
+        stmt = stmt.with_for_update()
+    return stmt
+
+
+def build_update_users(
+    users: Table,
+    user_ids: Sequence[UserId],
+    values: dict,
+) -> Update:
+    """`id = ANY(:user_ids)`: one statement whatever the number of users."""
+    return (
+        users.update()
+        .where(
+            users.c.id
+            == any_(
+                bindparam(
+                    "user_ids",
+                    [user_id.value for user_id in user_ids],
+                    type_=ARRAY(Integer),
+                )
+            )
+        )
+        .values(**values, updated_at=datetime.now(tz=timezone.utc))
+    )
+
+
 class SqlaUserDataMapper(UserCommandGateway):
     def __init__(self, session: MainAsyncSession):
         self._session = session
@@ -131,6 +198,56 @@ class SqlaUserDataMapper(UserCommandGateway):
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
 
+    async def read_many(
+        self,
+        selection: UserSelection,
+        *,
+        limit: int,
+        for_update: bool = False,
+    ) -> list[User]:
+        """
+        :raises DataMapperError:
+        """
+        try:
+            map_users_table()
+            UsersTable = mapping_registry.metadata.tables["users"]  # type: ignore
+            select_stmt = build_select_users(
+                UsersTable,
+                selection,
+                limit=limit,
+                for_update=for_update,
+            )
+            rows = (await self._session.execute(select_stmt)).mappings().all()
+            return [self._row_to_user(row) for row in rows]  # type: ignore[misc]
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def update_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool | None = None,
+        role: UserRole | None = None,
+    ) -> None:
+        """
+        :raises DataMapperError:
+        """
+        values: dict = {}
+        if is_active is not None:
+            values["is_active"] = is_active
+        if role is not None:
+            values["role"] = role
+        if not user_ids or not values:
+            return
+        try:
+            map_users_table()
+            UsersTable = mapping_registry.metadata.tables["users"]  # type: ignore
+            await self._session.execute(
+                build_update_users(UsersTable, user_ids, values)
+            )
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
     @staticmethod
     def _row_to_user(row: dict | None) -> User | None:
         if not row:
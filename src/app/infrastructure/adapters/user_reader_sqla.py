@@ -1,25 +1,122 @@
 import logging
-from collections.abc import Sequence
-from datetime import datetime
+from collections.abc import AsyncIterator, Mapping
+from typing import Any, Final
 
-from sqlalchemy import ColumnElement, Result, Row, Select, select
+from sqlalchemy import ColumnElement, Select, Table, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.application.common.ports.user_query_gateway import UserQueryGateway
 from app.application.common.query_models.user import UserQueryModel
 from app.application.common.query_params.sorting import SortingOrder
-from app.application.common.query_params.user import UserListParams
-from app.domain.enums.user_role import UserRole
+from app.application.common.query_params.user import UserListFilters, UserListParams
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import ReaderError
-from app.domain.entities.user import User
+from app.infrastructure.persistence_sqla.mappings.user import (
+    map_users_table,
+    user_email_lower,
+    user_full_name,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.timestamps import utc_for
 
 log = logging.getLogger(__name__)
 
+LIKE_ESCAPE: Final[str] = "\\"
+# Rows fetched per round trip when streaming from a server-side cursor.
+STREAM_BATCH_SIZE: Final[int] = 1000
+
+# Every column of the listing but the password hash.
+LISTED_COLUMNS: Final[tuple[str, ...]] = tuple(UserQueryModel.__annotations__)
+
+
+def escape_like(value: str) -> str:
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def user_list_conditions(
+    users: Table,
+    filters: UserListFilters,
+) -> list[ColumnElement[bool]]:
+    """
+    Written to match the indexes on `users`: the LIKE patterns are built
+    here rather than concatenated in SQL, so a prefix pattern is a plain
+    constant the `text_pattern_ops` index can be searched with.
+    """
+    conditions: list[ColumnElement[bool]] = []
+    if filters.email_prefix is not None:
+        conditions.append(
+            user_email_lower(users).like(
+                escape_like(filters.email_prefix.lower()) + "%",
+                escape=LIKE_ESCAPE,
+            )
+        )
+    if filters.name is not None:
+        conditions.append(
+            user_full_name(users).ilike(
+                "%" + escape_like(filters.name.strip()) + "%",
+                escape=LIKE_ESCAPE,
+            )
+        )
+    for column, value in (
+        (users.c.role, filters.role),
+        (users.c.is_active, filters.is_active),
+        (users.c.is_blocked, filters.is_blocked),
+        (users.c.is_verified, filters.is_verified),
+        (users.c.country_id, filters.country_id),
+    ):
+        if value is not None:
+            conditions.append(column == value)
+    for column, start, end in (
+        (users.c.created_at, filters.created_from, filters.created_to),
+        (users.c.last_login, filters.last_login_from, filters.last_login_to),
+    ):
+        if start is not None:
+            conditions.append(column >= utc_for(column, start))
+        if end is not None:
+            conditions.append(column < utc_for(column, end))
+    return conditions
+
+
+def _select_listed(users: Table, filters: UserListFilters) -> Select:
+    return select(*(users.c[name] for name in LISTED_COLUMNS)).where(
+        *user_list_conditions(users, filters)
+    )
+
+
+def build_user_list(users: Table, params: UserListParams) -> Select | None:
+    """`None` when the sorting field is not a listed column."""
+    sorting = params.sorting
+    if sorting.sorting_field not in LISTED_COLUMNS:
+        return None
+    column = users.c[sorting.sorting_field]
+    order_by = (
+        column.asc() if sorting.sorting_order == SortingOrder.ASC else column.desc()
+    )
+    return (
+        _select_listed(users, params.filters)
+        # `id` breaks ties so pages don't overlap.
+        .order_by(order_by, users.c.id)
+        .limit(params.pagination.limit)
+        .offset(params.pagination.offset)
+    )
+
+
+def build_user_export(users: Table, filters: UserListFilters) -> Select:
+    return (
+        _select_listed(users, filters)
+        .order_by(users.c.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+
 
 class SqlaUserReader(UserQueryGateway):
     def __init__(self, session: MainAsyncSession):
+        map_users_table()
         self._session = session
 
     async def read_all(
@@ -29,57 +126,37 @@ class SqlaUserReader(UserQueryGateway):
         """
         :raises ReaderError:
         """
-        # Get the sorting field attribute from User entity
-        sorting_field_attr = getattr(User, user_read_all_params.sorting.sorting_field, None)
-        if sorting_field_attr is None:
+        users = mapping_registry.metadata.tables["users"]  # type: ignore
+        select_stmt = build_user_list(users, user_read_all_params)
+        if select_stmt is None:
             log.error(
                 "Invalid sorting field: '%s'.",
                 user_read_all_params.sorting.sorting_field,
             )
             return None
 
-        order_by = (
-            sorting_field_attr.asc()
-            if user_read_all_params.sorting.sorting_order == SortingOrder.ASC
-            else sorting_field_attr.desc()
-        )
-
-        select_stmt: Select[tuple[User]] = (
-            select(User)
-            .order_by(order_by)
-            .limit(user_read_all_params.pagination.limit)
-            .offset(user_read_all_params.pagination.offset)
-        )
-
         try:
-            result: Result[tuple[User]] = await self._session.execute(select_stmt)
-            users: Sequence[Row[tuple[User]]] = result.all()
-
-            return [
-                UserQueryModel(
-                    id=user[0].id.value,
-                    email=user[0].email.value,
-                    first_name=user[0].first_name.value,
-                    last_name=user[0].last_name.value,
-                    role=user[0].role,
-                    is_active=user[0].is_active.value,
-                    is_blocked=user[0].is_blocked.value,
-                    is_verified=user[0].is_verified.value,
-                    retry_count=user[0].retry_count.value,
-                    created_at=user[0].created_at.value,
-                    updated_at=user[0].updated_at.value,
-                    last_login=user[0].last_login.value if user[0].last_login else None,
-                    profile_picture=user[0].profile_picture.value if user[0].profile_picture else None,
-                    phone_number=user[0].phone_number.value if user[0].phone_number else None,
-                    language=user[0].language.value,
-                    address=user[0].address.value if user[0].address else None,
-                    postal_code=user[0].postal_code.value if user[0].postal_code else None,
-                    country_id=user[0].country_id.value if user[0].country_id else None,
-                    city_id=user[0].city_id.value if user[0].city_id else None,
-                    subscription=user[0].subscription.value if user[0].subscription else None,
-                )
-                for user in users
-            ]
+            rows = (await self._session.execute(select_stmt)).mappings().all()
+        except SQLAlchemyError as error:
+            raise ReaderError(DB_QUERY_FAILED) from error
+        return [self._row_to_query_model(row) for row in rows]
 
+    async def stream_all(
+        self,
+        filters: UserListFilters,
+    ) -> AsyncIterator[UserQueryModel]:
+        """
+        :raises ReaderError:
+        """
+        users = mapping_registry.metadata.tables["users"]  # type: ignore
+        try:
+            result = await self._session.stream(build_user_export(users, filters))
+            async for row in result.mappings():
+                yield self._row_to_query_model(row)
         except SQLAlchemyError as error:
             raise ReaderError(DB_QUERY_FAILED) from error
+
+    @staticmethod
+    def _row_to_query_model(row: Mapping[str, Any]) -> UserQueryModel:
+        values = {name: row[name] for name in LISTED_COLUMNS}
+        return UserQueryModel(**values)  # type: ignore[typeddict-item]
@@ -8,10 +8,12 @@ from sqlalchemy import Select, and_, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.atlas.name_cache import AtlasNameCache
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.persistence_sqla.mappings.city import map_cities_table
 from app.infrastructure.persistence_sqla.mappings.country import map_countries_table
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 log = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class InitCitiesResult(TypedDict):
 @dataclass
 class InitCitiesHandler:
     session: MainAsyncSession
+    name_cache: AtlasNameCache
 
     async def execute(self, csv_path: Path | None = None) -> InitCitiesResult:
         map_cities_table()
@@ -150,6 +153,7 @@ class InitCitiesHandler:
                         errors += 1
                         continue
 
+            call_after_commit(self.session, self.name_cache.invalidate)
             await self.session.commit()
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
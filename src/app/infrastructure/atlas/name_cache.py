@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Final, Generic, TypeVar
+
+from app.infrastructure.metrics.registry import record_cache_lookup
+
+# Every country fits; cities are bounded to the ones users actually live in.
+ATLAS_NAME_CACHE_SIZE: Final[int] = 50_000
+# Bounds how long other processes keep serving names changed elsewhere.
+ATLAS_NAME_TTL_S: Final[float] = 15 * 60.0
+
+_V = TypeVar("_V")
+
+
+@dataclass(frozen=True, slots=True)
+class CountryName:
+    name: str
+    iso2: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry(Generic[_V]):
+    value: _V
+    expires_at: float
+
+
+class _Lru(Generic[_V]):
+    def __init__(self, max_entries: int, clock: Callable[[], float]) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[int, _Entry[_V]] = OrderedDict()
+
+    def get(self, key: int) -> _V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def put(self, key: int, value: _V, ttl_s: float) -> None:
+        self._entries[key] = _Entry(value=value, expires_at=self._clock() + ttl_s)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class AtlasNameCache:
+    """
+    Process-wide country and city names by ID, filled from the queries
+    that read them anyway. Atlas rows only change through the init
+    handlers, which clear the cache right after their commit; other
+    processes catch up when entries expire.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._countries: _Lru[CountryName] = _Lru(max_entries, clock)
+        self._cities: _Lru[str] = _Lru(max_entries, clock)
+
+    def country(self, country_id: int) -> CountryName | None:
+        country = self._countries.get(country_id)
+        record_cache_lookup("atlas_names", hit=country is not None)
+        return country
+
+    def city(self, city_id: int) -> str | None:
+        name = self._cities.get(city_id)
+        record_cache_lookup("atlas_names", hit=name is not None)
+        return name
+
+    def put_country(self, country_id: int, name: str, iso2: str | None) -> None:
+        self._countries.put(country_id, CountryName(name=name, iso2=iso2), self._ttl_s)
+
+    def put_city(self, city_id: int, name: str) -> None:
+        self._cities.put(city_id, name, self._ttl_s)
+
+    def invalidate(self) -> None:
+        self._countries.clear()
+        self._cities.clear()
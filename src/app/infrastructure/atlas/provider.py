@@ -0,0 +1,9 @@
+from app.infrastructure.atlas.name_cache import (
+    ATLAS_NAME_CACHE_SIZE,
+    ATLAS_NAME_TTL_S,
+    AtlasNameCache,
+)
+
+
+def get_atlas_name_cache() -> AtlasNameCache:
+    return AtlasNameCache(max_entries=ATLAS_NAME_CACHE_SIZE, ttl_s=ATLAS_NAME_TTL_S)
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from app.application.common.ports.access_revoker import AccessRevoker
 from app.domain.value_objects.user_id import UserId
 from app.infrastructure.auth.session.service import AuthSessionService
@@ -15,3 +17,9 @@ class AuthSessionAccessRevoker(AccessRevoker):
         :raises DataMapperError:
         """
         await self._auth_session_service.invalidate_all_sessions_for_user(user_id)
+
+    async def remove_all_access_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        await self._auth_session_service.invalidate_all_sessions_for_users(user_ids)
@@ -1,4 +1,6 @@
-from sqlalchemy import Delete, delete
+from collections.abc import Sequence
+
+from sqlalchemy import ARRAY, Delete, Integer, any_, bindparam, delete
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.domain.value_objects.user_id import UserId
@@ -9,6 +11,23 @@ from app.infrastructure.auth.session.ports.gateway import (
     AuthSessionGateway,
 )
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.auth_session import (
+    auth_sessions_table,
+)
+
+
+def build_delete_sessions_of_users(user_ids: Sequence[UserId]) -> Delete:
+    """`user_id = ANY(:user_ids)`: one statement whatever the number of users."""
+    return delete(auth_sessions_table).where(
+        auth_sessions_table.c.user_id
+        == any_(
+            bindparam(
+                "user_ids",
+                [user_id.value for user_id in user_ids],
+                type_=ARRAY(Integer),
+            )
+        )
+    )
 
 
 class SqlaAuthSessionDataMapper(AuthSessionGateway):
@@ -82,3 +101,16 @@ class SqlaAuthSessionDataMapper(AuthSessionGateway):
 
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
+        if not user_ids:
+            return
+
+        try:
+            await self._session.execute(build_delete_sessions_of_users(user_ids))
+
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
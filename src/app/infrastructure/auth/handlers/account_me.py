@@ -1,16 +1,20 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TypedDict
+from typing import Any, Final, TypedDict
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, Table, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.application.common.ports.country_query_gateway import CountryQueryGateway
 from app.application.common.ports.city_query_gateway import CityQueryGateway
 from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.identity_provider import IdentityProvider
 from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.current_user import CurrentUserService
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
 from app.domain.value_objects.first_name import FirstName
 from app.domain.value_objects.last_name import LastName
 from app.domain.value_objects.phone_number import PhoneNumber
@@ -22,10 +26,12 @@ from app.domain.value_objects.country_id import CountryId
 from app.domain.value_objects.city_id import CityId
 from app.domain.value_objects.updated_at import UpdatedAt
 from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.atlas.name_cache import AtlasNameCache, CountryName
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.persistence_sqla.mappings.country import map_countries_table
 from app.infrastructure.persistence_sqla.mappings.city import map_cities_table
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
@@ -51,62 +57,183 @@ class MeResponse(TypedDict, total=False):
     subscription: str | None
 
 
+# Profile columns of `users` returned as they are stored.
+ME_COLUMNS: Final[tuple[str, ...]] = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "is_active",
+    "is_blocked",
+    "is_verified",
+    "retry_count",
+    "profile_picture",
+    "phone_number",
+    "last_login",
+    "country_id",
+    "city_id",
+    "language",
+    "subscription",
+)
+
+
+def _atlas_tables() -> tuple[Table, Table]:
+    map_countries_table()
+    map_cities_table()
+    return (
+        mapping_registry.metadata.tables["countries"],  # type: ignore
+        mapping_registry.metadata.tables["cities"],  # type: ignore
+    )
+
+
+def build_me_query(
+    users: Table,
+    countries: Table,
+    cities: Table,
+    user_id: int,
+) -> Select:
+    """The profile and its country and city names in one round trip."""
+    return (
+        select(
+            *(users.c[name] for name in ME_COLUMNS),
+            countries.c.name.label("country_name"),
+            countries.c.iso2.label("country_code"),
+            cities.c.name.label("city_name"),
+        )
+        .select_from(
+            users.outerjoin(countries, countries.c.id == users.c.country_id).outerjoin(
+                cities, cities.c.id == users.c.city_id
+            )
+        )
+        .where(users.c.id == user_id)
+    )
+
+
+def build_atlas_names(
+    countries: Table,
+    cities: Table,
+    *,
+    country_id: int | None,
+    city_id: int | None,
+) -> Select:
+    """One row with the names of whichever of the two IDs are given."""
+    columns = []
+    if country_id is not None:
+        columns += [
+            select(column)
+            .where(countries.c.id == country_id)
+            .scalar_subquery()
+            .label(label)
+            for column, label in (
+                (countries.c.name, "country_name"),
+                (countries.c.iso2, "country_code"),
+            )
+        ]
+    if city_id is not None:
+        columns.append(
+            select(cities.c.name)
+            .where(cities.c.id == city_id)
+            .scalar_subquery()
+            .label("city_name")
+        )
+    return select(*columns)
+
+
+def _me_response(
+    values: Mapping[str, Any],
+    country: CountryName | None,
+    city_name: str | None,
+) -> MeResponse:
+    last_login = values["last_login"]
+    return MeResponse(
+        id=values["id"],
+        email=values["email"],
+        first_name=values["first_name"],
+        last_name=values["last_name"],
+        role=UserRole(values["role"]).value,
+        is_active=bool(values["is_active"]),
+        is_blocked=bool(values["is_blocked"]),
+        is_verified=bool(values["is_verified"]),
+        retry_count=values["retry_count"] or 0,
+        profile_picture=values["profile_picture"] or None,
+        phone_number=values["phone_number"] or None,
+        last_login=last_login.isoformat() if last_login else None,
+        country_id=values["country_id"],
+        country_name=country.name if country else None,
+        country_code=country.iso2 if country else None,
+        city_id=values["city_id"],
+        city_name=city_name,
+        language=values["language"] or "en",
+        subscription=values["subscription"] or None,
+    )
+
+
+def _user_values(user: User) -> dict[str, Any]:
+    """The `ME_COLUMNS` of an entity, as `build_me_query` would read them."""
+    return {
+        "id": user.id_.value,
+        "email": user.email.value,
+        "first_name": user.first_name.value,
+        "last_name": user.last_name.value,
+        "role": user.role.value,
+        "is_active": user.is_active.value,
+        "is_blocked": user.is_blocked.value,
+        "is_verified": user.is_verified.value,
+        "retry_count": user.retry_count.value,
+        "profile_picture": user.profile_picture.value if user.profile_picture else None,
+        "phone_number": user.phone_number.value if user.phone_number else None,
+        "last_login": user.last_login.value if user.last_login else None,
+        "country_id": user.country_id.value if user.country_id else None,
+        "city_id": user.city_id.value if user.city_id else None,
+        "language": user.language.value,
+        "subscription": user.subscription.value if user.subscription else None,
+    }
+
+
 class GetMeHandler:
-    def __init__(self, current_user_service: CurrentUserService, session: MainAsyncSession):
+    def __init__(
+        self,
+        identity_provider: IdentityProvider,
+        current_user_service: CurrentUserService,
+        session: MainAsyncSession,
+        name_cache: AtlasNameCache,
+    ):
+        self._identity_provider = identity_provider
         self._current_user_service = current_user_service
         self._session = session
+        self._name_cache = name_cache
 
     async def execute(self) -> MeResponse:
-        user = await self._current_user_service.get_current_user()
+        user_id = await self._identity_provider.get_current_user_id()
 
-        # Enrich with country/city names
-        map_countries_table()
-        map_cities_table()
-        country_name: str | None = None
-        country_code: str | None = None
-        city_name: str | None = None
+        map_users_table()
+        users = mapping_registry.metadata.tables["users"]  # type: ignore
+        countries, cities = _atlas_tables()
         try:
-            Countries = mapping_registry.metadata.tables["countries"]  # type: ignore
-            Cities = mapping_registry.metadata.tables["cities"]  # type: ignore
-            if user.country_id is not None:
-                stmt_c: Select = select(Countries.c.name, Countries.c.iso2).where(
-                    Countries.c.id == user.country_id.value
-                )
-                c_row = (await self._session.execute(stmt_c)).first()
-                if c_row:
-                    country_name = c_row[0]
-                    country_code = c_row[1]
-            if user.city_id is not None:
-                stmt_city: Select = select(Cities.c.name).where(
-                    Cities.c.id == user.city_id.value
+            row = (
+                (
+                    await self._session.execute(
+                        build_me_query(users, countries, cities, user_id.value)
+                    )
                 )
-                ct_row = (await self._session.execute(stmt_city)).first()
-                if ct_row:
-                    city_name = ct_row[0]
+                .mappings()
+                .first()
+            )
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
+        if row is None:
+            # The user is gone: this revokes their session and raises.
+            user = await self._current_user_service.get_current_user()
+            return _me_response(_user_values(user), None, None)
 
-        return MeResponse(
-            id=user.id_.value,
-            email=user.email.value,
-            first_name=user.first_name.value,
-            last_name=user.last_name.value,
-            role=user.role.value,
-            is_active=user.is_active.value,
-            is_blocked=user.is_blocked.value,
-            is_verified=user.is_verified.value,
-            retry_count=user.retry_count.value,
-            profile_picture=user.profile_picture.value if user.profile_picture else None,
-            phone_number=user.phone_number.value if user.phone_number else None,
-            last_login=user.last_login.value.isoformat() if user.last_login else None,
-            country_id=user.country_id.value if user.country_id else None,
-            country_name=country_name,
-            country_code=country_code,
-            city_id=user.city_id.value if user.city_id else None,
-            city_name=city_name,
-            language=user.language.value,
-            subscription=user.subscription.value if user.subscription else None,
-        )
+        country: CountryName | None = None
+        if row["country_name"] is not None:
+            country = CountryName(name=row["country_name"], iso2=row["country_code"])
+            self._name_cache.put_country(row["country_id"], country.name, country.iso2)
+        if row["city_name"] is not None:
+            self._name_cache.put_city(row["city_id"], row["city_name"])
+        return _me_response(row, country, row["city_name"])
 
 
 @dataclass(frozen=True, slots=True)
@@ -132,6 +259,7 @@ class UpdateMeHandler:
         country_query_gateway: CountryQueryGateway,
         city_query_gateway: CityQueryGateway,
         session: MainAsyncSession,
+        name_cache: AtlasNameCache,
     ) -> None:
         self._current_user_service = current_user_service
         self._user_command_gateway = user_command_gateway
@@ -140,6 +268,7 @@ class UpdateMeHandler:
         self._country_q = country_query_gateway
         self._city_q = city_query_gateway
         self._session = session
+        self._name_cache = name_cache
 
     async def execute(self, request: UpdateMeRequest) -> MeResponse:
         user = await self._current_user_service.get_current_user()
@@ -184,7 +313,34 @@ class UpdateMeHandler:
         await self._user_command_gateway.update(user)
         await self._tx.commit()
 
-        # Return enriched response
-        return await GetMeHandler(self._current_user_service, self._session).execute()
+        # The entity already holds what was written; only the names are looked up.
+        country, city_name = await self._atlas_names(user)
+        return _me_response(_user_values(user), country, city_name)
+
+    async def _atlas_names(self, user: User) -> tuple[CountryName | None, str | None]:
+        country_id = user.country_id.value if user.country_id else None
+        city_id = user.city_id.value if user.city_id else None
+        country = self._name_cache.country(country_id) if country_id else None
+        city_name = self._name_cache.city(city_id) if city_id else None
+        missing_country = country_id if country is None else None
+        missing_city = city_id if city_name is None else None
+        if missing_country is None and missing_city is None:
+            return country, city_name
+
+        countries, cities = _atlas_tables()
+        stmt = build_atlas_names(
+            countries, cities, country_id=missing_country, city_id=missing_city
+        )
+        try:
+            row = (await self._session.execute(stmt)).mappings().one()
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        if missing_country is not None and row["country_name"] is not None:
+            country = CountryName(name=row["country_name"], iso2=row["country_code"])
+            self._name_cache.put_country(missing_country, country.name, country.iso2)
+        if missing_city is not None and row["city_name"] is not None:
+            city_name = row["city_name"]
+            self._name_cache.put_city(missing_city, city_name)
+        return country, city_name
 
 
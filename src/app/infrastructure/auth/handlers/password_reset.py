@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from app.application.common.ports.password_reset_repository import PasswordResetRepository
+from app.application.common.ports.task_queue import TaskQueue
 from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.domain.value_objects.raw_password.raw_password import RawPassword
@@ -16,8 +17,6 @@ from app.domain.value_objects.user_id import UserId
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.domain.exceptions.user import UserNotFoundByEmailError
 
-from app.infrastructure.celery.app import celery_app
-
 log = logging.getLogger(__name__)
 
 
@@ -38,10 +37,12 @@ class ForgotPasswordHandler:
         user_command_gateway: UserCommandGateway,
         password_reset_repo: PasswordResetRepository,
         transaction_manager: TransactionManager,
+        task_queue: TaskQueue,
     ) -> None:
         self._user_gateway = user_command_gateway
         self._repo = password_reset_repo
         self._tx = transaction_manager
+        self._task_queue = task_queue
 
     async def execute(self, request: ForgotPasswordRequest) -> None:
         user = await self._user_gateway.read_by_email(Email(request.email))
@@ -55,26 +56,16 @@ class ForgotPasswordHandler:
         token = token_urlsafe(32)
         expires_at = datetime.utcnow() + timedelta(hours=24)
         await self._repo.add(user_id=user.id_.value, token=token, expires_at=expires_at)
+        # Templated task, so reset bursts can share Mailgun batch calls.
+        await self._task_queue.enqueue(
+            "tasks.email_tasks.send_password_reset_email",
+            {
+                "to_email": user.email.value,
+                "reset_token": token,
+            },
+        )
         await self._tx.commit()
 
-        try:
-            subject = "Password reset request"
-            body = (
-                "Use the code below to reset your password\n"
-                f"{token}\n\n"
-                "If you did not request this, you can ignore this email."
-            )
-            celery_app.send_task(
-                "tasks.email_tasks.send_email",
-                kwargs={
-                    "to_email": user.email.value,
-                    "subject": subject,
-                    "body": body,
-                },
-            )
-        except Exception as e:  # noqa: BLE001
-            log.warning("Failed to enqueue password reset email: %s", e)
-
 
 class ResetPasswordHandler:
     def __init__(
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import TypedDict
 
 from app.application.common.ports.flusher import Flusher
+from app.application.common.ports.task_queue import TaskQueue
 from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.services.current_user import CurrentUserService
@@ -29,7 +30,6 @@ from app.application.common.ports.session_recorder import SessionRecorder
 from app.application.common.ports.country_query_gateway import CountryQueryGateway
 from app.application.common.ports.city_query_gateway import CityQueryGateway
 from app.application.common.ports.email_verification_repository import EmailVerificationRepository
-from app.infrastructure.celery.app import celery_app
 
 log = logging.getLogger(__name__)
 
@@ -77,7 +77,8 @@ class SignUpHandler:
         session_recorder: SessionRecorder,
         country_query_gateway: CountryQueryGateway,
         city_query_gateway: CityQueryGateway,
-        email_verification_repo: EmailVerificationRepository):
+        email_verification_repo: EmailVerificationRepository,
+        task_queue: TaskQueue):
         self._current_user_service = current_user_service
         self._user_service = user_service
         self._user_command_gateway = user_command_gateway
@@ -88,6 +89,7 @@ class SignUpHandler:
         self._country_query_gateway = country_query_gateway
         self._city_query_gateway = city_query_gateway
         self._email_verification_repo = email_verification_repo
+        self._task_queue = task_queue
 
     async def execute(self, request_data: SignUpRequest) -> SignUpResponse:
         """
@@ -168,16 +170,15 @@ class SignUpHandler:
         token = token_urlsafe(32)
         expires_at = datetime.utcnow() + timedelta(hours=24)
         await self._email_verification_repo.add(user_id=user.id_.value, token=token, expires_at=expires_at)
-        try:
-            celery_app.send_task(
-                "tasks.email_tasks.send_verification_email",
-                kwargs={
-                    "to_email": user.email.value,
-                    "verification_url": token,
-                },
-            )
-        except Exception as e:  # noqa: BLE001
-            log.warning("Failed to enqueue verification email: %s", e)
+        # Outbox row commits together with the token; the relay publishes it.
+        await self._task_queue.enqueue(
+            "tasks.email_tasks.send_verification_email",
+            {
+                "to_email": user.email.value,
+                "verification_url": token,
+            },
+        )
+        await self._transaction_manager.commit()
         return SignUpResponse(
             id=user.id_.value,
             session_id=auth_session.id_,
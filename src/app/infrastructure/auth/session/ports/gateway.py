@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 from app.domain.value_objects.user_id import UserId
@@ -40,3 +41,9 @@ class AuthSessionGateway(Protocol):
         """
         :raises DataMapperError:
         """
+
+    @abstractmethod
+    async def delete_all_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        :raises DataMapperError:
+        """
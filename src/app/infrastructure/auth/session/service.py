@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 
 from app.domain.value_objects.user_id import UserId
@@ -25,6 +26,7 @@ from app.infrastructure.auth.session.ports.transaction_manager import (
 from app.infrastructure.auth.session.ports.transport import AuthSessionTransport
 from app.infrastructure.auth.session.timer_utc import UtcAuthSessionTimer
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.metrics.registry import record_cache_lookup
 
 log = logging.getLogger(__name__)
 
@@ -162,11 +164,32 @@ class AuthSessionService:
             user_id.value,
         )
 
+    async def invalidate_all_sessions_for_users(
+        self,
+        user_ids: Sequence[UserId],
+    ) -> None:
+        """
+        :raises DataMapperError:
+        """
+        log.debug(
+            "Invalidate all sessions for users: started. Users: %d.",
+            len(user_ids),
+        )
+
+        await self._auth_session_gateway.delete_all_for_users(user_ids)
+        await self._auth_transaction_manager.commit()
+
+        log.debug(
+            "Invalidate all sessions for users: done. Users: %d.",
+            len(user_ids),
+        )
+
     async def _load_current_session(self) -> AuthSession:
         """
         :raises AuthenticationError:
         """
         log.debug("Load current auth session: started. Auth session id: unknown.")
+        record_cache_lookup("auth_session", hit=self._cached_auth_session is not None)
         if self._cached_auth_session is not None:
             cached_auth_session = self._cached_auth_session
             log.debug(
@@ -1,15 +1,31 @@
 import os
+from typing import Final
+
 from celery import Celery
 
-from app.setup.config.settings import load_settings
+from app.infrastructure.celery import (
+    metrics as _metrics,  # noqa: F401  (signals)
+    tracing as _tracing,  # noqa: F401  (signals)
+)
+from app.infrastructure.celery.runtime import WorkerRuntimeStep
+
+# A mail task waits for its batch to reach Mailgun, so batching only merges
+# messages when many of them are in flight in one process. Their queue is
+# therefore consumed by a thread-pool worker (`--pool threads`, see
+# docker-compose); a prefork child would send every email on its own.
+MAIL_QUEUE: Final[str] = "mail"
+MAIL_TASK_ROUTES: Final[dict[str, dict[str, str]]] = {
+    "send_email": {"queue": MAIL_QUEUE},
+    "tasks.email_tasks.*": {"queue": MAIL_QUEUE},
+}
 
 
 def create_celery() -> Celery:
-    settings = load_settings()
-    celery_cfg = getattr(settings, "celery", {}) if hasattr(settings, "celery") else {}
-    app_name = os.getenv("CELERY_APP_NAME") or celery_cfg.get("app_name", "baseapi_hexagonal")
-    broker = os.getenv("CELERY_BROKER_URL") or celery_cfg.get("broker_url", None)
-    backend = os.getenv("CELERY_RESULT_BACKEND") or celery_cfg.get("result_backend", None)
+    # Broker settings come from the environment (see docker-compose), so building
+    # the app does not parse the TOML config or pull in the application graph.
+    app_name = os.getenv("CELERY_APP_NAME") or "baseapi_hexagonal"
+    broker = os.getenv("CELERY_BROKER_URL")
+    backend = os.getenv("CELERY_RESULT_BACKEND")
 
     app = Celery(
         app_name,
@@ -25,9 +41,9 @@ def create_celery() -> Celery:
     app.conf.result_serializer = "json"
     app.conf.timezone = "UTC"
     app.conf.enable_utc = True
+    app.conf.task_routes = MAIL_TASK_ROUTES
+    app.steps["worker"].add(WorkerRuntimeStep)
     return app
 
 
 celery_app = create_celery()
-
-
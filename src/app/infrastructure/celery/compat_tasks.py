@@ -1,46 +1,69 @@
 import logging
-from typing import Any
+from typing import Any, Final
 
-import requests
+from celery import Task
 
 from app.infrastructure.celery.app import celery_app
-from app.setup.config.settings import load_settings
-from app.setup.ioc.application import ApplicationProvider
-from app.setup.ioc.infrastructure import infrastructure_provider
-from app.setup.ioc.presentation import PresentationProvider
-from app.setup.ioc.settings import SettingsProvider
-from app.setup.app_factory import create_async_ioc_container
+from app.infrastructure.celery.mail import delivery_timeout_s, get_mail_batcher
+from app.setup.config.settings import get_settings_snapshot
 
 log = logging.getLogger(__name__)
 
-
-def _send_email_via_mailgun(to_email: str, subject: str, body: str) -> None:
-    settings = load_settings()
-    mailgun = getattr(settings, "mailgun", None)
+# Acknowledged only after the task returned, so a message whose worker
+# died mid-delivery is redelivered rather than lost.
+MAIL_TASK_OPTIONS: Final[dict[str, Any]] = {
+    "bind": True,
+    "acks_late": True,
+    "reject_on_worker_lost": True,
+}
+
+
+def _send_email_via_mailgun(
+    task: Task,
+    to_email: str,
+    subject: str,
+    text: str,
+    variables: dict[str, str] | None = None,
+) -> None:
+    """
+    Hands the message to the process-wide batcher and waits for its batch,
+    so the task is only acknowledged once Mailgun accepted it. Retryable
+    failures are retried through the broker with exponential backoff.
+    """
+    # Celery owns SIGHUP in workers, so config edits are picked up by mtime.
+    snapshot = get_settings_snapshot()
+    snapshot.reload_if_modified()
+    mailgun = snapshot.current.mailgun
     if not mailgun:
         log.info("Mailgun not configured; skipping email to %s. Subject: %s", to_email, subject)
         return
-    domain = getattr(mailgun, "domain", None)
-    api_key = getattr(mailgun, "api_key", None)
-    if not (domain and api_key):
+    if not (mailgun.domain and mailgun.api_key):
         log.info("Mailgun keys missing; skipping email to %s. Subject: %s", to_email, subject)
         return
+    from app.infrastructure.email.mailgun import (
+        EmailMessage,
+        MailgunDeliveryError,
+        retry_backoff_s,
+    )
+
+    delivered = get_mail_batcher(mailgun).submit(
+        EmailMessage(
+            to=to_email,
+            subject=subject,
+            text=text,
+            variables=variables or {},
+        ),
+    )
     try:
-        resp = requests.post(
-            f"https://api.mailgun.net/v3/{domain}/messages",
-            auth=("api", api_key),
-            data={
-                "from": f"noreply@{domain}",
-                "to": [to_email],
-                "subject": subject,
-                "text": body,
-            },
-            timeout=10,
-        )
-        if resp.status_code >= 300:
-            log.warning("Mailgun send failed (%s): %s", resp.status_code, resp.text)
-    except Exception as e:  # noqa: BLE001
-        log.warning("Mailgun exception: %s", e)
+        delivered.result(timeout=delivery_timeout_s(mailgun))
+    except (MailgunDeliveryError, TimeoutError) as e:
+        if isinstance(e, MailgunDeliveryError) and not e.retryable:
+            raise
+        raise task.retry(
+            exc=e,
+            countdown=retry_backoff_s(task.request.retries),
+            max_retries=mailgun.max_attempts - 1,
+        ) from e
 
 
 def _safe_get(d: dict[str, Any], key: str, default: str = "") -> str:
@@ -48,63 +71,104 @@ def _safe_get(d: dict[str, Any], key: str, default: str = "") -> str:
     return v if isinstance(v, str) else default
 
 
-@celery_app.task(name="send_email")
-def send_email_compat(to_email: str | None = None, subject: str | None = None, body: str | None = None, **_: Any) -> None:
+def _send_email(
+    task: Task,
+    to_email: str | None,
+    subject: str | None,
+    body: str | None,
+) -> None:
     if not to_email or not subject or not body:
         log.info("send_email called with missing args; to=%s subject=%s", to_email, subject)
         return
-    _send_email_via_mailgun(to_email, subject, body)
+    _send_email_via_mailgun(task, to_email, subject, body)
 
 
-@celery_app.task(name="tasks.email_tasks.send_email")
-def send_email_namespaced(**kwargs: Any) -> None:
-    send_email_compat(
+@celery_app.task(name="send_email", **MAIL_TASK_OPTIONS)
+def send_email_compat(
+    self: Task,
+    to_email: str | None = None,
+    subject: str | None = None,
+    body: str | None = None,
+    **_: Any,
+) -> None:
+    _send_email(self, to_email, subject, body)
+
+
+@celery_app.task(name="tasks.email_tasks.send_email", **MAIL_TASK_OPTIONS)
+def send_email_namespaced(self: Task, **kwargs: Any) -> None:
+    _send_email(
+        self,
         to_email=_safe_get(kwargs, "to_email"),
         subject=_safe_get(kwargs, "subject"),
         body=_safe_get(kwargs, "body"),
     )
 
 
-@celery_app.task(name="tasks.email_tasks.send_password_change_notification")
-def send_password_change_notification(**kwargs: Any) -> None:
+@celery_app.task(
+    name="tasks.email_tasks.send_password_change_notification",
+    **MAIL_TASK_OPTIONS,
+)
+def send_password_change_notification(self: Task, **kwargs: Any) -> None:
     to_email = _safe_get(kwargs, "to_email")
     username = _safe_get(kwargs, "username")
     ip = _safe_get(kwargs, "ip_address")
     ua = _safe_get(kwargs, "user_agent")
     subject = "Password Changed"
     body = (
-        f"Hello {username},\n\nYour password was changed.\n"
-        f"IP: {ip}\nUser-Agent: {ua}\n\nIf this was not you, contact support."
+        "Hello %recipient.username%,\n\nYour password was changed.\n"
+        "IP: %recipient.ip_address%\nUser-Agent: %recipient.user_agent%\n\n"
+        "If this was not you, contact support."
     )
     if to_email:
-        _send_email_via_mailgun(to_email, subject, body)
+        _send_email_via_mailgun(
+            self,
+            to_email,
+            subject,
+            body,
+            {"username": username, "ip_address": ip, "user_agent": ua},
+        )
 
 
-@celery_app.task(name="tasks.email_tasks.send_verification_email")
-def send_verification_email(**kwargs: Any) -> None:
+@celery_app.task(name="tasks.email_tasks.send_verification_email", **MAIL_TASK_OPTIONS)
+def send_verification_email(self: Task, **kwargs: Any) -> None:
     to_email = _safe_get(kwargs, "to_email")
     verification_url = _safe_get(kwargs, "verification_url")
     subject = "Verify your email"
     body = (
         "use the code below to verify your email\n"
-        f"{verification_url}\n\n"
+        "%recipient.verification_url%\n\n"
     )
     if to_email and verification_url:
-        _send_email_via_mailgun(to_email, subject, body)
+        _send_email_via_mailgun(
+            self,
+            to_email,
+            subject,
+            body,
+            {"verification_url": verification_url},
+        )
 
 
-@celery_app.task(name="tasks.email_tasks.send_password_reset_email")
-def send_password_reset_email(**kwargs: Any) -> None:
+@celery_app.task(
+    name="tasks.email_tasks.send_password_reset_email",
+    **MAIL_TASK_OPTIONS,
+)
+def send_password_reset_email(self: Task, **kwargs: Any) -> None:
     to_email = _safe_get(kwargs, "to_email")
     reset_token = _safe_get(kwargs, "reset_token")
     subject = "Password reset request"
     body = (
         "Use the code below to reset your password\n"
-        f"{reset_token}\n\n"
+        "%recipient.reset_token%\n\n"
         "If you did not request this, you can ignore this email."
     )
     if to_email and reset_token:
-        _send_email_via_mailgun(to_email, subject, body)
+        _send_email_via_mailgun(
+            self,
+            to_email,
+            subject,
+            body,
+            {"reset_token": reset_token},
+        )
 
 
 @celery_app.task(name="invalidate_all_sessions")
@@ -0,0 +1,12 @@
+from typing import Any
+
+
+def message_header(request: Any, name: str) -> Any:
+    """
+    Custom headers end up on the task request itself or, depending on the
+    protocol and the worker, in its `headers`.
+    """
+    value = request.get(name)
+    if value is None:
+        value = (request.get("headers") or {}).get(name)
+    return value
@@ -0,0 +1,73 @@
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+from app.setup.config.mailgun import MailgunSettings
+
+if TYPE_CHECKING:
+    from app.infrastructure.email.mailgun import MailBatcher
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_batcher: "MailBatcher | None" = None
+_batcher_settings: MailgunSettings | None = None
+_batcher_pid: int | None = None
+
+
+def delivery_timeout_s(settings: MailgunSettings) -> float:
+    """
+    How long a task waits for its batch: the window, plus the batches
+    queued ahead of it in the same process.
+    """
+    return settings.batch_window_ms / 1000 + 3 * settings.timeout_s
+
+
+def get_mail_batcher(settings: MailgunSettings) -> "MailBatcher":
+    """
+    One pooled transport and batcher per worker process, rebuilt when the
+    Mailgun settings change.
+    """
+    global _batcher, _batcher_settings, _batcher_pid
+    # requests is only loaded by workers that actually send mail.
+    from app.infrastructure.email.mailgun import MailBatcher, MailgunTransport
+
+    with _lock:
+        if (
+            _batcher is not None
+            and _batcher_pid == os.getpid()
+            and _batcher_settings == settings
+        ):
+            return _batcher
+        if _batcher is not None and _batcher_pid == os.getpid():
+            _batcher.stop()
+        transport = MailgunTransport(
+            domain=settings.domain,
+            api_key=settings.api_key,
+            base_url=settings.base_url,
+            timeout_s=settings.timeout_s,
+            pool_size=settings.pool_size,
+        )
+        _batcher = MailBatcher(
+            transport.send_batch,
+            window_s=settings.batch_window_ms / 1000,
+            max_batch_size=settings.max_batch_size,
+        )
+        _batcher_settings = settings
+        _batcher_pid = os.getpid()
+        log.debug("Mail batcher started in process %s.", _batcher_pid)
+        return _batcher
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_mail_batcher(**_: Any) -> None:
+    global _batcher, _batcher_settings
+    with _lock:
+        if _batcher is not None and _batcher_pid == os.getpid():
+            _batcher.stop()
+        _batcher = None
+        _batcher_settings = None
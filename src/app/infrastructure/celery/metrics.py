@@ -0,0 +1,87 @@
+"""
+Task runtime and queue lag, recorded through Celery signals. Publishers
+stamp each message with its publish time; the worker observes the lag
+when the task starts. Set `CELERY_METRICS_PORT` to serve the metrics
+from the main worker process, which reads every pool process's samples
+when `PROMETHEUS_MULTIPROC_DIR` is set.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Final
+
+from celery.signals import (
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_shutdown,
+)
+
+from app.infrastructure.celery.headers import message_header
+from app.infrastructure.metrics.registry import (
+    CELERY_TASK_DURATION,
+    CELERY_TASK_QUEUE_LAG,
+    mark_process_dead,
+    metrics_registry,
+)
+
+log = logging.getLogger(__name__)
+
+METRICS_PORT_ENV: Final[str] = "CELERY_METRICS_PORT"
+PUBLISHED_AT_HEADER: Final[str] = "published_at"
+
+# Start times by task ID; thread pools run several tasks at once.
+_started: dict[str, float] = {}
+
+
+def _published_at(request: Any) -> float | None:
+    published_at = message_header(request, PUBLISHED_AT_HEADER)
+    return float(published_at) if published_at is not None else None
+
+
+@before_task_publish.connect
+def _stamp_published_at(headers: dict[str, Any] | None = None, **_: Any) -> None:
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def _task_started(task_id: str, task: Any, **_: Any) -> None:
+    _started[task_id] = time.perf_counter()
+    published_at = _published_at(task.request)
+    if published_at is not None:
+        CELERY_TASK_QUEUE_LAG.labels(task.name).observe(
+            max(0.0, time.time() - published_at)
+        )
+
+
+@task_postrun.connect
+def _task_finished(
+    task_id: str,
+    task: Any,
+    state: str | None = None,
+    **_: Any,
+) -> None:
+    started = _started.pop(task_id, None)
+    if started is not None:
+        CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
+
+
+@worker_init.connect
+def _serve_metrics(**_: Any) -> None:
+    port = os.getenv(METRICS_PORT_ENV)
+    if not port:
+        return
+    from prometheus_client import start_http_server
+
+    start_http_server(int(port), registry=metrics_registry())
+    log.info("Serving worker metrics on port %s.", port)
+
+
+@worker_process_shutdown.connect
+def _forget_pool_process(**_: Any) -> None:
+    mark_process_dead()
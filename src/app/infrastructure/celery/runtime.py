@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from celery import bootsteps
+from celery.signals import worker_process_init, worker_process_shutdown
+from dishka import AsyncContainer
+
+from app.infrastructure.tracing.tracer import (
+    SpanContext,
+    current_span_context,
+    get_tracer,
+    use_span_context,
+)
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def create_worker_container() -> AsyncContainer:
+    from app.infrastructure.tracing.instrument import instrument_providers
+    from app.setup.app_factory import create_async_ioc_container
+    from app.setup.config.settings import get_settings_snapshot
+    from app.setup.config.tracing import configure_tracing
+    from app.setup.ioc.provider_registry import get_providers
+
+    snapshot = get_settings_snapshot()
+    providers = get_providers()
+    if configure_tracing(snapshot.current.tracing):
+        instrument_providers(providers)
+    return create_async_ioc_container(
+        providers=providers,
+        settings=snapshot.current,
+        snapshot=snapshot,
+    )
+
+
+class WorkerRuntime:
+    """
+    One event loop, one IoC container (and therefore one engine and pool)
+    per worker process. The loop lives in a daemon thread so tasks from any
+    pool implementation (prefork, solo, threads) can submit coroutines to it.
+    """
+
+    def __init__(
+        self,
+        container_factory: Callable[[], AsyncContainer] | None = None,
+    ) -> None:
+        self.pid = os.getpid()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="celery-worker-loop",
+            daemon=True,
+        )
+        self._thread.start()
+        self._container = (container_factory or create_worker_container)()
+        log.info("Worker runtime started in process %s.", self.pid)
+
+    def run(self, coro_factory: Callable[[AsyncContainer], Awaitable[T]]) -> T:
+        future = asyncio.run_coroutine_threadsafe(
+            # The loop thread does not share our context; carry the task's span.
+            self._run_in_request_scope(coro_factory, current_span_context()),
+            self._loop,
+        )
+        return future.result()
+
+    async def _run_in_request_scope(
+        self,
+        coro_factory: Callable[[AsyncContainer], Awaitable[T]],
+        span_context: SpanContext | None = None,
+    ) -> T:
+        with use_span_context(span_context):
+            async with self._container() as request_container:
+                return await coro_factory(request_container)
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._container.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        get_tracer().shutdown()
+        log.info("Worker runtime stopped in process %s.", self.pid)
+
+
+_runtime: WorkerRuntime | None = None
+_runtime_lock = threading.Lock()
+
+
+def get_worker_runtime() -> WorkerRuntime:
+    """
+    Returns the runtime of the current process, starting it if needed.
+    A runtime inherited through `fork` is never reused.
+    """
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None or _runtime.pid != os.getpid():
+            _runtime = WorkerRuntime()
+        return _runtime
+
+
+def stop_worker_runtime() -> None:
+    global _runtime
+    with _runtime_lock:
+        if _runtime is not None and _runtime.pid == os.getpid():
+            _runtime.close()
+        _runtime = None
+
+
+@worker_process_init.connect
+def _start_in_pool_process(**_: Any) -> None:
+    get_worker_runtime()
+
+
+@worker_process_shutdown.connect
+def _stop_in_pool_process(**_: Any) -> None:
+    stop_worker_runtime()
+
+
+class WorkerRuntimeStep(bootsteps.StartStopStep):
+    """
+    Starts the runtime with the worker for pools that execute tasks in the
+    main process. Prefork children start their own on `worker_process_init`;
+    starting one in the parent would only leak a loop thread into the forks.
+    """
+
+    def start(self, parent: Any) -> None:
+        if _runs_tasks_in_main_process(parent):
+            get_worker_runtime()
+
+    def stop(self, parent: Any) -> None:
+        if _runs_tasks_in_main_process(parent):
+            stop_worker_runtime()
+
+
+def _runs_tasks_in_main_process(worker: Any) -> bool:
+    pool_cls = getattr(worker, "pool_cls", None)
+    pool_module = getattr(pool_cls, "__module__", str(pool_cls))
+    return "prefork" not in pool_module
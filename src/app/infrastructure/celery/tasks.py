@@ -1,73 +1,196 @@
-import asyncio
-from dishka import Scope
+from datetime import datetime, timezone
+from typing import Any, Final
+
 from celery.schedules import crontab
 
 from app.infrastructure.celery.app import celery_app
-from app.setup.ioc.provider_registry import get_providers
-from app.setup.ioc.application import ApplicationProvider
-from app.setup.ioc.infrastructure import infrastructure_provider
-from app.setup.ioc.presentation import PresentationProvider
-from app.setup.ioc.settings import SettingsProvider
-from app.setup.app_factory import create_async_ioc_container
-from app.setup.config.settings import load_settings
-from app.application.maintenance.tasks import (
-    CleanupExpiredPasswordResetsTask,
-    CleanupExpiredSessionsTask,
-)
-
-
-async def _run_task(coro_factory):
-    settings = load_settings()
-    container = create_async_ioc_container(
-        providers=(
-            ApplicationProvider(),
-            infrastructure_provider(),
-            PresentationProvider(),
-            SettingsProvider(),
-        ),
-        settings=settings,
-    )
-    try:
-        # Enter request scope so REQUEST-scoped providers can be resolved
-        async with container() as request_container:  # type: ignore[misc]
-            await coro_factory(request_container)
-    finally:
-        await container.close()
-
-
-@celery_app.task(name="cleanup_expired_sessions")
-def cleanup_expired_sessions():
+from app.infrastructure.celery.runtime import get_worker_runtime
+from app.application.maintenance.ports import CleanupTarget
+from app.infrastructure.tracing.tracer import TRACEPARENT_HEADER
+
+OUTBOX_RELAY_INTERVAL_S: Final[float] = 2.0
+OUTBOX_RELAY_BATCH_SIZE: Final[int] = 500
+OUTBOX_RELAY_TIME_BUDGET_S: Final[float] = 1.5
+
+# Small batches keep each DELETE's locks and WAL short; the budget keeps a
+# backlog from occupying a worker for longer than one schedule interval.
+CLEANUP_INTERVAL_MIN: Final[int] = 15
+CLEANUP_BATCH_SIZE: Final[int] = 1000
+CLEANUP_TIME_BUDGET_S: Final[float] = 60.0
+CLEANUP_PAUSE_S: Final[float] = 0.05
+
+# Partitions are prepared months ahead, so a daily run has ample slack.
+PARTITION_MAINTENANCE_SCHEDULE: Final = crontab(hour=0, minute=30)
+
+# One multi-row insert and one counter upsert per chunk.
+FAN_OUT_CHUNK_SIZE: Final[int] = 5000
+
+# Webhooks are acknowledged on receipt; the inbox is drained shortly after.
+BILLING_EVENTS_INTERVAL_S: Final[float] = 2.0
+BILLING_EVENTS_BATCH_SIZE: Final[int] = 500
+BILLING_EVENTS_TIME_BUDGET_S: Final[float] = 1.5
+
+
+def _run_task(coro_factory):
+    # The loop, container and engine are owned by the worker process;
+    # each task only opens (and closes) a request scope.
+    return get_worker_runtime().run(coro_factory)
+
+
+@celery_app.task(name="cleanup_expired_records")
+def cleanup_expired_records(target: str):
+    async def runner(container):
+        from app.application.maintenance.ports import ExpiredRecordsPurger
+        from app.application.maintenance.tasks import PurgeExpiredRecordsTask
+
+        purger = await container.get(ExpiredRecordsPurger)
+        report = await PurgeExpiredRecordsTask(purger).run(
+            CleanupTarget(target),
+            batch_size=CLEANUP_BATCH_SIZE,
+            time_budget_s=CLEANUP_TIME_BUDGET_S,
+            pause_s=CLEANUP_PAUSE_S,
+        )
+        return {
+            "deleted": report.deleted,
+            "rows_per_second": round(report.rows_per_second, 1),
+            "finished": report.finished,
+        }
+
+    return _run_task(runner)
+
+
+@celery_app.task(name="maintain_partitions")
+def maintain_partitions():
     async def runner(container):
-        from app.application.maintenance.ports import AuthSessionRepository
+        from app.infrastructure.maintenance.partitions_sqla import (
+            SqlaPartitionMaintainer,
+        )
 
-        repo = await container.get(AuthSessionRepository)
-        task = CleanupExpiredSessionsTask(repo)
-        await task.run()
+        maintainer = await container.get(SqlaPartitionMaintainer)
+        report = await maintainer.maintain(datetime.now(tz=timezone.utc))
+        return {
+            "created": report.created,
+            "detached": report.detached,
+            "dropped": report.dropped,
+            "failed": report.failed,
+        }
 
-    asyncio.run(_run_task(runner))
+    return _run_task(runner)
 
 
-@celery_app.task(name="cleanup_expired_password_resets")
-def cleanup_expired_password_resets():
+@celery_app.task(name="fan_out_notification", bind=True)
+def fan_out_notification(self, audience: dict[str, Any], template: dict[str, Any]):
+    """
+    Progress is published as the `PROGRESS` state of the task's result.
+    """
+
     async def runner(container):
-        from app.application.maintenance.ports import PasswordResetRepository
+        from app.application.notification.ports import (
+            NotificationAudience,
+            NotificationFanOutWriter,
+            NotificationTemplate,
+        )
+        from app.application.notification.tasks import (
+            FanOutNotificationsTask,
+            FanOutReport,
+        )
+
+        def report_progress(progress: FanOutReport) -> None:
+            self.update_state(
+                state="PROGRESS",
+                meta={"written": progress.written, "chunks": progress.chunks},
+            )
 
-        repo = await container.get(PasswordResetRepository)
-        task = CleanupExpiredPasswordResetsTask(repo)
-        await task.run()
+        writer = await container.get(NotificationFanOutWriter)
+        report = await FanOutNotificationsTask(writer).run(
+            NotificationAudience(**audience),
+            NotificationTemplate(**template),
+            chunk_size=FAN_OUT_CHUNK_SIZE,
+            on_progress=report_progress,
+        )
+        return {
+            "written": report.written,
+            "chunks": report.chunks,
+            "rows_per_second": round(report.rows_per_second, 1),
+        }
 
-    asyncio.run(_run_task(runner))
+    return _run_task(runner)
+
+
+def _publish(task_name: str, kwargs: dict[str, Any], traceparent: str | None) -> None:
+    headers = {TRACEPARENT_HEADER: traceparent} if traceparent else None
+    celery_app.send_task(task_name, kwargs=kwargs, headers=headers)
+
+
+@celery_app.task(name="relay_outbox")
+def relay_outbox():
+    async def runner(container):
+        from app.infrastructure.outbox.relay_sqla import SqlaOutboxRelay
+
+        relay = await container.get(SqlaOutboxRelay)
+        return await relay.drain(
+            _publish,
+            batch_size=OUTBOX_RELAY_BATCH_SIZE,
+            time_budget_s=OUTBOX_RELAY_TIME_BUDGET_S,
+        )
+
+    return _run_task(runner)
+
+
+@celery_app.task(name="apply_billing_events")
+def apply_billing_events():
+    async def runner(container):
+        from app.application.common.ports.transaction_manager import (
+            TransactionManager,
+        )
+        from app.application.subscription.ports import (
+            BillingEventInbox,
+            BillingStateWriter,
+        )
+        from app.application.subscription.tasks import ApplyBillingEventsTask
+
+        report = await ApplyBillingEventsTask(
+            await container.get(BillingEventInbox),
+            await container.get(BillingStateWriter),
+            await container.get(TransactionManager),
+        ).run(
+            batch_size=BILLING_EVENTS_BATCH_SIZE,
+            time_budget_s=BILLING_EVENTS_TIME_BUDGET_S,
+        )
+        return {
+            "applied": report.applied,
+            "failed": report.failed,
+            "batches": report.batches,
+            "finished": report.finished,
+        }
+
+    return _run_task(runner)
 
 
 celery_app.conf.beat_schedule = {
-    "cleanup-expired-sessions": {
-        "task": "cleanup_expired_sessions",
-        "schedule": crontab(hour=0, minute=0),
+    "relay-outbox": {
+        "task": "relay_outbox",
+        "schedule": OUTBOX_RELAY_INTERVAL_S,
+        # A relay run that could not start in time is superseded by the next.
+        "options": {"expires": OUTBOX_RELAY_INTERVAL_S},
     },
-    "cleanup-expired-password-resets": {
-        "task": "cleanup_expired_password_resets",
-        "schedule": crontab(minute=0),
+    "apply-billing-events": {
+        "task": "apply_billing_events",
+        "schedule": BILLING_EVENTS_INTERVAL_S,
+        "options": {"expires": BILLING_EVENTS_INTERVAL_S},
+    },
+    "maintain-partitions": {
+        "task": "maintain_partitions",
+        "schedule": PARTITION_MAINTENANCE_SCHEDULE,
+    },
+    # Staggered by a minute so the tables are not purged all at once.
+    **{
+        f"cleanup-expired-{target.replace('_', '-')}": {
+            "task": "cleanup_expired_records",
+            "schedule": crontab(minute=f"{offset}-59/{CLEANUP_INTERVAL_MIN}"),
+            "kwargs": {"target": target.value},
+            "options": {"expires": CLEANUP_INTERVAL_MIN * 60},
+        }
+        for offset, target in enumerate(CleanupTarget)
     },
 }
-
-
@@ -0,0 +1,86 @@
+"""
+Publish and run spans for Celery tasks, joined through a `traceparent`
+message header: the run span of a task is a child of the span that sent
+it, so a request and the tasks it triggers share one trace.
+"""
+
+from contextvars import Token
+from typing import Any
+
+from celery.signals import (
+    after_task_publish,
+    before_task_publish,
+    task_postrun,
+    task_prerun,
+)
+
+from app.infrastructure.celery.headers import message_header
+from app.infrastructure.tracing.tracer import (
+    TRACEPARENT_HEADER,
+    Span,
+    SpanContext,
+    SpanKind,
+    attach,
+    detach,
+    format_traceparent,
+    get_tracer,
+    parse_traceparent,
+)
+
+# Open spans by task ID; thread pools run several tasks at once.
+_publishing: dict[str, Span] = {}
+_running: dict[str, tuple[Span, Token[SpanContext | None]]] = {}
+
+
+@before_task_publish.connect
+def _start_publish_span(
+    sender: str | None = None,
+    headers: dict[str, Any] | None = None,
+    **_: Any,
+) -> None:
+    if headers is None:
+        return
+    # Outbox messages carry the trace of the request that enqueued them.
+    span = get_tracer().start_span(
+        f"celery.publish {sender}",
+        kind=SpanKind.PRODUCER,
+        parent=parse_traceparent(headers.get(TRACEPARENT_HEADER)),
+        attributes={"messaging.system": "celery", "celery.task": sender},
+    )
+    headers[TRACEPARENT_HEADER] = format_traceparent(span.context)
+    if span.context.sampled and headers.get("id"):
+        _publishing[headers["id"]] = span
+
+
+@after_task_publish.connect
+def _end_publish_span(headers: dict[str, Any] | None = None, **_: Any) -> None:
+    task_id = (headers or {}).get("id")
+    span = _publishing.pop(task_id, None) if isinstance(task_id, str) else None
+    if span is not None:
+        get_tracer().end_span(span)
+
+
+@task_prerun.connect
+def _start_run_span(task_id: str, task: Any, **_: Any) -> None:
+    parent = parse_traceparent(message_header(task.request, TRACEPARENT_HEADER))
+    span = get_tracer().start_span(
+        f"celery.run {task.name}",
+        kind=SpanKind.CONSUMER,
+        parent=parent,
+        attributes={"messaging.system": "celery", "celery.task_id": task_id},
+    )
+    # Tasks handing work to the worker loop carry this context along.
+    _running[task_id] = (span, attach(span.context))
+
+
+@task_postrun.connect
+def _end_run_span(task_id: str, state: str | None = None, **_: Any) -> None:
+    running = _running.pop(task_id, None)
+    if running is None:
+        return
+    span, token = running
+    detach(token)
+    span.set_attribute("celery.state", state or "UNKNOWN")
+    if state == "FAILURE":
+        span.error = "Task failed"
+    get_tracer().end_span(span)
@@ -0,0 +1,223 @@
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Final
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+MAILGUN_MAX_RECIPIENTS: Final[int] = 1000
+MAX_BACKOFF_S: Final[float] = 300.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EmailMessage:
+    """
+    `text` may reference `%recipient.<name>%` placeholders filled from
+    `variables`; messages with the same subject and text can share one
+    Mailgun batch call.
+    """
+
+    to: str
+    subject: str
+    text: str
+    variables: Mapping[str, str] = field(default_factory=dict)
+
+
+class MailgunDeliveryError(Exception):
+    def __init__(self, message: str, *, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class MailgunTransport:
+    """
+    Sends through a single pooled HTTP session, so bursts reuse a handful of
+    TLS connections instead of opening one per email.
+    """
+
+    def __init__(
+        self,
+        *,
+        domain: str,
+        api_key: str,
+        base_url: str,
+        timeout_s: float,
+        pool_size: int,
+    ) -> None:
+        self._url = f"{base_url.rstrip('/')}/{domain}/messages"
+        self._sender = f"noreply@{domain}"
+        self._timeout_s = timeout_s
+        self._session = requests.Session()
+        self._session.auth = ("api", api_key)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> None:
+        """
+        All messages must share subject and text and have distinct recipients.
+
+        :raises MailgunDeliveryError:
+        """
+        first = messages[0]
+        data = {
+            "from": self._sender,
+            "to": [message.to for message in messages],
+            "subject": first.subject,
+            "text": first.text,
+            # Also keeps each recipient from seeing the others in `To`.
+            "recipient-variables": orjson.dumps(
+                {message.to: dict(message.variables) for message in messages},
+            ).decode(),
+        }
+        try:
+            response = self._session.post(self._url, data=data, timeout=self._timeout_s)
+        except requests.RequestException as e:
+            raise MailgunDeliveryError(str(e), retryable=True) from e
+        status = response.status_code
+        if status >= HTTPStatus.MULTIPLE_CHOICES:
+            raise MailgunDeliveryError(
+                f"Mailgun responded {status}: {response.text}",
+                retryable=(
+                    status == HTTPStatus.TOO_MANY_REQUESTS
+                    or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+                ),
+            )
+
+    def close(self) -> None:
+        self._session.close()
+
+
+@dataclass(slots=True)
+class _Pending:
+    message: EmailMessage
+    due_at: float
+    delivered: "Future[None]" = field(default_factory=Future)
+
+
+def retry_backoff_s(retries: int, base_s: float = 1.0) -> float:
+    """Delay before retry number `retries + 1` of a failed delivery."""
+    return min(base_s * 2.0**retries, MAX_BACKOFF_S)
+
+
+class MailBatcher:
+    """
+    Collects messages for `window_s` and hands them to `send_batch` grouped
+    by subject and text. Each message is tried once: `submit` returns a
+    future that resolves when its batch was accepted, or fails with the
+    batch's `MailgunDeliveryError`. Callers wait on it before acknowledging
+    the message, and retry through their own queue, so nothing is lost with
+    the process.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[Sequence[EmailMessage]], None],
+        *,
+        window_s: float,
+        max_batch_size: int = MAILGUN_MAX_RECIPIENTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._send_batch = send_batch
+        self._window_s = window_s
+        self._max_batch_size = min(max_batch_size, MAILGUN_MAX_RECIPIENTS)
+        self._clock = clock
+        self._pending: list[_Pending] = []
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="mail-batcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, message: EmailMessage) -> "Future[None]":
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("Mail batcher is stopped.")
+            item = _Pending(message=message, due_at=self._clock() + self._window_s)
+            self._pending.append(item)
+            self._cond.notify()
+        return item.delivered
+
+    def stop(self, timeout_s: float | None = None) -> None:
+        """
+        Sends everything still queued right away, so waiting callers get
+        their result.
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join(timeout_s)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                due = self._wait_for_due()
+                if due is None:
+                    return
+            for batch in self._group(due):
+                self._deliver(batch)
+
+    def _wait_for_due(self) -> list[_Pending] | None:
+        """
+        Once the oldest message is due, every queued message rides along.
+        """
+        while True:
+            if self._pending and (
+                self._stopping
+                or len(self._pending) >= self._max_batch_size
+                or self._pending[0].due_at <= self._clock()
+            ):
+                due, self._pending = self._pending, []
+                return due
+            if self._stopping:
+                return None
+            timeout = (
+                self._pending[0].due_at - self._clock() if self._pending else None
+            )
+            self._cond.wait(timeout)
+
+    def _group(self, items: list[_Pending]) -> list[list[_Pending]]:
+        """
+        Recipient variables are keyed by address, so a recipient appears at
+        most once per batch.
+        """
+        groups: dict[tuple[str, str], list[tuple[list[_Pending], set[str]]]] = (
+            defaultdict(list)
+        )
+        for item in items:
+            chunks = groups[item.message.subject, item.message.text]
+            for chunk, recipients in chunks:
+                if (
+                    len(chunk) < self._max_batch_size
+                    and item.message.to not in recipients
+                ):
+                    break
+            else:
+                chunk, recipients = [], set()
+                chunks.append((chunk, recipients))
+            chunk.append(item)
+            recipients.add(item.message.to)
+        return [chunk for chunks in groups.values() for chunk, _ in chunks]
+
+    def _deliver(self, batch: list[_Pending]) -> None:
+        try:
+            self._send_batch([item.message for item in batch])
+        except MailgunDeliveryError as e:
+            error = e
+        except Exception as e:
+            error = MailgunDeliveryError(str(e), retryable=True)
+        else:
+            for item in batch:
+                item.delivered.set_result(None)
+            return
+        for item in batch:
+            item.delivered.set_exception(error)
@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+from app.infrastructure.metrics.registry import record_cache_lookup
+
+IDEMPOTENCY_CACHE_SIZE: Final[int] = 10_000
+
+IdempotencyCacheKey = tuple[int, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    fingerprint: str
+    result: Mapping[str, Any]
+    expires_at: float
+
+
+class IdempotencyCache:
+    """
+    Per-process LRU of completed results, so a retry burst is answered
+    without touching the database. Only completed keys are cached; their
+    stored result never changes until the key expires.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[IdempotencyCacheKey, CachedResult] = OrderedDict()
+
+    def get(self, key: IdempotencyCacheKey) -> CachedResult | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            del self._entries[key]
+            entry = None
+        record_cache_lookup("idempotency", hit=entry is not None)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: IdempotencyCacheKey,
+        *,
+        fingerprint: str,
+        result: Mapping[str, Any],
+        ttl_s: float,
+    ) -> None:
+        self._entries[key] = CachedResult(
+            fingerprint=fingerprint,
+            result=result,
+            expires_at=self._clock() + ttl_s,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
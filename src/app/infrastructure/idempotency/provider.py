@@ -0,0 +1,8 @@
+from app.infrastructure.idempotency.cache import (
+    IDEMPOTENCY_CACHE_SIZE,
+    IdempotencyCache,
+)
+
+
+def get_idempotency_cache() -> IdempotencyCache:
+    return IdempotencyCache(max_entries=IDEMPOTENCY_CACHE_SIZE)
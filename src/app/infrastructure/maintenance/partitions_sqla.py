@@ -0,0 +1,165 @@
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.persistence_sqla.partitioning import (
+    PARTITION_MONTHS_AHEAD,
+    PARTITION_SPECS,
+    PartitionSpec,
+    RetentionAction,
+    default_partition_name,
+    is_retired,
+    months_to_prepare,
+    parse_partition_month,
+    partition_bounds,
+    partition_name,
+    partition_of_clause,
+)
+
+log = logging.getLogger(__name__)
+
+# DDL below takes short exclusive locks; rather than queue every query on
+# the table behind a long-running reader, give up and retry on the next run.
+DDL_LOCK_TIMEOUT = "5s"
+
+
+@dataclass(slots=True)
+class PartitionMaintenanceReport:
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+_PartitionOperation = Callable[
+    [PartitionSpec, date, PartitionMaintenanceReport],
+    Awaitable[None],
+]
+
+
+class SqlaPartitionMaintainer:
+    """
+    Keeps `PARTITION_MONTHS_AHEAD` months of partitions ready and retires
+    the ones past retention. Every partition is handled in a transaction of
+    its own, so one lock timeout does not hold back the rest.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        self._session = session
+
+    async def maintain(
+        self,
+        now: datetime,
+        months_ahead: int = PARTITION_MONTHS_AHEAD,
+        specs: Sequence[PartitionSpec] = PARTITION_SPECS,
+    ) -> PartitionMaintenanceReport:
+        report = PartitionMaintenanceReport()
+        for spec in specs:
+            existing = await self._attached_months(spec)
+            if existing is None:
+                continue
+            for month in months_to_prepare(now, months_ahead):
+                if month not in existing:
+                    await self._run(spec, month, report, self._create)
+            for month in sorted(existing):
+                if is_retired(spec, month, now):
+                    await self._run(spec, month, report, self._retire)
+        log.info(
+            "Partition maintenance: created %s, detached %s, dropped %s, failed %s.",
+            report.created,
+            report.detached,
+            report.dropped,
+            report.failed,
+        )
+        return report
+
+    async def _attached_months(self, spec: PartitionSpec) -> set[date] | None:
+        """
+        `None` when the table is missing or not partitioned (not migrated).
+        """
+        rows = await self._session.execute(
+            text(
+                "SELECT c.relname FROM pg_class p "
+                "LEFT JOIN pg_inherits i ON i.inhparent = p.oid "
+                "LEFT JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE p.oid = to_regclass(:table) AND p.relkind = 'p'"
+            ),
+            {"table": spec.table},
+        )
+        names = rows.scalars().all()
+        await self._session.rollback()
+        if not names:
+            return None
+        months = (parse_partition_month(spec.table, name) for name in names if name)
+        return {month for month in months if month is not None}
+
+    async def _run(
+        self,
+        spec: PartitionSpec,
+        month: date,
+        report: PartitionMaintenanceReport,
+        operation: _PartitionOperation,
+    ) -> None:
+        name = partition_name(spec.table, month)
+        try:
+            await self._session.execute(
+                text(f"SET LOCAL lock_timeout = '{DDL_LOCK_TIMEOUT}'")
+            )
+            await operation(spec, month, report)
+            await self._session.commit()
+        except SQLAlchemyError as error:
+            await self._session.rollback()
+            log.warning("Partition maintenance of %s failed: %s", name, error)
+            report.failed.append(name)
+
+    async def _create(
+        self,
+        spec: PartitionSpec,
+        month: date,
+        report: PartitionMaintenanceReport,
+    ) -> None:
+        """
+        Built standalone and attached afterwards: rows for the month that
+        already landed in the default partition are moved into it first,
+        otherwise attaching would fail the default partition's constraint.
+        """
+        name = partition_name(spec.table, month)
+        lower, upper = partition_bounds(spec, month)
+        statements = (
+            f"CREATE TABLE {name} (LIKE {spec.table} INCLUDING DEFAULTS "
+            "INCLUDING CONSTRAINTS)",
+            f"WITH moved AS (DELETE FROM {default_partition_name(spec.table)} "
+            f"WHERE {spec.column} >= {lower} AND {spec.column} < {upper} "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+            f"ALTER TABLE {spec.table} ATTACH PARTITION {name} "
+            f"{partition_of_clause(spec, month)}",
+        )
+        for statement in statements:
+            await self._session.execute(text(statement))
+        report.created.append(name)
+
+    async def _retire(
+        self,
+        spec: PartitionSpec,
+        month: date,
+        report: PartitionMaintenanceReport,
+    ) -> None:
+        name = partition_name(spec.table, month)
+        await self._session.execute(
+            text(f"ALTER TABLE {spec.table} DETACH PARTITION {name}")
+        )
+        if spec.before_retire_sql is not None:
+            # Detached first, so no row can change in between.
+            await self._session.execute(
+                text(spec.before_retire_sql.format(partition=name))
+            )
+        if spec.action == RetentionAction.DROP:
+            await self._session.execute(text(f"DROP TABLE {name}"))
+            report.dropped.append(name)
+        else:
+            report.detached.append(name)
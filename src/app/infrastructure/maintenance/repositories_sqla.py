@@ -1,56 +1,114 @@
 from datetime import datetime
 
-from sqlalchemy import Delete, delete
+from sqlalchemy import Column, Delete, Select, delete, select
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.application.maintenance.ports import (
-    AuthSessionRepository,
-    PasswordResetRepository,
-)
+from app.application.maintenance.ports import CleanupTarget, ExpiredRecordsPurger
 from app.infrastructure.adapters.constants import DB_QUERY_FAILED
 from app.infrastructure.adapters.types import MainAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.infrastructure.persistence_sqla.mappings.auth_session import (
     auth_sessions_table,
 )
+from app.infrastructure.persistence_sqla.mappings.email_verification import (
+    map_email_verifications_table,
+)
+from app.infrastructure.persistence_sqla.mappings.idempotency_key import (
+    map_idempotency_keys_table,
+)
 from app.infrastructure.persistence_sqla.mappings.password_reset import (
     map_password_resets_table,
 )
+from app.infrastructure.persistence_sqla.mappings.session import (
+    map_sessions_table,
+)
+from app.infrastructure.persistence_sqla.mappings.stripe_event import (
+    map_stripe_events_table,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.timestamps import utc_for
 
 
-class SqlaAuthSessionRepository(AuthSessionRepository):
-    def __init__(self, session: MainAsyncSession):
-        self._session = session
+def _expiry_columns() -> dict[CleanupTarget, tuple[Column, Column]]:
+    """
+    `(primary key, expiry)` column pairs; each expiry column is indexed.
+    """
+    map_sessions_table()
+    map_password_resets_table()
+    map_email_verifications_table()
+    map_idempotency_keys_table()
+    map_stripe_events_table()
+    tables = mapping_registry.metadata.tables
+    sessions = tables["sessions"]  # type: ignore
+    password_resets = tables["password_resets"]  # type: ignore
+    email_verifications = tables["email_verifications"]  # type: ignore
+    idempotency_keys = tables["idempotency_keys"]  # type: ignore
+    stripe_events = tables["stripe_events"]  # type: ignore
+    return {
+        CleanupTarget.AUTH_SESSIONS: (
+            auth_sessions_table.c.id,
+            auth_sessions_table.c.expiration,
+        ),
+        CleanupTarget.SESSIONS: (sessions.c.id, sessions.c.expires_at),
+        CleanupTarget.PASSWORD_RESETS: (
+            password_resets.c.id,
+            password_resets.c.expires_at,
+        ),
+        CleanupTarget.EMAIL_VERIFICATIONS: (
+            email_verifications.c.id,
+            email_verifications.c.expires_at,
+        ),
+        CleanupTarget.IDEMPOTENCY_KEYS: (
+            idempotency_keys.c.id,
+            idempotency_keys.c.expires_at,
+        ),
+        CleanupTarget.STRIPE_EVENTS: (
+            stripe_events.c.id,
+            stripe_events.c.expires_at,
+        ),
+    }
 
-    async def delete_expired(self, now: datetime) -> int:
-        try:
-            stmt: Delete = delete(auth_sessions_table).where(
-                auth_sessions_table.c.expiration < now
-            )
-            result = await self._session.execute(stmt)
-            await self._session.commit()
-            return int(getattr(result, "rowcount", 0) or 0)
-        except SQLAlchemyError as error:
-            raise DataMapperError(DB_QUERY_FAILED) from error
+
+def build_delete_expired_batch(
+    pk: Column,
+    expiry: Column,
+    now: datetime,
+    limit: int,
+) -> Delete:
+    """
+    `DELETE ... WHERE pk IN (SELECT pk ... LIMIT n FOR UPDATE SKIP LOCKED)`:
+    each statement touches a bounded number of rows, and concurrent runs
+    (or writers holding a row) are stepped over instead of waited on.
+    """
+    batch: Select = (
+        select(pk)
+        .where(expiry < utc_for(expiry, now))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return delete(pk.table).where(pk.in_(batch.scalar_subquery()))
 
 
-class SqlaPasswordResetRepository(PasswordResetRepository):
+class SqlaExpiredRecordsPurger(ExpiredRecordsPurger):
     def __init__(self, session: MainAsyncSession):
         self._session = session
+        self._columns = _expiry_columns()
 
-    async def delete_expired(self, now: datetime) -> int:
+    async def delete_expired_batch(
+        self,
+        target: CleanupTarget,
+        now: datetime,
+        limit: int,
+    ) -> int:
+        """
+        :raises DataMapperError:
+        """
+        pk, expiry = self._columns[target]
         try:
-            # Ensure table is mapped, then fetch table from registry
-            map_password_resets_table()
-            pr_table = mapping_registry.metadata.tables["password_resets"]
-            stmt: Delete = delete(pr_table).where(
-                pr_table.c.expires_at < now
+            result = await self._session.execute(
+                build_delete_expired_batch(pk, expiry, now, limit)
             )
-            result = await self._session.execute(stmt)
             await self._session.commit()
             return int(getattr(result, "rowcount", 0) or 0)
         except SQLAlchemyError as error:
             raise DataMapperError(DB_QUERY_FAILED) from error
-
-
@@ -0,0 +1,110 @@
+"""
+Metrics shared by the API and the Celery workers.
+
+With several uvicorn or prefork workers, set `PROMETHEUS_MULTIPROC_DIR`
+to an empty, writable directory before the processes start: each one then
+writes its samples there and a scrape of any of them sums them up. The
+variable is read when `prometheus_client` is first imported, and the
+directory must be emptied on every deploy.
+"""
+
+import os
+from typing import Final
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROC_DIR_ENV: Final[str] = "PROMETHEUS_MULTIPROC_DIR"
+
+# Requests not matched by any route share one label value, so scanners
+# probing random paths cannot inflate the series count.
+UNMATCHED_ROUTE: Final[str] = "unmatched"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ("method", "route", "status"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being handled.",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity",
+    "Connections the pool may open: its size plus the allowed overflow.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS_OPEN = Gauge(
+    "db_pool_connections_open",
+    "Database connections held by the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Pooled connections in use by a session.",
+    multiprocess_mode="livesum",
+)
+
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "In-memory cache lookups, by cache and whether the entry was there.",
+    ("cache", "result"),
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent in bcrypt, during which the calling event loop is blocked.",
+    ("operation",),
+    buckets=(0.05, 0.1, 0.15, 0.2, 0.3, 0.5, 1),
+)
+
+CELERY_TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Time a worker spent running a task.",
+    ("task", "state"),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+CELERY_TASK_QUEUE_LAG = Histogram(
+    "celery_task_queue_lag_seconds",
+    "Time from publishing a task to a worker starting it.",
+    ("task",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+
+
+def record_cache_lookup(cache: str, *, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def metrics_registry() -> CollectorRegistry:
+    """What a scrape should read: every process's samples, or this one's."""
+    if not is_multiprocess():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int | None = None) -> None:
+    """Drops the live gauges of an exiting process from the shared files."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid if pid is not None else os.getpid())
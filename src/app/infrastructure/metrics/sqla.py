@@ -0,0 +1,37 @@
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from app.infrastructure.metrics.registry import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CONNECTIONS_CHECKED_OUT,
+    DB_POOL_CONNECTIONS_OPEN,
+)
+
+
+def install_pool_metrics(engine: Engine, *, capacity: int) -> None:
+    """
+    Tracks the pool through its events rather than reading it at scrape
+    time, which would only ever see the pool of the process scraped.
+    """
+    DB_POOL_CAPACITY.inc(capacity)
+
+    @event.listens_for(engine, "connect")
+    def _connect(*_: Any) -> None:
+        DB_POOL_CONNECTIONS_OPEN.inc()
+
+    @event.listens_for(engine, "close")
+    def _close(*_: Any) -> None:
+        DB_POOL_CONNECTIONS_OPEN.dec()
+
+    @event.listens_for(engine, "close_detached")
+    def _close_detached(*_: Any) -> None:
+        DB_POOL_CONNECTIONS_OPEN.dec()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(*_: Any) -> None:
+        DB_POOL_CONNECTIONS_CHECKED_OUT.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(*_: Any) -> None:
+        DB_POOL_CONNECTIONS_CHECKED_OUT.dec()
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationStreamConfig:
+    redis_url: str | None
+    channel: str
+    queue_size: int
+    heartbeat_s: float
+    max_connections: int
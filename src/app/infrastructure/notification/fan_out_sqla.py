@@ -0,0 +1,188 @@
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+from sqlalchemy import Insert, Select, Table, exists, false, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.application.notification.ports import (
+    NotificationAudience,
+    NotificationFanOutWriter,
+    NotificationPublisher,
+    NotificationTemplate,
+)
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.notification_repository_sqla import (
+    build_increment_unread,
+    unnest_user_ids,
+)
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.notification.config import NotificationStreamConfig
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    map_notifications_table,
+)
+from app.infrastructure.persistence_sqla.mappings.notification_counter import (
+    map_notification_counters_table,
+)
+from app.infrastructure.persistence_sqla.mappings.subscription_user import (
+    map_subscription_users_table,
+)
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def build_audience_query(
+    users: Table,
+    subscription_users: Table,
+    audience: NotificationAudience,
+) -> Select:
+    # EXISTS rather than a join: every user comes out once, which the
+    # counter upsert relies on.
+    stmt = select(users.c.id).order_by(users.c.id)
+    if audience.active_only:
+        stmt = stmt.where(
+            users.c.is_active.is_(True),
+            users.c.is_blocked.is_not(True),
+        )
+    if audience.country_id is not None:
+        stmt = stmt.where(users.c.country_id == audience.country_id)
+    if audience.subscription_id is not None:
+        stmt = stmt.where(
+            exists().where(
+                subscription_users.c.user_id == users.c.id,
+                subscription_users.c.subscription_id == audience.subscription_id,
+                subscription_users.c.status == "active",
+            )
+        )
+    return stmt
+
+
+def build_fan_out_insert(
+    notifications: Table,
+    user_ids: Sequence[int],
+    template: NotificationTemplate,
+    now: datetime,
+) -> Insert:
+    """
+    `INSERT ... SELECT ... FROM unnest(:user_ids)`: one multi-row insert per
+    chunk with a constant number of parameters.
+    """
+    recipients = unnest_user_ids(user_ids)
+    data_json = dict(template.data_json) if template.data_json is not None else None
+    rows = select(
+        recipients.c.user_id,
+        literal(template.title, notifications.c.title.type),
+        literal(template.action, notifications.c.action.type),
+        literal(data_json, notifications.c.data_json.type),
+        false(),
+        literal(now, notifications.c.created_at.type),
+        literal(now, notifications.c.updated_at.type),
+    )
+    return (
+        notifications.insert()
+        .from_select(
+            [
+                "user_id",
+                "title",
+                "action",
+                "data_json",
+                "is_read",
+                "created_at",
+                "updated_at",
+            ],
+            rows,
+        )
+        .returning(*notifications.c)
+    )
+
+
+def _publish_all(
+    publisher: NotificationPublisher,
+    notifications: Sequence[Mapping[str, Any]],
+) -> None:
+    for notification in notifications:
+        publisher.publish(notification["user_id"], notification)
+
+
+class SqlaNotificationFanOutWriter(NotificationFanOutWriter):
+    """
+    Recipients are read through a server-side cursor on a connection of
+    their own, because the per-chunk commits on the main session would end
+    the cursor's transaction. The cursor's snapshot is taken when the
+    stream starts, so users who sign up mid-broadcast are not included.
+
+    Fan-out runs in a worker, which holds no client streams: written
+    notifications are pushed only through the Redis bus. Without it they
+    are not pushed at all, and clients pick them up on their next fetch.
+    """
+
+    def __init__(
+        self,
+        session: MainAsyncSession,
+        engine: AsyncEngine,
+        publisher: NotificationPublisher,
+        config: NotificationStreamConfig,
+    ):
+        map_users_table()
+        map_subscription_users_table()
+        map_notifications_table()
+        map_notification_counters_table()
+        self._session = session
+        self._engine = engine
+        # A process-local publisher would deliver to nobody here.
+        self._publisher = publisher if config.redis_url is not None else None
+
+    async def stream_recipients(
+        self,
+        audience: NotificationAudience,
+        *,
+        chunk_size: int,
+    ) -> AsyncIterator[Sequence[int]]:
+        tables = mapping_registry.metadata.tables
+        stmt = build_audience_query(
+            tables["users"],  # type: ignore
+            tables["subscription_users"],  # type: ignore
+            audience,
+        ).execution_options(yield_per=chunk_size)
+        try:
+            async with self._engine.connect() as connection:
+                result = await connection.stream_scalars(stmt)
+                async for user_ids in result.partitions():
+                    yield user_ids
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def write_chunk(
+        self,
+        user_ids: Sequence[int],
+        template: NotificationTemplate,
+    ) -> int:
+        if not user_ids:
+            return 0
+        tables = mapping_registry.metadata.tables
+        notifications = tables["notifications"]  # type: ignore
+        counters = tables["notification_counters"]  # type: ignore
+        try:
+            result = await self._session.execute(
+                build_fan_out_insert(
+                    notifications,
+                    user_ids,
+                    template,
+                    datetime.utcnow(),
+                )
+            )
+            written = [dict(row) for row in result.mappings()]
+            await self._session.execute(build_increment_unread(counters, user_ids))
+            if self._publisher is not None:
+                call_after_commit(
+                    self._session,
+                    partial(_publish_all, self._publisher, written),
+                )
+            await self._session.commit()
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        return len(written)
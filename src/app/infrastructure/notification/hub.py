@@ -0,0 +1,118 @@
+import asyncio
+import contextlib
+from collections.abc import Mapping
+from typing import Any, Final
+
+from app.application.notification.ports import (
+    NotificationFeed,
+    NotificationPublisher,
+    NotificationStream,
+)
+from app.infrastructure.exceptions.base import InfrastructureError
+
+_CLOSED: Final = object()
+
+
+class NotificationFeedFullError(InfrastructureError):
+    pass
+
+
+class _HubStream(NotificationStream):
+    # A class rather than an async generator: `__anext__` can be cancelled
+    # (e.g. by a heartbeat timeout) without ending the stream.
+    def __init__(self, hub: "NotificationHub", user_id: int, queue_size: int):
+        self._hub = hub
+        self.user_id = user_id
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def __aiter__(self) -> "_HubStream":
+        return self
+
+    async def __anext__(self) -> Mapping[str, Any]:
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+
+
+class NotificationHub(NotificationFeed):
+    """
+    Per-process registry of live notification streams. Pushing is one
+    `put_nowait` per open stream of the recipient, so it never blocks the
+    writer; a stream whose buffer is full is closed instead, and the client
+    reconnects and catches up through the paginated listing.
+    Not thread-safe: use it from the event loop only.
+    """
+
+    def __init__(self, *, queue_size: int, max_connections: int):
+        self._queue_size = queue_size
+        self._max_connections = max_connections
+        self._streams: dict[int, set[_HubStream]] = {}
+        self._count = 0
+
+    @property
+    def connection_count(self) -> int:
+        return self._count
+
+    def subscribe(self, user_id: int) -> _HubStream:
+        """
+        :raises NotificationFeedFullError:
+        """
+        if self._count >= self._max_connections:
+            raise NotificationFeedFullError(
+                f"Notification streams are at capacity ({self._max_connections}).",
+            )
+        stream = _HubStream(self, user_id, self._queue_size)
+        self._streams.setdefault(user_id, set()).add(stream)
+        self._count += 1
+        return stream
+
+    def unsubscribe(self, stream: _HubStream) -> None:
+        streams = self._streams.get(stream.user_id)
+        if streams is None or stream not in streams:
+            return
+        streams.discard(stream)
+        if not streams:
+            del self._streams[stream.user_id]
+        self._count -= 1
+        stream.closed = True
+        # Wakes a consumer blocked on an empty queue; a full one ends anyway.
+        with contextlib.suppress(asyncio.QueueFull):
+            stream.queue.put_nowait(_CLOSED)
+
+    def deliver(self, user_id: int, notification: Mapping[str, Any]) -> int:
+        """
+        Returns the number of streams the notification was queued on.
+        """
+        delivered = 0
+        for stream in tuple(self._streams.get(user_id, ())):
+            try:
+                stream.queue.put_nowait(notification)
+            except asyncio.QueueFull:
+                self._evict(stream)
+            else:
+                delivered += 1
+        return delivered
+
+    def _evict(self, stream: _HubStream) -> None:
+        while not stream.queue.empty():
+            stream.queue.get_nowait()
+        self.unsubscribe(stream)
+
+
+class LocalNotificationPublisher(NotificationPublisher):
+    """
+    Delivers to streams of this process only; for single-process setups.
+    """
+
+    def __init__(self, hub: NotificationHub):
+        self._hub = hub
+
+    def publish(self, user_id: int, notification: Mapping[str, Any]) -> None:
+        self._hub.deliver(user_id, notification)
@@ -0,0 +1,45 @@
+from collections.abc import AsyncIterator
+
+from app.application.notification.ports import (
+    NotificationFeed,
+    NotificationPublisher,
+)
+from app.infrastructure.notification.config import NotificationStreamConfig
+from app.infrastructure.notification.hub import (
+    LocalNotificationPublisher,
+    NotificationHub,
+)
+
+
+def get_notification_hub(config: NotificationStreamConfig) -> NotificationHub:
+    return NotificationHub(
+        queue_size=config.queue_size,
+        max_connections=config.max_connections,
+    )
+
+
+async def get_notification_publisher(
+    hub: NotificationHub,
+    config: NotificationStreamConfig,
+) -> AsyncIterator[NotificationPublisher]:
+    if config.redis_url is None:
+        yield LocalNotificationPublisher(hub)
+        return
+
+    from app.infrastructure.notification.redis_bus import RedisNotificationBus
+
+    bus = RedisNotificationBus(hub, url=config.redis_url, channel=config.channel)
+    bus.start()
+    try:
+        yield bus
+    finally:
+        await bus.close()
+
+
+def get_notification_feed(
+    hub: NotificationHub,
+    _publisher: NotificationPublisher,
+) -> NotificationFeed:
+    # Depending on the publisher starts the cross-process listener (if any)
+    # no later than the first stream is opened.
+    return hub
@@ -0,0 +1,82 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Mapping
+from typing import Any, Final
+
+import orjson
+
+from app.application.notification.ports import NotificationPublisher
+from app.infrastructure.notification.hub import NotificationHub
+
+log = logging.getLogger(__name__)
+
+MAX_RECONNECT_DELAY_S: Final[float] = 30.0
+
+
+class RedisNotificationBus(NotificationPublisher):
+    """
+    Fans notifications out across processes: each one publishes to a single
+    Redis channel and keeps one subscriber connection that forwards every
+    message to its local hub, which drops those for users it does not serve.
+    Publishing never waits for Redis.
+    """
+
+    def __init__(self, hub: NotificationHub, *, url: str, channel: str):
+        from redis.asyncio import Redis  # keeps redis off the import path
+
+        self._hub = hub
+        self._channel = channel
+        self._redis = Redis.from_url(url)
+        self._pending: set[asyncio.Task[Any]] = set()
+        self._listener: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._listener = asyncio.get_running_loop().create_task(
+            self._listen(),
+            name="notification-bus-listener",
+        )
+
+    def publish(self, user_id: int, notification: Mapping[str, Any]) -> None:
+        message = orjson.dumps({"user_id": user_id, "notification": notification})
+        task = asyncio.get_running_loop().create_task(
+            self._redis.publish(self._channel, message),
+        )
+        self._pending.add(task)
+        task.add_done_callback(self._on_published)
+
+    def _on_published(self, task: asyncio.Task[Any]) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.warning("Publishing notification failed: %s", task.exception())
+
+    async def _listen(self) -> None:
+        delay_s = 0.5
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    delay_s = 0.5
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        decoded = orjson.loads(message["data"])
+                        self._hub.deliver(decoded["user_id"], decoded["notification"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # noqa: BLE001
+                log.warning(
+                    "Notification bus disconnected, retrying in %.1fs: %s",
+                    delay_s,
+                    e,
+                )
+                await asyncio.sleep(delay_s)
+                delay_s = min(delay_s * 2, MAX_RECONNECT_DELAY_S)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        await self._redis.aclose()
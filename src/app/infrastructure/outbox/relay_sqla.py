@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
+
+from sqlalchemy import Select, bindparam, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.mappings.outbox import (
+    map_outbox_messages_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+log = logging.getLogger(__name__)
+
+# (task name, kwargs, traceparent of the enqueuing request)
+OutboxPublisher = Callable[[str, dict[str, Any], str | None], None]
+
+# A message failing this often is dead-lettered instead of retried.
+OUTBOX_MAX_ATTEMPTS: Final[int] = 10
+OUTBOX_RETRY_BASE_S: Final[float] = 5.0
+OUTBOX_MAX_RETRY_DELAY_S: Final[float] = 30 * 60.0
+
+
+def retry_delay_s(attempts: int) -> float:
+    """Backoff after the `attempts`-th failed publish of a message."""
+    return min(OUTBOX_RETRY_BASE_S * 2.0 ** (attempts - 1), OUTBOX_MAX_RETRY_DELAY_S)
+
+
+class SqlaOutboxRelay:
+    """
+    Moves committed outbox rows to the broker. Rows are claimed with
+    `FOR UPDATE SKIP LOCKED`, so any number of relays can drain concurrently
+    without handing the same message out twice. A row that fails to publish
+    is retried after an exponential backoff, and dead-lettered (`dead_at`
+    set, kept for inspection) after `OUTBOX_MAX_ATTEMPTS` attempts.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        map_outbox_messages_table()
+        self._session = session
+
+    async def relay_batch(
+        self,
+        publish: OutboxPublisher,
+        limit: int,
+    ) -> tuple[int, int]:
+        """
+        Returns `(published, failed)`.
+
+        :raises DataMapperError:
+        """
+        table = mapping_registry.metadata.tables["outbox_messages"]  # type: ignore
+        try:
+            stmt: Select = (
+                select(
+                    table.c.id,
+                    table.c.task_name,
+                    table.c.payload,
+                    table.c.traceparent,
+                    table.c.attempts,
+                )
+                .where(
+                    table.c.dead_at.is_(None),
+                    table.c.available_at <= func.now(),
+                )
+                .order_by(table.c.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            rows = (await self._session.execute(stmt)).all()
+            if not rows:
+                await self._session.rollback()
+                return 0, 0
+
+            # The broker client is blocking; keep it off the event loop.
+            published, failed = await asyncio.to_thread(_publish_all, publish, rows)
+
+            if published:
+                await self._session.execute(
+                    table.delete().where(table.c.id.in_(published))
+                )
+            if failed:
+                await self._session.execute(
+                    table.update()
+                    .where(table.c.id == bindparam("b_id"))
+                    .values(
+                        attempts=table.c.attempts + 1,
+                        last_error=bindparam("b_error"),
+                        available_at=bindparam("b_available_at"),
+                        dead_at=bindparam("b_dead_at"),
+                    ),
+                    _failure_updates(failed, datetime.now(UTC)),
+                )
+            await self._session.commit()
+            return len(published), len(failed)
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def drain(
+        self,
+        publish: OutboxPublisher,
+        *,
+        batch_size: int,
+        time_budget_s: float,
+    ) -> int:
+        """
+        Relays batches until the outbox is empty, a whole batch fails (the
+        broker is likely down; the next run retries) or the time budget is
+        spent. Failed rows wait out their backoff, so they do not hold back
+        the rows behind them.
+
+        :raises DataMapperError:
+        """
+        deadline = time.monotonic() + time_budget_s
+        total = 0
+        while time.monotonic() < deadline:
+            published, failed = await self.relay_batch(publish, batch_size)
+            total += published
+            if not published or published + failed < batch_size:
+                break
+        if total:
+            log.info("Outbox relay: published %d message(s).", total)
+        return total
+
+
+def _publish_all(
+    publish: OutboxPublisher,
+    rows: Sequence[Any],
+) -> tuple[list[int], list[tuple[int, int, str]]]:
+    """Returns the published IDs and `(id, attempts so far, error)` of the rest."""
+    published: list[int] = []
+    failed: list[tuple[int, int, str]] = []
+    for id_, task_name, payload, traceparent, attempts in rows:
+        try:
+            publish(task_name, payload, traceparent)
+        except Exception as e:  # noqa: BLE001
+            log.warning("Outbox relay: publishing message %s failed: %s", id_, e)
+            failed.append((id_, attempts, str(e)))
+        else:
+            published.append(id_)
+    return published, failed
+
+
+def _failure_updates(
+    failed: Sequence[tuple[int, int, str]],
+    now: datetime,
+) -> list[dict[str, Any]]:
+    updates = []
+    for id_, attempts, error in failed:
+        attempts += 1
+        dead = attempts >= OUTBOX_MAX_ATTEMPTS
+        if dead:
+            log.error(
+                "Outbox relay: message %s dead-lettered after %d attempts: %s",
+                id_,
+                attempts,
+                error,
+            )
+        updates.append(
+            {
+                "b_id": id_,
+                "b_error": error,
+                "b_available_at": now + timedelta(seconds=retry_delay_s(attempts)),
+                "b_dead_at": now if dead else None,
+            },
+        )
+    return updates
@@ -0,0 +1,33 @@
+import logging
+from collections.abc import Callable
+from typing import Final
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+log = logging.getLogger(__name__)
+
+_CALLBACKS_KEY: Final[str] = "after_commit_callbacks"
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Runs `callback` once the session's current transaction commits.
+    A rollback discards it, so side effects never reveal uncommitted rows.
+    """
+    session.info.setdefault(_CALLBACKS_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_CALLBACKS_KEY, ()):
+        try:
+            callback()
+        except Exception:  # noqa: BLE001
+            log.exception("After-commit callback failed.")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_callbacks(session: Session) -> None:
+    session.info.pop(_CALLBACKS_KEY, None)
@@ -0,0 +1,115 @@
+"""
+Index builds for revisions that must not block writes.
+
+`CREATE INDEX CONCURRENTLY` is not supported on a partitioned parent. The
+index is created on the parent alone (`ON ONLY`, which leaves it invalid and
+touches no data), then built concurrently on every partition that has no
+index attached to it yet, and attached; the parent becomes valid once every
+partition has one. Partitions created later inherit the index.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+from alembic import op
+
+
+@dataclass(frozen=True)
+class ConcurrentIndex:
+    table: str
+    # Name without the `ix_<table>_` prefix, reused for the partitions.
+    suffix: str
+    # Everything after `ON <table>`, e.g. `(user_id) WHERE is_read IS NOT TRUE`.
+    definition: str
+
+    @property
+    def name(self) -> str:
+        return f"ix_{self.table}_{self.suffix}"
+
+
+def _is_partitioned(table: str) -> bool:
+    return op.get_bind().execute(
+        sa.text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table},
+    ).scalar() is True
+
+
+def _partitions(table: str) -> list[str]:
+    return list(
+        op.get_bind().execute(
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:name) ORDER BY c.relname"
+            ),
+            {"name": table},
+        ).scalars()
+    )
+
+
+def _partitions_with_attached_index(index: str) -> set[str]:
+    """
+    Partitions already covered by `index`, whatever their index is called:
+    `create_all` builds it on the whole table, so each partition carries
+    one named by Postgres.
+    """
+    return set(
+        op.get_bind().execute(
+            sa.text(
+                "SELECT t.relname FROM pg_inherits i "
+                "JOIN pg_index x ON x.indexrelid = i.inhrelid "
+                "JOIN pg_class t ON t.oid = x.indrelid "
+                "WHERE i.inhparent = to_regclass(:name)"
+            ),
+            {"name": index},
+        ).scalars()
+    )
+
+
+def _is_valid_index(name: str) -> bool | None:
+    """`None` when the index does not exist."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+
+
+def _create_partitioned(index: ConcurrentIndex) -> None:
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {index.name} "
+        f"ON ONLY {index.table} {index.definition}"
+    )
+    attached = _partitions_with_attached_index(index.name)
+    for partition in _partitions(index.table):
+        if partition in attached:
+            continue
+        child = f"ix_{partition}_{index.suffix}"
+        valid = _is_valid_index(child)
+        if valid is False:
+            # Left behind by a failed concurrent build; rebuild it.
+            op.execute(f"DROP INDEX CONCURRENTLY {child}")
+        if not valid:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {child} "
+                f"ON {partition} {index.definition}"
+            )
+        op.execute(f"ALTER INDEX {index.name} ATTACH PARTITION {child}")
+
+
+def create_indexes_concurrently(indexes: Sequence[ConcurrentIndex]) -> None:
+    """
+    Safe to rerun after a failed attempt: finished builds are kept and
+    half-built ones are rebuilt.
+    """
+    with op.get_context().autocommit_block():
+        for index in indexes:
+            if _is_partitioned(index.table):
+                _create_partitioned(index)
+            else:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index.name} "
+                    f"ON {index.table} {index.definition}"
+                )
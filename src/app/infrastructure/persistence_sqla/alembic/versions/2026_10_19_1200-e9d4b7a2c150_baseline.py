@@ -0,0 +1,398 @@
+"""baseline schema
+
+Revision ID: e9d4b7a2c150
+Revises:
+Create Date: 2026-10-19 12:00:00.000000
+
+The tables as `create_all` built them before the schema was managed by
+Alembic, so every later revision starts from a known schema. Databases
+that were built that way already have them: tables that exist are left
+alone, and the next revisions bring them up to date.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e9d4b7a2c150"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+USER_ROLE = postgresql.ENUM(
+    "admin",
+    "moderator",
+    "user",
+    "guest",
+    name="userrole",
+    create_type=False,
+)
+
+
+def _create_countries() -> None:
+    op.create_table(
+        "countries",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("country_id", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("iso3", sa.String(length=3), nullable=False),
+        sa.Column("iso2", sa.String(length=2), nullable=True),
+        sa.Column("numeric_code", sa.String(length=3), nullable=True),
+        sa.Column("phonecode", sa.String(length=20), nullable=True),
+        sa.Column("capital", sa.String(length=100), nullable=True),
+        sa.Column("currency", sa.String(length=3), nullable=True),
+        sa.Column("currency_name", sa.String(length=50), nullable=True),
+        sa.Column("currency_symbol", sa.String(length=10), nullable=True),
+        sa.Column("tld", sa.String(length=10), nullable=True),
+        sa.Column("native", sa.String(length=100), nullable=True),
+        sa.Column("nationality", sa.String(length=100), nullable=True),
+        sa.Column("timezones", sa.JSON(), nullable=True),
+        sa.Column("latitude", sa.Float(), nullable=True),
+        sa.Column("longitude", sa.Float(), nullable=True),
+        sa.Column("emoji", sa.String(length=10), nullable=True),
+        sa.Column("emojiU", sa.String(length=20), nullable=True),
+        sa.Column("region", sa.String(length=50), nullable=True),
+        sa.Column("subregion", sa.String(length=50), nullable=True),
+        sa.CheckConstraint(
+            "latitude >= -90 AND latitude <= 90",
+            name=op.f("ck_countries_check_latitude_range"),
+        ),
+        sa.CheckConstraint(
+            "longitude >= -180 AND longitude <= 180",
+            name=op.f("ck_countries_check_longitude_range"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_countries")),
+    )
+    for column in ("id", "country_id", "name", "iso2", "region", "subregion"):
+        op.create_index(op.f(f"ix_countries_{column}"), "countries", [column])
+    op.create_index(op.f("ix_countries_iso3"), "countries", ["iso3"], unique=True)
+
+
+def _create_cities() -> None:
+    op.create_table(
+        "cities",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("city_id", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("state_id", sa.String(length=20), nullable=True),
+        sa.Column("state_code", sa.String(length=10), nullable=True),
+        sa.Column("state_name", sa.String(length=100), nullable=True),
+        sa.Column("country_id", sa.Integer(), nullable=False),
+        sa.Column("country_code", sa.String(length=2), nullable=True),
+        sa.Column("country_name", sa.String(length=100), nullable=True),
+        sa.Column("latitude", sa.Float(), nullable=True),
+        sa.Column("longitude", sa.Float(), nullable=True),
+        sa.Column("wikiDataId", sa.String(length=50), nullable=True),
+        sa.CheckConstraint(
+            "latitude >= -90 AND latitude <= 90",
+            name=op.f("ck_cities_check_city_latitude_range"),
+        ),
+        sa.CheckConstraint(
+            "longitude >= -180 AND longitude <= 180",
+            name=op.f("ck_cities_check_city_longitude_range"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_cities")),
+        sa.UniqueConstraint(
+            "city_id",
+            "country_id",
+            name=op.f("uq_cities_city_country"),
+        ),
+    )
+    for column in (
+        "id",
+        "city_id",
+        "name",
+        "state_id",
+        "state_code",
+        "country_id",
+        "country_code",
+        "wikiDataId",
+    ):
+        op.create_index(op.f(f"ix_cities_{column}"), "cities", [column])
+
+
+def _create_subscriptions() -> None:
+    op.create_table(
+        "subscriptions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("subscription_type", sa.String(length=100), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=True),
+        sa.Column("duration", sa.Integer(), nullable=False),
+        sa.Column("features", sa.JSON(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("stripe_price_id", sa.String(length=255), nullable=True),
+        sa.Column("stripe_product_id", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_subscriptions")),
+    )
+    op.create_index(op.f("ix_subscriptions_id"), "subscriptions", ["id"])
+
+
+def _create_users() -> None:
+    USER_ROLE.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column("role", USER_ROLE, nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_blocked", sa.Boolean(), nullable=True),
+        sa.Column("is_verified", sa.Boolean(), nullable=True),
+        sa.Column("retry_count", sa.Integer(), nullable=True),
+        sa.Column("password", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.Column("last_login", sa.DateTime(), nullable=True),
+        sa.Column("profile_picture", sa.String(length=255), nullable=True),
+        sa.Column("phone_number", sa.String(length=20), nullable=True),
+        sa.Column("language", sa.String(length=10), nullable=True),
+        sa.Column("address", sa.Text(), nullable=True),
+        sa.Column("postal_code", sa.String(length=20), nullable=True),
+        sa.Column("country_id", sa.Integer(), nullable=True),
+        sa.Column("city_id", sa.Integer(), nullable=True),
+        sa.Column("subscription", sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["city_id"],
+            ["cities.id"],
+            name=op.f("fk_users_city_id_cities"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["country_id"],
+            ["countries.id"],
+            name=op.f("fk_users_country_id_countries"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_users")),
+    )
+    op.create_index(op.f("ix_users_id"), "users", ["id"])
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+
+
+def _create_auth_sessions() -> None:
+    op.create_table(
+        "auth_sessions",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("expiration", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_auth_sessions_user_id_users"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_auth_sessions")),
+    )
+
+
+def _create_user_tokens(table: str) -> None:
+    """`email_verifications` and `password_resets` share one layout."""
+    op.create_table(
+        table,
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(length=255), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_used", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f(f"fk_{table}_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f(f"pk_{table}")),
+    )
+    op.create_index(op.f(f"ix_{table}_id"), table, ["id"])
+
+
+def _create_email_verifications() -> None:
+    _create_user_tokens("email_verifications")
+
+
+def _create_password_resets() -> None:
+    _create_user_tokens("password_resets")
+
+
+def _create_notifications() -> None:
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("is_read", sa.Boolean(), nullable=True),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("data_json", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_notifications_user_id_users"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_notifications")),
+    )
+    op.create_index(op.f("ix_notifications_id"), "notifications", ["id"])
+
+
+def _create_sessions() -> None:
+    op.create_table(
+        "sessions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("access_token", sa.String(length=500), nullable=False),
+        sa.Column("refresh_token", sa.String(length=500), nullable=False),
+        sa.Column("token_type", sa.String(length=50), nullable=True),
+        sa.Column("ip_address", sa.String(length=50), nullable=True),
+        sa.Column("user_agent", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("last_activity", sa.DateTime(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_sessions_user_id_users"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_sessions")),
+    )
+    op.create_index(op.f("ix_sessions_id"), "sessions", ["id"])
+
+
+def _create_subscription_users() -> None:
+    op.create_table(
+        "subscription_users",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("subscription_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("stripe_subscription_id", sa.String(length=255), nullable=True),
+        sa.Column("stripe_customer_id", sa.String(length=255), nullable=True),
+        sa.Column("client_secret", sa.String(length=255), nullable=True),
+        sa.Column("subscription_data", sa.JSON(), nullable=True),
+        sa.Column("data_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default="now()",
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["subscription_id"],
+            ["subscriptions.id"],
+            name=op.f("fk_subscription_users_subscription_id_subscriptions"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_subscription_users_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_subscription_users")),
+    )
+    op.create_index(
+        op.f("ix_subscription_users_id"),
+        "subscription_users",
+        ["id"],
+    )
+
+
+def _create_payments() -> None:
+    op.create_table(
+        "payments",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("subscription_id", sa.Integer(), nullable=True),
+        sa.Column("subscription_user_id", sa.Integer(), nullable=True),
+        sa.Column("amount", sa.Float(), nullable=True),
+        sa.Column("currency", sa.String(length=3), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=False),
+        sa.Column("stripe_payment_intent_id", sa.String(length=255), nullable=True),
+        sa.Column("stripe_customer_id", sa.String(length=255), nullable=True),
+        sa.Column("payment_data", sa.JSON(), nullable=True),
+        sa.Column("payment_method", sa.String(length=50), nullable=True),
+        sa.Column("payment_type", sa.String(length=50), nullable=True),
+        sa.Column("date", sa.DateTime(), nullable=True),
+        sa.Column("data_json", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["subscription_id"],
+            ["subscriptions.id"],
+            name=op.f("fk_payments_subscription_id_subscriptions"),
+            ondelete="SET NULL",
+        ),
+        sa.ForeignKeyConstraint(
+            ["subscription_user_id"],
+            ["subscription_users.id"],
+            name=op.f("fk_payments_subscription_user_id_subscription_users"),
+            ondelete="SET NULL",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_payments_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_payments")),
+    )
+    op.create_index(op.f("ix_payments_id"), "payments", ["id"])
+
+
+# In dependency order; the foreign keys point backwards only.
+TABLES = (
+    ("countries", _create_countries),
+    ("cities", _create_cities),
+    ("subscriptions", _create_subscriptions),
+    ("users", _create_users),
+    ("auth_sessions", _create_auth_sessions),
+    ("email_verifications", _create_email_verifications),
+    ("password_resets", _create_password_resets),
+    ("notifications", _create_notifications),
+    ("sessions", _create_sessions),
+    ("subscription_users", _create_subscription_users),
+    ("payments", _create_payments),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, create in TABLES:
+        if not inspector.has_table(table):
+            create()
+
+
+def downgrade() -> None:
+    for table, _ in reversed(TABLES):
+        op.drop_table(table)
+    USER_ROLE.drop(op.get_bind(), checkfirst=True)
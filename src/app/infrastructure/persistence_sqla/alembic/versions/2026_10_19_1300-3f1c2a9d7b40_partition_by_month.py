@@ -0,0 +1,197 @@
+"""partition sessions, notifications and payments by month
+
+Revision ID: 3f1c2a9d7b40
+Revises: e9d4b7a2c150
+Create Date: 2026-10-19 13:00:00.000000
+
+Rebuilds each table as a range-partitioned one and copies the rows over.
+Tables that are already partitioned are left alone.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.persistence_sqla.partitioning import (
+    PARTITION_MONTHS_AHEAD,
+    SPECS_BY_TABLE,
+    PartitionSpec,
+    add_months,
+    create_default_partition_ddl,
+    create_partition_ddl,
+    month_start,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d7b40"
+down_revision: Union[str, None] = "e9d4b7a2c150"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UTC_NOW = "timezone('utc', now())"
+
+
+@dataclass(frozen=True)
+class _ForeignKey:
+    column: str
+    referred_table: str
+    on_delete: str | None = None
+
+
+@dataclass(frozen=True)
+class _TableLayout:
+    name: str
+    serial_id: bool
+    expiry_keyed: bool
+    indexed_columns: tuple[str, ...]
+    foreign_keys: tuple[_ForeignKey, ...]
+
+
+TABLES: tuple[_TableLayout, ...] = (
+    _TableLayout(
+        name="auth_sessions",
+        serial_id=False,
+        expiry_keyed=True,
+        indexed_columns=("expiration",),
+        foreign_keys=(_ForeignKey("user_id", "users"),),
+    ),
+    _TableLayout(
+        name="sessions",
+        serial_id=True,
+        expiry_keyed=True,
+        indexed_columns=("id", "expires_at"),
+        foreign_keys=(_ForeignKey("user_id", "users"),),
+    ),
+    _TableLayout(
+        name="notifications",
+        serial_id=True,
+        expiry_keyed=False,
+        indexed_columns=("id",),
+        foreign_keys=(_ForeignKey("user_id", "users"),),
+    ),
+    _TableLayout(
+        name="payments",
+        serial_id=True,
+        expiry_keyed=False,
+        indexed_columns=("id",),
+        foreign_keys=(
+            _ForeignKey("user_id", "users", "CASCADE"),
+            _ForeignKey("subscription_id", "subscriptions", "SET NULL"),
+            _ForeignKey("subscription_user_id", "subscription_users", "SET NULL"),
+        ),
+    ),
+)
+
+
+def _relkind(name: str) -> str | None:
+    return op.get_bind().execute(
+        sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+
+
+def _now_sql(spec: PartitionSpec) -> str:
+    return "now()" if spec.timezone else UTC_NOW
+
+
+def _add_constraints_and_indexes(layout: _TableLayout, pk_columns: str) -> None:
+    name = layout.name
+    op.execute(
+        f"ALTER TABLE {name} ADD CONSTRAINT pk_{name} PRIMARY KEY ({pk_columns})"
+    )
+    for fk in layout.foreign_keys:
+        on_delete = f" ON DELETE {fk.on_delete}" if fk.on_delete else ""
+        op.execute(
+            f"ALTER TABLE {name} ADD CONSTRAINT "
+            f"fk_{name}_{fk.column}_{fk.referred_table} FOREIGN KEY ({fk.column}) "
+            f"REFERENCES {fk.referred_table} (id){on_delete}"
+        )
+    for column in layout.indexed_columns:
+        op.execute(f"CREATE INDEX ix_{name}_{column} ON {name} ({column})")
+
+
+def _move_sequence(source: str, target: str) -> None:
+    sequence = op.get_bind().execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"),
+        {"table": source},
+    ).scalar()
+    if sequence is not None:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {target}.id")
+
+
+def _partition_table(layout: _TableLayout) -> None:
+    name = layout.name
+    if _relkind(name) in (None, "p"):
+        return
+    spec = SPECS_BY_TABLE[name]
+    key = spec.column
+    legacy = f"{name}_legacy"
+    bind = op.get_bind()
+
+    if not layout.expiry_keyed:
+        op.execute(f"UPDATE {name} SET {key} = {UTC_NOW} WHERE {key} IS NULL")
+    op.execute(f"ALTER TABLE {name} RENAME TO {legacy}")
+    op.execute(
+        f"CREATE TABLE {name} "
+        f"(LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE ({key})"
+    )
+    op.execute(f"ALTER TABLE {name} ALTER COLUMN {key} SET NOT NULL")
+    if not layout.expiry_keyed:
+        op.execute(f"ALTER TABLE {name} ALTER COLUMN {key} SET DEFAULT {UTC_NOW}")
+
+    now = datetime.now(tz=timezone.utc)
+    first_month = month_start(now)
+    if not layout.expiry_keyed:
+        oldest = bind.execute(sa.text(f"SELECT min({key}) FROM {legacy}")).scalar()
+        if oldest is not None:
+            first_month = min(first_month, month_start(oldest))
+    last_month = add_months(month_start(now), PARTITION_MONTHS_AHEAD)
+    op.execute(create_default_partition_ddl(spec))
+    month = first_month
+    while month <= last_month:
+        op.execute(create_partition_ddl(spec, month))
+        month = add_months(month, 1)
+
+    # Expired sessions are not worth copying.
+    live_only = f" WHERE {key} >= {_now_sql(spec)}" if layout.expiry_keyed else ""
+    op.execute(f"INSERT INTO {name} SELECT * FROM {legacy}{live_only}")
+    if layout.serial_id:
+        _move_sequence(legacy, name)
+    op.execute(f"DROP TABLE {legacy}")
+    _add_constraints_and_indexes(layout, pk_columns=f"id, {key}")
+
+
+def _unpartition_table(layout: _TableLayout) -> None:
+    name = layout.name
+    if _relkind(name) != "p":
+        return
+    key = SPECS_BY_TABLE[name].column
+    partitioned = f"{name}_partitioned"
+
+    op.execute(f"ALTER TABLE {name} RENAME TO {partitioned}")
+    op.execute(
+        f"CREATE TABLE {name} "
+        f"(LIKE {partitioned} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    if not layout.expiry_keyed:
+        op.execute(f"ALTER TABLE {name} ALTER COLUMN {key} DROP DEFAULT")
+        op.execute(f"ALTER TABLE {name} ALTER COLUMN {key} DROP NOT NULL")
+    op.execute(f"INSERT INTO {name} SELECT * FROM {partitioned}")
+    if layout.serial_id:
+        _move_sequence(partitioned, name)
+    # Drops the attached partitions; detached archives are left in place.
+    op.execute(f"DROP TABLE {partitioned}")
+    _add_constraints_and_indexes(layout, pk_columns="id")
+
+
+def upgrade() -> None:
+    for layout in TABLES:
+        _partition_table(layout)
+
+
+def downgrade() -> None:
+    for layout in TABLES:
+        _unpartition_table(layout)
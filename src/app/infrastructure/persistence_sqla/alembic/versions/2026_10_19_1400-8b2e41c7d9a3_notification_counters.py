@@ -0,0 +1,42 @@
+"""notification unread counters
+
+Revision ID: 8b2e41c7d9a3
+Revises: 3f1c2a9d7b40
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e41c7d9a3"
+down_revision: Union[str, None] = "3f1c2a9d7b40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_counters",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("unread", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_notification_counters_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", name=op.f("pk_notification_counters")),
+    )
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread) "
+        "SELECT user_id, count(*) FROM notifications "
+        "WHERE is_read IS NOT TRUE GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_counters")
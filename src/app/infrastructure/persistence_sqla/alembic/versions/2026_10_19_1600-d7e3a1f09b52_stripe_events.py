@@ -0,0 +1,59 @@
+"""stripe events
+
+Revision ID: d7e3a1f09b52
+Revises: c5d19e7a2f64
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e3a1f09b52"
+down_revision: Union[str, None] = "c5d19e7a2f64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stripe_events",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("event_id", sa.String(length=255), nullable=False),
+        sa.Column("type", sa.String(length=100), nullable=False),
+        sa.Column("customer_id", sa.String(length=255), nullable=True),
+        sa.Column("created", sa.BigInteger(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column(
+            "received_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_stripe_events")),
+        sa.UniqueConstraint("event_id", name=op.f("uq_stripe_events_event_id")),
+    )
+    op.create_index(
+        "ix_stripe_events_pending",
+        "stripe_events",
+        ["created", "id"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+    op.create_index(
+        op.f("ix_stripe_events_expires_at"),
+        "stripe_events",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_stripe_events_expires_at"), table_name="stripe_events")
+    op.drop_index("ix_stripe_events_pending", table_name="stripe_events")
+    op.drop_table("stripe_events")
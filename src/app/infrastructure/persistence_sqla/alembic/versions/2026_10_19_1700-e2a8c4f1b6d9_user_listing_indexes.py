@@ -0,0 +1,55 @@
+"""per-user listing indexes on notifications and payments
+
+Revision ID: e2a8c4f1b6d9
+Revises: d7e3a1f09b52
+Create Date: 2026-10-19 17:00:00.000000
+
+Both tables are partitioned; the indexes are built one partition at a
+time, concurrently, so writes are never blocked for the length of a build
+(see `concurrent_indexes`).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.infrastructure.persistence_sqla.alembic.concurrent_indexes import (
+    ConcurrentIndex,
+    create_indexes_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a8c4f1b6d9"
+down_revision: Union[str, None] = "d7e3a1f09b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES: tuple[ConcurrentIndex, ...] = (
+    ConcurrentIndex(
+        "notifications",
+        "user_id_created_at_id",
+        "(user_id, created_at DESC, id)",
+    ),
+    ConcurrentIndex(
+        "notifications",
+        "user_id_unread",
+        "(user_id, created_at DESC) WHERE is_read IS NOT TRUE",
+    ),
+    ConcurrentIndex(
+        "payments",
+        "user_id_created_at_id",
+        "(user_id, created_at DESC, id)",
+    ),
+    ConcurrentIndex("payments", "subscription_user_id", "(subscription_user_id)"),
+)
+
+
+def upgrade() -> None:
+    create_indexes_concurrently(INDEXES)
+
+
+def downgrade() -> None:
+    # Dropping a partitioned index drops the attached partition indexes too.
+    for index in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {index.name}")
@@ -0,0 +1,68 @@
+"""jsonb payload columns and indexes on the keys looked up
+
+Revision ID: f4b9d2e6a1c7
+Revises: e2a8c4f1b6d9
+Create Date: 2026-10-19 18:00:00.000000
+
+`json` columns can't be indexed or compared, so every lookup by an embedded
+key was a sequential scan. The payload columns become `jsonb`; note that the
+type change rewrites each table under an ACCESS EXCLUSIVE lock, so run it in
+a maintenance window on large installs. The indexes are then built
+concurrently, partitioned tables one partition at a time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.infrastructure.persistence_sqla.alembic.concurrent_indexes import (
+    ConcurrentIndex,
+    create_indexes_concurrently,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b9d2e6a1c7"
+down_revision: Union[str, None] = "e2a8c4f1b6d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("payments", "data_json"),
+    ("payments", "payment_data"),
+    ("notifications", "data_json"),
+    ("subscription_users", "data_json"),
+)
+
+INDEXES: tuple[ConcurrentIndex, ...] = (
+    ConcurrentIndex(
+        "subscription_users",
+        "checkout_session_id",
+        "((data_json ->> 'checkout_session_id'))",
+    ),
+    ConcurrentIndex(
+        "payments",
+        "checkout_session_id",
+        "((data_json ->> 'checkout_session_id'))",
+    ),
+    ConcurrentIndex("payments", "data_json", "USING gin (data_json jsonb_path_ops)"),
+)
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB "
+            f"USING {column}::jsonb"
+        )
+    create_indexes_concurrently(INDEXES)
+
+
+def downgrade() -> None:
+    for index in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {index.name}")
+    for table, column in reversed(COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON "
+            f"USING {column}::json"
+        )
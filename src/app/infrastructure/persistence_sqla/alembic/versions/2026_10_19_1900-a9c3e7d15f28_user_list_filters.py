@@ -0,0 +1,48 @@
+"""indexes for the admin user listing filters
+
+Revision ID: a9c3e7d15f28
+Revises: f4b9d2e6a1c7
+Create Date: 2026-10-19 19:00:00.000000
+
+Name search uses a trigram index, so `pg_trgm` must be available; creating
+the extension needs a role allowed to do so (it is a trusted extension
+since PostgreSQL 13, so the database owner is enough there).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c3e7d15f28"
+down_revision: Union[str, None] = "f4b9d2e6a1c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES: tuple[tuple[str, str], ...] = (
+    ("ix_users_email_lower_pattern", "(lower(email) text_pattern_ops)"),
+    (
+        "ix_users_full_name_trgm",
+        "USING gin (((first_name || ' ') || last_name) gin_trgm_ops)",
+    ),
+    ("ix_users_country_id", "(country_id)"),
+    ("ix_users_created_at", "(created_at)"),
+    ("ix_users_last_login", "(last_login)"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON users {definition}"
+            )
+
+
+def downgrade() -> None:
+    # The extension is left in place; other objects may depend on it.
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
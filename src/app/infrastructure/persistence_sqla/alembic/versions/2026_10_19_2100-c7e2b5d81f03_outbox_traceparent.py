@@ -0,0 +1,29 @@
+"""outbox traceparent
+
+Revision ID: c7e2b5d81f03
+Revises: b3d8f6a2c914
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2b5d81f03"
+down_revision: Union[str, None] = "b3d8f6a2c914"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox_messages",
+        sa.Column("traceparent", sa.String(length=55), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_messages", "traceparent")
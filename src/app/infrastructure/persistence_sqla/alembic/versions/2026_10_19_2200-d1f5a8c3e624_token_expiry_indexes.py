@@ -0,0 +1,35 @@
+"""expiry indexes for the purge of used-up tokens
+
+Revision ID: d1f5a8c3e624
+Revises: c7e2b5d81f03
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d1f5a8c3e624"
+down_revision: Union[str, None] = "c7e2b5d81f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES: tuple[str, ...] = ("email_verifications", "password_resets")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_expires_at "
+                f"ON {table} (expires_at)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_expires_at")
@@ -0,0 +1,69 @@
+"""billing event retries and status ordering
+
+Revision ID: e5b9c2d7a481
+Revises: d1f5a8c3e624
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9c2d7a481"
+down_revision: Union[str, None] = "d1f5a8c3e624"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild_pending_index(predicate: str) -> None:
+    # Webhook inserts keep flowing while the index is rebuilt.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_stripe_events_pending")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_stripe_events_pending "
+            f"ON stripe_events (created, id) WHERE {predicate}"
+        )
+
+
+def upgrade() -> None:
+    op.add_column(
+        "stripe_events",
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.add_column("stripe_events", sa.Column("last_error", sa.Text(), nullable=True))
+    op.add_column(
+        "stripe_events",
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "stripe_events",
+        sa.Column("dead_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "subscription_users",
+        sa.Column("status_event_created", sa.BigInteger(), nullable=True),
+    )
+    # The pending index leaves dead-lettered events out from now on.
+    _rebuild_pending_index("processed_at IS NULL AND dead_at IS NULL")
+
+
+def downgrade() -> None:
+    _rebuild_pending_index("processed_at IS NULL")
+    op.drop_column("subscription_users", "status_event_created")
+    op.drop_column("stripe_events", "dead_at")
+    op.drop_column("stripe_events", "available_at")
+    op.drop_column("stripe_events", "last_error")
+    op.drop_column("stripe_events", "attempts")
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Final, TypedDict
+
+from app.application.common.services.authorization.authorize import authorize
+from app.application.common.services.authorization.permissions import (
+    CanManageRole,
+    RoleManagementContext,
+)
+from app.application.common.services.current_user import CurrentUserService
+from app.domain.enums.user_role import UserRole
+from app.infrastructure.persistence_sqla.query_profiler import QueryStats
+
+SLOWEST_QUERIES_MAX_LIMIT: Final[int] = 100
+
+
+class SlowQuery(TypedDict):
+    shape: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+class SlowestQueriesResponse(TypedDict):
+    queries: list[SlowQuery]
+    # Statements whose shape came after the tracked ones were full.
+    untracked: int
+
+
+@dataclass(frozen=True, slots=True)
+class SlowestQueriesRequest:
+    limit: int = 20
+
+
+class SlowestQueriesHandler:
+    """
+    - Open to admins.
+    - Statement shapes run by this process since it started, by total
+      database time, with their counts, mean and worst durations.
+    """
+
+    def __init__(
+        self,
+        current_user_service: CurrentUserService,
+        query_stats: QueryStats,
+    ) -> None:
+        self._current_user_service = current_user_service
+        self._query_stats = query_stats
+
+    async def execute(self, request: SlowestQueriesRequest) -> SlowestQueriesResponse:
+        """
+        :raises AuthenticationError:
+        :raises DataMapperError:
+        :raises AuthorizationError:
+        """
+        current_user = await self._current_user_service.get_current_user()
+        authorize(
+            CanManageRole(),
+            context=RoleManagementContext(
+                subject=current_user,
+                target_role=UserRole.USER,
+            ),
+        )
+
+        limit = min(request.limit, SLOWEST_QUERIES_MAX_LIMIT)
+        return SlowestQueriesResponse(
+            queries=[
+                SlowQuery(
+                    shape=stats.shape,
+                    count=stats.count,
+                    total_ms=round(stats.total_s * 1000, 3),
+                    mean_ms=round(stats.total_s * 1000 / stats.count, 3),
+                    max_ms=round(stats.max_s * 1000, 3),
+                )
+                for stats in self._query_stats.slowest(limit)
+            ],
+            untracked=self._query_stats.untracked,
+        )
@@ -0,0 +1,13 @@
+from sqlalchemy import ColumnElement, String, literal_column
+from sqlalchemy.sql.elements import KeyedColumnElement
+
+
+def json_text(column: KeyedColumnElement, key: str) -> ColumnElement[str]:
+    """
+    `column ->> 'key'` with the key inlined. A bound key would render as a
+    parameter, which no longer matches the expression index on the key once
+    PostgreSQL switches to a generic plan.
+    """
+    if not key.isidentifier():
+        raise ValueError(f"Not a plain JSON key: {key!r}")
+    return column.op("->>", return_type=String())(literal_column(f"'{key}'"))
@@ -27,10 +27,20 @@ from app.infrastructure.persistence_sqla.mappings.auth_session import (
 from app.infrastructure.persistence_sqla.mappings.city import map_cities_table
 from app.infrastructure.persistence_sqla.mappings.country import map_countries_table
 from app.infrastructure.persistence_sqla.mappings.email_verification import map_email_verifications_table
+from app.infrastructure.persistence_sqla.mappings.idempotency_key import (
+    map_idempotency_keys_table,
+)
 from app.infrastructure.persistence_sqla.mappings.notification import map_notifications_table
+from app.infrastructure.persistence_sqla.mappings.notification_counter import (
+    map_notification_counters_table,
+)
+from app.infrastructure.persistence_sqla.mappings.outbox import map_outbox_messages_table
 from app.infrastructure.persistence_sqla.mappings.password_reset import map_password_resets_table
 from app.infrastructure.persistence_sqla.mappings.payment import map_payments_table
 from app.infrastructure.persistence_sqla.mappings.session import map_sessions_table
+from app.infrastructure.persistence_sqla.mappings.stripe_event import (
+    map_stripe_events_table,
+)
 from app.infrastructure.persistence_sqla.mappings.subscription import map_subscriptions_table
 from app.infrastructure.persistence_sqla.mappings.subscription_user import map_subscription_users_table
 from app.infrastructure.persistence_sqla.mappings.user import map_users_table
@@ -42,9 +52,13 @@ def map_tables() -> None:
     map_countries_table()
     map_cities_table()
     map_email_verifications_table()
+    map_idempotency_keys_table()
     map_notifications_table()
+    map_notification_counters_table()
+    map_outbox_messages_table()
     map_password_resets_table()
     map_payments_table()
     map_sessions_table()
+    map_stripe_events_table()
     map_subscriptions_table()
     map_subscription_users_table()
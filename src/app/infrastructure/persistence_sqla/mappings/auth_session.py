@@ -3,15 +3,28 @@ from sqlalchemy.orm import composite
 
 from app.domain.value_objects.user_id import UserId
 from app.infrastructure.auth.session.model import AuthSession
+from app.infrastructure.persistence_sqla.partitioning import (
+    register_partition_bootstrap,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
+# Partitioned by month of expiry; the partition key has to be part of the
+# primary key, while the mapper keeps identifying sessions by `id` alone.
 auth_sessions_table = Table(
     "auth_sessions",
     mapping_registry.metadata,
     Column("id", String, primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
-    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column(
+        "expiration",
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        index=True,
+    ),
+    postgresql_partition_by="RANGE (expiration)",
 )
+register_partition_bootstrap(auth_sessions_table)
 
 
 def map_auth_sessions_table() -> None:
@@ -24,4 +37,5 @@ def map_auth_sessions_table() -> None:
             "expiration": auth_sessions_table.c.expiration,
         },
         column_prefix="_",
+        primary_key=[auth_sessions_table.c.id],
     )
@@ -26,7 +26,7 @@ def map_email_verifications_table() -> None:
         
         # Verification information
         token = mapped_column(String(255), nullable=False)
-        expires_at = mapped_column(DateTime(timezone=True), nullable=False)
+        expires_at = mapped_column(DateTime(timezone=True), nullable=False, index=True)
         is_used = mapped_column(Boolean, default=False)
         
         # Timestamps
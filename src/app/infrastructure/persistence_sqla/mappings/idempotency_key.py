@@ -0,0 +1,61 @@
+"""
+SQLAlchemy mapping for IdempotencyKey table metadata.
+"""
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.orm import mapped_column
+
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def map_idempotency_keys_table() -> None:
+    """Map idempotency keys to database table (idempotent)."""
+    if "idempotency_keys" in mapping_registry.metadata.tables:
+        return
+
+    @mapping_registry.mapped
+    class IdempotencyKeysTable:
+        __tablename__ = "idempotency_keys"
+        # Keys are scoped to the user and the endpoint they were sent to.
+        __table_args__ = (
+            UniqueConstraint(
+                "user_id",
+                "scope",
+                "key",
+                name="uq_idempotency_keys_user_id_scope_key",
+            ),
+        )
+
+        id = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+        user_id = mapped_column(
+            Integer,
+            ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        )
+        scope = mapped_column(String(100), nullable=False)
+        key = mapped_column(String(255), nullable=False)
+
+        # Hash of the request the key was first used with
+        fingerprint = mapped_column(String(64), nullable=False)
+        status = mapped_column(String(16), nullable=False)  # pending, completed
+        result = mapped_column(JSON, nullable=True)
+
+        # A pending claim older than this was abandoned and may be taken over
+        locked_until = mapped_column(DateTime(timezone=True), nullable=False)
+        expires_at = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+        created_at = mapped_column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+
+    # Keep only table metadata for create_all
@@ -3,33 +3,67 @@ SQLAlchemy mapping for Notification table metadata.
 """
 
 from datetime import datetime
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, JSON
+from typing import Any, ClassVar
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column
 
+from app.infrastructure.persistence_sqla.partitioning import (
+    register_partition_bootstrap,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
 def map_notifications_table() -> None:
-    """Map Notification entity to database table."""
-    
+    """Map Notification entity to database table (idempotent)."""
+    if "notifications" in mapping_registry.metadata.tables:
+        return
+
     @mapping_registry.mapped
     class NotificationsTable:
         __tablename__ = "notifications"
-        
-        # Primary key
-        id = mapped_column(Integer, primary_key=True, index=True)
-        
+        # Partitioned by month of creation; see persistence_sqla.partitioning.
+        __table_args__: ClassVar[dict[str, Any]] = {
+            "postgresql_partition_by": "RANGE (created_at)",
+        }
+
+        # Primary key (must include the partition key)
+        id = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
+
         # Foreign key to users table
         user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
-        
+
         # Notification information
         title = mapped_column(String(255), nullable=False)
         is_read = mapped_column(Boolean, default=False)
         action = mapped_column(String(50), nullable=False)  # e.g., 'payment', 'subscription', 'system'
-        data_json = mapped_column(JSON, nullable=True)
-        
+        data_json = mapped_column(JSONB, nullable=True)
+
         # Timestamps
-        created_at = mapped_column(DateTime, default=datetime.utcnow)
+        created_at = mapped_column(
+            DateTime,
+            primary_key=True,
+            default=datetime.utcnow,
+            server_default=text("timezone('utc', now())"),
+        )
         updated_at = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+
+    table = NotificationsTable.__table__
+    # A user's history page in order, and their unread backlog.
+    Index(
+        "ix_notifications_user_id_created_at_id",
+        table.c.user_id,
+        table.c.created_at.desc(),
+        table.c.id,
+    )
+    Index(
+        "ix_notifications_user_id_unread",
+        table.c.user_id,
+        table.c.created_at.desc(),
+        postgresql_where=text("is_read IS NOT TRUE"),
+    )
+
+    register_partition_bootstrap(table)
+
     # Keep only table metadata for create_all
@@ -0,0 +1,29 @@
+"""
+SQLAlchemy mapping for NotificationCounter table metadata.
+"""
+
+from sqlalchemy import ForeignKey, Integer, text
+from sqlalchemy.orm import mapped_column
+
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def map_notification_counters_table() -> None:
+    """Map per-user notification counters (idempotent)."""
+    if "notification_counters" in mapping_registry.metadata.tables:
+        return
+
+    @mapping_registry.mapped
+    class NotificationCountersTable:
+        __tablename__ = "notification_counters"
+
+        # One row per user, kept in step with `notifications` by the
+        # repository in the same transaction as each insert / mark-read.
+        user_id = mapped_column(
+            Integer,
+            ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+        unread = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+    # Keep only table metadata for create_all
@@ -0,0 +1,64 @@
+"""
+SQLAlchemy mapping for the transactional outbox table metadata.
+"""
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.orm import mapped_column
+
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def map_outbox_messages_table() -> None:
+    """Map outbox messages to database table (idempotent)."""
+    if "outbox_messages" in mapping_registry.metadata.tables:
+        return
+
+    @mapping_registry.mapped
+    class OutboxMessagesTable:
+        __tablename__ = "outbox_messages"
+        # Only live messages are indexed, in relay order.
+        __table_args__ = (
+            Index(
+                "ix_outbox_messages_pending",
+                "id",
+                postgresql_where=text("dead_at IS NULL"),
+            ),
+        )
+
+        # Monotonic id doubles as the relay order
+        id = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+        # Celery task name and its keyword arguments
+        task_name = mapped_column(String(255), nullable=False)
+        payload = mapped_column(JSON, nullable=False)
+        # Trace of the enqueuing request, continued when the task runs
+        traceparent = mapped_column(String(55), nullable=True)
+
+        # Relay bookkeeping
+        attempts = mapped_column(Integer, nullable=False, server_default=text("0"))
+        last_error = mapped_column(Text, nullable=True)
+        # Failed messages wait out a backoff before the next attempt
+        available_at = mapped_column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+        # Set once the message ran out of attempts; the relay skips it
+        dead_at = mapped_column(DateTime(timezone=True), nullable=True)
+
+        created_at = mapped_column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+
+    # Keep only table metadata for create_all
@@ -22,7 +22,7 @@ def map_password_resets_table() -> None:
         
         # Reset information
         token = mapped_column(String(255), nullable=False)
-        expires_at = mapped_column(DateTime(timezone=True), nullable=False)
+        expires_at = mapped_column(DateTime(timezone=True), nullable=False, index=True)
         is_used = mapped_column(Boolean, default=False)
         
         # Timestamps
@@ -3,9 +3,24 @@ SQLAlchemy mapping for Payment table metadata.
 """
 
 from datetime import datetime
-from sqlalchemy import Integer, String, Float, DateTime, ForeignKey, JSON, Boolean
+from typing import Any, ClassVar
+
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column
 
+from app.infrastructure.persistence_sqla.json_keys import json_text
+from app.infrastructure.persistence_sqla.partitioning import (
+    register_partition_bootstrap,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
@@ -17,10 +32,14 @@ def map_payments_table() -> None:
     @mapping_registry.mapped
     class PaymentsTable:
         __tablename__ = "payments"
-        __table_args__ = {"extend_existing": True}
+        # Partitioned by month of creation; see persistence_sqla.partitioning.
+        __table_args__: ClassVar[dict[str, Any]] = {
+            "extend_existing": True,
+            "postgresql_partition_by": "RANGE (created_at)",
+        }
 
-        # Primary key
-        id = mapped_column(Integer, primary_key=True, index=True)
+        # Primary key (must include the partition key)
+        id = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
 
         # Foreign keys
         user_id = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -33,14 +52,43 @@ def map_payments_table() -> None:
         status = mapped_column(String(50), nullable=False, default="pending")
         stripe_payment_intent_id = mapped_column(String(255), nullable=True)
         stripe_customer_id = mapped_column(String(255), nullable=True)
-        payment_data = mapped_column(JSON, nullable=True)
+        payment_data = mapped_column(JSONB, nullable=True)
         payment_method = mapped_column(String(50), nullable=True)
         payment_type = mapped_column(String(50), nullable=True)
         date = mapped_column(DateTime, nullable=True, default=datetime.utcnow)
-        data_json = mapped_column(JSON, nullable=True)
+        data_json = mapped_column(JSONB, nullable=True)
 
         # Timestamps
-        created_at = mapped_column(DateTime, default=datetime.utcnow)
+        created_at = mapped_column(
+            DateTime,
+            primary_key=True,
+            default=datetime.utcnow,
+            server_default=text("timezone('utc', now())"),
+        )
         updated_at = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    table = PaymentsTable.__table__
+    # A user's history page in order, and the payments of a subscription.
+    Index(
+        "ix_payments_user_id_created_at_id",
+        table.c.user_id,
+        table.c.created_at.desc(),
+        table.c.id,
+    )
+    Index("ix_payments_subscription_user_id", table.c.subscription_user_id)
+    # Lookups by an embedded key: the checkout session by expression, any
+    # other key (e.g. a renewal's invoice) by containment.
+    Index(
+        "ix_payments_checkout_session_id",
+        json_text(table.c.data_json, "checkout_session_id"),
+    )
+    Index(
+        "ix_payments_data_json",
+        table.c.data_json,
+        postgresql_using="gin",
+        postgresql_ops={"data_json": "jsonb_path_ops"},
+    )
+
+    register_partition_bootstrap(table)
+
     # Keep only table metadata for create_all
@@ -6,6 +6,9 @@ from datetime import datetime
 from sqlalchemy import Integer, String, DateTime, Boolean, ForeignKey
 from sqlalchemy.orm import mapped_column
 
+from app.infrastructure.persistence_sqla.partitioning import (
+    register_partition_bootstrap,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
@@ -17,10 +20,14 @@ def map_sessions_table() -> None:
     @mapping_registry.mapped
     class SessionsTable:
         __tablename__ = "sessions"
-        __table_args__ = {"extend_existing": True}
+        # Partitioned by month of expiry; see persistence_sqla.partitioning.
+        __table_args__ = {
+            "extend_existing": True,
+            "postgresql_partition_by": "RANGE (expires_at)",
+        }
         
-        # Primary key
-        id = mapped_column(Integer, primary_key=True, index=True)
+        # Primary key (must include the partition key)
+        id = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
         
         # Foreign key to users table
         user_id = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -34,8 +41,10 @@ def map_sessions_table() -> None:
         
         # Timestamps
         created_at = mapped_column(DateTime, default=datetime.utcnow)
-        expires_at = mapped_column(DateTime, nullable=False)
+        expires_at = mapped_column(DateTime, primary_key=True, nullable=False, index=True)
         last_activity = mapped_column(DateTime, default=datetime.utcnow)
         is_active = mapped_column(Boolean, default=True)
+
+    register_partition_bootstrap(SessionsTable.__table__)
     
     # See comment in user mapping: keep only table metadata for create_all
@@ -0,0 +1,70 @@
+"""
+SQLAlchemy mapping for the Stripe webhook inbox table metadata.
+"""
+
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.orm import mapped_column
+
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def map_stripe_events_table() -> None:
+    """Map Stripe events to database table (idempotent)."""
+    if "stripe_events" in mapping_registry.metadata.tables:
+        return
+
+    @mapping_registry.mapped
+    class StripeEventsTable:
+        __tablename__ = "stripe_events"
+        # Only the live backlog is indexed in consumption order.
+        __table_args__ = (
+            Index(
+                "ix_stripe_events_pending",
+                "created",
+                "id",
+                postgresql_where=text("processed_at IS NULL AND dead_at IS NULL"),
+            ),
+        )
+
+        # Arrival order; breaks ties between events of the same second
+        id = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+
+        # Stripe's event id; deliveries of the same event are stored once
+        event_id = mapped_column(String(255), nullable=False, unique=True)
+        type = mapped_column(String(100), nullable=False)
+        customer_id = mapped_column(String(255), nullable=True)
+        # Event time as reported by Stripe (unix seconds)
+        created = mapped_column(BigInteger, nullable=False)
+        payload = mapped_column(JSON, nullable=False)
+
+        received_at = mapped_column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+        processed_at = mapped_column(DateTime(timezone=True), nullable=True)
+
+        # Consumer bookkeeping
+        attempts = mapped_column(Integer, nullable=False, server_default=text("0"))
+        last_error = mapped_column(Text, nullable=True)
+        # Failed events wait out a backoff before the next attempt
+        available_at = mapped_column(
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=text("CURRENT_TIMESTAMP"),
+        )
+        # Set once the event ran out of attempts; the consumer skips it
+        dead_at = mapped_column(DateTime(timezone=True), nullable=True)
+        # Kept past Stripe's retry window so late redeliveries stay deduplicated
+        expires_at = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+
+    # Keep only table metadata for create_all
@@ -3,9 +3,20 @@ SQLAlchemy mapping for SubscriptionUser table metadata.
 """
 
 from datetime import datetime
-from sqlalchemy import Integer, String, DateTime, Boolean, ForeignKey, JSON
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column
 
+from app.infrastructure.persistence_sqla.json_keys import json_text
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
@@ -32,12 +43,21 @@ def map_subscription_users_table() -> None:
         end_date = mapped_column(DateTime(timezone=True), nullable=True)
         stripe_subscription_id = mapped_column(String(255), nullable=True)
         stripe_customer_id = mapped_column(String(255), nullable=True)
+        # Stripe time (unix seconds) of the event that set `status`; older
+        # events arriving late are not applied over it
+        status_event_created = mapped_column(BigInteger, nullable=True)
         client_secret = mapped_column(String(255), nullable=True)
         subscription_data = mapped_column(JSON, nullable=True)
-        data_json = mapped_column(JSON, nullable=True, default=dict)
+        data_json = mapped_column(JSONB, nullable=True, default=dict)
 
         # Timestamps
         created_at = mapped_column(DateTime(timezone=True), server_default="now()")
         updated_at = mapped_column(DateTime(timezone=True), onupdate="now()")
 
+    # Stripe redirects and webhooks find the row by its checkout session.
+    Index(
+        "ix_subscription_users_checkout_session_id",
+        json_text(SubscriptionUsersTable.__table__.c.data_json, "checkout_session_id"),
+    )
+
     # Keep only table metadata for create_all
@@ -2,7 +2,24 @@
 SQLAlchemy mapping for User table metadata.
 """
 
-from sqlalchemy import Integer, String, DateTime, Boolean, Text, Enum, ForeignKey
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    ColumnElement,
+    Connection,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import mapped_column
 import sqlalchemy as sa
 
@@ -10,6 +27,18 @@ from app.domain.enums.user_role import UserRole
 from app.infrastructure.persistence_sqla.registry import mapping_registry
 
 
+def user_email_lower(table: Table) -> ColumnElement[str]:
+    """`lower(email)`, as indexed for prefix search."""
+    return func.lower(table.c.email)
+
+
+def user_full_name(table: Table) -> ColumnElement[str]:
+    """`first_name || ' ' || last_name`, as indexed for substring search."""
+    return table.c.first_name.op("||")(literal_column("' '")).op("||")(
+        table.c.last_name
+    )
+
+
 def map_users_table() -> None:
     """Map User entity to database table (idempotent)."""
     # Idempotency guard: don't remap if already present
@@ -54,6 +83,36 @@ def map_users_table() -> None:
         # Subscription
         subscription = mapped_column(String(50), nullable=True)
     
+    table = UsersTable.__table__
+
+    # Admin listing filters. Substring search on names goes through
+    # trigrams; the flags and the role are left to the planner, which only
+    # reaches for an index on them for rare values anyway.
+    Index(
+        "ix_users_email_lower_pattern",
+        user_email_lower(table).label("email_lower"),
+        postgresql_ops={"email_lower": "text_pattern_ops"},
+    )
+    Index(
+        "ix_users_full_name_trgm",
+        user_full_name(table).label("full_name"),
+        postgresql_using="gin",
+        postgresql_ops={"full_name": "gin_trgm_ops"},
+    )
+    Index("ix_users_country_id", table.c.country_id)
+    Index("ix_users_created_at", table.c.created_at)
+    Index("ix_users_last_login", table.c.last_login)
+
+    @event.listens_for(table, "before_create")
+    def _create_trgm_extension(
+        _target: Table,
+        connection: Connection,
+        **_: Any,
+    ) -> None:
+        if connection.dialect.name != "postgresql":
+            return
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
     # Note: We intentionally do not map the domain `User` entity here.
     # The purpose of this module during init_db is to define table metadata
     # via the mapped `UsersTable` so that `create_all` can create tables.
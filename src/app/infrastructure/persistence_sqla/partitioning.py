@@ -0,0 +1,171 @@
+"""
+Monthly range partitioning of the append-only tables.
+
+Each partitioned table has one partition per calendar month, named
+`<table>_pYYYYMM`, plus a `<table>_default` partition that catches rows
+outside every pre-created range so inserts never fail. Partitions are
+created ahead of time and retired once their whole range is past the
+retention cutoff, which turns bulk cleanup into a catalog operation.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import StrEnum
+from typing import Any, Final
+
+from sqlalchemy import Connection, Table, event, text
+
+PARTITION_MONTHS_AHEAD: Final[int] = 3
+
+
+class RetentionAction(StrEnum):
+    DROP = "drop"
+    # Keeps the retired partition as a standalone table for archiving.
+    DETACH = "detach"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PartitionSpec:
+    table: str
+    column: str
+    timezone: bool
+    retention_months: int
+    action: RetentionAction
+    # Runs once a partition is detached, before it is dropped or kept;
+    # `{partition}` is replaced with its name.
+    before_retire_sql: str | None = None
+
+
+PARTITION_SPECS: Final[tuple[PartitionSpec, ...]] = (
+    # Keyed on expiry: a month is retired as soon as every row in it expired.
+    PartitionSpec(
+        table="auth_sessions",
+        column="expiration",
+        timezone=True,
+        retention_months=0,
+        action=RetentionAction.DROP,
+    ),
+    PartitionSpec(
+        table="sessions",
+        column="expires_at",
+        timezone=False,
+        retention_months=0,
+        action=RetentionAction.DROP,
+    ),
+    PartitionSpec(
+        table="notifications",
+        column="created_at",
+        timezone=False,
+        retention_months=12,
+        action=RetentionAction.DROP,
+        # Unread rows dropped with the partition leave the counters.
+        before_retire_sql=(
+            "UPDATE notification_counters AS c "
+            "SET unread = GREATEST(c.unread - r.unread, 0) "
+            "FROM (SELECT user_id, count(*) AS unread FROM {partition} "
+            "WHERE is_read IS NOT TRUE GROUP BY user_id) AS r "
+            "WHERE c.user_id = r.user_id"
+        ),
+    ),
+    PartitionSpec(
+        table="payments",
+        column="created_at",
+        timezone=False,
+        retention_months=24,
+        action=RetentionAction.DETACH,
+    ),
+)
+
+SPECS_BY_TABLE: Final[dict[str, PartitionSpec]] = {
+    spec.table: spec for spec in PARTITION_SPECS
+}
+
+
+def month_start(moment: date) -> date:
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def parse_partition_month(table: str, name: str) -> date | None:
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})(\d{{2}})", name)
+    if match is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def bound_literal(spec: PartitionSpec, month: date) -> str:
+    # Bounds of `timestamptz` keys are pinned to UTC rather than to the
+    # session time zone of whoever runs the DDL.
+    suffix = "+00" if spec.timezone else ""
+    return f"'{month:%Y-%m-%d} 00:00:00{suffix}'"
+
+
+def partition_bounds(spec: PartitionSpec, month: date) -> tuple[str, str]:
+    return bound_literal(spec, month), bound_literal(spec, add_months(month, 1))
+
+
+def partition_of_clause(spec: PartitionSpec, month: date) -> str:
+    lower, upper = partition_bounds(spec, month)
+    return f"FOR VALUES FROM ({lower}) TO ({upper})"
+
+
+def create_partition_ddl(spec: PartitionSpec, month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(spec.table, month)} "
+        f"PARTITION OF {spec.table} {partition_of_clause(spec, month)}"
+    )
+
+
+def create_default_partition_ddl(spec: PartitionSpec) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {default_partition_name(spec.table)} "
+        f"PARTITION OF {spec.table} DEFAULT"
+    )
+
+
+def months_to_prepare(now: datetime, months_ahead: int) -> list[date]:
+    current = month_start(now)
+    return [add_months(current, offset) for offset in range(months_ahead + 1)]
+
+
+def is_retired(spec: PartitionSpec, month: date, now: datetime) -> bool:
+    """
+    True once the partition's upper bound is at least `retention_months`
+    in the past; bounds fall on month starts, so whole months suffice.
+    """
+    upper = add_months(month, 1)
+    return add_months(upper, spec.retention_months) <= month_start(now)
+
+
+def register_partition_bootstrap(table: Table) -> None:
+    """
+    Lets `create_all` produce a usable partitioned table: the default
+    partition and the months around now are created right after it.
+    """
+    spec = SPECS_BY_TABLE[table.name]
+
+    @event.listens_for(table, "after_create")
+    def _create_initial_partitions(
+        _target: Table,
+        connection: Connection,
+        **_: Any,
+    ) -> None:
+        if connection.dialect.name != "postgresql":
+            return
+        now = datetime.now(tz=timezone.utc)
+        connection.execute(text(create_default_partition_ddl(spec)))
+        for month in months_to_prepare(now, PARTITION_MONTHS_AHEAD):
+            connection.execute(text(create_partition_ddl(spec, month)))
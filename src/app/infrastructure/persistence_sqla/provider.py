@@ -13,7 +13,14 @@ from app.infrastructure.adapters.types import (
     MainAsyncSession,
 )
 from app.infrastructure.auth.adapters.types import AuthAsyncSession
+from app.infrastructure.metrics.sqla import install_pool_metrics
 from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.persistence_sqla.query_profiler import (
+    QUERY_STATS_MAX_SHAPES,
+    QueryStats,
+    install_query_profiler,
+)
+from app.infrastructure.tracing.sqla import install_query_tracing
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +28,7 @@ log = logging.getLogger(__name__)
 async def get_async_engine(
     dsn: PostgresDsn,
     engine_config: SqlaEngineConfig,
+    query_stats: QueryStats,
 ) -> AsyncIterator[AsyncEngine]:
     async_engine = create_async_engine(
         url=dsn,
@@ -31,6 +39,12 @@ async def get_async_engine(
         connect_args={"connect_timeout": 5},
         pool_pre_ping=True,
     )
+    install_query_profiler(async_engine.sync_engine, query_stats)
+    install_query_tracing(async_engine.sync_engine)
+    install_pool_metrics(
+        async_engine.sync_engine,
+        capacity=engine_config.pool_size + engine_config.max_overflow,
+    )
     log.debug("Async engine created with DSN: %s", dsn)
     yield async_engine
     log.debug("Disposing async engine...")
@@ -38,6 +52,10 @@ async def get_async_engine(
     log.debug("Engine is disposed.")
 
 
+def get_query_stats() -> QueryStats:
+    return QueryStats(max_shapes=QUERY_STATS_MAX_SHAPES)
+
+
 def get_async_session_factory(
     engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
@@ -0,0 +1,202 @@
+"""
+Counts and times every statement sent through an engine. Each one is
+recorded under its shape (the SQL with literals and expanded bind lists
+folded), into the process-wide `QueryStats` and, while `profile_queries()`
+is active, into the `QueryProfile` of the current request.
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+from app.infrastructure.exceptions.base import InfrastructureError
+
+QUERY_STATS_MAX_SHAPES: Final[int] = 1000
+SHAPE_MAX_LENGTH: Final[int] = 2000
+
+_STARTED_KEY: Final[str] = "query_profiler_started"
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|(?<!\$)\b\d+(?:\.\d+)?\b")
+# A bind parameter in any of the paramstyles our drivers use.
+_BIND = r"(?:%\(\w+\)s|%s|\$\d+|\?|:\w+)"
+# `IN (...)` lists are expanded to one parameter per element.
+_BIND_LIST = re.compile(rf"\(\s*{_BIND}(?:\s*,\s*{_BIND})+\s*\)")
+
+_current_profile: ContextVar["QueryProfile | None"] = ContextVar(
+    "query_profile",
+    default=None,
+)
+
+
+class QueryBudgetExceededError(InfrastructureError):
+    pass
+
+
+def statement_shape(statement: str) -> str:
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _LITERAL.sub("?", shape)
+    shape = _BIND_LIST.sub("(...)", shape)
+    return shape[:SHAPE_MAX_LENGTH]
+
+
+@dataclass(slots=True)
+class QueryProfile:
+    statements: int = 0
+    total_s: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, shape: str, elapsed_s: float) -> None:
+        self.statements += 1
+        self.total_s += elapsed_s
+        self.shapes[shape] += 1
+
+    def repeated(self, more_than: int) -> dict[str, int]:
+        """Shapes run more than `more_than` times, the usual sign of N+1."""
+        return {shape: n for shape, n in self.shapes.items() if n > more_than}
+
+
+@dataclass(slots=True)
+class ShapeStats:
+    shape: str
+    count: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+
+
+class QueryStats:
+    """
+    Process-wide totals per statement shape. Bounded: once `max_shapes`
+    are tracked, new shapes are only counted in `untracked`.
+    """
+
+    def __init__(self, *, max_shapes: int) -> None:
+        self._max_shapes = max_shapes
+        self._shapes: dict[str, ShapeStats] = {}
+        self.untracked = 0
+
+    def record(self, shape: str, elapsed_s: float) -> None:
+        stats = self._shapes.get(shape)
+        if stats is None:
+            if len(self._shapes) >= self._max_shapes:
+                self.untracked += 1
+                return
+            stats = self._shapes[shape] = ShapeStats(shape)
+        stats.count += 1
+        stats.total_s += elapsed_s
+        stats.max_s = max(stats.max_s, elapsed_s)
+
+    def slowest(self, limit: int) -> list[ShapeStats]:
+        """By total time, which weighs frequent and slow shapes alike."""
+        return sorted(
+            self._shapes.values(),
+            key=lambda stats: stats.total_s,
+            reverse=True,
+        )[:limit]
+
+    def reset(self) -> None:
+        self._shapes.clear()
+        self.untracked = 0
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudget:
+    max_statements: int
+    # A shape run more often than this in one request is reported as N+1.
+    max_repeats: int
+
+    def violations(self, profile: QueryProfile) -> list[str]:
+        violations = []
+        if profile.statements > self.max_statements:
+            violations.append(
+                f"{profile.statements} statements, "
+                f"budget is {self.max_statements}"
+            )
+        violations += [
+            f"{count}x {shape}"
+            for shape, count in profile.repeated(self.max_repeats).items()
+        ]
+        return violations
+
+    def check(self, profile: QueryProfile, *, where: str) -> None:
+        """
+        :raises QueryBudgetExceededError:
+        """
+        violations = self.violations(profile)
+        if violations:
+            raise QueryBudgetExceededError(
+                f"Query budget exceeded in {where}: " + "; ".join(violations)
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudgets:
+    default: QueryBudget
+    # Statement ceilings by endpoint, e.g. "POST /api/v1/auth/signup".
+    endpoints: Mapping[str, int] = field(default_factory=dict)
+
+    def for_endpoint(self, endpoint: str) -> QueryBudget:
+        max_statements = self.endpoints.get(endpoint)
+        if max_statements is None:
+            return self.default
+        return QueryBudget(
+            max_statements=max_statements,
+            max_repeats=self.default.max_repeats,
+        )
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    """Records the statements run in this context into a fresh profile."""
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextmanager
+def query_budget(budget: QueryBudget, *, where: str) -> Iterator[QueryProfile]:
+    """
+    For tests: fails the block if it runs more statements than `budget`.
+
+    :raises QueryBudgetExceededError:
+    """
+    with profile_queries() as profile:
+        yield profile
+    budget.check(profile, where=where)
+
+
+def install_query_profiler(engine: Engine, stats: QueryStats) -> None:
+    def finish(info: dict[Any, Any], statement: str) -> None:
+        started = info.get(_STARTED_KEY)
+        if not started:
+            return
+        elapsed_s = time.perf_counter() - started.pop()
+        shape = statement_shape(statement)
+        stats.record(shape, elapsed_s)
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(shape, elapsed_s)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn: Connection, _cursor: Any, statement: str, *_: Any) -> None:
+        finish(conn.info, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(context: ExceptionContext) -> None:
+        if context.connection is not None and context.statement is not None:
+            finish(context.connection.info, context.statement)
@@ -0,0 +1,88 @@
+import logging
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.exceptions.base import InfrastructureError
+
+log = logging.getLogger(__name__)
+
+ALEMBIC_DIR_PATH: Final[Path] = Path(__file__).parent / "alembic"
+
+
+class SchemaVersionMismatchError(InfrastructureError):
+    pass
+
+
+@cache
+def get_packaged_heads() -> frozenset[str]:
+    """
+    Revision heads shipped with this build.
+    Parsing the scripts directory is done once per process.
+    """
+    from alembic.script import ScriptDirectory  # keeps alembic off the import path
+
+    script = ScriptDirectory(str(ALEMBIC_DIR_PATH))
+    return frozenset(script.get_heads())
+
+
+def stamp_packaged_heads(connection: Connection) -> None:
+    """
+    Records a schema just built by `create_all` as being at the packaged
+    heads, so `alembic upgrade head` does not try to build it again.
+    A database that already carries a revision is left to the migrations.
+    """
+    from alembic.migration import MigrationContext  # see get_packaged_heads
+    from alembic.script import ScriptDirectory
+
+    context = MigrationContext.configure(connection)
+    if context.get_current_heads():
+        return
+    context.stamp(ScriptDirectory(str(ALEMBIC_DIR_PATH)), "heads")
+
+
+async def read_database_heads(engine: AsyncEngine) -> frozenset[str]:
+    """
+    Reads the revisions stamped in `alembic_version` with a single query.
+    A database that was never migrated has no such table and yields no heads.
+    """
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:
+            return frozenset()
+        return frozenset(result.scalars().all())
+
+
+def ensure_heads_match(
+    *,
+    database_heads: frozenset[str],
+    packaged_heads: frozenset[str],
+) -> None:
+    """
+    :raises SchemaVersionMismatchError:
+    """
+    if database_heads != packaged_heads:
+        raise SchemaVersionMismatchError(
+            "Database schema is not at the packaged Alembic head: "
+            f"database={sorted(database_heads)}, "
+            f"expected={sorted(packaged_heads)}. "
+            "Run `alembic upgrade head` before starting the app.",
+        )
+
+
+async def verify_schema_version(engine: AsyncEngine) -> None:
+    """
+    :raises SchemaVersionMismatchError:
+    """
+    packaged_heads = get_packaged_heads()
+    database_heads = await read_database_heads(engine)
+    ensure_heads_match(
+        database_heads=database_heads,
+        packaged_heads=packaged_heads,
+    )
+    log.info("Database schema is at Alembic head %s.", sorted(packaged_heads))
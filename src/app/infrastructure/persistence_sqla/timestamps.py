@@ -0,0 +1,13 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement
+
+
+def utc_for(column: ColumnElement[datetime], value: datetime) -> datetime:
+    """
+    `value` in the form `column` stores: aware for `timestamptz`, UTC wall
+    time for a naive `timestamp`. asyncpg rejects the other form.
+    """
+    if column.type.timezone:  # type: ignore[attr-defined]
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
@@ -0,0 +1,22 @@
+from sqlalchemy import Select, Table, select
+
+
+def build_user_history_page(
+    table: Table,
+    *,
+    user_id: int,
+    offset: int,
+    limit: int,
+) -> Select:
+    """
+    Newest first, ties broken by id so pages never overlap. The order is
+    exactly that of the table's `(user_id, created_at DESC, id)` index,
+    so a page is read off the index without sorting the user's history.
+    """
+    return (
+        select(table)
+        .where(table.c.user_id == user_id)
+        .order_by(table.c.created_at.desc(), table.c.id)
+        .offset(offset)
+        .limit(limit)
+    )
@@ -0,0 +1,543 @@
+import logging
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
+
+from sqlalchemy import (
+    Insert,
+    Table,
+    Update,
+    bindparam,
+    case,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.subscription.ports import (
+    BillingEvent,
+    BillingEventInbox,
+    BillingStateWriter,
+)
+from app.infrastructure.adapters.constants import DB_QUERY_FAILED
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.json_keys import json_text
+from app.infrastructure.persistence_sqla.mappings.payment import map_payments_table
+from app.infrastructure.persistence_sqla.mappings.stripe_event import (
+    map_stripe_events_table,
+)
+from app.infrastructure.persistence_sqla.mappings.subscription_user import (
+    map_subscription_users_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+log = logging.getLogger(__name__)
+
+# Stripe retries a delivery for up to three days; ids are kept well past that.
+STRIPE_EVENT_RETENTION: Final[timedelta] = timedelta(days=30)
+# Transaction-level advisory lock serializing inbox consumers.
+BILLING_EVENTS_LOCK_KEY: Final[int] = 0x5E7E_B111
+# An event failing this often is dead-lettered instead of retried.
+STRIPE_EVENT_MAX_ATTEMPTS: Final[int] = 10
+STRIPE_EVENT_RETRY_BASE_S: Final[float] = 5.0
+STRIPE_EVENT_MAX_RETRY_DELAY_S: Final[float] = 30 * 60.0
+
+# Stripe subscription statuses in terms of `subscription_users.status`.
+SUBSCRIPTION_STATUSES: Final[Mapping[str, str]] = {
+    "active": "active",
+    "trialing": "active",
+    "past_due": "past_due",
+    "unpaid": "past_due",
+    "canceled": "cancelled",
+    "incomplete_expired": "cancelled",
+}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CheckoutCompletion:
+    event_created: int
+    checkout_session_id: str
+    stripe_subscription_id: str | None
+    stripe_customer_id: str | None
+    payment_intent_id: str | None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StatusChange:
+    event_created: int
+    status: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RenewalPayment:
+    invoice_id: str
+    stripe_subscription_id: str
+    stripe_customer_id: str | None
+    payment_intent_id: str | None
+    amount: float
+    currency: str
+
+
+@dataclass(slots=True)
+class BillingChanges:
+    """
+    The net effect of a batch of events: one write per checkout session,
+    per subscription and per invoice, however many events touched them.
+    """
+
+    completions: dict[str, CheckoutCompletion] = field(default_factory=dict)
+    statuses: dict[str, StatusChange] = field(default_factory=dict)
+    renewals: dict[str, RenewalPayment] = field(default_factory=dict)
+
+
+def _id_of(value: Any) -> str | None:
+    # Related objects arrive as ids unless the endpoint expands them.
+    if isinstance(value, Mapping):
+        value = value.get("id")
+    return str(value) if value else None
+
+
+def _supersedes(change: StatusChange | None, event_created: int) -> bool:
+    # Events of the same second keep their delivery order.
+    return change is None or change.event_created <= event_created
+
+
+def fold_stripe_events(events: Sequence[BillingEvent]) -> BillingChanges:
+    """
+    For each subscription the latest status wins, and a checkout completion
+    supersedes any status reported before it. Events should come in the
+    order they happened, which decides between events of the same second.
+    """
+    changes = BillingChanges()
+    for event in events:
+        obj = event.object
+        if event.type == "checkout.session.completed":
+            session_id = _id_of(obj)
+            if session_id is None:
+                continue
+            subscription_id = _id_of(obj.get("subscription"))
+            if subscription_id is not None and _supersedes(
+                changes.statuses.get(subscription_id), event.created
+            ):
+                changes.statuses.pop(subscription_id, None)
+            changes.completions[session_id] = CheckoutCompletion(
+                event_created=event.created,
+                checkout_session_id=session_id,
+                stripe_subscription_id=subscription_id,
+                stripe_customer_id=event.customer_id,
+                payment_intent_id=_id_of(obj.get("payment_intent")),
+            )
+        elif event.type in (
+            "customer.subscription.updated",
+            "customer.subscription.deleted",
+        ):
+            subscription_id = _id_of(obj)
+            status = (
+                "cancelled"
+                if event.type == "customer.subscription.deleted"
+                else SUBSCRIPTION_STATUSES.get(str(obj.get("status")))
+            )
+            if (
+                subscription_id is not None
+                and status is not None
+                and _supersedes(changes.statuses.get(subscription_id), event.created)
+            ):
+                changes.statuses[subscription_id] = StatusChange(
+                    event_created=event.created,
+                    status=status,
+                )
+        elif event.type == "invoice.paid":
+            invoice_id = _id_of(obj)
+            subscription_id = _id_of(obj.get("subscription"))
+            # The first invoice is settled by the checkout completion.
+            if (
+                invoice_id is None
+                or subscription_id is None
+                or obj.get("billing_reason") == "subscription_create"
+            ):
+                continue
+            changes.renewals[invoice_id] = RenewalPayment(
+                invoice_id=invoice_id,
+                stripe_subscription_id=subscription_id,
+                stripe_customer_id=event.customer_id,
+                payment_intent_id=_id_of(obj.get("payment_intent")),
+                amount=int(obj.get("amount_paid") or 0) / 100,
+                currency=str(obj.get("currency") or "usd").upper(),
+            )
+    return changes
+
+
+class SqlaBillingEventInbox(BillingEventInbox):
+    def __init__(self, session: MainAsyncSession):
+        map_stripe_events_table()
+        self._session = session
+
+    def _table(self) -> Table:
+        return mapping_registry.metadata.tables["stripe_events"]  # type: ignore
+
+    async def append(self, event: Mapping[str, Any]) -> bool:
+        table = self._table()
+        obj = (event.get("data") or {}).get("object") or {}
+        stmt = (
+            pg_insert(table)
+            .values(
+                event_id=str(event["id"]),
+                type=str(event["type"]),
+                customer_id=_id_of(obj.get("customer")),
+                created=int(event["created"]),
+                payload=dict(event),
+                expires_at=datetime.now(tz=UTC) + STRIPE_EVENT_RETENTION,
+            )
+            .on_conflict_do_nothing(index_elements=[table.c.event_id])
+            .returning(table.c.id)
+        )
+        try:
+            return (await self._session.execute(stmt)).first() is not None
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def claim_batch(self, limit: int) -> Sequence[BillingEvent]:
+        table = self._table()
+        try:
+            locked = (
+                await self._session.execute(
+                    select(func.pg_try_advisory_xact_lock(BILLING_EVENTS_LOCK_KEY))
+                )
+            ).scalar_one()
+            if not locked:
+                return []
+            rows = (
+                await self._session.execute(
+                    select(
+                        table.c.id,
+                        table.c.type,
+                        table.c.customer_id,
+                        table.c.created,
+                        table.c.payload,
+                        table.c.attempts,
+                    )
+                    .where(
+                        table.c.processed_at.is_(None),
+                        table.c.dead_at.is_(None),
+                        table.c.available_at <= func.now(),
+                    )
+                    .order_by(table.c.created, table.c.id)
+                    .limit(limit)
+                )
+            ).all()
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        return [
+            BillingEvent(
+                id=row.id,
+                type=row.type,
+                customer_id=row.customer_id,
+                created=row.created,
+                object=(row.payload.get("data") or {}).get("object") or {},
+                attempts=row.attempts,
+            )
+            for row in rows
+        ]
+
+    async def mark_processed(self, ids: Sequence[int]) -> None:
+        table = self._table()
+        try:
+            await self._session.execute(
+                table.update()
+                .where(table.c.id.in_(ids))
+                .values(processed_at=datetime.now(tz=UTC))
+            )
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+    async def mark_failed(self, failures: Sequence[tuple[BillingEvent, str]]) -> None:
+        table = self._table()
+        try:
+            await self._session.execute(
+                table.update()
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    attempts=table.c.attempts + 1,
+                    last_error=bindparam("b_error"),
+                    available_at=bindparam("b_available_at"),
+                    dead_at=bindparam("b_dead_at"),
+                ),
+                _failure_updates(failures, datetime.now(tz=UTC)),
+            )
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+
+
+def retry_delay_s(attempts: int) -> float:
+    """Backoff after the `attempts`-th failed try to apply an event."""
+    return min(
+        STRIPE_EVENT_RETRY_BASE_S * 2.0 ** (attempts - 1),
+        STRIPE_EVENT_MAX_RETRY_DELAY_S,
+    )
+
+
+def _failure_updates(
+    failures: Sequence[tuple[BillingEvent, str]],
+    now: datetime,
+) -> list[dict[str, Any]]:
+    updates = []
+    for event, error in failures:
+        attempts = event.attempts + 1
+        dead = attempts >= STRIPE_EVENT_MAX_ATTEMPTS
+        if dead:
+            log.error(
+                "Billing events: event %s dead-lettered after %d attempts: %s",
+                event.id,
+                attempts,
+                error,
+            )
+        updates.append(
+            {
+                "b_id": event.id,
+                "b_error": error,
+                "b_available_at": now + timedelta(seconds=retry_delay_s(attempts)),
+                "b_dead_at": now if dead else None,
+            },
+        )
+    return updates
+
+
+class SqlaBillingStateWriter(BillingStateWriter):
+    """
+    Writes a folded batch with one executemany per kind of change, in the
+    order completions, statuses, renewals. The batch is written under a
+    savepoint; if it fails, each event is retried under its own savepoint
+    so one bad event does not hold back the others.
+    """
+
+    def __init__(self, session: MainAsyncSession):
+        map_subscription_users_table()
+        map_payments_table()
+        self._session = session
+
+    async def apply(
+        self,
+        events: Sequence[BillingEvent],
+    ) -> Sequence[tuple[BillingEvent, str]]:
+        try:
+            reason = await self._write_under_savepoint(events)
+            if reason is None:
+                return []
+            if len(events) == 1:
+                failures = [(events[0], reason)]
+            else:
+                failures = []
+                for event in events:
+                    reason = await self._write_under_savepoint([event])
+                    if reason is not None:
+                        failures.append((event, reason))
+        except SQLAlchemyError as error:
+            raise DataMapperError(DB_QUERY_FAILED) from error
+        for event, reason in failures:
+            log.warning("Billing events: applying event %s failed: %s", event.id, reason)
+        return failures
+
+    async def _write_under_savepoint(
+        self,
+        events: Sequence[BillingEvent],
+    ) -> str | None:
+        """Returns the error if the events could not be applied."""
+        try:
+            async with self._session.begin_nested():
+                await self._write(fold_stripe_events(events))
+        # Rejected writes and malformed payloads. A lost connection lands
+        # here too, but then recording the failures fails and nothing is
+        # committed.
+        except (SQLAlchemyError, ValueError, TypeError) as error:
+            return str(error)
+        return None
+
+    async def _write(self, changes: BillingChanges) -> None:
+        tables = mapping_registry.metadata.tables
+        subscription_users = tables["subscription_users"]  # type: ignore
+        payments = tables["payments"]  # type: ignore
+        if changes.completions:
+            params = [
+                {
+                    "b_created": completion.event_created,
+                    "b_session_id": completion.checkout_session_id,
+                    "b_subscription_id": completion.stripe_subscription_id,
+                    "b_customer_id": completion.stripe_customer_id,
+                    "b_payment_intent_id": completion.payment_intent_id,
+                }
+                for completion in changes.completions.values()
+            ]
+            await self._session.execute(
+                build_activate_subscription_user(subscription_users),
+                params,
+            )
+            await self._session.execute(
+                build_complete_checkout_payment(payments),
+                params,
+            )
+        if changes.statuses:
+            await self._session.execute(
+                build_update_subscription_status(subscription_users),
+                [
+                    {
+                        "b_subscription_id": subscription_id,
+                        "b_status": change.status,
+                        "b_created": change.event_created,
+                    }
+                    for subscription_id, change in changes.statuses.items()
+                ],
+            )
+        if changes.renewals:
+            await self._session.execute(
+                build_insert_renewal_payment(payments, subscription_users),
+                [
+                    {
+                        "b_subscription_id": renewal.stripe_subscription_id,
+                        "b_customer_id": renewal.stripe_customer_id,
+                        "b_payment_intent_id": renewal.payment_intent_id,
+                        "b_amount": renewal.amount,
+                        "b_currency": renewal.currency,
+                        "b_data_json": {"invoice_id": renewal.invoice_id},
+                        "b_invoice_id": {"invoice_id": renewal.invoice_id},
+                    }
+                    for renewal in changes.renewals.values()
+                ],
+            )
+
+
+def _checkout_session_id(table: Table) -> Any:
+    # Matches the `ix_<table>_checkout_session_id` expression indexes.
+    return json_text(table.c.data_json, "checkout_session_id")
+
+
+def _event_created(subscription_users: Table) -> Any:
+    return bindparam(
+        "b_created",
+        type_=subscription_users.c.status_event_created.type,
+    )
+
+
+def _is_not_stale(subscription_users: Table) -> Any:
+    """The bound event is no older than the status already applied."""
+    applied = subscription_users.c.status_event_created
+    return or_(applied.is_(None), applied <= _event_created(subscription_users))
+
+
+def build_activate_subscription_user(subscription_users: Table) -> Update:
+    """
+    A completion older than the current status (a late redelivery after a
+    cancellation) still records the Stripe ids but leaves the status.
+    """
+    return (
+        subscription_users.update()
+        .where(
+            _checkout_session_id(subscription_users) == bindparam("b_session_id")
+        )
+        .values(
+            status=case(
+                (_is_not_stale(subscription_users), "active"),
+                else_=subscription_users.c.status,
+            ),
+            # NULLs are ignored by greatest().
+            status_event_created=func.greatest(
+                subscription_users.c.status_event_created,
+                _event_created(subscription_users),
+            ),
+            stripe_subscription_id=func.coalesce(
+                bindparam("b_subscription_id"),
+                subscription_users.c.stripe_subscription_id,
+            ),
+            stripe_customer_id=func.coalesce(
+                bindparam("b_customer_id"),
+                subscription_users.c.stripe_customer_id,
+            ),
+        )
+    )
+
+
+def build_complete_checkout_payment(payments: Table) -> Update:
+    # The checkout flow stores the session id on the payment as well.
+    return (
+        payments.update()
+        .where(
+            _checkout_session_id(payments) == bindparam("b_session_id"),
+            payments.c.status == "pending",
+        )
+        .values(
+            status="completed",
+            stripe_payment_intent_id=bindparam("b_payment_intent_id"),
+            stripe_customer_id=bindparam("b_customer_id"),
+        )
+    )
+
+
+def build_update_subscription_status(subscription_users: Table) -> Update:
+    """Events older than the status already applied change nothing."""
+    return (
+        subscription_users.update()
+        .where(
+            subscription_users.c.stripe_subscription_id
+            == bindparam("b_subscription_id"),
+            _is_not_stale(subscription_users),
+        )
+        .values(
+            status=bindparam("b_status"),
+            status_event_created=_event_created(subscription_users),
+        )
+    )
+
+
+def build_insert_renewal_payment(
+    payments: Table,
+    subscription_users: Table,
+) -> Insert:
+    """
+    `INSERT ... SELECT` from the subscription the invoice belongs to;
+    invoices of unknown subscriptions, or already recorded (a redelivery
+    after the inbox retention), insert nothing.
+    """
+    recorded = exists().where(
+        payments.c.data_json.contains(
+            bindparam("b_invoice_id", type_=payments.c.data_json.type)
+        )
+    )
+    rows = select(
+        subscription_users.c.user_id,
+        subscription_users.c.subscription_id,
+        subscription_users.c.id,
+        bindparam("b_amount", type_=payments.c.amount.type),
+        bindparam("b_currency", type_=payments.c.currency.type),
+        literal("completed", payments.c.status.type),
+        bindparam(
+            "b_payment_intent_id",
+            type_=payments.c.stripe_payment_intent_id.type,
+        ),
+        bindparam("b_customer_id", type_=payments.c.stripe_customer_id.type),
+        bindparam("b_data_json", type_=payments.c.data_json.type),
+        text("timezone('utc', now())"),
+    ).where(
+        subscription_users.c.stripe_subscription_id == bindparam("b_subscription_id"),
+        ~recorded,
+    )
+    return payments.insert().from_select(
+        [
+            "user_id",
+            "subscription_id",
+            "subscription_user_id",
+            "amount",
+            "currency",
+            "status",
+            "stripe_payment_intent_id",
+            "stripe_customer_id",
+            "data_json",
+            "created_at",
+        ],
+        rows,
+    )
@@ -0,0 +1,85 @@
+from typing import NewType
+from urllib.parse import quote
+
+from app.application.subscription.ports import BillingGateway
+from app.infrastructure.subscription.stripe_client import StripeHttpClient
+
+StripeApiKey = NewType("StripeApiKey", str)
+
+
+def _segment(value: str) -> str:
+    """
+    IDs reach us from query strings; quoted, a `/` or `..` in one cannot
+    point the keyed request at another Stripe endpoint.
+    """
+    return quote(value, safe="")
+
+
+class StripeBillingGateway(BillingGateway):
+    def __init__(self, api_key: StripeApiKey, client: StripeHttpClient) -> None:
+        self._api_key = api_key
+        self._client = client
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self._api_key)
+
+    async def create_checkout_session(
+        self,
+        *,
+        price_id: str,
+        success_url: str,
+        cancel_url: str,
+    ) -> str:
+        session = await self._client.request(
+            "POST",
+            "/v1/checkout/sessions",
+            api_key=self._api_key,
+            params={
+                "mode": "subscription",
+                "line_items": [{"price": price_id, "quantity": 1}],
+                "success_url": success_url,
+                "cancel_url": cancel_url,
+            },
+        )
+        return str(session["id"])
+
+    async def retrieve_checkout_session(self, session_id: str) -> dict:
+        return await self._client.request(
+            "GET",
+            f"/v1/checkout/sessions/{_segment(session_id)}",
+            api_key=self._api_key,
+        )
+
+    async def cancel_subscription(self, stripe_subscription_id: str) -> None:
+        await self._client.request(
+            "DELETE",
+            f"/v1/subscriptions/{_segment(stripe_subscription_id)}",
+            api_key=self._api_key,
+        )
+
+    async def create_recurring_price(
+        self,
+        *,
+        product_name: str,
+        unit_amount: int,
+        currency: str,
+    ) -> tuple[str, str]:
+        product = await self._client.request(
+            "POST",
+            "/v1/products",
+            api_key=self._api_key,
+            params={"name": product_name},
+        )
+        price = await self._client.request(
+            "POST",
+            "/v1/prices",
+            api_key=self._api_key,
+            params={
+                "unit_amount": unit_amount,
+                "currency": currency,
+                "recurring": {"interval": "month"},
+                "product": product["id"],
+            },
+        )
+        return str(product["id"]), str(price["id"])
@@ -1,8 +1,8 @@
-import stripe
 from dataclasses import dataclass
 from datetime import datetime
 
 from app.application.subscription.ports import (
+    BillingGateway,
     PaymentRepository,
     SubscriptionUserRepository,
 )
@@ -22,11 +22,13 @@ class CancelSubscriptionHandler:
         subscription_user_repo: SubscriptionUserRepository,
         payment_repo: PaymentRepository,
         transaction_manager: TransactionManager,
+        billing_gateway: BillingGateway,
     ) -> None:
         self._current_user_service = current_user_service
         self._subs_user = subscription_user_repo
         self._payments = payment_repo
         self._tx = transaction_manager
+        self._billing = billing_gateway
 
     async def execute(self, request: CancelSubscriptionRequest) -> dict:
         user = await self._current_user_service.get_current_user()
@@ -37,15 +39,9 @@ class CancelSubscriptionHandler:
             raise ValueError("Subscription not found")
 
         # Cancel in Stripe if id exists
-        from app.setup.config.settings import load_settings
-
-        settings = load_settings()
-        stripe_cfg = getattr(settings, "stripe", None)
-        api_key = getattr(stripe_cfg, "STRIPE_API_KEY", None) if stripe_cfg else None
-        if api_key and subs_user.get("stripe_subscription_id"):
+        if self._billing.is_configured and subs_user.get("stripe_subscription_id"):
             try:
-                stripe.api_key = api_key
-                stripe.Subscription.delete(subs_user["stripe_subscription_id"])  # type: ignore[index]
+                await self._billing.cancel_subscription(subs_user["stripe_subscription_id"])  # type: ignore[index]
             except Exception:
                 pass
 
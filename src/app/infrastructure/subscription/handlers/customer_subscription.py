@@ -1,14 +1,18 @@
-import stripe
 from dataclasses import dataclass
-from datetime import datetime
+from functools import partial
 
 from app.application.subscription.ports import (
+    BillingGateway,
     PaymentRepository,
     SubscriptionRepository,
     SubscriptionUserRepository,
 )
-from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.idempotency import (
+    IdempotencyService,
+    IdempotentRequest,
+    request_fingerprint,
+)
 from app.application.notification.ports import NotificationRepository
 
 
@@ -16,6 +20,7 @@ from app.application.notification.ports import NotificationRepository
 class CreateSubscriptionRequest:
     subscription_id: int
     callback_base_url: str | None = None
+    idempotency_key: str | None = None
 
 
 class CreateSubscriptionHandler:
@@ -26,24 +31,52 @@ class CreateSubscriptionHandler:
         subscription_user_repo: SubscriptionUserRepository,
         payment_repo: PaymentRepository,
         notification_repo: NotificationRepository,
-        transaction_manager: TransactionManager,
+        billing_gateway: BillingGateway,
+        idempotency_service: IdempotencyService,
     ) -> None:
         self._current_user_service = current_user_service
         self._subs = subscription_repo
         self._subs_user = subscription_user_repo
         self._payments = payment_repo
         self._notifications = notification_repo
-        self._tx = transaction_manager
+        self._billing = billing_gateway
+        self._idempotency = idempotency_service
 
     async def execute(self, request: CreateSubscriptionRequest) -> dict:
         user = await self._current_user_service.get_current_user()
+        idempotent: IdempotentRequest | None = None
+        if request.idempotency_key is not None:
+            # A retried request must not open a second checkout session.
+            scope = "subscription.subscribe"
+            idempotent = IdempotentRequest(
+                user_id=user.id_.value,
+                scope=scope,
+                key=request.idempotency_key,
+                fingerprint=request_fingerprint(
+                    scope,
+                    {
+                        "subscription_id": request.subscription_id,
+                        "callback_base_url": request.callback_base_url,
+                    },
+                ),
+            )
+        return await self._idempotency.run(
+            idempotent,
+            partial(self._subscribe, user.id_.value, request),
+        )
+
+    async def _subscribe(
+        self,
+        user_id: int,
+        request: CreateSubscriptionRequest,
+    ) -> dict:
         plan = await self._subs.read_by_id(request.subscription_id)
         if not plan:
             raise ValueError("Subscription not found")
 
         # Create SubscriptionUser row
         subs_user_id = await self._subs_user.add(
-            user_id=user.id_.value,
+            user_id=user_id,
             subscription_id=int(plan["id"]),
             status="pending",
             data_json={},
@@ -51,7 +84,7 @@ class CreateSubscriptionHandler:
 
         # Create a Payment row (pending)
         payment_id = await self._payments.add(
-            user_id=user.id_.value,
+            user_id=user_id,
             subscription_id=int(plan["id"]),
             subscription_user_id=subs_user_id,
             amount=float(plan.get("price") or 0.0),
@@ -62,27 +95,19 @@ class CreateSubscriptionHandler:
         )
 
         # Create Stripe Checkout Session if keys exist
-        from app.setup.config.settings import load_settings
-
-        settings = load_settings()
-        stripe_cfg = getattr(settings, "stripe", None)
-        api_key = getattr(stripe_cfg, "STRIPE_API_KEY", None) if stripe_cfg else None
         checkout_session_id: str | None = None
-        if api_key and plan.get("stripe_price_id"):
-            stripe.api_key = api_key
+        if self._billing.is_configured and plan.get("stripe_price_id"):
             base = request.callback_base_url or "http://127.0.0.1:9999"
             if base.endswith("/"):
                 base = base[:-1]
             success_url = f"{base}/api/v1/subscription/success?session_id={{CHECKOUT_SESSION_ID}}"
             cancel_url = f"{base}/api/v1/subscription/cancel?session_id={{CHECKOUT_SESSION_ID}}"
             try:
-                session = stripe.checkout.Session.create(
-                    mode="subscription",
-                    line_items=[{"price": plan["stripe_price_id"], "quantity": 1}],
+                checkout_session_id = await self._billing.create_checkout_session(
+                    price_id=plan["stripe_price_id"],
                     success_url=success_url,
                     cancel_url=cancel_url,
                 )
-                checkout_session_id = session["id"]
             except Exception as e:  # noqa: BLE001
                 raise ValueError(str(e))
             # persist on subscription_user and payment
@@ -95,15 +120,10 @@ class CreateSubscriptionHandler:
                 data_json={"checkout_session_id": checkout_session_id},
             )
 
-        # Persist checkout session id on subscription user and payment
-        await self._tx.commit()
-
+        # Committed by the idempotency service, with the stored result
         return {
             "status": "success",
             "subscription_user_id": subs_user_id,
             "payment_id": payment_id,
             "checkout_session_id": checkout_session_id,
         }
-
-
-
@@ -16,13 +16,20 @@ class SubscriptionItem:
     stripe_price_id: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class SubscriptionList:
+    items: list[SubscriptionItem]
+    # Changes whenever any plan does; usable as a strong validator.
+    version: str
+
+
 class GetSubscriptionsHandler:
     def __init__(self, subscription_repo: SubscriptionRepository) -> None:
         self._repo = subscription_repo
 
-    async def execute(self) -> list[SubscriptionItem]:
-        rows = await self._repo.read_all()
-        return [
+    async def execute(self) -> SubscriptionList:
+        catalog = await self._repo.read_catalog()
+        items = [
             SubscriptionItem(
                 id=int(r["id"]),
                 name=str(r["name"]),
@@ -34,7 +41,6 @@ class GetSubscriptionsHandler:
                 stripe_product_id=r.get("stripe_product_id"),
                 stripe_price_id=r.get("stripe_price_id"),
             )
-            for r in rows
+            for r in catalog.plans
         ]
-
-
+        return SubscriptionList(items=items, version=catalog.version)
@@ -1,9 +1,8 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-import stripe
 
-from app.application.subscription.ports import SubscriptionRepository
+from app.application.subscription.ports import BillingGateway, SubscriptionRepository
 from app.application.common.ports.transaction_manager import TransactionManager
 
 
@@ -20,9 +19,11 @@ class InitSubscriptionsHandler:
         self,
         subscription_repo: SubscriptionRepository,
         transaction_manager: TransactionManager,
+        billing_gateway: BillingGateway,
     ) -> None:
         self._repo = subscription_repo
         self._tx = transaction_manager
+        self._billing = billing_gateway
 
     async def execute(self, _request: InitSubscriptionsRequest | None = None) -> list[dict]:
         definitions = [
@@ -91,13 +92,7 @@ class InitSubscriptionsHandler:
 
         # Optionally create Stripe products/prices if API key is configured
         try:
-            from app.setup.config.settings import load_settings
-
-            settings = load_settings()
-            stripe_cfg = getattr(settings, "stripe", None)
-            api_key = getattr(stripe_cfg, "STRIPE_API_KEY", None) if stripe_cfg else None
-            if api_key:
-                stripe.api_key = api_key
+            if self._billing.is_configured:
                 for item in results:
                     if item.get("stripe_product_id") and item.get("stripe_price_id"):
                         continue
@@ -105,21 +100,18 @@ class InitSubscriptionsHandler:
                     price = float(item["price"])
                     currency = str(item["currency"]).lower()
                     # Create product & price
-                    product = stripe.Product.create(name=f"{name} Plan")
-                    unit_amount = int(round(price * 100))
-                    price_obj = stripe.Price.create(
-                        unit_amount=unit_amount,
+                    product_id, price_id = await self._billing.create_recurring_price(
+                        product_name=f"{name} Plan",
+                        unit_amount=int(round(price * 100)),
                         currency=currency,
-                        recurring={"interval": "month"},
-                        product=product["id"],
                     )
                     await self._repo.update_stripe_ids(
                         id_=int(item["id"]),
-                        stripe_price_id=price_obj["id"],
-                        stripe_product_id=product["id"],
+                        stripe_price_id=price_id,
+                        stripe_product_id=product_id,
                     )
-                    item["stripe_product_id"] = product["id"]
-                    item["stripe_price_id"] = price_obj["id"]
+                    item["stripe_product_id"] = product_id
+                    item["stripe_price_id"] = price_id
         except Exception as e:  # noqa: BLE001
             log.warning("Stripe integration skipped or failed: %s", e)
 
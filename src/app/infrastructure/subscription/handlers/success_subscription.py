@@ -1,7 +1,7 @@
-import stripe
 from dataclasses import dataclass
 
 from app.application.subscription.ports import (
+    BillingGateway,
     PaymentRepository,
     SubscriptionUserRepository,
 )
@@ -19,22 +19,18 @@ class SubscriptionSuccessHandler:
         subscription_user_repo: SubscriptionUserRepository,
         payment_repo: PaymentRepository,
         transaction_manager: TransactionManager,
+        billing_gateway: BillingGateway,
     ) -> None:
         self._subs_user = subscription_user_repo
         self._payments = payment_repo
         self._tx = transaction_manager
+        self._billing = billing_gateway
 
     async def execute(self, request: SubscriptionSuccessRequest) -> dict:
-        from app.setup.config.settings import load_settings
-
-        settings = load_settings()
-        stripe_cfg = getattr(settings, "stripe", None)
-        api_key = getattr(stripe_cfg, "STRIPE_API_KEY", None) if stripe_cfg else None
-        if not api_key:
+        if not self._billing.is_configured:
             raise ValueError("Stripe is not configured")
-        stripe.api_key = api_key
 
-        session = stripe.checkout.Session.retrieve(request.session_id)
+        session = await self._billing.retrieve_checkout_session(request.session_id)
         subs_user = await self._subs_user.read_by_checkout_session_id(session_id=request.session_id)
         if not subs_user:
             raise ValueError("Subscription not found")
@@ -0,0 +1,72 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any, Final
+
+import orjson
+
+from app.application.subscription.ports import PlanCatalog
+from app.infrastructure.metrics.registry import record_cache_lookup
+
+# Bounds how long other processes keep serving plans changed elsewhere.
+PLAN_CATALOG_TTL_S: Final[float] = 60.0
+
+
+def build_plan_catalog(rows: Sequence[Mapping[str, Any]]) -> PlanCatalog:
+    plans = tuple(dict(row) for row in sorted(rows, key=lambda row: row["id"]))
+    digest = hashlib.sha256(
+        orjson.dumps(plans, option=orjson.OPT_SORT_KEYS, default=str),
+    )
+    return PlanCatalog(plans=plans, version=digest.hexdigest()[:32])
+
+
+class PlanCatalogCache:
+    """
+    Process-wide copy of the plan catalog. Plans only change through the
+    init handler, so the table is read once per `ttl_s` at most; writers
+    invalidate the copy right after their commit, and other processes
+    catch up when it expires. Concurrent misses share one load.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._catalog: PlanCatalog | None = None
+        self._expires_at = 0.0
+        # Bumped on invalidation, so a load that raced a write is not kept.
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self,
+        load: Callable[[], Awaitable[Sequence[Mapping[str, Any]]]],
+    ) -> PlanCatalog:
+        catalog = self._fresh()
+        record_cache_lookup("plan_catalog", hit=catalog is not None)
+        if catalog is not None:
+            return catalog
+        async with self._lock:
+            catalog = self._fresh()
+            if catalog is not None:
+                return catalog
+            generation = self._generation
+            catalog = build_plan_catalog(await load())
+            if generation == self._generation:
+                self._catalog = catalog
+                self._expires_at = self._clock() + self._ttl_s
+            return catalog
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._catalog = None
+
+    def _fresh(self) -> PlanCatalog | None:
+        if self._catalog is not None and self._clock() < self._expires_at:
+            return self._catalog
+        return None
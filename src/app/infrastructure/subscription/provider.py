@@ -0,0 +1,24 @@
+from collections.abc import AsyncIterator
+
+from app.infrastructure.subscription.plan_catalog import (
+    PLAN_CATALOG_TTL_S,
+    PlanCatalogCache,
+)
+from app.infrastructure.subscription.stripe_client import (
+    StripeClientConfig,
+    StripeHttpClient,
+)
+
+
+async def get_stripe_client(
+    config: StripeClientConfig,
+) -> AsyncIterator[StripeHttpClient]:
+    client = StripeHttpClient(config)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+def get_plan_catalog_cache() -> PlanCatalogCache:
+    return PlanCatalogCache(ttl_s=PLAN_CATALOG_TTL_S)
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Final
+
+import orjson
+
+from app.infrastructure.exceptions.base import InfrastructureError
+
+log = logging.getLogger(__name__)
+
+# The API version the previous SDK-based gateway was pinned to.
+STRIPE_API_VERSION: Final[str] = "2023-10-16"
+
+
+@dataclass(frozen=True, slots=True)
+class StripeClientConfig:
+    api_base: str
+    timeout_s: float
+    pool_size: int
+
+
+class StripeApiError(InfrastructureError):
+    def __init__(self, message: str, *, status: int | None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def encode_form(params: Mapping[str, Any], prefix: str = "") -> list[tuple[str, str]]:
+    """
+    Stripe's form encoding: nested mappings and lists become bracketed keys,
+    e.g. `line_items[0][price]`. `None` values are left out.
+    """
+    pairs: list[tuple[str, str]] = []
+    for key, value in params.items():
+        pairs.extend(_encode_value(f"{prefix}[{key}]" if prefix else str(key), value))
+    return pairs
+
+
+def _encode_value(name: str, value: Any) -> list[tuple[str, str]]:
+    if value is None:
+        return []
+    if isinstance(value, Mapping):
+        return encode_form(value, name)
+    if isinstance(value, list | tuple):
+        pairs: list[tuple[str, str]] = []
+        for index, item in enumerate(value):
+            pairs.extend(_encode_value(f"{name}[{index}]", item))
+        return pairs
+    if isinstance(value, bool):
+        return [(name, "true" if value else "false")]
+    return [(name, str(value))]
+
+
+class StripeHttpClient:
+    """
+    Calls the Stripe REST API through one pooled HTTP session. The session
+    blocks, so requests run on an executor of `pool_size` threads: the event
+    loop never waits on Stripe, and a slow Stripe queues at most the calls
+    beyond the pool instead of freezing every request on the worker.
+    """
+
+    def __init__(self, config: StripeClientConfig) -> None:
+        import requests  # keeps requests off the import path
+        from requests.adapters import HTTPAdapter
+
+        self._api_base = config.api_base.rstrip("/")
+        self._timeout_s = config.timeout_s
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.pool_size,
+            thread_name_prefix="stripe",
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        api_key: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        :raises StripeApiError:
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            partial(self._send, method, path, api_key, params or {}),
+        )
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        api_key: str,
+        params: Mapping[str, Any],
+    ) -> dict[str, Any]:
+        import requests
+
+        form = encode_form(params)
+        try:
+            response = self._session.request(
+                method,
+                f"{self._api_base}{path}",
+                params=form if method == "GET" else None,
+                data=None if method == "GET" else form,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Stripe-Version": STRIPE_API_VERSION,
+                },
+                timeout=self._timeout_s,
+            )
+        except requests.RequestException as e:
+            raise StripeApiError(str(e), status=None) from e
+        try:
+            body = orjson.loads(response.content) if response.content else {}
+        except orjson.JSONDecodeError:
+            body = {}
+        if response.status_code >= 400:
+            error = body.get("error") or {}
+            raise StripeApiError(
+                f"Stripe responded {response.status_code}: "
+                f"{error.get('message') or response.text}",
+                status=response.status_code,
+            )
+        return body
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+        log.debug("Stripe client closed.")
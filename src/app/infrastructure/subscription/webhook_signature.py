@@ -0,0 +1,73 @@
+import hashlib
+import hmac
+import time
+from typing import Final, NewType
+
+from app.infrastructure.exceptions.base import InfrastructureError
+
+StripeWebhookSecret = NewType("StripeWebhookSecret", str)
+
+# Stripe's own default: older signatures are treated as replays.
+STRIPE_SIGNATURE_TOLERANCE_S: Final[int] = 300
+
+
+class StripeSignatureError(InfrastructureError):
+    pass
+
+
+def verify_stripe_signature(
+    payload: bytes,
+    header: str,
+    *,
+    secret: str,
+    now: float,
+    tolerance_s: int = STRIPE_SIGNATURE_TOLERANCE_S,
+) -> None:
+    """
+    Checks a `Stripe-Signature` header (`t=<unix time>,v1=<hex>,...`): one
+    `v1` value must be the HMAC-SHA256 of `<t>.<payload>` under the endpoint
+    secret, and `t` must be within `tolerance_s` of `now`.
+
+    :raises StripeSignatureError:
+    """
+    timestamp: int | None = None
+    signatures: list[str] = []
+    for item in header.split(","):
+        name, _, value = item.strip().partition("=")
+        if name == "t":
+            try:
+                timestamp = int(value)
+            except ValueError:
+                raise StripeSignatureError("Malformed signature timestamp.") from None
+        elif name == "v1":
+            signatures.append(value)
+    if timestamp is None or not signatures:
+        raise StripeSignatureError("Malformed signature header.")
+    if abs(now - timestamp) > tolerance_s:
+        raise StripeSignatureError("Signature timestamp is outside the tolerance.")
+
+    expected = hmac.new(
+        secret.encode(),
+        f"{timestamp}.".encode() + payload,
+        hashlib.sha256,
+    ).hexdigest()
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise StripeSignatureError("No signature matches the payload.")
+
+
+class StripeWebhookVerifier:
+    def __init__(self, secret: StripeWebhookSecret) -> None:
+        self._secret = secret
+
+    def verify(self, payload: bytes, header: str) -> None:
+        """
+        :raises StripeSignatureError:
+        """
+        if not self._secret:
+            raise StripeSignatureError("Stripe webhook secret is not configured.")
+        verify_stripe_signature(
+            payload,
+            header,
+            secret=self._secret,
+            now=time.time(),
+        )
@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import queue
+import threading
+import urllib.request
+from collections.abc import Sequence
+from typing import Any, Final
+
+from app.infrastructure.tracing.tracer import Span
+
+log = logging.getLogger(__name__)
+
+OTLP_QUEUE_SIZE: Final[int] = 2048
+OTLP_BATCH_SIZE: Final[int] = 512
+OTLP_FLUSH_INTERVAL_S: Final[float] = 5.0
+OTLP_TIMEOUT_S: Final[float] = 10.0
+
+# OTLP status codes.
+_STATUS_OK: Final[int] = 1
+_STATUS_ERROR: Final[int] = 2
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans, for tests."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self.spans.extend(spans)
+
+    def named(self, name: str) -> list[Span]:
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OtlpHttpSpanExporter:
+    """
+    Posts spans as OTLP/HTTP JSON from a daemon thread, in batches. The
+    traced code only puts spans on a bounded queue; when the collector
+    falls behind, spans are dropped and counted rather than buffered.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str,
+        max_queue: int = OTLP_QUEUE_SIZE,
+        batch_size: int = OTLP_BATCH_SIZE,
+        flush_interval_s: float = OTLP_FLUSH_INTERVAL_S,
+        timeout_s: float = OTLP_TIMEOUT_S,
+    ) -> None:
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._batch_size = batch_size
+        self._flush_interval_s = flush_interval_s
+        self._timeout_s = timeout_s
+        self._queue: queue.Queue[Span] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self.dropped = 0
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._ensure_thread()
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self.dropped += 1
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=self._timeout_s)
+        self._flush()
+
+    def _ensure_thread(self) -> None:
+        # Started lazily and again after `fork`, which does not copy threads.
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="otlp-span-exporter",
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._flush_interval_s):
+            self._flush()
+
+    def _flush(self) -> None:
+        while True:
+            batch: list[Span] = []
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._post(batch)
+
+    def _post(self, spans: Sequence[Span]) -> None:
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(encode_otlp(spans, self._service_name)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout_s):
+                pass
+        except OSError as error:
+            log.warning("Dropped %d spans, export failed: %s", len(spans), error)
+
+
+def encode_otlp(spans: Sequence[Span], service_name: str) -> dict[str, Any]:
+    """An `ExportTraceServiceRequest` in the OTLP/JSON encoding."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _attributes({"service.name": service_name}),
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app"},
+                        "spans": [_encode_span(span) for span in spans],
+                    },
+                ],
+            },
+        ],
+    }
+
+
+def _encode_span(span: Span) -> dict[str, Any]:
+    encoded: dict[str, Any] = {
+        "traceId": span.context.trace_id,
+        "spanId": span.context.span_id,
+        "name": span.name,
+        "kind": int(span.kind),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": (
+            {"code": _STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {"code": _STATUS_OK}
+        ),
+    }
+    if span.parent_id is not None:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def _attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _any_value(value)} for key, value in attributes.items()
+    ]
+
+
+def _any_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
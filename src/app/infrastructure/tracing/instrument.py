@@ -0,0 +1,59 @@
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Final, ParamSpec, TypeVar
+
+from dishka import Provider
+
+from app.infrastructure.tracing.tracer import get_tracer
+
+# Interactors, query services, handlers and gateways live here; the
+# domain and presentation layers are left alone.
+TRACED_PACKAGES: Final[tuple[str, ...]] = ("app.application.", "app.infrastructure.")
+
+_TRACED_MARK: Final[str] = "__traced__"
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with get_tracer().span(name):
+                return await func(*args, **kwargs)
+
+        setattr(wrapper, _TRACED_MARK, True)
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(cls: type) -> None:
+    """
+    Wraps the public coroutine methods defined on `cls` in spans named
+    `Class.method`. Safe to call more than once.
+    """
+    if vars(cls).get(_TRACED_MARK):
+        return
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(member):
+            continue
+        if getattr(member, _TRACED_MARK, False):
+            continue
+        setattr(cls, name, traced(f"{cls.__name__}.{name}")(member))
+    setattr(cls, _TRACED_MARK, True)
+
+
+def instrument_providers(providers: Iterable[Provider]) -> None:
+    """Traces every application and infrastructure class the providers build."""
+    for provider in providers:
+        for factory in provider.factories:
+            source: Any = factory.source
+            if isinstance(source, type) and source.__module__.startswith(
+                TRACED_PACKAGES
+            ):
+                trace_methods(source)
@@ -0,0 +1,54 @@
+from typing import Any, Final
+
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.engine import ExceptionContext
+
+from app.infrastructure.persistence_sqla.query_profiler import statement_shape
+from app.infrastructure.tracing.tracer import (
+    Span,
+    SpanKind,
+    current_span_context,
+    get_tracer,
+)
+
+_SPANS_KEY: Final[str] = "tracing_spans"
+
+
+def install_query_tracing(engine: Engine) -> None:
+    """
+    One client span per statement, under the span that ran it. Statements
+    outside a sampled trace, such as pool pre-pings at startup, get none.
+    """
+
+    def finish(info: dict[Any, Any], error: BaseException | None = None) -> None:
+        spans: list[Span | None] | None = info.get(_SPANS_KEY)
+        if not spans:
+            return
+        span = spans.pop()
+        if span is not None:
+            get_tracer().end_span(span, error)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn: Connection, _cursor: Any, statement: str, *_: Any) -> None:
+        parent = current_span_context()
+        span = None
+        if parent is not None and parent.sampled:
+            span = get_tracer().start_span(
+                "db.query",
+                kind=SpanKind.CLIENT,
+                parent=parent,
+                attributes={
+                    "db.system": engine.dialect.name,
+                    "db.statement": statement_shape(statement),
+                },
+            )
+        conn.info.setdefault(_SPANS_KEY, []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finish(conn: Connection, *_: Any) -> None:
+        finish(conn.info)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(context: ExceptionContext) -> None:
+        if context.connection is not None:
+            finish(context.connection.info, context.original_exception)
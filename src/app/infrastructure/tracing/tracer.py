@@ -0,0 +1,216 @@
+"""
+A small OpenTelemetry-style tracer. Spans nest through a context variable
+and cross process boundaries as W3C `traceparent` headers. Sampling is
+decided once per trace, at its root, so an unsampled request only pays
+for creating its span IDs.
+"""
+
+import random
+import re
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Final, Protocol
+
+TRACEPARENT_HEADER: Final[str] = "traceparent"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID: Final[str] = "0" * 32
+_INVALID_SPAN_ID: Final[str] = "0" * 16
+
+_current_context: ContextVar["SpanContext | None"] = ContextVar(
+    "span_context",
+    default=None,
+)
+
+
+class SpanKind(IntEnum):
+    # Numbered as in OTLP.
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    context: SpanContext
+    parent_id: str | None
+    kind: SpanKind
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.context.sampled:
+            self.attributes[key] = value
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: Sequence[Span]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class Tracer:
+    """
+    Root spans are sampled with probability `sample_ratio`; every other
+    span follows its parent. Without an exporter nothing is sampled.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter | None = None,
+        *,
+        sample_ratio: float = 0.0,
+    ) -> None:
+        self.exporter = exporter
+        self._threshold = (
+            int(min(max(sample_ratio, 0.0), 1.0) * 2**64) if exporter else 0
+        )
+
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: SpanContext | None = None,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Span:
+        """A span under `parent`, or under the current span if not given."""
+        if parent is None:
+            parent = _current_context.get()
+        if parent is None:
+            trace_id = random.getrandbits(128)
+            context = SpanContext(
+                trace_id=f"{trace_id:032x}",
+                span_id=_new_span_id(),
+                # The low 64 bits are random, so comparing them samples evenly.
+                sampled=(trace_id & (2**64 - 1)) < self._threshold,
+            )
+        else:
+            context = SpanContext(
+                trace_id=parent.trace_id,
+                span_id=_new_span_id(),
+                sampled=parent.sampled,
+            )
+        return Span(
+            name=name,
+            context=context,
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes) if attributes and context.sampled else {},
+        )
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        if not span.context.sampled or self.exporter is None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        self.exporter.export((span,))
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        *,
+        kind: SpanKind = SpanKind.INTERNAL,
+        parent: SpanContext | None = None,
+        attributes: Mapping[str, Any] | None = None,
+    ) -> Iterator[Span]:
+        """Runs the block in a new current span, ended when it exits."""
+        span = self.start_span(name, kind=kind, parent=parent, attributes=attributes)
+        token = _current_context.set(span.context)
+        try:
+            yield span
+        except BaseException as error:
+            self.end_span(span, error)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_context.reset(token)
+
+    def shutdown(self) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+def _new_span_id() -> str:
+    return f"{random.getrandbits(64) or 1:016x}"
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Installs `tracer` process-wide and returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def current_span_context() -> SpanContext | None:
+    return _current_context.get()
+
+
+def attach(context: SpanContext | None) -> Token["SpanContext | None"]:
+    return _current_context.set(context)
+
+
+def detach(token: Token["SpanContext | None"]) -> None:
+    _current_context.reset(token)
+
+
+@contextmanager
+def use_span_context(context: SpanContext | None) -> Iterator[None]:
+    """Continues `context` here, e.g. in a thread it was handed to."""
+    token = attach(context)
+    try:
+        yield
+    finally:
+        detach(token)
+
+
+def format_traceparent(context: SpanContext) -> str:
+    flags = "01" if context.sampled else "00"
+    return f"00-{context.trace_id}-{context.span_id}-{flags}"
+
+
+def parse_traceparent(value: str | None) -> SpanContext | None:
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(
+        trace_id=trace_id,
+        span_id=span_id,
+        sampled=bool(int(flags, 16) & 1),
+    )
@@ -0,0 +1 @@
+"""Admin query statistics routers package."""
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+
+from app.presentation.http.controllers.admin.queries.slowest_queries import (
+    create_slowest_queries_router,
+)
+
+
+def create_queries_router() -> APIRouter:
+    router = APIRouter(
+        prefix="/admin/queries",
+        tags=["AdminQueries"],
+    )
+
+    sub_routers = (create_slowest_queries_router(),)
+
+    for sub_router in sub_routers:
+        router.include_router(sub_router)
+
+    return router
@@ -0,0 +1,51 @@
+from inspect import getdoc
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Query, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.persistence_sqla.handlers.slowest_queries import (
+    SLOWEST_QUERIES_MAX_LIMIT,
+    SlowestQueriesHandler,
+    SlowestQueriesRequest,
+    SlowestQueriesResponse,
+)
+from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+def create_slowest_queries_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/slowest",
+        description=getdoc(SlowestQueriesHandler),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def slowest_queries(
+        handler: FromDishka[SlowestQueriesHandler],
+        limit: Annotated[int, Query(ge=1, le=SLOWEST_QUERIES_MAX_LIMIT)] = 20,
+    ) -> SlowestQueriesResponse:
+        return await handler.execute(SlowestQueriesRequest(limit=limit))
+
+    return router
@@ -0,0 +1,73 @@
+from inspect import getdoc
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi_error_map import ErrorAwareRouter, rule
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.application.commands.user.bulk_update_users import (
+    BULK_USERS_LIMIT,
+    BulkUpdateUsersInteractor,
+    BulkUpdateUsersRequest,
+    BulkUpdateUsersResponse,
+    BulkUserAction,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.bulk import BulkSelectionError
+from app.domain.enums.user_role import UserRole
+from app.domain.exceptions.base import DomainFieldError
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+
+
+class BulkUpdateUsersRequestPydantic(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    action: BulkUserAction
+    emails: Annotated[list[str] | None, Field(max_length=BULK_USERS_LIMIT)] = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+
+
+def create_bulk_update_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.post(
+        "/bulk",
+        description=getdoc(BulkUpdateUsersInteractor),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            DomainFieldError: status.HTTP_400_BAD_REQUEST,
+            BulkSelectionError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def bulk_update_users(
+        request_data_pydantic: BulkUpdateUsersRequestPydantic,
+        interactor: FromDishka[BulkUpdateUsersInteractor],
+    ) -> BulkUpdateUsersResponse:
+        request_data = BulkUpdateUsersRequest(
+            action=request_data_pydantic.action,
+            emails=request_data_pydantic.emails,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+        )
+        return await interactor.execute(request_data)
+
+    return router
@@ -0,0 +1,83 @@
+from inspect import getdoc
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Depends, Query, Security, status
+from fastapi.responses import StreamingResponse
+from fastapi_error_map import ErrorAwareRouter, rule
+
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.query import FilteringError
+from app.application.common.query_models.user import UserQueryModel
+from app.application.common.query_params.user import UserListFilters
+from app.application.queries.export_users import (
+    ExportUsersQueryService,
+    ExportUsersRequest,
+)
+from app.infrastructure.auth.exceptions import AuthenticationError
+from app.infrastructure.exceptions.gateway import DataMapperError
+from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
+from app.presentation.http.controllers.admin.user.list_users import (
+    UserFiltersPydantic,
+)
+from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.errors.translators import (
+    ServiceUnavailableTranslator,
+)
+from app.presentation.http.export import ExportFormat, export_response
+
+
+def create_export_users_router() -> APIRouter:
+    router = ErrorAwareRouter()
+
+    @router.get(
+        "/export",
+        description=getdoc(ExportUsersQueryService),
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            FilteringError: status.HTTP_400_BAD_REQUEST,
+        },
+        default_on_error=log_info,
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+        dependencies=[Security(bearer_scheme)],
+    )
+    @inject
+    async def export_users(
+        filters: Annotated[UserFiltersPydantic, Depends()],
+        interactor: FromDishka[ExportUsersQueryService],
+        export_format: Annotated[ExportFormat, Query(alias="format")] = (
+            ExportFormat.NDJSON
+        ),
+    ) -> StreamingResponse:
+        request_data = ExportUsersRequest(
+            filters=UserListFilters(
+                email_prefix=filters.email_prefix,
+                name=filters.name,
+                role=filters.role,
+                is_active=filters.is_active,
+                is_blocked=filters.is_blocked,
+                is_verified=filters.is_verified,
+                country_id=filters.country_id,
+                created_from=filters.created_from,
+                created_to=filters.created_to,
+                last_login_from=filters.last_login_from,
+                last_login_to=filters.last_login_to,
+            ),
+        )
+        rows = await interactor.execute(request_data)
+        return export_response(
+            rows,
+            columns=tuple(UserQueryModel.__annotations__),
+            export_format=export_format,
+            filename="users",
+        )
+
+    return router
@@ -1,3 +1,4 @@
+from datetime import datetime
 from inspect import getdoc
 from typing import Annotated
 
@@ -8,13 +9,19 @@ from fastapi_error_map import ErrorAwareRouter, rule
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.application.common.exceptions.authorization import AuthorizationError
-from app.application.common.exceptions.query import PaginationError, SortingError
+from app.application.common.exceptions.query import (
+    FilteringError,
+    PaginationError,
+    SortingError,
+)
 from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import NAME_SEARCH_MIN_LENGTH
 from app.application.queries.list_users import (
     ListUsersQueryService,
     ListUsersRequest,
     ListUsersResponse,
 )
+from app.domain.enums.user_role import UserRole
 from app.infrastructure.auth.exceptions import AuthenticationError
 from app.infrastructure.exceptions.gateway import DataMapperError, ReaderError
 from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
@@ -24,14 +31,33 @@ from app.presentation.http.errors.translators import (
 )
 
 
-class ListUsersRequestPydantic(BaseModel):
+class UserFiltersPydantic(BaseModel):
+    """Query parameters shared by the user listing and the user export."""
+
+    model_config = ConfigDict(frozen=True)
+
+    email_prefix: Annotated[str | None, Field(min_length=1, max_length=255)] = None
+    name: Annotated[
+        str | None,
+        Field(min_length=NAME_SEARCH_MIN_LENGTH, max_length=201),
+    ] = None
+    role: UserRole | None = None
+    is_active: bool | None = None
+    is_blocked: bool | None = None
+    is_verified: bool | None = None
+    country_id: Annotated[int | None, Field(ge=1)] = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    last_login_from: datetime | None = None
+    last_login_to: datetime | None = None
+
+
+class ListUsersRequestPydantic(UserFiltersPydantic):
     """
     Using a Pydantic model here is generally unnecessary.
     It's only implemented to render a specific Swagger UI (OpenAPI) schema.
     """
 
-    model_config = ConfigDict(frozen=True)
-
     limit: Annotated[int, Field(ge=1)] = 20
     offset: Annotated[int, Field(ge=0)] = 0
     sorting_field: Annotated[str, Field()] = "email"
@@ -59,6 +85,7 @@ def create_list_users_router() -> APIRouter:
             ),
             PaginationError: status.HTTP_400_BAD_REQUEST,
             SortingError: status.HTTP_400_BAD_REQUEST,
+            FilteringError: status.HTTP_400_BAD_REQUEST,
         },
         default_on_error=log_info,
         status_code=status.HTTP_200_OK,
@@ -74,6 +101,17 @@ def create_list_users_router() -> APIRouter:
             offset=request_data_pydantic.offset,
             sorting_field=request_data_pydantic.sorting_field,
             sorting_order=request_data_pydantic.sorting_order,
+            email_prefix=request_data_pydantic.email_prefix,
+            name=request_data_pydantic.name,
+            role=request_data_pydantic.role,
+            is_active=request_data_pydantic.is_active,
+            is_blocked=request_data_pydantic.is_blocked,
+            is_verified=request_data_pydantic.is_verified,
+            country_id=request_data_pydantic.country_id,
+            created_from=request_data_pydantic.created_from,
+            created_to=request_data_pydantic.created_to,
+            last_login_from=request_data_pydantic.last_login_from,
+            last_login_to=request_data_pydantic.last_login_to,
         )
         return await interactor.execute(request_data)
 
@@ -3,12 +3,18 @@ from fastapi import APIRouter
 from app.presentation.http.controllers.admin.user.activate_user import (
     create_activate_user_router,
 )
+from app.presentation.http.controllers.admin.user.bulk_update_users import (
+    create_bulk_update_users_router,
+)
 from app.presentation.http.controllers.admin.user.change_password import (
     create_change_password_router,
 )
 from app.presentation.http.controllers.admin.user.deactivate_user import (
     create_deactivate_user_router,
 )
+from app.presentation.http.controllers.admin.user.export_users import (
+    create_export_users_router,
+)
 from app.presentation.http.controllers.admin.user.grant_admin import (
     create_grant_admin_router,
 )
@@ -26,11 +32,13 @@ def create_users_router() -> APIRouter:
 
     sub_routers = (
         create_list_users_router(),
+        create_export_users_router(),
         create_change_password_router(),
         create_grant_admin_router(),
         create_revoke_admin_router(),
         create_activate_user_router(),
         create_deactivate_user_router(),
+        create_bulk_update_users_router(),
     )
 
     for sub_router in sub_routers:
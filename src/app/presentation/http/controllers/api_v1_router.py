@@ -2,6 +2,7 @@ from fastapi import APIRouter
 
 from app.presentation.http.controllers.account.router import create_account_router
 from app.presentation.http.controllers.general.router import create_general_router
+from app.presentation.http.controllers.admin.queries.router import create_queries_router
 from app.presentation.http.controllers.admin.user.router import create_users_router
 from app.presentation.http.controllers.atlas.router import create_atlas_router
 from app.presentation.http.controllers.subscription.router import create_subscription_router
@@ -18,6 +19,7 @@ def create_api_v1_router() -> APIRouter:
         create_account_router(),
         create_general_router(),
         create_users_router(),
+        create_queries_router(),
         create_atlas_router(),
         create_subscription_router(),
         create_notification_router(),
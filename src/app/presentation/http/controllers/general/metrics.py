@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.infrastructure.metrics.registry import render_metrics
+from app.presentation.http.metrics import METRICS_PATH
+
+
+def create_metrics_router() -> APIRouter:
+    router = APIRouter()
+
+    @router.get(METRICS_PATH, include_in_schema=False)
+    async def metrics() -> Response:
+        """
+        - Open to everyone; keep it off the public network.
+        - Prometheus exposition of every worker's metrics.
+        """
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
+
+    return router
@@ -1,12 +1,20 @@
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Query, Security, status
+from fastapi import APIRouter, Body, Query, Security, status
+from fastapi.responses import StreamingResponse
 from fastapi_error_map import ErrorAwareRouter, rule
+from starlette.background import BackgroundTask
 
+from app.application.common.ports.transaction_manager import TransactionManager
 from app.application.common.services.current_user import CurrentUserService
-from app.application.notification.ports import NotificationRepository
-from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
+from app.application.notification.ports import NotificationFeed, NotificationRepository
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.auth.adapters.types import AuthAsyncSession
 from app.infrastructure.exceptions.gateway import DataMapperError
+from app.infrastructure.notification.config import NotificationStreamConfig
+from app.infrastructure.notification.hub import NotificationFeedFullError
+from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
+from app.presentation.http.controllers.notification.sse import encode_event_stream
 from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import ServiceUnavailableTranslator
 
@@ -39,6 +47,112 @@ def create_notification_router() -> APIRouter:
         offset = (page - 1) * per_page
         return await repo.read_by_user_paginated(user_id=current_user.id_.value, offset=offset, limit=per_page)
 
+    @router.get(
+        "/unread-count",
+        description="Get the number of the user's unread notifications",
+        dependencies=[Security(bearer_scheme)],
+        error_map={
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+    )
+    @inject
+    async def get_unread_count(
+        current_user_service: FromDishka[CurrentUserService] = None,  # type: ignore[assignment]
+        repo: FromDishka[NotificationRepository] = None,  # type: ignore[assignment]
+    ) -> dict[str, int]:
+        current_user = await current_user_service.get_current_user()
+        unread = await repo.read_unread_count(current_user.id_.value)
+        return {"unread": unread}
+
+    @router.post(
+        "/mark-read",
+        description=(
+            "Mark the given notifications as read, or all of them when no ids "
+            "are sent. Returns the remaining unread count."
+        ),
+        dependencies=[Security(bearer_scheme)],
+        error_map={
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+    )
+    @inject
+    async def mark_notifications_read(
+        notification_ids: list[int] | None = Body(
+            None,
+            embed=True,
+            max_length=1000,
+            description="Notification ids; omit to mark all as read",
+        ),
+        current_user_service: FromDishka[CurrentUserService] = None,  # type: ignore[assignment]
+        repo: FromDishka[NotificationRepository] = None,  # type: ignore[assignment]
+        transaction_manager: FromDishka[TransactionManager] = None,  # type: ignore[assignment]
+    ) -> dict[str, int]:
+        current_user = await current_user_service.get_current_user()
+        unread = await repo.mark_read(
+            user_id=current_user.id_.value,
+            notification_ids=notification_ids,
+        )
+        await transaction_manager.commit()
+        return {"unread": unread}
+
+    @router.get(
+        "/stream",
+        description=(
+            "Server-Sent Events stream of the user's new notifications. "
+            "Missed events are not replayed; re-read the list after reconnecting."
+        ),
+        dependencies=[Security(bearer_scheme)],
+        error_map={
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+            NotificationFeedFullError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+    )
+    @inject
+    async def stream_user_notifications(
+        current_user_service: FromDishka[CurrentUserService] = None,  # type: ignore[assignment]
+        feed: FromDishka[NotificationFeed] = None,  # type: ignore[assignment]
+        config: FromDishka[NotificationStreamConfig] = None,  # type: ignore[assignment]
+        main_session: FromDishka[MainAsyncSession] = None,  # type: ignore[assignment]
+        auth_session: FromDishka[AuthAsyncSession] = None,  # type: ignore[assignment]
+    ) -> StreamingResponse:
+        current_user = await current_user_service.get_current_user()
+        # The request scope lives as long as the stream; hand the connections
+        # back to the pool now instead of pinning one per open stream.
+        await main_session.close()
+        await auth_session.close()
+
+        stream = feed.subscribe(current_user.id_.value)
+        return StreamingResponse(
+            encode_event_stream(stream, heartbeat_s=config.heartbeat_s),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            # Also runs if the client is gone before the first event.
+            background=BackgroundTask(stream.close),
+        )
+
     return router
 
 
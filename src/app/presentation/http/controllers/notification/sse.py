@@ -0,0 +1,42 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Final
+
+import orjson
+
+from app.application.notification.ports import NotificationStream
+
+# Browsers' EventSource waits this long before reconnecting.
+RECONNECT_DELAY_MS: Final[int] = 3000
+
+
+async def encode_event_stream(
+    stream: NotificationStream,
+    *,
+    heartbeat_s: float,
+) -> AsyncIterator[bytes]:
+    """
+    Encodes notifications as Server-Sent Events. A comment line is sent
+    whenever the stream has been idle for `heartbeat_s`, so proxies keep
+    the connection open and dead clients are noticed on write.
+    """
+    notifications = aiter(stream)
+    try:
+        yield b"retry: %d\n\n" % RECONNECT_DELAY_MS
+        while True:
+            try:
+                notification = await asyncio.wait_for(
+                    anext(notifications),
+                    heartbeat_s,
+                )
+            except TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+            except StopAsyncIteration:
+                return
+            yield b"id: %d\nevent: notification\ndata: %s\n\n" % (
+                notification["id"],
+                orjson.dumps(notification),
+            )
+    finally:
+        stream.close()
@@ -1,14 +1,35 @@
+from datetime import datetime
+from inspect import getdoc
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Body, Query, Security, status
+from fastapi import APIRouter, Body, Header, Query, Security, status
+from fastapi.responses import StreamingResponse
 from fastapi_error_map import ErrorAwareRouter, rule
 
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.idempotency import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+)
+from app.application.common.exceptions.query import FilteringError
 from app.application.common.services.current_user import CurrentUserService
-from app.application.subscription.ports import PaymentRepository
+from app.application.common.services.idempotency import (
+    IdempotencyService,
+    IdempotentRequest,
+    request_fingerprint,
+)
+from app.application.queries.export_payments import (
+    ExportPaymentsQueryService,
+    ExportPaymentsRequest,
+)
+from app.application.subscription.ports import PaymentExportRow, PaymentRepository
+from app.infrastructure.auth.exceptions import AuthenticationError
 from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.presentation.http.errors.callbacks import log_error, log_info
 from app.presentation.http.errors.translators import ServiceUnavailableTranslator
+from app.presentation.http.export import ExportFormat, export_response
 
 
 def create_payment_router() -> APIRouter:
@@ -40,12 +61,54 @@ def create_payment_router() -> APIRouter:
         items = await payments.read_by_user_paginated(user_id=current_user.id_.value, offset=offset, limit=per_page)
         return {"items": items, "page": page, "per_page": per_page}
 
+    @router.get(
+        "/export",
+        description=getdoc(ExportPaymentsQueryService),
+        dependencies=[Security(bearer_scheme)],
+        error_map={
+            AuthenticationError: status.HTTP_401_UNAUTHORIZED,
+            AuthorizationError: status.HTTP_403_FORBIDDEN,
+            FilteringError: status.HTTP_400_BAD_REQUEST,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+    )
+    @inject
+    async def export_payments(
+        created_from: datetime | None = Query(None),
+        created_to: datetime | None = Query(None),
+        payment_status: str | None = Query(None, alias="status", max_length=50),
+        export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+        interactor: FromDishka[ExportPaymentsQueryService] = None,  # type: ignore[assignment]
+    ) -> StreamingResponse:
+        rows = await interactor.execute(
+            ExportPaymentsRequest(
+                created_from=created_from,
+                created_to=created_to,
+                status=payment_status,
+            )
+        )
+        return export_response(
+            rows,
+            columns=tuple(PaymentExportRow.__annotations__),
+            export_format=export_format,
+            filename="payments",
+        )
+
     @router.post(
         "/transaction",
         description="Create a new payment transaction",
         dependencies=[Security(bearer_scheme)],
         error_map={
             ValueError: status.HTTP_400_BAD_REQUEST,
+            IdempotencyKeyInUseError: status.HTTP_409_CONFLICT,
+            IdempotencyKeyMismatchError: status.HTTP_422_UNPROCESSABLE_ENTITY,
             DataMapperError: rule(
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
                 translator=ServiceUnavailableTranslator(),
@@ -60,17 +123,44 @@ def create_payment_router() -> APIRouter:
         amount: float = Body(..., embed=True),
         currency: str = Body(..., embed=True),
         description: str = Body(..., embed=True),
+        idempotency_key: str | None = Header(
+            None,
+            alias="Idempotency-Key",
+            max_length=255,
+        ),
         current_user_service: FromDishka[CurrentUserService] = None,  # type: ignore[assignment]
         payments: FromDishka[PaymentRepository] = None,  # type: ignore[assignment]
+        idempotency: FromDishka[IdempotencyService] = None,  # type: ignore[assignment]
     ) -> dict:
         current_user = await current_user_service.get_current_user()
-        result = await payments.find_or_create_transaction(
-            user_id=current_user.id_.value,
-            amount=amount,
-            currency=currency,
-            description=description,
-        )
-        return {"status": "success", "payment": result}
+        user_id = current_user.id_.value
+        idempotent: IdempotentRequest | None = None
+        if idempotency_key is not None:
+            scope = "payments.transaction"
+            idempotent = IdempotentRequest(
+                user_id=user_id,
+                scope=scope,
+                key=idempotency_key,
+                fingerprint=request_fingerprint(
+                    scope,
+                    {
+                        "amount": amount,
+                        "currency": currency,
+                        "description": description,
+                    },
+                ),
+            )
+
+        async def create() -> dict:
+            payment = await payments.find_or_create_transaction(
+                user_id=user_id,
+                amount=amount,
+                currency=currency,
+                description=description,
+            )
+            return {"status": "success", "payment": payment}
+
+        return await idempotency.run(idempotent, create)
 
     return router
 
@@ -1,7 +1,10 @@
 from dataclasses import asdict
+
+import orjson
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Security, status
+from fastapi import APIRouter, Header, Request, Response, Security, status
+from fastapi.responses import ORJSONResponse
 from fastapi_error_map import ErrorAwareRouter, rule
 
 from app.infrastructure.subscription.handlers.get_subscriptions import (
@@ -22,9 +25,20 @@ from app.infrastructure.subscription.handlers.success_subscription import (
     SubscriptionSuccessHandler,
     SubscriptionSuccessRequest,
 )
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.subscription.ports import BillingEventInbox
+from app.infrastructure.subscription.webhook_signature import (
+    StripeSignatureError,
+    StripeWebhookVerifier,
+)
+from app.application.common.exceptions.idempotency import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+)
 from app.infrastructure.exceptions.gateway import DataMapperError
 from app.presentation.http.auth.fastapi_openapi_markers import bearer_scheme
 from app.presentation.http.errors.callbacks import log_error, log_info
+from app.presentation.http.etag import if_none_match, strong_etag
 from app.presentation.http.errors.translators import ServiceUnavailableTranslator
 
 
@@ -44,13 +58,23 @@ def create_subscription_router() -> APIRouter:
         },
         default_on_error=log_info,
         status_code=status.HTTP_200_OK,
+        responses={status.HTTP_304_NOT_MODIFIED: {"description": "Not modified"}},
     )
     @inject
     async def get_subscriptions(
         handler: FromDishka[GetSubscriptionsHandler],
-    ) -> list[dict]:
-        items = await handler.execute()
-        return [asdict(item) for item in items]
+        if_none_match_header: str | None = Header(None, alias="If-None-Match"),
+    ) -> Response:
+        subscriptions = await handler.execute()
+        etag = strong_etag(subscriptions.version)
+        # Served from the in-process catalog; clients revalidate every time.
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if if_none_match(if_none_match_header, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return ORJSONResponse(
+            [asdict(item) for item in subscriptions.items],
+            headers=headers,
+        )
 
     @router.post(
         "/init",
@@ -85,6 +109,8 @@ def create_subscription_router() -> APIRouter:
                 on_error=log_error,
             ),
             ValueError: status.HTTP_404_NOT_FOUND,
+            IdempotencyKeyInUseError: status.HTTP_409_CONFLICT,
+            IdempotencyKeyMismatchError: status.HTTP_422_UNPROCESSABLE_ENTITY,
         },
         default_on_error=log_info,
         status_code=status.HTTP_200_OK,
@@ -94,6 +120,11 @@ def create_subscription_router() -> APIRouter:
         subscription_id: int,
         handler: FromDishka[CreateSubscriptionHandler],
         request_host: str | None = None,
+        idempotency_key: str | None = Header(
+            None,
+            alias="Idempotency-Key",
+            max_length=255,
+        ),
     ) -> dict:
         # Build callback base url from request headers if available
         # Fallback handled in handler
@@ -101,6 +132,7 @@ def create_subscription_router() -> APIRouter:
             CreateSubscriptionRequest(
                 subscription_id=subscription_id,
                 callback_base_url=request_host,
+                idempotency_key=idempotency_key,
             )
         )
 
@@ -148,6 +180,42 @@ def create_subscription_router() -> APIRouter:
     ) -> dict:
         return await handler.execute(SubscriptionSuccessRequest(session_id=session_id))
 
+    @router.post(
+        "/webhook",
+        description=(
+            "Receive Stripe webhook events. Events are stored and acknowledged; "
+            "they are applied to subscriptions and payments in the background."
+        ),
+        error_map={
+            StripeSignatureError: status.HTTP_400_BAD_REQUEST,
+            ValueError: status.HTTP_400_BAD_REQUEST,
+            DataMapperError: rule(
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                translator=ServiceUnavailableTranslator(),
+                on_error=log_error,
+            ),
+        },
+        default_on_error=log_info,
+        status_code=status.HTTP_200_OK,
+    )
+    @inject
+    async def stripe_webhook(
+        request: Request,
+        verifier: FromDishka[StripeWebhookVerifier],
+        inbox: FromDishka[BillingEventInbox],
+        transaction_manager: FromDishka[TransactionManager],
+        stripe_signature: str = Header(..., alias="Stripe-Signature"),
+    ) -> dict:
+        # The signature covers the exact bytes Stripe sent.
+        payload = await request.body()
+        verifier.verify(payload, stripe_signature)
+        event = orjson.loads(payload)
+        if not isinstance(event, dict) or not {"id", "type", "created"} <= event.keys():
+            raise ValueError("Malformed Stripe event.")
+        await inbox.append(event)
+        await transaction_manager.commit()
+        return {"received": True}
+
     @router.get(
         "/cancel",
         description="Handle cancelled subscription payment",
@@ -0,0 +1,17 @@
+def strong_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    """
+    True when an `If-None-Match` header matches `etag`, i.e. the client's
+    copy is current. Uses the weak comparison RFC 9110 prescribes for it.
+    """
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in header.split(","))
+    return etag.removeprefix("W/") in (
+        candidate.removeprefix("W/") for candidate in candidates
+    )
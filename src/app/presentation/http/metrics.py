@@ -0,0 +1,46 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.metrics.registry import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    UNMATCHED_ROUTE,
+)
+
+# Not measured: scrapes would otherwise dominate the histograms.
+METRICS_PATH = "/metrics"
+
+
+class MetricsMiddleware:
+    """
+    Latency by route template, so `/users/1` and `/users/2` share series.
+    Streamed responses are measured until their last chunk is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status)).observe(
+                time.perf_counter() - started
+            )
+        return None
@@ -0,0 +1,76 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.persistence_sqla.query_profiler import (
+    QueryBudgets,
+    QueryProfile,
+    profile_queries,
+)
+
+log = logging.getLogger(__name__)
+
+
+def endpoint_name(scope: Scope) -> str:
+    """`METHOD /path/{template}`, as budgets are configured."""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope["path"]
+    return f"{scope['method']} {path}"
+
+
+def server_timing(profile: QueryProfile) -> str:
+    return (
+        f'db;dur={profile.total_s * 1000:.1f};desc="{profile.statements} queries, '
+        f'{len(profile.shapes)} distinct"'
+    )
+
+
+class QueryProfilingMiddleware:
+    """
+    Profiles the statements of each request against its budget. Requests
+    over budget are logged, or fail when `enforce_budgets` is set, as in
+    test runs. Streamed responses send their headers before the body is
+    read, so their `Server-Timing` only covers the queries run until then.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        budgets: QueryBudgets,
+        server_timing: bool = False,
+        enforce_budgets: bool = False,
+    ) -> None:
+        self.app = app
+        self._budgets = budgets
+        self._server_timing = server_timing
+        self._enforce_budgets = enforce_budgets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        with profile_queries() as profile:
+
+            async def send_wrapper(message: Message) -> None:
+                if self._server_timing and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(profile))
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        endpoint = endpoint_name(scope)
+        budget = self._budgets.for_endpoint(endpoint)
+        if self._enforce_budgets:
+            budget.check(profile, where=endpoint)
+            return None
+        violations = budget.violations(profile)
+        if violations:
+            log.warning(
+                "Query budget exceeded in %s: %s",
+                endpoint,
+                "; ".join(violations),
+            )
+        return None
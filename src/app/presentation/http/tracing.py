@@ -0,0 +1,50 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.tracing.tracer import (
+    TRACEPARENT_HEADER,
+    SpanKind,
+    get_tracer,
+    parse_traceparent,
+)
+from app.presentation.http.query_profiling import endpoint_name
+
+
+class TracingMiddleware:
+    """
+    One server span per request, continuing the caller's trace when it
+    sends a `traceparent`. Named after the route template once routed.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        parent = parse_traceparent(Headers(scope=scope).get(TRACEPARENT_HEADER))
+        with get_tracer().span(
+            f"{scope['method']} {scope['path']}",
+            kind=SpanKind.SERVER,
+            parent=parent,
+            attributes={
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+            },
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.error = f"HTTP {message['status']}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if scope.get("route") is not None:
+                    span.name = endpoint_name(scope)
+                    span.set_attribute("http.route", scope["route"].path)
+        return None
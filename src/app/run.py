@@ -2,10 +2,17 @@ from dishka import Provider
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 
+from app.infrastructure.tracing.instrument import instrument_providers
 from app.presentation.http.controllers.root_router import create_root_router
 from app.setup.app_factory import configure_app, create_app, create_async_ioc_container
 from app.setup.config.logs import configure_logging
-from app.setup.config.settings import AppSettings, load_settings
+from app.setup.config.settings import (
+    AppSettings,
+    SettingsSnapshot,
+    get_settings_snapshot,
+    reload_settings_on_sighup,
+)
+from app.setup.config.tracing import configure_tracing
 from app.setup.ioc.provider_registry import get_providers
 
 
@@ -13,18 +20,30 @@ def make_app(
     *di_providers: Provider,
     settings: AppSettings | None = None,
 ) -> FastAPI:
+    snapshot: SettingsSnapshot | None = None
     if settings is None:
         configure_logging()
-        settings = load_settings()
+        snapshot = get_settings_snapshot()
+        reload_settings_on_sighup(snapshot)
+        settings = snapshot.current
 
     configure_logging(level=settings.logs.level)
+    tracing_enabled = configure_tracing(settings.tracing)
 
     app: FastAPI = create_app()
-    configure_app(app=app, root_router=create_root_router())
+    configure_app(
+        app=app,
+        root_router=create_root_router(),
+        profiling=settings.profiling,
+    )
 
+    providers = (*get_providers(), *di_providers)
+    if tracing_enabled:
+        instrument_providers(providers)
     async_ioc_container = create_async_ioc_container(
-        providers=(*get_providers(), *di_providers),
+        providers=providers,
         settings=settings,
+        snapshot=snapshot,
     )
     setup_dishka(container=async_ioc_container, app=app)
 
@@ -7,12 +7,27 @@ from fastapi import APIRouter, FastAPI
 from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from app.infrastructure.metrics.registry import mark_process_dead
 from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.query_profiler import (
+    QueryBudget,
+    QueryBudgets,
+)
 from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.persistence_sqla.schema_version import (
+    stamp_packaged_heads,
+    verify_schema_version,
+)
+from app.infrastructure.tracing.tracer import get_tracer
 from app.presentation.http.auth.asgi_middleware import (
     ASGIAuthMiddleware,
 )
-from app.setup.config.settings import AppSettings
+from app.presentation.http.metrics import MetricsMiddleware
+from app.presentation.http.query_profiling import QueryProfilingMiddleware
+from app.presentation.http.tracing import TracingMiddleware
+from app.setup.config.database import SchemaStartupMode
+from app.setup.config.profiling import QueryProfilingSettings
+from app.setup.config.settings import AppSettings, SettingsSnapshot
 
 
 async def init_database(engine: AsyncEngine) -> None:
@@ -20,32 +35,27 @@ async def init_database(engine: AsyncEngine) -> None:
     Initialize the database by creating all tables.
     This function ensures all SQLAlchemy mappings are registered and tables are created.
     """
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Ensure all table mappings are registered
-        map_tables()
-        
-        # Import entities to ensure they are registered
-        from app.domain.entities.user import User
-        from app.domain.entities.country import Country
-        from app.domain.entities.city import City
-        from app.domain.entities.email_verification import EmailVerification
-        from app.domain.entities.notification import Notification
-        from app.domain.entities.password_reset import PasswordReset
-        from app.domain.entities.payment import Payment
-        from app.domain.entities.session import Session
-        from app.domain.entities.subscription import Subscription
-        from app.domain.entities.subscription_user import SubscriptionUser
-        
-        # Create all tables
-        async with engine.begin() as conn:
-            await conn.run_sync(mapping_registry.metadata.create_all)
-        
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Error creating database tables: {str(e)}")
-        raise
+    # Ensure all table mappings are registered
+    map_tables()
+
+    # Import entities to ensure they are registered
+    from app.domain.entities.user import User
+    from app.domain.entities.country import Country
+    from app.domain.entities.city import City
+    from app.domain.entities.email_verification import EmailVerification
+    from app.domain.entities.notification import Notification
+    from app.domain.entities.password_reset import PasswordReset
+    from app.domain.entities.payment import Payment
+    from app.domain.entities.session import Session
+    from app.domain.entities.subscription import Subscription
+    from app.domain.entities.subscription_user import SubscriptionUser
+
+    # Create all tables, and record them as migrated
+    async with engine.begin() as conn:
+        await conn.run_sync(mapping_registry.metadata.create_all)
+        await conn.run_sync(stamp_packaged_heads)
+
+    logging.getLogger(__name__).info("Database tables created successfully")
 
 
 def create_app() -> FastAPI:
@@ -57,30 +67,60 @@ def create_app() -> FastAPI:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    # Initialize database tables
-    try:
-        # Get the engine from the container
-        container = app.state.dishka_container
-        engine = await container.get(AsyncEngine)
-        await init_database(engine)
-    except Exception as e:
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to initialize database: {str(e)}")
-        # You might want to raise here depending on your requirements
-        # raise
-    
+    container = app.state.dishka_container
+    settings = await container.get(AppSettings)
+    engine = await container.get(AsyncEngine)
+    await prepare_database_schema(engine, settings.db_startup.schema_mode)
+
     yield None
     await app.state.dishka_container.close()
+    mark_process_dead()
+    get_tracer().shutdown()
     # https://dishka.readthedocs.io/en/stable/integrations/fastapi.html
 
 
+async def prepare_database_schema(
+    engine: AsyncEngine,
+    mode: SchemaStartupMode,
+) -> None:
+    """
+    A failure stops the boot: the app is never served without its schema.
+
+    :raises SchemaVersionMismatchError:
+    """
+    if mode == SchemaStartupMode.VERIFY:
+        await verify_schema_version(engine)
+        return
+
+    if mode == SchemaStartupMode.CREATE_ALL:
+        await init_database(engine)
+
+
 def configure_app(
     app: FastAPI,
     root_router: APIRouter,
+    profiling: QueryProfilingSettings | None = None,
 ) -> None:
+    if profiling is None:
+        profiling = QueryProfilingSettings()
     app.include_router(root_router)
     app.add_middleware(ASGIAuthMiddleware)
     # https://github.com/encode/starlette/discussions/2451
+    app.add_middleware(
+        QueryProfilingMiddleware,
+        budgets=QueryBudgets(
+            default=QueryBudget(
+                max_statements=profiling.max_statements,
+                max_repeats=profiling.max_repeats,
+            ),
+            endpoints=profiling.budgets,
+        ),
+        server_timing=profiling.server_timing,
+        enforce_budgets=profiling.enforce_budgets,
+    )
+    app.add_middleware(TracingMiddleware)
+    # Outermost of ours, so the time spent in the other middlewares counts.
+    app.add_middleware(MetricsMiddleware)
 
     # Good place to register global exception handlers
 
@@ -88,8 +128,11 @@ def configure_app(
 def create_async_ioc_container(
     providers: Iterable[Provider],
     settings: AppSettings,
+    snapshot: SettingsSnapshot | None = None,
 ) -> AsyncContainer:
+    if snapshot is None:
+        snapshot = SettingsSnapshot(settings)
     return make_async_container(
         *providers,
-        context={AppSettings: settings},
+        context={AppSettings: settings, SettingsSnapshot: snapshot},
     )
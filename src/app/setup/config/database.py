@@ -1,13 +1,16 @@
 import os
+from enum import StrEnum
 from typing import Final
 
-from pydantic import BaseModel, Field, PostgresDsn, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PostgresDsn, field_validator
 
 PORT_MIN: Final[int] = 1
 PORT_MAX: Final[int] = 65535
 
 
 class PostgresSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user: str = Field(alias="USER")
     password: str = Field(alias="PASSWORD")
     db: str = Field(alias="DB")
@@ -45,7 +48,25 @@ class PostgresSettings(BaseModel):
 
 
 class SqlaEngineSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     echo: bool = Field(alias="ECHO")
     echo_pool: bool = Field(alias="ECHO_POOL")
     pool_size: int = Field(alias="POOL_SIZE")
     max_overflow: int = Field(alias="MAX_OVERFLOW")
+
+
+class SchemaStartupMode(StrEnum):
+    VERIFY = "verify"
+    # For tests and throwaway databases; deployments migrate with Alembic.
+    CREATE_ALL = "create_all"
+    SKIP = "skip"
+
+
+class DbStartupSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    schema_mode: SchemaStartupMode = Field(
+        alias="SCHEMA_MODE",
+        default=SchemaStartupMode.VERIFY,
+    )
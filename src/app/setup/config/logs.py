@@ -2,7 +2,7 @@ import logging
 from enum import StrEnum
 from typing import Final
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LoggingLevel(StrEnum):
@@ -14,6 +14,8 @@ class LoggingLevel(StrEnum):
 
 
 class LoggingSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     level: LoggingLevel = Field(alias="LEVEL")
 
 
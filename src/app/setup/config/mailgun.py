@@ -1,8 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MailgunSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     domain: str = Field(alias="DOMAIN")
     api_key: str = Field(alias="API_KEY")
-
-
+    base_url: str = Field(alias="BASE_URL", default="https://api.mailgun.net/v3")
+    timeout_s: float = Field(alias="TIMEOUT_S", default=10.0, gt=0)
+    pool_size: int = Field(alias="POOL_SIZE", default=10, ge=1)
+    batch_window_ms: int = Field(alias="BATCH_WINDOW_MS", default=200, ge=0)
+    max_batch_size: int = Field(alias="MAX_BATCH_SIZE", default=1000, ge=1, le=1000)
+    max_attempts: int = Field(alias="MAX_ATTEMPTS", default=5, ge=1)
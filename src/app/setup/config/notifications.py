@@ -0,0 +1,13 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class NotificationStreamSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Without Redis, pushes only reach clients connected to the same process,
+    # and broadcasts fanned out by a worker are not pushed at all.
+    redis_url: str | None = Field(alias="REDIS_URL", default=None)
+    channel: str = Field(alias="CHANNEL", default="notifications")
+    queue_size: int = Field(alias="QUEUE_SIZE", default=100, ge=1)
+    heartbeat_s: float = Field(alias="HEARTBEAT_S", default=15.0, gt=0)
+    max_connections: int = Field(alias="MAX_CONNECTIONS", default=10_000, ge=1)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class QueryProfilingSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Adds `Server-Timing: db;dur=...` to responses; keep it off in prod.
+    server_timing: bool = Field(alias="SERVER_TIMING", default=False)
+    # Fails requests over budget instead of logging them, for test runs.
+    enforce_budgets: bool = Field(alias="ENFORCE_BUDGETS", default=False)
+    max_statements: int = Field(alias="MAX_STATEMENTS", default=30, ge=1)
+    # How often one statement shape may run per request before it is N+1.
+    max_repeats: int = Field(alias="MAX_REPEATS", default=5, ge=1)
+    # Statement ceilings by endpoint, e.g. {"GET /api/v1/account/me" = 3}.
+    budgets: dict[str, int] = Field(alias="BUDGETS", default_factory=dict)
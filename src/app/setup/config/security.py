@@ -1,10 +1,12 @@
 from datetime import timedelta
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AuthSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     jwt_secret: str = Field(alias="JWT_SECRET")
     jwt_algorithm: Literal[
         "HS256",
@@ -42,14 +44,20 @@ class AuthSettings(BaseModel):
 
 
 class CookiesSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     secure: bool = Field(alias="SECURE")
 
 
 class PasswordSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     pepper: str = Field(alias="PEPPER")
 
 
 class SecuritySettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     auth: AuthSettings
     cookies: CookiesSettings
     password: PasswordSettings
@@ -1,24 +1,147 @@
-from pydantic import BaseModel
+import logging
+import signal
+from collections.abc import Mapping
+from functools import cache
+from pathlib import Path
+from threading import Lock, current_thread, main_thread
 
-from app.setup.config.database import PostgresSettings, SqlaEngineSettings
-from app.setup.config.loader import ValidEnvs, get_current_env, load_full_config
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.setup.config.database import (
+    DbStartupSettings,
+    PostgresSettings,
+    SqlaEngineSettings,
+)
+from app.setup.config.loader import (
+    ENV_TO_DIR_PATHS,
+    DirContents,
+    ValidEnvs,
+    get_current_env,
+    load_full_config,
+)
 from app.setup.config.logs import LoggingSettings
 from app.setup.config.security import SecuritySettings
 from app.setup.config.mailgun import MailgunSettings
+from app.setup.config.notifications import NotificationStreamSettings
+from app.setup.config.profiling import QueryProfilingSettings
 from app.setup.config.stripe import StripeSettings
+from app.setup.config.tracing import TracingSettings
+
+log = logging.getLogger(__name__)
 
 
 class AppSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     postgres: PostgresSettings
     sqla: SqlaEngineSettings
+    db_startup: DbStartupSettings = Field(default_factory=DbStartupSettings)
     security: SecuritySettings
     logs: LoggingSettings
     mailgun: MailgunSettings | None = None
     stripe: StripeSettings | None = None
+    notifications: NotificationStreamSettings = Field(
+        default_factory=NotificationStreamSettings,
+    )
+    profiling: QueryProfilingSettings = Field(
+        default_factory=QueryProfilingSettings,
+    )
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
 
 
-def load_settings(env: ValidEnvs | None = None) -> AppSettings:
+def load_settings(
+    env: ValidEnvs | None = None,
+    dir_paths: Mapping[ValidEnvs, Path] = ENV_TO_DIR_PATHS,
+) -> AppSettings:
     if env is None:
         env = get_current_env()
-    raw_config = load_full_config(env=env)
+    raw_config = load_full_config(env=env, dir_paths=dir_paths)
     return AppSettings.model_validate(raw_config)
+
+
+type ConfigMtimes = tuple[int | None, ...]
+
+
+def read_config_mtimes(
+    env: ValidEnvs,
+    dir_paths: Mapping[ValidEnvs, Path] = ENV_TO_DIR_PATHS,
+) -> ConfigMtimes:
+    dir_path = dir_paths[env]
+    mtimes: list[int | None] = []
+    for name in (DirContents.CONFIG_NAME, DirContents.SECRETS_NAME):
+        try:
+            mtimes.append((dir_path / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+class SettingsSnapshot:
+    """
+    Process-wide, immutable view of the configuration.
+    TOML files are parsed only on construction and on reload,
+    so reading `current` never touches the disk.
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        env: ValidEnvs | None = None,
+        dir_paths: Mapping[ValidEnvs, Path] = ENV_TO_DIR_PATHS,
+    ) -> None:
+        self._env = env if env is not None else get_current_env()
+        self._dir_paths = dir_paths
+        self._lock = Lock()
+        self._mtimes = read_config_mtimes(self._env, self._dir_paths)
+        self._current = (
+            settings
+            if settings is not None
+            else load_settings(self._env, self._dir_paths)
+        )
+
+    @property
+    def current(self) -> AppSettings:
+        return self._current
+
+    def reload(self) -> AppSettings:
+        """
+        :raises ValidationError:
+        :raises FileNotFoundError:
+        """
+        with self._lock:
+            mtimes = read_config_mtimes(self._env, self._dir_paths)
+            self._current = load_settings(self._env, self._dir_paths)
+            self._mtimes = mtimes
+        log.info("Settings reloaded for environment: '%s'", self._env)
+        return self._current
+
+    def reload_if_modified(self) -> bool:
+        """
+        Costs two `stat` calls; files are parsed only if either has changed.
+        """
+        if read_config_mtimes(self._env, self._dir_paths) == self._mtimes:
+            return False
+        self.reload()
+        return True
+
+
+@cache
+def get_settings_snapshot() -> SettingsSnapshot:
+    return SettingsSnapshot()
+
+
+def reload_settings_on_sighup(snapshot: SettingsSnapshot) -> None:
+    """
+    Installs a SIGHUP handler that re-reads the configuration files.
+    No-op on platforms without SIGHUP and outside the main thread.
+    """
+    if not hasattr(signal, "SIGHUP") or current_thread() is not main_thread():
+        return
+
+    def handle_sighup(_signum: int, _frame: object) -> None:
+        try:
+            snapshot.reload()
+        except Exception as e:  # noqa: BLE001
+            log.error("Settings reload failed, keeping previous snapshot: %s", e)
+
+    signal.signal(signal.SIGHUP, handle_sighup)
@@ -1,7 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class StripeSettings(BaseModel):
-    STRIPE_API_KEY: str | None = None
-
+    model_config = ConfigDict(frozen=True)
 
+    STRIPE_API_KEY: str | None = None
+    STRIPE_API_BASE: str = "https://api.stripe.com"
+    STRIPE_TIMEOUT_S: float = Field(default=10.0, gt=0)
+    # Also the number of Stripe calls one process runs at a time.
+    STRIPE_POOL_SIZE: int = Field(default=10, ge=1)
+    # Signing secret of the webhook endpoint (`whsec_...`); without it every
+    # webhook delivery is rejected.
+    STRIPE_WEBHOOK_SECRET: str | None = None
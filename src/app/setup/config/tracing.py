@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.infrastructure.tracing.exporters import OtlpHttpSpanExporter
+from app.infrastructure.tracing.tracer import Tracer, set_tracer
+
+
+class TracingSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Share of requests traced from the start; callers that send a sampled
+    # `traceparent` are always followed.
+    sample_ratio: float = Field(alias="SAMPLE_RATIO", default=0.01, ge=0, le=1)
+    # OTLP/HTTP collector, e.g. "http://otel-collector:4318/v1/traces".
+    # Tracing stays off without one.
+    otlp_endpoint: str | None = Field(alias="OTLP_ENDPOINT", default=None)
+    service_name: str = Field(alias="SERVICE_NAME", default="baseapi")
+
+
+def configure_tracing(settings: TracingSettings) -> bool:
+    """Installs the process-wide tracer; returns whether spans are exported."""
+    if settings.otlp_endpoint is None or settings.sample_ratio == 0:
+        set_tracer(Tracer())
+        return False
+    exporter = OtlpHttpSpanExporter(
+        settings.otlp_endpoint,
+        service_name=settings.service_name,
+    )
+    set_tracer(Tracer(exporter, sample_ratio=settings.sample_ratio))
+    return True
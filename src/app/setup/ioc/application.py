@@ -1,6 +1,7 @@
 from dishka import Provider, Scope, provide, provide_all
 
 from app.application.commands.user.activate_user import ActivateUserInteractor
+from app.application.commands.user.bulk_update_users import BulkUpdateUsersInteractor
 from app.application.commands.user.change_password import ChangePasswordInteractor
 from app.application.commands.user.deactivate_user import DeactivateUserInteractor
 from app.application.commands.user.grant_admin import GrantAdminInteractor
@@ -14,6 +15,9 @@ from app.application.common.ports.transaction_manager import (
 from app.application.common.ports.user_command_gateway import UserCommandGateway
 from app.application.common.ports.user_query_gateway import UserQueryGateway
 from app.application.common.services.current_user import CurrentUserService
+from app.application.common.services.idempotency import IdempotencyService
+from app.application.queries.export_payments import ExportPaymentsQueryService
+from app.application.queries.export_users import ExportUsersQueryService
 from app.application.queries.list_users import ListUsersQueryService
 from app.application.atlas.queries import (
     SearchCountriesQueryService,
@@ -48,6 +52,7 @@ class ApplicationProvider(Provider):
     # Services
     services = provide_all(
         CurrentUserService,
+        IdempotencyService,
         UserService,
     )
 
@@ -92,6 +97,7 @@ class ApplicationProvider(Provider):
     # Commands
     commands = provide_all(
         ActivateUserInteractor,
+        BulkUpdateUsersInteractor,
         ChangePasswordInteractor,
         DeactivateUserInteractor,
         GrantAdminInteractor,
@@ -100,6 +106,8 @@ class ApplicationProvider(Provider):
 
     # Queries
     query_services = provide_all(
+        ExportPaymentsQueryService,
+        ExportUsersQueryService,
         ListUsersQueryService,
         SearchCountriesQueryService,
         SearchCitiesQueryService,
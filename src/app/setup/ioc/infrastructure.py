@@ -34,7 +34,22 @@ from app.infrastructure.auth.handlers.change_password import ChangeOwnPasswordHa
 from app.infrastructure.subscription.handlers.init_subscriptions import InitSubscriptionsHandler
 from app.infrastructure.subscription.handlers.get_subscriptions import GetSubscriptionsHandler
 from app.infrastructure.subscription.handlers.customer_subscription import CreateSubscriptionHandler
+from app.infrastructure.subscription.handlers.cancel_subscription import CancelSubscriptionHandler
+from app.infrastructure.subscription.handlers.success_subscription import SubscriptionSuccessHandler
+from app.infrastructure.subscription.billing_gateway_stripe import StripeBillingGateway
+from app.infrastructure.subscription.billing_events_sqla import (
+    SqlaBillingEventInbox,
+    SqlaBillingStateWriter,
+)
+from app.infrastructure.subscription.webhook_signature import StripeWebhookVerifier
+from app.infrastructure.subscription.provider import (
+    get_plan_catalog_cache,
+    get_stripe_client,
+)
 from app.infrastructure.auth.handlers.account_me import GetMeHandler, UpdateMeHandler
+from app.infrastructure.persistence_sqla.handlers.slowest_queries import (
+    SlowestQueriesHandler,
+)
 from app.infrastructure.auth.session.id_generator_str import (
     StrAuthSessionIdGenerator,
 )
@@ -56,6 +71,7 @@ from app.infrastructure.persistence_sqla.provider import (
     get_async_session_factory,
     get_auth_async_session,
     get_main_async_session,
+    get_query_stats,
 )
 from app.presentation.http.auth.adapters.session_transport_jwt_header import (
     JwtHeaderAuthSessionTransport,
@@ -63,14 +79,11 @@ from app.presentation.http.auth.adapters.session_transport_jwt_header import (
 from app.infrastructure.atlas.handlers.init_cities import InitCitiesHandler
 from app.infrastructure.atlas.handlers.init_countries import InitCountriesHandler
 from app.infrastructure.adapters.session_store_sqla import SqlaSessionStore
+from app.infrastructure.maintenance.partitions_sqla import SqlaPartitionMaintainer
 from app.infrastructure.maintenance.repositories_sqla import (
-    SqlaAuthSessionRepository,
-    SqlaPasswordResetRepository,
-)
-from app.application.maintenance.ports import (
-    AuthSessionRepository,
-    PasswordResetRepository,
+    SqlaExpiredRecordsPurger,
 )
+from app.application.maintenance.ports import ExpiredRecordsPurger
 from app.application.common.ports.password_reset_repository import (
     PasswordResetRepository as CommonPasswordResetRepository,
 )
@@ -85,17 +98,41 @@ from app.application.subscription.ports import SubscriptionRepository
 from app.infrastructure.adapters.subscription_repository_sqla import (
     SqlaSubscriptionRepository,
 )
-from app.application.subscription.ports import SubscriptionUserRepository, PaymentRepository
+from app.application.subscription.ports import (
+    BillingEventInbox,
+    BillingGateway,
+    BillingStateWriter,
+    PaymentRepository,
+    SubscriptionUserRepository,
+)
+from app.application.common.ports.task_queue import TaskQueue
+from app.infrastructure.adapters.task_queue_outbox_sqla import SqlaOutboxTaskQueue
+from app.infrastructure.outbox.relay_sqla import SqlaOutboxRelay
 from app.infrastructure.adapters.subscription_user_repository_sqla import (
     SqlaSubscriptionUserRepository,
 )
 from app.infrastructure.adapters.payment_repository_sqla import (
     SqlaPaymentRepository,
 )
-from app.application.notification.ports import NotificationRepository
+from app.application.notification.ports import (
+    NotificationFanOutWriter,
+    NotificationRepository,
+)
+from app.infrastructure.notification.fan_out_sqla import (
+    SqlaNotificationFanOutWriter,
+)
+from app.infrastructure.notification.provider import (
+    get_notification_feed,
+    get_notification_hub,
+    get_notification_publisher,
+)
 from app.infrastructure.adapters.notification_repository_sqla import (
     SqlaNotificationRepository,
 )
+from app.application.common.ports.idempotency_store import IdempotencyStore
+from app.infrastructure.adapters.idempotency_store_sqla import SqlaIdempotencyStore
+from app.infrastructure.idempotency.provider import get_idempotency_cache
+from app.infrastructure.atlas.provider import get_atlas_name_cache
 
 
 class InfrastructureProvider(Provider):
@@ -145,15 +182,9 @@ class InfrastructureProvider(Provider):
         source=AtlasSqlaCityReader,
         provides=AtlasCityReader,
     )
-    auth_session_repo = provide(
-        source=SqlaAuthSessionRepository,
-        provides=AuthSessionRepository,
-        scope=Scope.APP,
-    )
-    password_reset_repo = provide(
-        source=SqlaPasswordResetRepository,
-        provides=PasswordResetRepository,
-        scope=Scope.APP,
+    expired_records_purger = provide(
+        source=SqlaExpiredRecordsPurger,
+        provides=ExpiredRecordsPurger,
     )
     # Common Password Reset Port (create/read/mark used)
     common_password_reset_repo = provide(
@@ -172,15 +203,43 @@ class InfrastructureProvider(Provider):
         source=SqlaPaymentRepository,
         provides=PaymentRepository,
     )
+    billing_event_inbox = provide(
+        source=SqlaBillingEventInbox,
+        provides=BillingEventInbox,
+    )
+    billing_state_writer = provide(
+        source=SqlaBillingStateWriter,
+        provides=BillingStateWriter,
+    )
     notification_repo = provide(
         source=SqlaNotificationRepository,
         provides=NotificationRepository,
     )
+    notification_fan_out_writer = provide(
+        source=SqlaNotificationFanOutWriter,
+        provides=NotificationFanOutWriter,
+    )
+    idempotency_store = provide(
+        source=SqlaIdempotencyStore,
+        provides=IdempotencyStore,
+    )
     email_verification_repo = provide(
         source=SqlaEmailVerificationRepository,
         provides=EmailVerificationRepository,
     )
 
+    # Background tasks go through the transactional outbox
+    task_queue = provide(
+        source=SqlaOutboxTaskQueue,
+        provides=TaskQueue,
+    )
+
+    # Integrations (HTTP clients are built on first use)
+    billing_gateway = provide(
+        source=StripeBillingGateway,
+        provides=BillingGateway,
+    )
+
     # Infrastructure Handlers
     infra_handlers = provide_all(
         SignUpHandler,
@@ -195,8 +254,11 @@ class InfrastructureProvider(Provider):
         InitSubscriptionsHandler,
         GetSubscriptionsHandler,
         CreateSubscriptionHandler,
+        CancelSubscriptionHandler,
+        SubscriptionSuccessHandler,
         GetMeHandler,
         UpdateMeHandler,
+        SlowestQueriesHandler,
     )
 
     # Concrete Objects
@@ -214,6 +276,9 @@ class InfrastructureProvider(Provider):
         SqlaMainTransactionManager,
         InitCountriesHandler,
         InitCitiesHandler,
+        SqlaOutboxRelay,
+        SqlaPartitionMaintainer,
+        StripeWebhookVerifier,
     )
 
 
@@ -221,6 +286,10 @@ def infrastructure_provider() -> InfrastructureProvider:
     provider = InfrastructureProvider()
 
     # SQLA Persistence
+    provider.provide(
+        source=get_query_stats,
+        scope=Scope.APP,
+    )
     provider.provide(
         source=get_async_engine,
         scope=Scope.APP,
@@ -231,10 +300,46 @@ def infrastructure_provider() -> InfrastructureProvider:
     )
     provider.provide(
         source=get_main_async_session,
-        scope=Scope.APP,
+        scope=Scope.REQUEST,
     )
     provider.provide(
         source=get_auth_async_session,
+        scope=Scope.REQUEST,
+    )
+
+    # Notification push (one hub and publisher per process)
+    provider.provide(
+        source=get_notification_hub,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_notification_publisher,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_notification_feed,
+        scope=Scope.APP,
+    )
+
+    # Stripe (one connection pool and executor per process)
+    provider.provide(
+        source=get_stripe_client,
+        scope=Scope.APP,
+    )
+    provider.provide(
+        source=get_plan_catalog_cache,
+        scope=Scope.APP,
+    )
+
+    # Completed idempotency keys are replayed from memory
+    provider.provide(
+        source=get_idempotency_cache,
+        scope=Scope.APP,
+    )
+
+    # Country and city names for profiles
+    provider.provide(
+        source=get_atlas_name_cache,
         scope=Scope.APP,
     )
     return provider
@@ -5,19 +5,25 @@ from app.infrastructure.auth.session.timer_utc import (
     AuthSessionRefreshThreshold,
     AuthSessionTtlMin,
 )
+from app.infrastructure.notification.config import NotificationStreamConfig
 from app.infrastructure.persistence_sqla.config import PostgresDsn, SqlaEngineConfig
+from app.infrastructure.subscription.billing_gateway_stripe import StripeApiKey
+from app.infrastructure.subscription.stripe_client import StripeClientConfig
+from app.infrastructure.subscription.webhook_signature import StripeWebhookSecret
 from app.presentation.http.auth.access_token_processor_jwt import (
     JwtAlgorithm,
     JwtSecret,
 )
 from app.presentation.http.auth.cookie_params import CookieParams
-from app.setup.config.settings import AppSettings
+from app.setup.config.settings import AppSettings, SettingsSnapshot
+from app.setup.config.stripe import StripeSettings
 
 
 class SettingsProvider(Provider):
     scope = Scope.APP
 
     settings = from_context(provides=AppSettings)
+    snapshot = from_context(provides=SettingsSnapshot)
 
     @provide
     def provide_postgres_dsn(self, settings: AppSettings) -> PostgresDsn:
@@ -27,6 +33,13 @@ class SettingsProvider(Provider):
     def provide_sqla_engine_config(self, settings: AppSettings) -> SqlaEngineConfig:
         return SqlaEngineConfig(**settings.sqla.model_dump())
 
+    @provide
+    def provide_notification_stream_config(
+        self,
+        settings: AppSettings,
+    ) -> NotificationStreamConfig:
+        return NotificationStreamConfig(**settings.notifications.model_dump())
+
     @provide
     def provide_password_pepper(self, settings: AppSettings) -> PasswordPepper:
         return PasswordPepper(settings.security.password.pepper)
@@ -55,3 +68,31 @@ class SettingsProvider(Provider):
     @provide
     def provide_cookie_params(self, settings: AppSettings) -> CookieParams:
         return CookieParams(secure=settings.security.cookies.secure)
+
+    @provide
+    def provide_stripe_client_config(self, settings: AppSettings) -> StripeClientConfig:
+        stripe = settings.stripe or StripeSettings()
+        return StripeClientConfig(
+            api_base=stripe.STRIPE_API_BASE,
+            timeout_s=stripe.STRIPE_TIMEOUT_S,
+            pool_size=stripe.STRIPE_POOL_SIZE,
+        )
+
+    # Integration credentials are read per request from the live snapshot,
+    # so rotating them only needs a SIGHUP, not a restart.
+    @provide(scope=Scope.REQUEST)
+    def provide_stripe_api_key(self, snapshot: SettingsSnapshot) -> StripeApiKey:
+        stripe = snapshot.current.stripe
+        if stripe is None:
+            return StripeApiKey("")
+        return StripeApiKey(stripe.STRIPE_API_KEY or "")
+
+    @provide(scope=Scope.REQUEST)
+    def provide_stripe_webhook_secret(
+        self,
+        snapshot: SettingsSnapshot,
+    ) -> StripeWebhookSecret:
+        stripe = snapshot.current.stripe
+        if stripe is None:
+            return StripeWebhookSecret("")
+        return StripeWebhookSecret(stripe.STRIPE_WEBHOOK_SECRET or "")
@@ -0,0 +1,92 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedRequest:
+    path: str
+    form: dict[str, list[str]]
+    client_address: tuple[str, int]
+
+
+class FakeMailgun:
+    """
+    Local stand-in for the Mailgun messages API. Records every request and
+    answers with queued failure statuses first, then 200.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[RecordedRequest] = []
+        self._failures: list[int] = []
+        self._cond = threading.Condition()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode())
+                status = fake._record(
+                    RecordedRequest(
+                        path=self.path,
+                        form=form,
+                        client_address=self.client_address,
+                    ),
+                )
+                body = b'{"message": "Queued. Thank you."}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/v3"
+
+    def fail_next(self, status: int, times: int = 1) -> None:
+        with self._cond:
+            self._failures.extend([status] * times)
+
+    def wait_for_requests(self, count: int, timeout_s: float = 5.0) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self.requests) >= count, timeout_s)
+
+    def _record(self, request: RecordedRequest) -> int:
+        with self._cond:
+            self.requests.append(request)
+            self._cond.notify_all()
+            return self._failures.pop(0) if self._failures else 200
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextmanager
+def run_fake_mailgun() -> Iterator[FakeMailgun]:
+    fake = FakeMailgun()
+    fake.start()
+    try:
+        yield fake
+    finally:
+        fake.stop()
@@ -0,0 +1,237 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.infrastructure.celery import compat_tasks, mail
+from app.infrastructure.celery.app import MAIL_QUEUE, celery_app
+from app.infrastructure.email.mailgun import (
+    EmailMessage,
+    MailBatcher,
+    MailgunDeliveryError,
+    MailgunTransport,
+    retry_backoff_s,
+)
+from app.setup.config.mailgun import MailgunSettings
+from tests.app.integration.email.fake_mailgun import FakeMailgun, run_fake_mailgun
+
+TEMPLATE = "Your code: %recipient.code%"
+
+
+@pytest.fixture
+def mailgun() -> Iterator[FakeMailgun]:
+    with run_fake_mailgun() as fake:
+        yield fake
+
+
+def create_batcher(
+    mailgun: FakeMailgun,
+    *,
+    window_s: float = 0.1,
+) -> tuple[MailBatcher, MailgunTransport]:
+    transport = MailgunTransport(
+        domain="mg.example.com",
+        api_key="key",
+        base_url=mailgun.base_url,
+        timeout_s=5,
+        pool_size=2,
+    )
+    batcher = MailBatcher(transport.send_batch, window_s=window_s)
+    return batcher, transport
+
+
+def create_message(to: str, code: str = "123") -> EmailMessage:
+    return EmailMessage(to=to, subject="Code", text=TEMPLATE, variables={"code": code})
+
+
+def test_messages_in_window_share_one_batch_call(mailgun: FakeMailgun) -> None:
+    batcher, transport = create_batcher(mailgun)
+
+    for i in range(3):
+        batcher.submit(create_message(f"user{i}@example.com", code=str(i)))
+    batcher.stop()
+    transport.close()
+
+    assert len(mailgun.requests) == 1
+    form = mailgun.requests[0].form
+    assert form["to"] == [f"user{i}@example.com" for i in range(3)]
+    assert form["text"] == [TEMPLATE]
+    assert orjson.loads(form["recipient-variables"][0]) == {
+        f"user{i}@example.com": {"code": str(i)} for i in range(3)
+    }
+
+
+def test_same_recipient_is_split_across_batches(mailgun: FakeMailgun) -> None:
+    batcher, transport = create_batcher(mailgun)
+
+    batcher.submit(create_message("a@example.com", code="1"))
+    batcher.submit(create_message("a@example.com", code="2"))
+    batcher.stop()
+    transport.close()
+
+    assert len(mailgun.requests) == 2
+
+
+def test_delivery_resolves_once_the_batch_is_accepted(
+    mailgun: FakeMailgun,
+) -> None:
+    batcher, transport = create_batcher(mailgun)
+
+    delivered = batcher.submit(create_message("a@example.com"))
+
+    assert delivered.result(timeout=5) is None
+    batcher.stop()
+    transport.close()
+
+
+@pytest.mark.parametrize(("status", "retryable"), [(503, True), (400, False)])
+def test_failed_batch_fails_every_message_once(
+    mailgun: FakeMailgun,
+    status: int,
+    retryable: bool,
+) -> None:
+    mailgun.fail_next(status)
+    batcher, transport = create_batcher(mailgun)
+
+    first = batcher.submit(create_message("a@example.com"))
+    second = batcher.submit(create_message("b@example.com"))
+    batcher.stop()
+    transport.close()
+
+    for delivered in (first, second):
+        with pytest.raises(MailgunDeliveryError) as error:
+            delivered.result(timeout=5)
+        assert error.value.retryable is retryable
+    # Retries are left to the caller's queue.
+    assert len(mailgun.requests) == 1
+
+
+def test_stop_sends_queued_messages_without_waiting(mailgun: FakeMailgun) -> None:
+    batcher, transport = create_batcher(mailgun, window_s=60)
+
+    delivered = batcher.submit(create_message("a@example.com"))
+    batcher.stop(timeout_s=5)
+    transport.close()
+
+    assert delivered.done()
+    assert delivered.exception() is None
+
+
+def test_retry_backoff_doubles_up_to_a_ceiling() -> None:
+    assert [retry_backoff_s(n) for n in range(4)] == [1.0, 2.0, 4.0, 8.0]
+    assert retry_backoff_s(20) == 300.0
+
+
+@pytest.fixture
+def batch_window_ms() -> int:
+    return 0
+
+
+@pytest.fixture
+def mail_settings(
+    mailgun: FakeMailgun,
+    monkeypatch: pytest.MonkeyPatch,
+    batch_window_ms: int,
+) -> Iterator[MailgunSettings]:
+    settings = MailgunSettings.model_validate(
+        {
+            "DOMAIN": "mg.example.com",
+            "API_KEY": "key",
+            "BASE_URL": mailgun.base_url,
+            "BATCH_WINDOW_MS": batch_window_ms,
+            "MAX_ATTEMPTS": 2,
+        },
+    )
+    snapshot = SimpleNamespace(
+        current=SimpleNamespace(mailgun=settings),
+        reload_if_modified=lambda: None,
+    )
+    monkeypatch.setattr(compat_tasks, "get_settings_snapshot", lambda: snapshot)
+    yield settings
+    mail.stop_mail_batcher()
+
+
+@pytest.mark.usefixtures("mail_settings")
+def test_task_returns_only_after_delivery(mailgun: FakeMailgun) -> None:
+    result = compat_tasks.send_password_reset_email.apply(
+        kwargs={"to_email": "a@example.com", "reset_token": "t0k3n"},
+    )
+
+    assert result.successful()
+    [request] = mailgun.requests
+    assert orjson.loads(request.form["recipient-variables"][0]) == {
+        "a@example.com": {"reset_token": "t0k3n"},
+    }
+
+
+@pytest.mark.parametrize("batch_window_ms", [200])
+@pytest.mark.usefixtures("mail_settings")
+def test_tasks_running_on_threads_share_one_batch(mailgun: FakeMailgun) -> None:
+    recipients = [f"user{i}@example.com" for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(recipients)) as pool:
+        results = list(
+            pool.map(
+                lambda to: compat_tasks.send_password_reset_email.apply(
+                    kwargs={"to_email": to, "reset_token": "t0k3n"},
+                ),
+                recipients,
+            ),
+        )
+
+    assert all(result.successful() for result in results)
+    [request] = mailgun.requests
+    assert sorted(request.form["to"]) == recipients
+
+
+@pytest.mark.parametrize(
+    ("task_name", "queue"),
+    [
+        ("send_email", MAIL_QUEUE),
+        ("tasks.email_tasks.send_password_reset_email", MAIL_QUEUE),
+        ("relay_outbox", "celery"),
+    ],
+)
+def test_mail_tasks_go_to_the_thread_pool_queue(task_name: str, queue: str) -> None:
+    options = celery_app.amqp.router.route({}, task_name)
+
+    assert options["queue"].name == queue
+
+
+@pytest.mark.usefixtures("mail_settings")
+def test_task_retries_retryable_failures_through_celery(mailgun: FakeMailgun) -> None:
+    mailgun.fail_next(503)
+
+    result = compat_tasks.send_password_reset_email.apply(
+        kwargs={"to_email": "a@example.com", "reset_token": "t0k3n"},
+    )
+
+    assert result.successful()
+    assert len(mailgun.requests) == 2
+
+
+@pytest.mark.usefixtures("mail_settings")
+def test_task_fails_on_permanent_failure(mailgun: FakeMailgun) -> None:
+    mailgun.fail_next(400)
+
+    result = compat_tasks.send_password_reset_email.apply(
+        kwargs={"to_email": "a@example.com", "reset_token": "t0k3n"},
+    )
+
+    assert result.failed()
+    assert len(mailgun.requests) == 1
+
+
+def test_batches_reuse_pooled_connection(mailgun: FakeMailgun) -> None:
+    batcher, transport = create_batcher(mailgun, window_s=0)
+
+    batcher.submit(create_message("a@example.com"))
+    assert mailgun.wait_for_requests(1)
+    batcher.submit(create_message("b@example.com"))
+    assert mailgun.wait_for_requests(2)
+    batcher.stop()
+    transport.close()
+
+    assert mailgun.requests[0].client_address == mailgun.requests[1].client_address
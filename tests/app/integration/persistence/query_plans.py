@@ -0,0 +1,84 @@
+"""
+Helpers for asserting on PostgreSQL query plans.
+
+Statements are explained exactly as the repositories build them, against a
+throwaway schema seeded with a realistic amount of data and analyzed, so
+the planner picks the plan it would pick in production.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import Connection, Executable
+
+
+def explain(connection: Connection, stmt: Executable) -> dict[str, Any]:
+    """
+    Returns the root plan node of `EXPLAIN (FORMAT JSON)`; the statement
+    is planned, not run.
+    """
+    compiled = stmt.compile(dialect=connection.dialect)
+    result = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}",
+        compiled.params,
+    ).scalar_one()
+    return result[0]["Plan"]
+
+
+def plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def scans_of(plan: dict[str, Any], table: str) -> list[dict[str, Any]]:
+    """
+    Scan nodes reading `table` or one of its partitions
+    (`<table>_pYYYYMM`, `<table>_default`).
+    """
+    return [
+        node
+        for node in plan_nodes(plan)
+        if node.get("Relation Name") == table
+        or str(node.get("Relation Name", "")).startswith(f"{table}_")
+    ]
+
+
+def root_index(connection: Connection, name: str) -> str:
+    """
+    The partitioned index a partition's index is attached to, or the index
+    itself; partition indexes built by PostgreSQL get generated names.
+    """
+    return connection.exec_driver_sql(
+        "SELECT coalesce(pg_partition_root(to_regclass(%(name)s)), "
+        "to_regclass(%(name)s))::text",
+        {"name": name},
+    ).scalar_one()
+
+
+def assert_index_scan(
+    connection: Connection,
+    plan: dict[str, Any],
+    table: str,
+    index: str,
+) -> None:
+    """
+    Every scan of `table` goes through an index, `index` among them, and
+    nothing is sorted after the fact.
+    """
+    scans = scans_of(plan, table)
+    assert scans, f"{table} is not read by the plan"
+    for node in scans:
+        assert node["Node Type"] in {
+            "Index Scan",
+            "Index Only Scan",
+            "Bitmap Heap Scan",
+        }, f"{node['Node Type']} on {node['Relation Name']}"
+    used = {
+        root_index(connection, node["Index Name"])
+        for node in plan_nodes(plan)
+        if "Index Name" in node
+    }
+    assert index in used, f"{index} is not among the indexes used: {used}"
+    sorts = [node for node in plan_nodes(plan) if node["Node Type"] == "Sort"]
+    assert not sorts, "the plan sorts rows the index should deliver in order"
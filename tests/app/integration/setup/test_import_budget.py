@@ -0,0 +1,73 @@
+import subprocess
+import sys
+from typing import Final
+
+import pytest
+
+# Cumulative import time ceilings in microseconds, with headroom over a warm
+# `.pyc` cache on a developer laptop. Tighten when an entry point gets lighter.
+APP_IMPORT_BUDGET_US: Final[int] = 2_500_000
+CELERY_IMPORT_BUDGET_US: Final[int] = 800_000
+
+# Integrations that must stay behind their ports until first use.
+LAZY_MODULES: Final[frozenset[str]] = frozenset({"stripe", "requests", "alembic"})
+
+APP_ENTRY: Final[tuple[str, ...]] = ("app.run",)
+# What a worker loads: the Celery app module alone does not import its tasks.
+CELERY_ENTRY: Final[tuple[str, ...]] = (
+    "app.infrastructure.celery.tasks",
+    "app.infrastructure.celery.compat_tasks",
+    "app.infrastructure.celery.mail",
+)
+
+
+def profile_import(modules: tuple[str, ...]) -> tuple[dict[str, int], int]:
+    """
+    Imports `modules` in a fresh interpreter under `-X importtime`. Returns
+    the cumulative import time of every module loaded, and the total time.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+        # Nested imports are indented and already counted by their importer.
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative_us)
+    return cumulative, total_us
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [pytest.param(APP_ENTRY, id="app"), pytest.param(CELERY_ENTRY, id="celery")],
+)
+def test_entry_point_does_not_import_heavy_integrations(
+    entry: tuple[str, ...],
+) -> None:
+    loaded, _ = profile_import(entry)
+
+    assert not LAZY_MODULES & loaded.keys()
+
+
+@pytest.mark.parametrize(
+    ("entry", "budget_us"),
+    [
+        pytest.param(APP_ENTRY, APP_IMPORT_BUDGET_US, id="app"),
+        pytest.param(CELERY_ENTRY, CELERY_IMPORT_BUDGET_US, id="celery"),
+    ],
+)
+def test_entry_point_import_fits_budget(
+    entry: tuple[str, ...],
+    budget_us: int,
+) -> None:
+    _, total_us = profile_import(entry)
+
+    assert total_us <= budget_us
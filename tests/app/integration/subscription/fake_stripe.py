@@ -0,0 +1,140 @@
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedRequest:
+    method: str
+    path: str
+    form: dict[str, list[str]]
+    headers: dict[str, str]
+
+
+class FakeStripe:
+    """
+    Local stand-in for the parts of the Stripe API the billing gateway uses.
+    Every response can be delayed by `delay_s` to play a slow Stripe, and
+    queued failure statuses are answered first.
+    """
+
+    def __init__(self, *, delay_s: float = 0.0) -> None:
+        self.delay_s = delay_s
+        self.requests: list[RecordedRequest] = []
+        self.checkout_sessions: dict[str, dict[str, Any]] = {}
+        self._failures: list[int] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self._handle()
+
+            def do_POST(self) -> None:
+                self._handle()
+
+            def do_DELETE(self) -> None:
+                self._handle()
+
+            def _handle(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length).decode() if length else url.query
+                request = RecordedRequest(
+                    method=self.command,
+                    path=url.path,
+                    form=parse_qs(raw),
+                    headers=dict(self.headers),
+                )
+                status, body = fake._answer(request)
+                time.sleep(fake.delay_s)
+                payload = orjson.dumps(body)
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except ConnectionError:
+                    pass  # the client timed out while we were "slow"
+
+            def log_message(self, *_args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def fail_next(self, status: int, times: int = 1) -> None:
+        with self._lock:
+            self._failures.extend([status] * times)
+
+    def _answer(self, request: RecordedRequest) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            self.requests.append(request)
+            if self._failures:
+                status = self._failures.pop(0)
+                return status, {"error": {"message": "Injected failure."}}
+            return self._route(request)
+
+    def _route(self, request: RecordedRequest) -> tuple[int, dict[str, Any]]:
+        form = {key: values[0] for key, values in request.form.items()}
+        parts = request.path.strip("/").split("/")
+        match request.method, parts:
+            case "POST", ["v1", "checkout", "sessions"]:
+                session = {
+                    "id": f"cs_test_{next(self._ids)}",
+                    "object": "checkout.session",
+                    "mode": form.get("mode"),
+                    "subscription": f"sub_test_{next(self._ids)}",
+                    "payment_intent": None,
+                }
+                self.checkout_sessions[session["id"]] = session
+                return 200, session
+            case "GET", ["v1", "checkout", "sessions", session_id]:
+                if session_id not in self.checkout_sessions:
+                    return 404, {"error": {"message": "No such checkout.session"}}
+                return 200, self.checkout_sessions[session_id]
+            case "POST", ["v1", "products"]:
+                return 200, {"id": f"prod_test_{next(self._ids)}", "name": form["name"]}
+            case "POST", ["v1", "prices"]:
+                return 200, {"id": f"price_test_{next(self._ids)}", **form}
+            case "DELETE", ["v1", "subscriptions", subscription_id]:
+                return 200, {"id": subscription_id, "status": "canceled"}
+        return 404, {"error": {"message": "Unrecognized request URL."}}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@contextmanager
+def run_fake_stripe(*, delay_s: float = 0.0) -> Iterator[FakeStripe]:
+    fake = FakeStripe(delay_s=delay_s)
+    fake.start()
+    try:
+        yield fake
+    finally:
+        fake.stop()
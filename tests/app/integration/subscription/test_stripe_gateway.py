@@ -0,0 +1,161 @@
+import asyncio
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from app.infrastructure.subscription.billing_gateway_stripe import (
+    StripeApiKey,
+    StripeBillingGateway,
+)
+from app.infrastructure.subscription.stripe_client import (
+    StripeApiError,
+    StripeClientConfig,
+    StripeHttpClient,
+    encode_form,
+)
+from tests.app.integration.subscription.fake_stripe import FakeStripe, run_fake_stripe
+
+
+@pytest.fixture
+def stripe() -> Iterator[FakeStripe]:
+    with run_fake_stripe() as fake:
+        yield fake
+
+
+@pytest.fixture
+def client(stripe: FakeStripe) -> Iterator[StripeHttpClient]:
+    client = StripeHttpClient(
+        StripeClientConfig(api_base=stripe.base_url, timeout_s=2, pool_size=2),
+    )
+    yield client
+    client.close()
+
+
+def create_gateway(client: StripeHttpClient) -> StripeBillingGateway:
+    return StripeBillingGateway(StripeApiKey("sk_test_123"), client)
+
+
+def test_encode_form_brackets_nested_values() -> None:
+    assert encode_form(
+        {
+            "line_items": [{"price": "price_1", "quantity": 1}],
+            "recurring": {"interval": "month"},
+            "livemode": False,
+            "skipped": None,
+        }
+    ) == [
+        ("line_items[0][price]", "price_1"),
+        ("line_items[0][quantity]", "1"),
+        ("recurring[interval]", "month"),
+        ("livemode", "false"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkout_session_round_trip(
+    stripe: FakeStripe,
+    client: StripeHttpClient,
+) -> None:
+    gateway = create_gateway(client)
+
+    session_id = await gateway.create_checkout_session(
+        price_id="price_1",
+        success_url="https://example.com/ok",
+        cancel_url="https://example.com/cancel",
+    )
+    session = await gateway.retrieve_checkout_session(session_id)
+
+    create = stripe.requests[0]
+    assert create.headers["Authorization"] == "Bearer sk_test_123"
+    assert create.form["line_items[0][price]"] == ["price_1"]
+    assert session["id"] == session_id and session["mode"] == "subscription"
+
+
+@pytest.mark.asyncio
+async def test_create_recurring_price_links_price_to_product(
+    stripe: FakeStripe,
+    client: StripeHttpClient,
+) -> None:
+    product_id, price_id = await create_gateway(client).create_recurring_price(
+        product_name="Pro Plan",
+        unit_amount=1999,
+        currency="usd",
+    )
+
+    price_request = stripe.requests[1]
+    assert price_request.path == "/v1/prices"
+    assert price_request.form["product"] == [product_id]
+    assert price_request.form["recurring[interval]"] == ["month"]
+    assert price_id.startswith("price_test_")
+
+
+@pytest.mark.asyncio
+async def test_stripe_errors_carry_the_status(
+    stripe: FakeStripe,
+    client: StripeHttpClient,
+) -> None:
+    stripe.fail_next(402)
+
+    with pytest.raises(StripeApiError) as error:
+        await create_gateway(client).cancel_subscription("sub_1")
+
+    assert error.value.status == 402
+    assert "Injected failure." in str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_ids_cannot_escape_their_path_segment(
+    stripe: FakeStripe,
+    client: StripeHttpClient,
+) -> None:
+    gateway = create_gateway(client)
+
+    with pytest.raises(StripeApiError):
+        await gateway.retrieve_checkout_session("cs_1/../../customers")
+    await gateway.cancel_subscription("sub_1?expand=customer")
+
+    lookup, cancel = stripe.requests
+    assert lookup.path == "/v1/checkout/sessions/cs_1%2F..%2F..%2Fcustomers"
+    assert cancel.path == "/v1/subscriptions/sub_1%3Fexpand%3Dcustomer"
+
+
+@pytest.mark.asyncio
+async def test_slow_stripe_does_not_block_the_event_loop(
+    stripe: FakeStripe,
+    client: StripeHttpClient,
+) -> None:
+    stripe.delay_s = 0.2
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    started = time.monotonic()
+    await asyncio.gather(
+        *(create_gateway(client).cancel_subscription(f"sub_{i}") for i in range(4)),
+    )
+    elapsed_s = time.monotonic() - started
+    ticker.cancel()
+
+    # Four calls through a pool of two take two rounds of the delay.
+    assert elapsed_s >= 0.4
+    assert ticks >= 20
+
+
+@pytest.mark.asyncio
+async def test_timeouts_surface_as_stripe_errors(stripe: FakeStripe) -> None:
+    stripe.delay_s = 0.5
+    client = StripeHttpClient(
+        StripeClientConfig(api_base=stripe.base_url, timeout_s=0.1, pool_size=1),
+    )
+
+    with pytest.raises(StripeApiError) as error:
+        await create_gateway(client).cancel_subscription("sub_1")
+    client.close()
+
+    assert error.value.status is None
@@ -0,0 +1,523 @@
+"""
+Load test of the core API flows: sign-up, login, refresh, `/account/me`,
+atlas search, notifications and payments. Boots the app with `make_app`
+against the Postgres of the current APP_ENV and drives it in process
+through its ASGI interface, so the numbers cover the app and the
+database but no network or server. `users` verified accounts and the
+atlas dump are seeded first; seeding is idempotent.
+
+Each flow runs on its own for `requests` requests spread over
+`concurrency` virtual users, after a warm-up. p50/p95/p99 latency and
+throughput are reported per flow and compared with a stored baseline;
+the run fails when a percentile or the throughput regressed by more
+than `tolerance`. Compare runs with the same arguments on the same
+machine; `--save-baseline` records the current run.
+
+Leave the notification REDIS_URL unset: the in-process notification bus
+stands in for Redis, and tasks only reach the outbox table, so no broker
+is needed.
+Run with `python -m tests.app.performance.benchmark_api_flows [--help]`.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import string
+import sys
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import FastAPI
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.domain.enums.user_role import UserRole
+from app.domain.ports.password_hasher import PasswordHasher
+from app.domain.value_objects.raw_password.raw_password import RawPassword
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.atlas.handlers.init_cities import InitCitiesHandler
+from app.infrastructure.atlas.handlers.init_countries import InitCountriesHandler
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.run import make_app
+
+API = "/api/v1"
+PASSWORD = "LoadTest-Passw0rd!"
+EMAIL_DOMAIN = "loadtest.example.com"
+DEFAULT_BASELINE = Path(__file__).with_name("baselines") / "api_flows.json"
+# Settings that change the numbers; baselines only compare like for like.
+COMPARED_SETTINGS = ("users", "concurrency", "requests")
+
+
+@dataclass(frozen=True, slots=True)
+class Response:
+    status: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class AsgiClient:
+    """Sends requests straight to the ASGI app, with no server in between."""
+
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: Mapping[str, Any] | None = None,
+        json_body: Any = None,
+        token: str | None = None,
+    ) -> Response:
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        headers = [(b"content-type", b"application/json")]
+        if token is not None:
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(query or {}).encode(),
+            "root_path": "",
+            "headers": headers,
+            "server": ("loadtest", 80),
+            "client": ("127.0.0.1", 50000),
+        }
+        status = 500
+        chunks: list[bytes] = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        return Response(status=status, body=b"".join(chunks))
+
+
+@dataclass(slots=True)
+class VirtualUser:
+    email: str
+    access_token: str = ""
+    refresh_token: str = ""
+
+
+class FlowError(Exception):
+    pass
+
+
+def expect(response: Response, status: int = 200) -> Response:
+    if response.status != status:
+        raise FlowError(f"{response.status}: {response.body[:200]!r}")
+    return response
+
+
+def seeded_email(index: int) -> str:
+    return f"user{index}@{EMAIL_DOMAIN}"
+
+
+async def seed(app: FastAPI, users: int) -> None:
+    """Loads the atlas dump if it is missing and upserts the seeded users."""
+    map_tables()
+    async with app.state.dishka_container() as container:
+        session = await container.get(MainAsyncSession)
+        countries = mapping_registry.metadata.tables["countries"]
+        if not await session.scalar(select(func.count()).select_from(countries)):
+            print("seeding countries...", file=sys.stderr)
+            await (await container.get(InitCountriesHandler)).execute()
+            try:
+                await (await container.get(InitCitiesHandler)).execute()
+            except FileNotFoundError as e:
+                print(f"  no cities: {e}", file=sys.stderr)
+
+        # Hashed once: bcrypt would dominate seeding otherwise.
+        hasher = await container.get(PasswordHasher)
+        password = hasher.hash(RawPassword(PASSWORD)).decode()
+        country_id = await session.scalar(select(countries.c.id).limit(1))
+        users_table = mapping_registry.metadata.tables["users"]
+        rows = [
+            {
+                "email": seeded_email(index),
+                "first_name": "Load",
+                "last_name": f"User{index}",
+                "role": UserRole.USER,
+                "is_active": True,
+                "is_blocked": False,
+                "is_verified": True,
+                "retry_count": 0,
+                "password": password,
+                "language": "en",
+                "country_id": country_id,
+            }
+            for index in range(users)
+        ]
+        for start in range(0, len(rows), 1000):
+            await session.execute(
+                insert(users_table)
+                .values(rows[start : start + 1000])
+                .on_conflict_do_nothing(index_elements=["email"]),
+            )
+        await session.commit()
+
+
+async def log_in(client: AsgiClient, user: VirtualUser) -> None:
+    response = await client.request(
+        "POST",
+        f"{API}/account/login",
+        json_body={"email": user.email, "password": PASSWORD},
+    )
+    tokens = expect(response).json()
+    user.access_token = tokens["access_token"]
+    user.refresh_token = tokens["refresh_token"]
+
+
+Flow = Callable[[AsgiClient, VirtualUser, random.Random], Awaitable[None]]
+
+
+async def sign_up_flow(
+    client: AsgiClient,
+    _user: VirtualUser,
+    rng: random.Random,
+) -> None:
+    # Unique across runs, so repeated runs against one database never collide.
+    suffix = "".join(rng.choices(string.ascii_lowercase, k=12))
+    expect(
+        await client.request(
+            "POST",
+            f"{API}/account/signup",
+            json_body={
+                "email": f"signup-{time.time_ns()}-{suffix}@{EMAIL_DOMAIN}",
+                "first_name": "Load",
+                "last_name": "Signup",
+                "password": PASSWORD,
+            },
+        ),
+        status=201,
+    )
+
+
+async def log_in_flow(
+    client: AsgiClient,
+    user: VirtualUser,
+    _rng: random.Random,
+) -> None:
+    await log_in(client, user)
+
+
+async def refresh_flow(
+    client: AsgiClient,
+    user: VirtualUser,
+    _rng: random.Random,
+) -> None:
+    response = await client.request(
+        "POST",
+        f"{API}/account/refresh-token",
+        json_body={"refresh_token": user.refresh_token},
+    )
+    tokens = expect(response).json()["tokens"]
+    user.access_token = tokens["access_token"]
+    user.refresh_token = tokens["refresh_token"]
+
+
+async def me_flow(client: AsgiClient, user: VirtualUser, _rng: random.Random) -> None:
+    expect(
+        await client.request("GET", f"{API}/account/me", token=user.access_token),
+    )
+
+
+async def atlas_search_flow(
+    client: AsgiClient,
+    user: VirtualUser,
+    rng: random.Random,
+) -> None:
+    expect(
+        await client.request(
+            "GET",
+            f"{API}/atlas/countries/search",
+            query={"name": rng.choice(string.ascii_uppercase)},
+            token=user.access_token,
+        ),
+    )
+
+
+async def notifications_flow(
+    client: AsgiClient,
+    user: VirtualUser,
+    _rng: random.Random,
+) -> None:
+    expect(
+        await client.request(
+            "GET",
+            f"{API}/notifications/",
+            query={"page": 1, "per_page": 10},
+            token=user.access_token,
+        ),
+    )
+
+
+async def payments_flow(
+    client: AsgiClient,
+    user: VirtualUser,
+    _rng: random.Random,
+) -> None:
+    expect(
+        await client.request(
+            "GET",
+            f"{API}/payments/user",
+            query={"page": 1, "per_page": 10},
+            token=user.access_token,
+        ),
+    )
+
+
+FLOWS: dict[str, Flow] = {
+    "signup": sign_up_flow,
+    "login": log_in_flow,
+    "refresh": refresh_flow,
+    "me": me_flow,
+    "atlas_search": atlas_search_flow,
+    "notifications": notifications_flow,
+    "payments": payments_flow,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FlowResult:
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rps: float
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not ordered:
+        return 0.0
+    rank = max(1, round(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def run_flow(
+    client: AsgiClient,
+    flow: Flow,
+    users: Sequence[VirtualUser],
+    *,
+    requests: int,
+    concurrency: int,
+    seed_: int,
+) -> FlowResult:
+    latencies: list[float] = []
+    errors: list[str] = []
+    remaining = requests
+
+    async def worker(user: VirtualUser, rng: random.Random) -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await flow(client, user, rng)
+            except FlowError as e:
+                errors.append(str(e))
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(users[index % len(users)], random.Random(seed_ + index))
+            for index in range(concurrency)
+        ),
+    )
+    elapsed = time.perf_counter() - start
+    if errors:
+        print(f"  first error: {errors[0]}", file=sys.stderr)
+    latencies.sort()
+    return FlowResult(
+        requests=len(latencies),
+        errors=len(errors),
+        p50_ms=percentile(latencies, 50) * 1000,
+        p95_ms=percentile(latencies, 95) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        rps=len(latencies) / elapsed,
+    )
+
+
+def regressions(
+    results: Mapping[str, FlowResult],
+    baseline: Mapping[str, Mapping[str, float]],
+    tolerance: float,
+) -> list[str]:
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if getattr(result, metric) > base[metric] * (1 + tolerance):
+                found.append(
+                    f"{name} {metric} {getattr(result, metric):.1f} "
+                    f"> {base[metric]:.1f}",
+                )
+        if result.rps < base["rps"] * (1 - tolerance):
+            found.append(f"{name} rps {result.rps:.1f} < {base['rps']:.1f}")
+        if result.errors > base.get("errors", 0):
+            found.append(f"{name} errors {result.errors}")
+    return found
+
+
+def print_results(
+    results: Mapping[str, FlowResult],
+    baseline: Mapping[str, Mapping[str, float]],
+) -> None:
+    print(
+        f"{'flow':14} {'ok':>6} {'err':>4} {'p50ms':>8} {'p95ms':>8} "
+        f"{'p99ms':>8} {'rps':>8} {'p95 vs base':>12}",
+    )
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = (
+            f"{(result.p95_ms / base['p95_ms'] - 1) * 100:+.0f}%"
+            if base and base["p95_ms"]
+            else "-"
+        )
+        print(
+            f"{name:14} {result.requests:6} {result.errors:4} "
+            f"{result.p50_ms:8.1f} {result.p95_ms:8.1f} {result.p99_ms:8.1f} "
+            f"{result.rps:8.1f} {delta:>12}",
+        )
+
+
+def load_baseline(
+    path: Path,
+    settings: Mapping[str, Any],
+) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        print(f"no baseline at {path}", file=sys.stderr)
+        return {}
+    stored = json.loads(path.read_text())
+    differing = [
+        key
+        for key in COMPARED_SETTINGS
+        if stored["settings"].get(key) != settings[key]
+    ]
+    if differing:
+        print(
+            f"baseline was recorded with other {', '.join(differing)}; "
+            "not comparing",
+            file=sys.stderr,
+        )
+        return {}
+    flows: dict[str, dict[str, float]] = stored["flows"]
+    return flows
+
+
+async def main(args: argparse.Namespace) -> int:
+    app = make_app()
+    # Per-request logs would be most of what is measured.
+    logging.getLogger().setLevel(logging.WARNING)
+    client = AsgiClient(app)
+    settings = {key: getattr(args, key) for key in COMPARED_SETTINGS}
+
+    async with app.router.lifespan_context(app):
+        await seed(app, args.users)
+        users = [VirtualUser(seeded_email(index)) for index in range(args.users)]
+        print(f"logging in {args.concurrency} virtual users...", file=sys.stderr)
+        for user in users[: args.concurrency]:
+            await log_in(client, user)
+        active = users[: args.concurrency]
+
+        results: dict[str, FlowResult] = {}
+        for name in args.flows:
+            flow = FLOWS[name]
+            for requests in (args.warmup, args.requests):
+                result = await run_flow(
+                    client,
+                    flow,
+                    active,
+                    requests=requests,
+                    concurrency=args.concurrency,
+                    seed_=args.seed,
+                )
+            results[name] = result
+
+    baseline = load_baseline(args.baseline, settings)
+    print_results(results, baseline)
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "settings": settings,
+                    "flows": {
+                        name: asdict(result) for name, result in results.items()
+                    },
+                },
+                indent=2,
+            )
+            + "\n",
+        )
+        print(f"baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    found = regressions(results, baseline, args.tolerance)
+    for regression in found:
+        print(f"REGRESSION {regression}")
+    return 1 if found else 0
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.app.performance.benchmark_api_flows",
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500, help="per flow")
+    parser.add_argument("--warmup", type=int, default=50, help="per flow")
+    parser.add_argument(
+        "--flows",
+        type=lambda value: value.split(","),
+        default=list(FLOWS),
+        help=f"comma-separated, from {','.join(FLOWS)}",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed relative regression, 0.2 is 20%%",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.flows) - set(FLOWS)
+    if unknown:
+        parser.error(f"unknown flows: {', '.join(sorted(unknown))}")
+    if not 0 < args.concurrency <= args.users:
+        parser.error("concurrency must be between 1 and --users")
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args(sys.argv[1:]))))
@@ -0,0 +1,148 @@
+"""
+Measures how many notification streams one worker process holds and what
+each costs. A bare app with the real hub and SSE encoder (no auth, no DB)
+runs in a child process; `connections` raw sockets subscribe to it, then one
+broadcast is timed until every client has received it.
+Run with `python -m tests.app.performance.benchmark_notification_stream
+[connections]`; raise `ulimit -n` above the connection count first.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+READY_MARKER = b"retry:"
+EVENT_MARKER = b"event: notification"
+
+
+def serve(port: int) -> None:
+    import uvicorn
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+
+    from app.infrastructure.notification.hub import NotificationHub
+    from app.presentation.http.controllers.notification.sse import (
+        encode_event_stream,
+    )
+
+    app = FastAPI()
+    hub = NotificationHub(queue_size=100, max_connections=1_000_000)
+
+    @app.get("/stream/{user_id}")
+    async def stream(user_id: int) -> StreamingResponse:
+        return StreamingResponse(
+            encode_event_stream(hub.subscribe(user_id), heartbeat_s=15),
+            media_type="text/event-stream",
+        )
+
+    @app.post("/broadcast/{users}")
+    async def broadcast(users: int) -> dict[str, int]:
+        delivered = sum(
+            hub.deliver(user_id, {"id": 1, "title": "Benchmark"})
+            for user_id in range(users)
+        )
+        return {"delivered": delivered, "connections": hub.connection_count}
+
+    uvicorn.run(app, port=port, log_level="warning", loop="uvloop")
+
+
+def rss_kib(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    raise RuntimeError("VmRSS not available")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def open_stream(
+    port: int,
+    user_id: int,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET /stream/{user_id} HTTP/1.1\r\nHost: bench\r\n\r\n".encode(),
+    )
+    await reader.readuntil(READY_MARKER)
+    return reader, writer
+
+
+async def post(port: int, path: str) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: 0\r\n"
+        "Connection: close\r\n\r\n".encode(),
+    )
+    await reader.read()
+    writer.close()
+
+
+async def wait_for_server(port: int) -> None:
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            return
+    raise RuntimeError("Benchmark server did not start.")
+
+
+async def main(connections: int) -> None:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", __spec__.name, "--serve", str(port)],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    try:
+        await wait_for_server(port)
+        baseline_kib = rss_kib(server.pid)
+
+        start = time.perf_counter()
+        clients = await asyncio.gather(
+            *(open_stream(port, user_id) for user_id in range(connections)),
+        )
+        connect_s = time.perf_counter() - start
+        connected_kib = rss_kib(server.pid)
+
+        start = time.perf_counter()
+        await post(port, f"/broadcast/{connections}")
+        await asyncio.gather(
+            *(reader.readuntil(EVENT_MARKER) for reader, _ in clients),
+        )
+        fan_out_s = time.perf_counter() - start
+
+        per_connection_kib = (connected_kib - baseline_kib) / connections
+        print(
+            f"connections={connections} "
+            f"connect={connect_s:.2f}s "
+            f"rss={connected_kib / 1024:.1f}MiB "
+            f"per_connection={per_connection_kib:.1f}KiB "
+            f"fan_out={fan_out_s * 1000:.1f}ms",
+        )
+        for _, writer in clients:
+            writer.close()
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            # Graceful shutdown waits for streams that never end on their own.
+            server.kill()
+            server.wait()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--serve"]:
+        serve(int(sys.argv[2]))
+    else:
+        asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,59 @@
+"""
+Measures worker boot cost of each schema startup mode against a live database.
+Run with `python -m tests.app.performance.benchmark_startup_schema [workers]`;
+`workers` concurrent boots emulate a rolling restart.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.setup.app_factory import prepare_database_schema
+from app.setup.config.database import SchemaStartupMode
+from app.setup.config.settings import load_settings
+
+
+async def boot_worker(dsn: str, mode: SchemaStartupMode) -> tuple[float, int]:
+    engine: AsyncEngine = create_async_engine(dsn, pool_size=1)
+    statements = 0
+
+    def count_statement(*_args: object) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    start = time.perf_counter()
+    try:
+        await prepare_database_schema(engine, mode)
+    except Exception as e:  # noqa: BLE001
+        print(f"  {mode}: {type(e).__name__}: {e}")
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed, statements
+
+
+async def main(workers: int) -> None:
+    settings = load_settings()
+    map_tables()
+
+    for mode in (SchemaStartupMode.CREATE_ALL, SchemaStartupMode.VERIFY):
+        results = await asyncio.gather(
+            *(boot_worker(settings.postgres.dsn, mode) for _ in range(workers)),
+        )
+        timings = [elapsed for elapsed, _ in results]
+        statements = sum(count for _, count in results)
+        print(
+            f"{mode:>10}: workers={workers} "
+            f"median={statistics.median(timings) * 1000:.1f}ms "
+            f"max={max(timings) * 1000:.1f}ms "
+            f"statements={statements}",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 16))
@@ -0,0 +1,166 @@
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from app.application.common.exceptions.idempotency import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+)
+from app.application.common.ports.idempotency_store import (
+    IdempotencyClaim,
+    IdempotencyStore,
+)
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.services.idempotency import (
+    IdempotencyService,
+    IdempotentRequest,
+    request_fingerprint,
+)
+
+Key = tuple[int, str, str]
+
+
+class FakeIdempotencyStore(IdempotencyStore):
+    def __init__(self) -> None:
+        self.claims: dict[Key, tuple[str, Mapping[str, Any] | None]] = {}
+        self.released: list[Key] = []
+
+    async def claim(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        fingerprint: str,
+    ) -> IdempotencyClaim:
+        existing = self.claims.get((user_id, scope, key))
+        if existing is None:
+            self.claims[(user_id, scope, key)] = (fingerprint, None)
+            return IdempotencyClaim(claimed=True)
+        return IdempotencyClaim(
+            claimed=False,
+            fingerprint=existing[0],
+            result=existing[1],
+        )
+
+    async def complete(
+        self,
+        *,
+        user_id: int,
+        scope: str,
+        key: str,
+        result: Mapping[str, Any],
+    ) -> None:
+        fingerprint, _ = self.claims[(user_id, scope, key)]
+        self.claims[(user_id, scope, key)] = (fingerprint, result)
+
+    async def release(self, *, user_id: int, scope: str, key: str) -> None:
+        del self.claims[(user_id, scope, key)]
+        self.released.append((user_id, scope, key))
+
+
+class FakeTransactionManager(TransactionManager):
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class CountingOperation:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("Stripe is down")
+        return {"payment_id": self.calls}
+
+
+def make_request(key: str = "k-1", amount: float = 10.0) -> IdempotentRequest:
+    return IdempotentRequest(
+        user_id=1,
+        scope="payments.transaction",
+        key=key,
+        fingerprint=request_fingerprint("payments.transaction", {"amount": amount}),
+    )
+
+
+def make_service() -> tuple[
+    IdempotencyService,
+    FakeIdempotencyStore,
+    FakeTransactionManager,
+]:
+    store = FakeIdempotencyStore()
+    tx = FakeTransactionManager()
+    return IdempotencyService(store, tx), store, tx
+
+
+@pytest.mark.asyncio
+async def test_repeat_replays_the_stored_result_without_running_again() -> None:
+    service, _, tx = make_service()
+    operation = CountingOperation()
+
+    first = await service.run(make_request(), operation)
+    second = await service.run(make_request(), operation)
+
+    assert first == second == {"payment_id": 1}
+    assert operation.calls == 1
+    assert tx.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_without_a_key_the_operation_runs_and_commits_every_time() -> None:
+    service, store, tx = make_service()
+    operation = CountingOperation()
+
+    await service.run(None, operation)
+    await service.run(None, operation)
+
+    assert operation.calls == 2
+    assert tx.commits == 2
+    assert store.claims == {}
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_another_payload_is_rejected() -> None:
+    service, _, _ = make_service()
+    await service.run(make_request(amount=10.0), CountingOperation())
+
+    with pytest.raises(IdempotencyKeyMismatchError):
+        await service.run(make_request(amount=99.0), CountingOperation())
+
+
+@pytest.mark.asyncio
+async def test_repeat_while_the_first_request_is_in_flight_conflicts() -> None:
+    service, store, _ = make_service()
+    request = make_request()
+    store.claims[(1, request.scope, request.key)] = (request.fingerprint, None)
+    operation = CountingOperation()
+
+    with pytest.raises(IdempotencyKeyInUseError):
+        await service.run(request, operation)
+    assert operation.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_operation_releases_the_key_for_a_retry() -> None:
+    service, store, tx = make_service()
+
+    with pytest.raises(RuntimeError):
+        await service.run(make_request(), CountingOperation(fail=True))
+
+    assert store.released == [(1, "payments.transaction", "k-1")]
+    assert tx.commits == 0
+    assert await service.run(make_request(), CountingOperation()) == {"payment_id": 1}
+
+
+def test_fingerprint_ignores_key_order_but_not_scope() -> None:
+    payload = {"amount": 10.0, "currency": "USD"}
+    reordered = {"currency": "USD", "amount": 10.0}
+
+    assert request_fingerprint("a", payload) == request_fingerprint("a", reordered)
+    assert request_fingerprint("a", payload) != request_fingerprint("b", payload)
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+from app.application.maintenance.ports import CleanupTarget, ExpiredRecordsPurger
+from app.application.maintenance.tasks import PurgeExpiredRecordsTask
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class ScriptedPurger(ExpiredRecordsPurger):
+    def __init__(self, batches: list[int], clock: FakeClock, batch_s: float) -> None:
+        self._batches = batches
+        self._clock = clock
+        self._batch_s = batch_s
+        self.cutoffs: list[datetime] = []
+
+    async def delete_expired_batch(
+        self,
+        target: CleanupTarget,
+        now: datetime,
+        limit: int,
+    ) -> int:
+        self.cutoffs.append(now)
+        self._clock.now += self._batch_s
+        return min(self._batches.pop(0), limit)
+
+
+@pytest.mark.asyncio
+async def test_purge_runs_until_a_short_batch() -> None:
+    clock = FakeClock()
+    purger = ScriptedPurger([100, 100, 40], clock, batch_s=0.5)
+    task = PurgeExpiredRecordsTask(purger, sleep=clock.sleep, clock=clock)
+
+    report = await task.run(
+        CleanupTarget.SESSIONS,
+        batch_size=100,
+        time_budget_s=60,
+        pause_s=0.25,
+    )
+
+    assert report.finished
+    assert (report.deleted, report.batches) == (240, 3)
+    assert report.elapsed_s == pytest.approx(2.0)
+    assert report.rows_per_second == pytest.approx(120.0)
+    assert len(set(purger.cutoffs)) == 1
+
+
+@pytest.mark.asyncio
+async def test_purge_stops_when_time_budget_is_spent() -> None:
+    clock = FakeClock()
+    purger = ScriptedPurger([100] * 10, clock, batch_s=1.0)
+    task = PurgeExpiredRecordsTask(purger, sleep=clock.sleep, clock=clock)
+
+    report = await task.run(
+        CleanupTarget.AUTH_SESSIONS,
+        batch_size=100,
+        time_budget_s=2.8,
+        pause_s=0.5,
+    )
+
+    assert not report.finished
+    assert (report.deleted, report.batches) == (200, 2)
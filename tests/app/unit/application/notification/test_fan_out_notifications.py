@@ -0,0 +1,77 @@
+from collections.abc import AsyncIterator, Sequence
+
+import pytest
+
+from app.application.notification.ports import (
+    NotificationAudience,
+    NotificationFanOutWriter,
+    NotificationTemplate,
+)
+from app.application.notification.tasks import FanOutNotificationsTask, FanOutReport
+
+TEMPLATE = NotificationTemplate(title="New plans", action="system")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingWriter(NotificationFanOutWriter):
+    def __init__(self, user_ids: list[int], clock: FakeClock) -> None:
+        self._user_ids = user_ids
+        self._clock = clock
+        self.written: list[list[int]] = []
+
+    async def stream_recipients(
+        self,
+        audience: NotificationAudience,
+        *,
+        chunk_size: int,
+    ) -> AsyncIterator[Sequence[int]]:
+        for start in range(0, len(self._user_ids), chunk_size):
+            yield self._user_ids[start : start + chunk_size]
+
+    async def write_chunk(
+        self,
+        user_ids: Sequence[int],
+        template: NotificationTemplate,
+    ) -> int:
+        self.written.append(list(user_ids))
+        self._clock.now += 0.5
+        return len(user_ids)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_writes_every_chunk_and_reports_progress() -> None:
+    clock = FakeClock()
+    writer = RecordingWriter(list(range(1, 11)), clock)
+    progress: list[FanOutReport] = []
+
+    report = await FanOutNotificationsTask(writer, clock=clock).run(
+        NotificationAudience(country_id=1),
+        TEMPLATE,
+        chunk_size=4,
+        on_progress=progress.append,
+    )
+
+    assert writer.written == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+    assert [p.written for p in progress] == [4, 8, 10]
+    assert report.written == 10 and report.chunks == 3
+    assert report.rows_per_second == pytest.approx(10 / 1.5)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_to_an_empty_audience_writes_nothing() -> None:
+    writer = RecordingWriter([], FakeClock())
+
+    report = await FanOutNotificationsTask(writer).run(
+        NotificationAudience(),
+        TEMPLATE,
+        chunk_size=4,
+    )
+
+    assert report.written == report.chunks == 0 and writer.written == []
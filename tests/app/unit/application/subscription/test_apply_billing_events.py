@@ -0,0 +1,113 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import pytest
+
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.subscription.ports import (
+    BillingEvent,
+    BillingEventInbox,
+    BillingStateWriter,
+)
+from app.application.subscription.tasks import ApplyBillingEventsTask
+
+
+def make_event(id_: int) -> BillingEvent:
+    return BillingEvent(
+        id=id_,
+        type="customer.subscription.updated",
+        customer_id="cus_1",
+        created=1700000000 + id_,
+        object={"id": "sub_1", "status": "active"},
+    )
+
+
+class FakeInbox(BillingEventInbox):
+    def __init__(self, pending: int) -> None:
+        self.pending = [make_event(id_) for id_ in range(1, pending + 1)]
+        self.processed: list[int] = []
+        self.failed: list[tuple[int, str]] = []
+
+    async def append(self, event: Mapping[str, Any]) -> bool:
+        raise NotImplementedError
+
+    async def claim_batch(self, limit: int) -> Sequence[BillingEvent]:
+        return self.pending[:limit]
+
+    async def mark_processed(self, ids: Sequence[int]) -> None:
+        self.processed.extend(ids)
+        self.pending = [event for event in self.pending if event.id not in ids]
+
+    async def mark_failed(self, failures: Sequence[tuple[BillingEvent, str]]) -> None:
+        failed_ids = {event.id for event, _ in failures}
+        self.failed.extend((event.id, error) for event, error in failures)
+        self.pending = [event for event in self.pending if event.id not in failed_ids]
+
+
+class RecordingWriter(BillingStateWriter):
+    def __init__(self, failing: Sequence[int] = ()) -> None:
+        self.batches: list[list[int]] = []
+        self.failing = failing
+
+    async def apply(
+        self,
+        events: Sequence[BillingEvent],
+    ) -> Sequence[tuple[BillingEvent, str]]:
+        self.batches.append([event.id for event in events])
+        return [(event, "rejected") for event in events if event.id in self.failing]
+
+
+class FakeTransactionManager(TransactionManager):
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_drains_the_inbox_one_committed_batch_at_a_time() -> None:
+    inbox, writer, tx = FakeInbox(5), RecordingWriter(), FakeTransactionManager()
+
+    report = await ApplyBillingEventsTask(inbox, writer, tx).run(
+        batch_size=2,
+        time_budget_s=60,
+    )
+
+    assert writer.batches == [[1, 2], [3, 4], [5]]
+    assert inbox.processed == [1, 2, 3, 4, 5]
+    assert tx.commits == 3
+    assert (report.applied, report.batches, report.finished) == (5, 3, True)
+
+
+@pytest.mark.asyncio
+async def test_stops_when_the_time_budget_is_spent() -> None:
+    ticks = iter(range(100))
+    inbox, writer, tx = FakeInbox(5), RecordingWriter(), FakeTransactionManager()
+
+    report = await ApplyBillingEventsTask(
+        inbox,
+        writer,
+        tx,
+        clock=lambda: float(next(ticks)),
+    ).run(batch_size=2, time_budget_s=2)
+
+    assert report.batches == 1
+    assert not report.finished
+    assert len(inbox.pending) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_events_are_committed_as_failed_with_the_batch() -> None:
+    inbox, tx = FakeInbox(3), FakeTransactionManager()
+
+    report = await ApplyBillingEventsTask(
+        inbox,
+        RecordingWriter(failing=[2]),
+        tx,
+    ).run(batch_size=3, time_budget_s=60)
+
+    assert inbox.processed == [1, 3]
+    assert inbox.failed == [(2, "rejected")]
+    assert tx.commits == 1
+    assert (report.applied, report.failed) == (2, 1)
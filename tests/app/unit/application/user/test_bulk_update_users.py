@@ -0,0 +1,242 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+import pytest
+
+from app.application.commands.user.bulk_update_users import (
+    BulkUpdateUsersInteractor,
+    BulkUpdateUsersRequest,
+    BulkUserAction,
+    BulkUserOutcome,
+)
+from app.application.common.exceptions.authorization import AuthorizationError
+from app.application.common.exceptions.bulk import BulkSelectionError
+from app.application.common.ports.access_revoker import AccessRevoker
+from app.application.common.ports.transaction_manager import TransactionManager
+from app.application.common.ports.user_command_gateway import (
+    UserCommandGateway,
+    UserSelection,
+)
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.services.user import UserService
+from app.domain.value_objects.created_at import CreatedAt
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.first_name import FirstName
+from app.domain.value_objects.language import Language
+from app.domain.value_objects.last_name import LastName
+from app.domain.value_objects.retry_count import RetryCount
+from app.domain.value_objects.updated_at import UpdatedAt
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.user_status import UserActive, UserBlocked, UserVerified
+
+
+def make_user(id_: int, role: UserRole = UserRole.USER, is_active: bool = True) -> User:
+    now = datetime(2026, 1, 1)
+    return User(
+        id_=UserId(id_),
+        email=Email(f"user{id_}@example.com"),
+        first_name=FirstName("First"),
+        last_name=LastName("Last"),
+        role=role,
+        is_active=UserActive(is_active),
+        is_blocked=UserBlocked(False),
+        is_verified=UserVerified(True),
+        retry_count=RetryCount(0),
+        password=UserPasswordHash(b"hash"),
+        created_at=CreatedAt(now),
+        updated_at=UpdatedAt(now),
+        last_login=None,
+        profile_picture=None,
+        phone_number=None,
+        language=Language("en"),
+        address=None,
+        postal_code=None,
+        country_id=None,
+        city_id=None,
+        subscription=None,
+    )
+
+
+class FakeCurrentUserService:
+    def __init__(self, user: User) -> None:
+        self._user = user
+
+    async def get_current_user(self) -> User:
+        return self._user
+
+
+class FakeUserGateway(UserCommandGateway):
+    def __init__(self, users: list[User]) -> None:
+        self.users = users
+        self.reads: list[tuple[UserSelection, int, bool]] = []
+        self.updates: list[tuple[list[int], bool | None, UserRole | None]] = []
+
+    async def add(self, user: User) -> None:
+        raise NotImplementedError
+
+    async def update(self, user: User) -> None:
+        raise NotImplementedError
+
+    async def read_by_id(self, user_id: UserId) -> User | None:
+        raise NotImplementedError
+
+    async def read_by_email(self, email: Email, for_update: bool = False) -> None:
+        raise NotImplementedError
+
+    async def read_many(
+        self,
+        selection: UserSelection,
+        *,
+        limit: int,
+        for_update: bool = False,
+    ) -> list[User]:
+        self.reads.append((selection, limit, for_update))
+        users = self.users
+        if selection.emails is not None:
+            users = [user for user in users if user.email in selection.emails]
+        if selection.role is not None:
+            users = [user for user in users if user.role == selection.role]
+        return users[:limit]
+
+    async def update_many(
+        self,
+        user_ids: Sequence[UserId],
+        *,
+        is_active: bool | None = None,
+        role: UserRole | None = None,
+    ) -> None:
+        self.updates.append(([user_id.value for user_id in user_ids], is_active, role))
+
+
+class RecordingRevoker(AccessRevoker):
+    def __init__(self) -> None:
+        self.revoked: list[list[int]] = []
+
+    async def remove_all_user_access(self, user_id: UserId) -> None:
+        raise NotImplementedError
+
+    async def remove_all_access_for_users(self, user_ids: Sequence[UserId]) -> None:
+        self.revoked.append([user_id.value for user_id in user_ids])
+
+
+class FakeTransactionManager(TransactionManager):
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def make_interactor(
+    subject: User,
+    gateway: FakeUserGateway,
+) -> tuple[BulkUpdateUsersInteractor, FakeTransactionManager, RecordingRevoker]:
+    tx, revoker = FakeTransactionManager(), RecordingRevoker()
+    interactor = BulkUpdateUsersInteractor(
+        FakeCurrentUserService(subject),  # type: ignore[arg-type]
+        gateway,
+        UserService(None, None),  # type: ignore[arg-type]
+        tx,
+        revoker,
+    )
+    return interactor, tx, revoker
+
+
+@pytest.mark.asyncio
+async def test_deactivation_is_one_update_and_one_revocation() -> None:
+    admin = make_user(1, UserRole.ADMIN)
+    gateway = FakeUserGateway(
+        [
+            make_user(2),
+            make_user(3, is_active=False),
+            make_user(4, UserRole.ADMIN),
+            make_user(5, UserRole.MODERATOR),
+        ]
+    )
+    interactor, tx, revoker = make_interactor(admin, gateway)
+
+    response = await interactor.execute(
+        BulkUpdateUsersRequest(
+            action=BulkUserAction.DEACTIVATE,
+            emails=[f"user{id_}@example.com" for id_ in (2, 3, 4, 5, 6)],
+        )
+    )
+
+    assert [(r["email"], r["outcome"]) for r in response["results"]] == [
+        ("user2@example.com", BulkUserOutcome.UPDATED),
+        ("user3@example.com", BulkUserOutcome.UNCHANGED),
+        ("user4@example.com", BulkUserOutcome.FORBIDDEN),
+        ("user5@example.com", BulkUserOutcome.UPDATED),
+        ("user6@example.com", BulkUserOutcome.NOT_FOUND),
+    ]
+    assert response["has_more"] is False
+    assert gateway.reads[0][2] is True
+    assert gateway.updates == [([2, 5], False, None)]
+    assert tx.commits == 1
+    assert revoker.revoked == [[2, 5]]
+
+
+@pytest.mark.asyncio
+async def test_activation_by_filter_does_not_revoke_sessions() -> None:
+    admin = make_user(1, UserRole.ADMIN)
+    gateway = FakeUserGateway(
+        [make_user(2, UserRole.MODERATOR, is_active=False), make_user(3)]
+    )
+    interactor, _, revoker = make_interactor(admin, gateway)
+
+    response = await interactor.execute(
+        BulkUpdateUsersRequest(
+            action=BulkUserAction.ACTIVATE,
+            role=UserRole.MODERATOR,
+        )
+    )
+
+    assert [r["outcome"] for r in response["results"]] == [BulkUserOutcome.UPDATED]
+    assert gateway.updates == [([2], True, None)]
+    assert revoker.revoked == []
+
+
+@pytest.mark.asyncio
+async def test_nothing_to_update_still_commits_without_writes() -> None:
+    admin = make_user(1, UserRole.ADMIN)
+    gateway = FakeUserGateway([make_user(2)])
+    interactor, tx, revoker = make_interactor(admin, gateway)
+
+    response = await interactor.execute(
+        BulkUpdateUsersRequest(action=BulkUserAction.ACTIVATE, role=UserRole.USER)
+    )
+
+    assert response["results"] == [
+        {"email": "user2@example.com", "outcome": BulkUserOutcome.UNCHANGED}
+    ]
+    assert gateway.updates == []
+    assert revoker.revoked == []
+
+
+@pytest.mark.asyncio
+async def test_a_selection_is_required() -> None:
+    interactor, _, _ = make_interactor(
+        make_user(1, UserRole.ADMIN),
+        FakeUserGateway([]),
+    )
+
+    with pytest.raises(BulkSelectionError):
+        await interactor.execute(BulkUpdateUsersRequest(action=BulkUserAction.ACTIVATE))
+
+
+@pytest.mark.asyncio
+async def test_moderators_cannot_change_admin_rights() -> None:
+    interactor, _, _ = make_interactor(
+        make_user(1, UserRole.MODERATOR),
+        FakeUserGateway([make_user(2)]),
+    )
+
+    with pytest.raises(AuthorizationError):
+        await interactor.execute(
+            BulkUpdateUsersRequest(
+                action=BulkUserAction.GRANT_ADMIN,
+                emails=["user2@example.com"],
+            )
+        )
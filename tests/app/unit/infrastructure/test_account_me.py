@@ -0,0 +1,206 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.entities.user import User
+from app.domain.enums.user_role import UserRole
+from app.domain.value_objects.city_id import CityId
+from app.domain.value_objects.country_id import CountryId
+from app.domain.value_objects.created_at import CreatedAt
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.first_name import FirstName
+from app.domain.value_objects.language import Language
+from app.domain.value_objects.last_name import LastName
+from app.domain.value_objects.retry_count import RetryCount
+from app.domain.value_objects.updated_at import UpdatedAt
+from app.domain.value_objects.user_id import UserId
+from app.domain.value_objects.user_password_hash import UserPasswordHash
+from app.domain.value_objects.user_status import UserActive, UserBlocked, UserVerified
+from app.infrastructure.atlas.name_cache import AtlasNameCache, CountryName
+from app.infrastructure.auth.handlers.account_me import (
+    UpdateMeHandler,
+    UpdateMeRequest,
+    build_me_query,
+)
+from app.infrastructure.persistence_sqla.mappings.all import map_tables
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def compile_sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_user() -> User:
+    now = datetime(2026, 1, 1)
+    return User(
+        id_=UserId(7),
+        email=Email("user7@example.com"),
+        first_name=FirstName("First"),
+        last_name=LastName("Last"),
+        role=UserRole.USER,
+        is_active=UserActive(True),
+        is_blocked=UserBlocked(False),
+        is_verified=UserVerified(True),
+        retry_count=RetryCount(0),
+        password=UserPasswordHash(b"hash"),
+        created_at=CreatedAt(now),
+        updated_at=UpdatedAt(now),
+        last_login=None,
+        profile_picture=None,
+        phone_number=None,
+        language=Language("en"),
+        address=None,
+        postal_code=None,
+        country_id=CountryId(1),
+        city_id=CityId(10),
+        subscription=None,
+    )
+
+
+class FakeCurrentUserService:
+    def __init__(self, user: User) -> None:
+        self.user = user
+
+    async def get_current_user(self) -> User:
+        return self.user
+
+
+class FakeUserGateway:
+    def __init__(self) -> None:
+        self.updated: list[User] = []
+
+    async def update(self, user: User) -> None:
+        self.updated.append(user)
+
+
+class FakeTransactionManager:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class FakeResult:
+    def __init__(self, row: Mapping[str, Any]) -> None:
+        self._row = row
+
+    def mappings(self) -> "FakeResult":
+        return self
+
+    def one(self) -> Mapping[str, Any]:
+        return self._row
+
+
+class FakeSession:
+    def __init__(self, row: Mapping[str, Any]) -> None:
+        self.row = row
+        self.statements: list[str] = []
+
+    async def execute(self, stmt) -> FakeResult:
+        self.statements.append(compile_sql(stmt))
+        return FakeResult(self.row)
+
+
+def make_handler(
+    session: FakeSession,
+    cache: AtlasNameCache,
+) -> tuple[UpdateMeHandler, FakeTransactionManager]:
+    tx = FakeTransactionManager()
+    handler = UpdateMeHandler(
+        current_user_service=FakeCurrentUserService(make_user()),  # type: ignore
+        user_command_gateway=FakeUserGateway(),  # type: ignore
+        flusher=None,  # type: ignore
+        transaction_manager=tx,  # type: ignore
+        country_query_gateway=None,  # type: ignore
+        city_query_gateway=None,  # type: ignore
+        session=session,  # type: ignore
+        name_cache=cache,
+    )
+    return handler, tx
+
+
+def test_profile_and_names_are_read_in_one_statement() -> None:
+    map_tables()
+    tables = mapping_registry.metadata.tables
+
+    sql = compile_sql(
+        build_me_query(tables["users"], tables["countries"], tables["cities"], 7)
+    )
+
+    assert sql.count("SELECT") == 1
+    assert "LEFT OUTER JOIN countries ON countries.id = users.country_id" in sql
+    assert "LEFT OUTER JOIN cities ON cities.id = users.city_id" in sql
+    assert "users.password" not in sql
+    assert sql.endswith("WHERE users.id = %(id_1)s")
+
+
+@pytest.mark.asyncio
+async def test_update_response_is_built_without_rereading_the_user() -> None:
+    session = FakeSession({"country_name": "France", "country_code": "FR"})
+    cache = AtlasNameCache(max_entries=10, ttl_s=60)
+    cache.put_city(10, "Paris")
+    handler, tx = make_handler(session, cache)
+
+    response = await handler.execute(UpdateMeRequest(first_name="Renamed"))
+
+    assert tx.commits == 1
+    assert response["first_name"] == "Renamed"
+    assert (response["country_name"], response["country_code"]) == ("France", "FR")
+    assert response["city_name"] == "Paris"
+    # Only the missing country name was looked up, and then kept.
+    [sql] = session.statements
+    assert "users" not in sql and "cities" not in sql
+    assert cache.country(1) == CountryName(name="France", iso2="FR")
+
+
+@pytest.mark.asyncio
+async def test_cached_names_need_no_query() -> None:
+    session = FakeSession({})
+    cache = AtlasNameCache(max_entries=10, ttl_s=60)
+    cache.put_country(1, "France", "FR")
+    cache.put_city(10, "Paris")
+    handler, _ = make_handler(session, cache)
+
+    response = await handler.execute(UpdateMeRequest(last_name="Renamed"))
+
+    assert session.statements == []
+    assert response["city_name"] == "Paris"
+
+
+def test_names_expire_and_are_cleared_on_invalidation() -> None:
+    clock = FakeClock()
+    cache = AtlasNameCache(max_entries=10, ttl_s=60, clock=clock)
+    cache.put_country(1, "France", "FR")
+    cache.put_city(10, "Paris")
+
+    clock.now = 61
+    assert cache.country(1) is None
+
+    cache.put_country(1, "France", "FR")
+    cache.invalidate()
+    assert cache.country(1) is None
+    assert cache.city(10) is None
+
+
+def test_least_recently_used_names_are_evicted() -> None:
+    cache = AtlasNameCache(max_entries=2, ttl_s=60)
+    cache.put_city(1, "Paris")
+    cache.put_city(2, "Lyon")
+    assert cache.city(1) == "Paris"
+
+    cache.put_city(3, "Nice")
+
+    assert cache.city(2) is None
+    assert (cache.city(1), cache.city(3)) == ("Paris", "Nice")
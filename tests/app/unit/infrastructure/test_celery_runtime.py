@@ -0,0 +1,55 @@
+import asyncio
+from collections.abc import Iterator
+from itertools import count
+from typing import NewType
+
+import pytest
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+
+from app.infrastructure.celery.runtime import WorkerRuntime
+
+EngineId = NewType("EngineId", int)
+RequestId = NewType("RequestId", int)
+
+
+class FakeWorkerProvider(Provider):
+    def __init__(self) -> None:
+        super().__init__()
+        self._engines = count()
+        self._requests = count()
+
+    @provide(scope=Scope.APP)
+    def engine_id(self) -> EngineId:
+        return EngineId(next(self._engines))
+
+    @provide(scope=Scope.REQUEST)
+    def request_id(self) -> RequestId:
+        return RequestId(next(self._requests))
+
+
+@pytest.fixture
+def runtime() -> Iterator[WorkerRuntime]:
+    sut = WorkerRuntime(lambda: make_async_container(FakeWorkerProvider()))
+    try:
+        yield sut
+    finally:
+        sut.close()
+
+
+async def resolve_ids(
+    container: AsyncContainer,
+) -> tuple[EngineId, RequestId, asyncio.AbstractEventLoop]:
+    return (
+        await container.get(EngineId),
+        await container.get(RequestId),
+        asyncio.get_running_loop(),
+    )
+
+
+def test_tasks_share_loop_and_app_scope(runtime: WorkerRuntime) -> None:
+    engine1, request1, loop1 = runtime.run(resolve_ids)
+    engine2, request2, loop2 = runtime.run(resolve_ids)
+
+    assert engine1 == engine2
+    assert loop1 is loop2
+    assert request1 != request2
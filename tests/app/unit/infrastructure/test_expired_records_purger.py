@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.maintenance.repositories_sqla import (
+    build_delete_expired_batch,
+)
+
+metadata = MetaData()
+tokens = Table(
+    "tokens",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("expires_at", DateTime, nullable=False),
+)
+
+
+def test_delete_batch_is_bounded_by_primary_key() -> None:
+    now = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+
+    stmt = build_delete_expired_batch(tokens.c.id, tokens.c.expires_at, now, 500)
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+
+    assert sql.startswith("DELETE FROM tokens WHERE tokens.id IN (SELECT tokens.id")
+    assert "LIMIT %(param_1)s FOR UPDATE SKIP LOCKED" in sql
+    assert compiled.params["param_1"] == 500
+    # Naive columns hold UTC, so the cutoff is converted rather than cast.
+    assert compiled.params["expires_at_1"] == datetime(2024, 1, 1, 10)
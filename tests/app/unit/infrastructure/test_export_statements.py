@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.common.exceptions.query import FilteringError
+from app.application.common.query_params.user import UserListFilters
+from app.application.queries.export_payments import ExportPaymentsRequest
+from app.infrastructure.adapters.payment_repository_sqla import build_payment_export
+from app.infrastructure.adapters.user_reader_sqla import build_user_export
+from app.infrastructure.persistence_sqla.mappings.payment import map_payments_table
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def compile_sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_user_export_streams_the_filtered_listing_in_id_order() -> None:
+    map_users_table()
+
+    stmt = build_user_export(
+        mapping_registry.metadata.tables["users"],
+        UserListFilters(is_active=False),
+    )
+    sql = compile_sql(stmt)
+
+    assert stmt.get_execution_options()["yield_per"] > 0
+    assert "WHERE users.is_active = false" in sql
+    assert sql.endswith("ORDER BY users.id")
+    assert "password" not in sql
+
+
+def test_payment_export_is_bounded_on_the_partition_key() -> None:
+    map_payments_table()
+
+    stmt = build_payment_export(
+        mapping_registry.metadata.tables["payments"],
+        created_from=datetime(2026, 1, 1),
+        created_to=datetime(2026, 2, 1),
+        status=None,
+    )
+    sql = compile_sql(stmt)
+
+    assert stmt.get_execution_options()["yield_per"] > 0
+    assert (
+        "WHERE payments.created_at >= %(created_at_1)s "
+        "AND payments.created_at < %(created_at_2)s "
+        "ORDER BY payments.created_at, payments.id"
+    ) in sql
+    assert "data_json" not in sql
+
+
+def test_payment_export_bounds_are_naive_utc() -> None:
+    map_payments_table()
+    request = ExportPaymentsRequest(
+        created_from=datetime(2026, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+        created_to=datetime(2026, 2, 1),
+    )
+
+    stmt = build_payment_export(
+        mapping_registry.metadata.tables["payments"],
+        created_from=request.created_from,
+        created_to=request.created_to,
+        status=None,
+    )
+    params = stmt.compile(dialect=postgresql.dialect()).params
+
+    # `payments.created_at` is a naive timestamp holding UTC.
+    assert params["created_at_1"] == datetime(2026, 1, 1)
+    assert params["created_at_2"] == datetime(2026, 2, 1)
+
+
+def test_payment_export_range_is_checked_before_streaming() -> None:
+    with pytest.raises(FilteringError):
+        ExportPaymentsRequest(
+            created_from=datetime(2026, 1, 1, 1),
+            created_to=datetime(2026, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+        )
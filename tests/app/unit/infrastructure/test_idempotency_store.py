@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.adapters.idempotency_store_sqla import build_claim
+from app.infrastructure.idempotency.cache import IdempotencyCache
+from app.infrastructure.persistence_sqla.mappings.idempotency_key import (
+    map_idempotency_keys_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_claim_is_a_single_insert_or_read() -> None:
+    map_idempotency_keys_table()
+    table = mapping_registry.metadata.tables["idempotency_keys"]
+
+    sql = " ".join(
+        str(
+            build_claim(
+                table,
+                user_id=1,
+                scope="payments.transaction",
+                key="k-1",
+                fingerprint="f" * 64,
+                now=datetime(2026, 10, 19, tzinfo=timezone.utc),
+            ).compile(dialect=postgresql.dialect())
+        ).split()
+    )
+
+    assert sql.startswith("WITH inserted AS (INSERT INTO idempotency_keys")
+    assert "ON CONFLICT (user_id, scope, key) DO NOTHING RETURNING" in sql
+    assert "UNION ALL" in sql
+    assert "NOT (EXISTS (SELECT 1 FROM inserted))" in sql
+
+
+def test_cache_expires_entries_and_evicts_least_recently_used() -> None:
+    clock = FakeClock()
+    cache = IdempotencyCache(max_entries=2, clock=clock)
+    cache.put((1, "s", "a"), fingerprint="fa", result={"id": 1}, ttl_s=10)
+    cache.put((1, "s", "b"), fingerprint="fb", result={"id": 2}, ttl_s=100)
+
+    assert cache.get((1, "s", "a")) is not None
+    cache.put((1, "s", "c"), fingerprint="fc", result={"id": 3}, ttl_s=100)
+    assert cache.get((1, "s", "b")) is None
+
+    clock.now = 10
+    assert cache.get((1, "s", "a")) is None
+    assert cache.get((1, "s", "c")) is not None
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.persistence_sqla.json_keys import json_text
+
+
+def test_json_text_inlines_the_key() -> None:
+    table = Table("t", MetaData(), Column("data_json", postgresql.JSONB))
+
+    sql = str(
+        (json_text(table.c.data_json, "checkout_session_id") == "cs_1").compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert sql == "(t.data_json ->> 'checkout_session_id') = %(param_1)s"
+
+
+@pytest.mark.parametrize("key", ["", "a'b", "a b", "1st"])
+def test_json_text_rejects_keys_that_are_not_identifiers(key: str) -> None:
+    table = Table("t", MetaData(), Column("data_json", postgresql.JSONB))
+
+    with pytest.raises(ValueError):
+        json_text(table.c.data_json, key)
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.celery import metrics as celery_metrics
+from app.infrastructure.metrics.registry import (
+    MULTIPROC_DIR_ENV,
+    record_cache_lookup,
+    render_metrics,
+)
+from app.infrastructure.metrics.sqla import install_pool_metrics
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_pool_gauges_follow_checkouts(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2)
+    before_capacity = sample("db_pool_capacity")
+    before_open = sample("db_pool_connections_open")
+    before_out = sample("db_pool_connections_checked_out")
+    install_pool_metrics(engine, capacity=12)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert sample("db_pool_connections_checked_out") == before_out + 1
+    engine.dispose()
+
+    assert sample("db_pool_capacity") == before_capacity + 12
+    assert sample("db_pool_connections_checked_out") == before_out
+    assert sample("db_pool_connections_open") == before_open
+
+
+def test_cache_lookups_are_counted_by_result() -> None:
+    hits = sample("cache_lookups_total", cache="test", result="hit")
+    misses = sample("cache_lookups_total", cache="test", result="miss")
+
+    record_cache_lookup("test", hit=True)
+    record_cache_lookup("test", hit=True)
+    record_cache_lookup("test", hit=False)
+
+    assert sample("cache_lookups_total", cache="test", result="hit") == hits + 2
+    assert sample("cache_lookups_total", cache="test", result="miss") == misses + 1
+
+
+def test_task_runtime_and_queue_lag_are_observed() -> None:
+    task = SimpleNamespace(name="test_task", request=None)
+    headers: dict[str, float] = {}
+    celery_metrics._stamp_published_at(headers=headers)
+    task.request = SimpleNamespace(get=lambda key, default=None: headers.get(key))
+    lag_count = sample("celery_task_queue_lag_seconds_count", task="test_task")
+    runs = sample(
+        "celery_task_duration_seconds_count",
+        task="test_task",
+        state="SUCCESS",
+    )
+
+    celery_metrics._task_started(task_id="1", task=task)
+    celery_metrics._task_finished(task_id="1", task=task, state="SUCCESS")
+
+    assert sample("celery_task_queue_lag_seconds_count", task="test_task") == (
+        lag_count + 1
+    )
+    assert sample(
+        "celery_task_duration_seconds_count",
+        task="test_task",
+        state="SUCCESS",
+    ) == runs + 1
+
+
+def test_rendered_metrics_are_in_the_exposition_format() -> None:
+    body, content_type = render_metrics()
+
+    assert content_type.startswith("text/plain")
+    assert b"# TYPE http_request_duration_seconds histogram" in body
+
+
+def run_python(code: str, multiproc_dir: Path) -> str:
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, MULTIPROC_DIR_ENV: str(multiproc_dir)},
+    )
+    return completed.stdout
+
+
+def test_worker_processes_are_summed_in_multiprocess_mode(tmp_path: Path) -> None:
+    for _ in range(2):
+        run_python(
+            "from app.infrastructure.metrics.registry import record_cache_lookup; "
+            "record_cache_lookup('shared', hit=True)",
+            tmp_path,
+        )
+
+    rendered = run_python(
+        "from app.infrastructure.metrics.registry import render_metrics; "
+        "print(render_metrics()[0].decode())",
+        tmp_path,
+    )
+
+    assert 'cache_lookups_total{cache="shared",result="hit"} 2.0' in rendered
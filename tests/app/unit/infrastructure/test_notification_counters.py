@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.adapters.notification_repository_sqla import (
+    build_increment_unread,
+    build_mark_read,
+)
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    map_notifications_table,
+)
+from app.infrastructure.persistence_sqla.mappings.notification_counter import (
+    map_notification_counters_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+NOW = datetime(2024, 4, 15, 12, 0)
+
+
+def _tables():
+    map_notifications_table()
+    map_notification_counters_table()
+    tables = mapping_registry.metadata.tables
+    return tables["notifications"], tables["notification_counters"]
+
+
+def _sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_increment_unread_upserts_the_counter() -> None:
+    _, counters = _tables()
+
+    sql = _sql(build_increment_unread(counters, [7]))
+
+    assert "ON CONFLICT (user_id) DO UPDATE" in sql
+    assert "unread = (notification_counters.unread + " in sql
+
+
+def test_mark_read_updates_rows_and_counter_in_one_statement() -> None:
+    notifications, counters = _tables()
+
+    sql = _sql(
+        build_mark_read(
+            notifications,
+            counters,
+            user_id=7,
+            notification_ids=[1, 2],
+            now=NOW,
+        )
+    )
+
+    assert sql.startswith("WITH marked AS (UPDATE notifications SET")
+    assert "notifications.is_read IS NOT true" in sql
+    assert "notifications.id IN (" in sql
+    assert "(SELECT count(*) AS count_1 FROM marked)" in sql
+    assert sql.endswith("RETURNING notification_counters.unread")
+
+
+def test_mark_all_read_has_no_id_filter() -> None:
+    notifications, counters = _tables()
+
+    sql = _sql(
+        build_mark_read(
+            notifications,
+            counters,
+            user_id=7,
+            notification_ids=None,
+            now=NOW,
+        )
+    )
+
+    assert "notifications.id IN" not in sql
@@ -0,0 +1,131 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.application.notification.ports import (
+    NotificationAudience,
+    NotificationPublisher,
+    NotificationTemplate,
+)
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.notification.config import NotificationStreamConfig
+from app.infrastructure.notification.fan_out_sqla import (
+    SqlaNotificationFanOutWriter,
+    build_audience_query,
+    build_fan_out_insert,
+)
+from app.infrastructure.persistence_sqla.after_commit import _run_callbacks
+from app.infrastructure.persistence_sqla.mappings.notification import (
+    map_notifications_table,
+)
+from app.infrastructure.persistence_sqla.mappings.subscription_user import (
+    map_subscription_users_table,
+)
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def _sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_audience_query_filters_and_orders_by_id() -> None:
+    map_users_table()
+    map_subscription_users_table()
+    tables = mapping_registry.metadata.tables
+
+    sql = _sql(
+        build_audience_query(
+            tables["users"],
+            tables["subscription_users"],
+            NotificationAudience(country_id=3, subscription_id=2),
+        )
+    )
+
+    assert "users.is_active IS true" in sql
+    assert "users.country_id = " in sql
+    assert "EXISTS (SELECT * FROM subscription_users" in sql
+    assert sql.endswith("ORDER BY users.id")
+
+
+def test_fan_out_insert_takes_the_chunk_as_one_array() -> None:
+    map_notifications_table()
+    notifications = mapping_registry.metadata.tables["notifications"]
+
+    compiled = build_fan_out_insert(
+        notifications,
+        [1, 2, 3],
+        NotificationTemplate(title="Hi", action="system", data_json={"a": 1}),
+        datetime(2024, 3, 15),
+    ).compile(dialect=postgresql.dialect())
+
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("INSERT INTO notifications (user_id, title, action")
+    assert "FROM unnest(%(user_ids)s::INTEGER[])" in sql
+    assert compiled.params["user_ids"] == [1, 2, 3]
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+
+    def mappings(self) -> list[dict[str, Any]]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, written: list[dict[str, Any]]) -> None:
+        self.info: dict[str, Any] = {}
+        self.written = written
+
+    async def execute(self, stmt: Any) -> FakeResult:
+        return FakeResult(self.written)
+
+    async def commit(self) -> None:
+        _run_callbacks(cast(Session, self))
+
+
+class RecordingPublisher(NotificationPublisher):
+    def __init__(self) -> None:
+        self.pushed: list[int] = []
+
+    def publish(self, user_id: int, notification: Mapping[str, Any]) -> None:
+        self.pushed.append(user_id)
+
+
+@pytest.mark.parametrize(
+    ("redis_url", "pushed"),
+    [(None, []), ("redis://localhost:6379/2", [1, 2])],
+    ids=["local-only", "redis-bus"],
+)
+@pytest.mark.asyncio
+async def test_worker_pushes_written_notifications_only_through_the_bus(
+    redis_url: str | None,
+    pushed: list[int],
+) -> None:
+    publisher = RecordingPublisher()
+    writer = SqlaNotificationFanOutWriter(
+        cast(MainAsyncSession, FakeSession([{"user_id": 1}, {"user_id": 2}])),
+        cast(AsyncEngine, None),
+        publisher,
+        NotificationStreamConfig(
+            redis_url=redis_url,
+            channel="notifications",
+            queue_size=100,
+            heartbeat_s=15.0,
+            max_connections=10,
+        ),
+    )
+
+    written = await writer.write_chunk(
+        [1, 2],
+        NotificationTemplate(title="Hi", action="system"),
+    )
+
+    assert written == 2
+    assert publisher.pushed == pushed
@@ -0,0 +1,81 @@
+import asyncio
+from typing import cast
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.infrastructure.notification.hub import (
+    NotificationFeedFullError,
+    NotificationHub,
+)
+from app.infrastructure.persistence_sqla.after_commit import call_after_commit
+from app.presentation.http.controllers.notification.sse import encode_event_stream
+
+
+async def collect(stream, count: int) -> list[dict]:
+    return [await anext(aiter(stream)) for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_deliver_reaches_every_stream_of_the_recipient_only() -> None:
+    hub = NotificationHub(queue_size=10, max_connections=10)
+    phone, laptop, other = hub.subscribe(1), hub.subscribe(1), hub.subscribe(2)
+
+    assert hub.deliver(1, {"id": 7}) == 2
+    assert await collect(phone, 1) == await collect(laptop, 1) == [{"id": 7}]
+    assert other.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_lagging_stream_is_closed_instead_of_blocking() -> None:
+    hub = NotificationHub(queue_size=2, max_connections=10)
+    stream = hub.subscribe(1)
+
+    for id_ in range(3):
+        hub.deliver(1, {"id": id_})
+
+    assert hub.connection_count == 0
+    assert [item async for item in stream] == []
+
+
+def test_subscribe_beyond_capacity_fails() -> None:
+    hub = NotificationHub(queue_size=1, max_connections=1)
+    hub.subscribe(1).close()
+    hub.subscribe(2)
+
+    with pytest.raises(NotificationFeedFullError):
+        hub.subscribe(3)
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_heartbeats_and_unsubscribes_on_close() -> None:
+    hub = NotificationHub(queue_size=10, max_connections=10)
+    stream = hub.subscribe(1)
+    events = encode_event_stream(stream, heartbeat_s=0.01)
+
+    assert await anext(events) == b"retry: 3000\n\n"
+    assert await anext(events) == b": keep-alive\n\n"
+    hub.deliver(1, {"id": 5, "title": "Paid"})
+    assert await anext(events) == (
+        b'id: 5\nevent: notification\ndata: {"id":5,"title":"Paid"}\n\n'
+    )
+
+    await events.aclose()
+    assert hub.connection_count == 0
+
+
+def test_after_commit_callbacks_run_on_commit_only() -> None:
+    calls: list[str] = []
+    with Session(create_engine("sqlite://")) as session:
+        as_async = cast(AsyncSession, session)
+        session.execute(text("SELECT 1"))
+        call_after_commit(as_async, lambda: calls.append("rolled back"))
+        session.rollback()
+        session.execute(text("SELECT 1"))
+        call_after_commit(as_async, lambda: calls.append("committed"))
+        session.commit()
+        session.commit()
+
+    assert calls == ["committed"]
@@ -0,0 +1,120 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import pytest
+
+from app.infrastructure.adapters.task_queue_outbox_sqla import SqlaOutboxTaskQueue
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.outbox.relay_sqla import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_MAX_RETRY_DELAY_S,
+    OutboxPublisher,
+    SqlaOutboxRelay,
+    _failure_updates,
+    _publish_all,
+    retry_delay_s,
+)
+from app.infrastructure.tracing.exporters import InMemorySpanExporter
+from app.infrastructure.tracing.tracer import Tracer, format_traceparent
+
+
+class ScriptedOutboxRelay(SqlaOutboxRelay):
+    def __init__(self, batches: list[tuple[int, int]]) -> None:
+        super().__init__(cast(MainAsyncSession, None))
+        self._batches = batches
+        self.calls = 0
+
+    async def relay_batch(
+        self,
+        publish: OutboxPublisher,
+        limit: int,
+    ) -> tuple[int, int]:
+        self.calls += 1
+        return self._batches.pop(0)
+
+
+def publish_nothing(
+    _task_name: str,
+    _kwargs: dict[str, Any],
+    _traceparent: str | None,
+) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("batches", "expected_calls", "expected_total"),
+    [
+        pytest.param([(10, 0), (10, 0), (3, 0)], 3, 23, id="until_partial_batch"),
+        pytest.param([(10, 0), (4, 1)], 2, 14, id="until_partial_batch_with_failure"),
+        pytest.param([(9, 1), (10, 0), (2, 0)], 3, 21, id="past_failed_rows"),
+        pytest.param([(10, 0), (0, 10)], 2, 10, id="stops_when_broker_fails"),
+        pytest.param([(0, 0)], 1, 0, id="empty_outbox"),
+    ],
+)
+async def test_drain_stops_when_outbox_is_drained_or_broker_fails(
+    batches: list[tuple[int, int]],
+    expected_calls: int,
+    expected_total: int,
+) -> None:
+    sut = ScriptedOutboxRelay(batches)
+
+    total = await sut.drain(publish_nothing, batch_size=10, time_budget_s=5)
+
+    assert total == expected_total
+    assert sut.calls == expected_calls
+
+
+def test_retries_back_off_exponentially_up_to_a_ceiling() -> None:
+    assert [retry_delay_s(n) for n in (1, 2, 3)] == [5.0, 10.0, 20.0]
+    assert retry_delay_s(30) == OUTBOX_MAX_RETRY_DELAY_S
+
+
+def test_failed_rows_are_delayed_then_dead_lettered() -> None:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+
+    retried, dead = _failure_updates(
+        [(1, 0, "broker down"), (2, OUTBOX_MAX_ATTEMPTS - 1, "bad payload")],
+        now,
+    )
+
+    assert retried["b_available_at"] == now + timedelta(seconds=5)
+    assert retried["b_dead_at"] is None
+    assert dead["b_dead_at"] == now
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        self.params: list[dict[str, Any]] = []
+
+    async def execute(self, stmt: Any) -> None:
+        self.params.append(stmt.compile().params)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_stores_the_current_trace() -> None:
+    session = RecordingSession()
+    queue = SqlaOutboxTaskQueue(cast(MainAsyncSession, session))
+
+    await queue.enqueue("send_mail", {"to": "a@example.com"})
+    with Tracer(InMemorySpanExporter(), sample_ratio=1.0).span("request") as span:
+        await queue.enqueue("send_mail", {"to": "b@example.com"})
+
+    untraced, traced = session.params
+    assert untraced["traceparent"] is None
+    assert traced["traceparent"] == format_traceparent(span.context)
+
+
+def test_relay_hands_the_stored_trace_to_the_publisher() -> None:
+    sent: list[tuple[str, dict[str, Any], str | None]] = []
+
+    def publish(task_name: str, kwargs: dict[str, Any], tp: str | None) -> None:
+        sent.append((task_name, kwargs, tp))
+
+    published, failed = _publish_all(
+        publish,
+        [(1, "send_mail", {"to": "a"}, "00-trace", 0), (2, "send_mail", {}, None, 0)],
+    )
+
+    assert (published, failed) == ([1, 2], [])
+    assert sent == [("send_mail", {"to": "a"}, "00-trace"), ("send_mail", {}, None)]
@@ -0,0 +1,138 @@
+from datetime import date, datetime, timezone
+from typing import Any, cast
+
+import pytest
+
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.maintenance.partitions_sqla import SqlaPartitionMaintainer
+from app.infrastructure.persistence_sqla.partitioning import (
+    SPECS_BY_TABLE,
+    add_months,
+    create_partition_ddl,
+    is_retired,
+    parse_partition_month,
+)
+
+NOW = datetime(2024, 3, 15, 12, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    ("month", "months", "expected"),
+    [
+        (date(2024, 11, 1), 3, date(2025, 2, 1)),
+        (date(2024, 1, 1), -1, date(2023, 12, 1)),
+        (date(2024, 3, 1), -24, date(2022, 3, 1)),
+    ],
+)
+def test_add_months(month: date, months: int, expected: date) -> None:
+    assert add_months(month, months) == expected
+
+
+def test_partition_ddl_pins_timestamptz_bounds_to_utc() -> None:
+    ddl = create_partition_ddl(SPECS_BY_TABLE["auth_sessions"], date(2024, 12, 1))
+
+    assert ddl == (
+        "CREATE TABLE IF NOT EXISTS auth_sessions_p202412 PARTITION OF "
+        "auth_sessions FOR VALUES FROM ('2024-12-01 00:00:00+00') "
+        "TO ('2025-01-01 00:00:00+00')"
+    )
+
+
+def test_parse_partition_month_ignores_other_tables() -> None:
+    assert parse_partition_month("sessions", "sessions_p202402") == date(2024, 2, 1)
+    assert parse_partition_month("sessions", "sessions_default") is None
+    assert parse_partition_month("sessions", "auth_sessions_p202402") is None
+
+
+@pytest.mark.parametrize(
+    ("table", "month", "expected"),
+    [
+        pytest.param("sessions", date(2024, 2, 1), True, id="expired_last_month"),
+        pytest.param("sessions", date(2024, 3, 1), False, id="expiring_this_month"),
+        pytest.param("notifications", date(2023, 2, 1), True, id="past_retention"),
+        pytest.param("notifications", date(2023, 3, 1), False, id="within_retention"),
+    ],
+)
+def test_is_retired(table: str, month: date, expected: bool) -> None:
+    assert is_retired(SPECS_BY_TABLE[table], month, NOW) is expected
+
+
+class _Result:
+    def __init__(self, names: list[str]) -> None:
+        self._names = names
+
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[str]:
+        return self._names
+
+
+class RecordingSession:
+    def __init__(self, partitions: list[str]) -> None:
+        self._partitions = partitions
+        self.statements: list[str] = []
+
+    async def execute(self, stmt: Any, _params: Any = None) -> _Result:
+        sql = str(stmt)
+        if sql.startswith("SELECT"):
+            return _Result(self._partitions)
+        self.statements.append(sql)
+        return _Result([])
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_maintain_creates_missing_months_and_retires_past_ones() -> None:
+    session = RecordingSession(
+        ["payments_default", "payments_p202201", "payments_p202203", "payments_p202404"]
+    )
+    maintainer = SqlaPartitionMaintainer(cast(MainAsyncSession, session))
+
+    report = await maintainer.maintain(
+        NOW,
+        months_ahead=2,
+        specs=[SPECS_BY_TABLE["payments"]],
+    )
+
+    assert report.created == ["payments_p202403", "payments_p202405"]
+    assert report.detached == ["payments_p202201"]
+    assert report.dropped == report.failed == []
+    assert (
+        "ALTER TABLE payments DETACH PARTITION payments_p202201" in session.statements
+    )
+    assert not any(sql.startswith("DROP") for sql in session.statements)
+
+
+@pytest.mark.asyncio
+async def test_maintain_skips_tables_that_are_not_partitioned() -> None:
+    session = RecordingSession([])
+    maintainer = SqlaPartitionMaintainer(cast(MainAsyncSession, session))
+
+    report = await maintainer.maintain(NOW)
+
+    assert report.created == [] and session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_retiring_notifications_releases_their_unread_counts() -> None:
+    session = RecordingSession(["notifications_p202201", "notifications_p202404"])
+    maintainer = SqlaPartitionMaintainer(cast(MainAsyncSession, session))
+
+    report = await maintainer.maintain(
+        NOW,
+        months_ahead=0,
+        specs=[SPECS_BY_TABLE["notifications"]],
+    )
+
+    assert report.dropped == ["notifications_p202201"]
+    detach, release, drop = session.statements[-3:]
+    assert detach.endswith("DETACH PARTITION notifications_p202201")
+    assert release.startswith("UPDATE notification_counters")
+    assert "FROM notifications_p202201 " in release
+    assert drop == "DROP TABLE notifications_p202201"
@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from app.infrastructure.subscription.plan_catalog import (
+    PlanCatalogCache,
+    build_plan_catalog,
+)
+
+PRO = {"id": 1, "name": "PRO", "price": 9.99}
+CORPORATE = {"id": 2, "name": "CORPORATE", "price": 49.99}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self, rows: list[Mapping[str, Any]]) -> None:
+        self.rows = rows
+        self.loads = 0
+
+    async def __call__(self) -> list[Mapping[str, Any]]:
+        self.loads += 1
+        await asyncio.sleep(0)
+        return list(self.rows)
+
+
+def test_catalog_version_follows_content_not_row_order() -> None:
+    assert (
+        build_plan_catalog([PRO, CORPORATE]).version
+        == build_plan_catalog([CORPORATE, PRO]).version
+    )
+    changed = {**PRO, "price": 12.99}
+    assert (
+        build_plan_catalog([changed, CORPORATE]).version
+        != build_plan_catalog([PRO, CORPORATE]).version
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load() -> None:
+    cache = PlanCatalogCache(ttl_s=60)
+    loader = CountingLoader([PRO, CORPORATE])
+
+    catalogs = await asyncio.gather(*(cache.get(loader) for _ in range(5)))
+
+    assert loader.loads == 1
+    assert {catalog.version for catalog in catalogs} == {catalogs[0].version}
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_reloaded_after_ttl_or_invalidation() -> None:
+    clock = FakeClock()
+    cache = PlanCatalogCache(ttl_s=60, clock=clock)
+    loader = CountingLoader([PRO])
+
+    await cache.get(loader)
+    clock.now = 59
+    await cache.get(loader)
+    assert loader.loads == 1
+
+    clock.now = 60
+    await cache.get(loader)
+    assert loader.loads == 2
+
+    cache.invalidate()
+    await cache.get(loader)
+    assert loader.loads == 3
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_kept() -> None:
+    cache = PlanCatalogCache(ttl_s=60)
+    loader = CountingLoader([PRO])
+
+    async def invalidating_load() -> list[Mapping[str, Any]]:
+        rows = await loader()
+        cache.invalidate()
+        return rows
+
+    await cache.get(invalidating_load)
+    await cache.get(loader)
+
+    assert loader.loads == 2
@@ -0,0 +1,102 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from app.infrastructure.persistence_sqla.query_profiler import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    QueryBudgets,
+    QueryStats,
+    install_query_profiler,
+    profile_queries,
+    query_budget,
+    statement_shape,
+)
+
+
+@pytest.fixture
+def stats() -> QueryStats:
+    return QueryStats(max_shapes=10)
+
+
+@pytest.fixture
+def engine(stats: QueryStats) -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    install_query_profiler(engine, stats)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("statement", "shape"),
+    [
+        (
+            "SELECT id\n  FROM users WHERE id = %(id_1)s LIMIT 20",
+            "SELECT id FROM users WHERE id = %(id_1)s LIMIT ?",
+        ),
+        (
+            "SELECT id FROM users WHERE email = 'a@example.com'",
+            "SELECT id FROM users WHERE email = ?",
+        ),
+        (
+            "DELETE FROM sessions WHERE user_id IN (%(p_1)s, %(p_2)s, %(p_3)s)",
+            "DELETE FROM sessions WHERE user_id IN (...)",
+        ),
+        (
+            "SELECT * FROM users WHERE id IN ($1, $2)",
+            "SELECT * FROM users WHERE id IN (...)",
+        ),
+    ],
+)
+def test_statement_shape(statement: str, shape: str) -> None:
+    assert statement_shape(statement) == shape
+
+
+def test_statements_are_recorded_per_profile_and_per_process(
+    engine: Engine,
+    stats: QueryStats,
+) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with profile_queries() as profile:
+            for user_id in range(3):
+                connection.execute(text("SELECT :id"), {"id": user_id})
+            with pytest.raises(Exception):
+                connection.execute(text("SELECT * FROM missing"))
+
+    assert profile.statements == 4
+    assert profile.shapes == {"SELECT ?": 3, "SELECT * FROM missing": 1}
+    assert profile.total_s > 0
+    assert {s.shape: s.count for s in stats.slowest(10)} == {
+        "SELECT ?": 4,
+        "SELECT * FROM missing": 1,
+    }
+
+
+def test_stats_stop_tracking_new_shapes_when_full() -> None:
+    stats = QueryStats(max_shapes=2)
+    for shape, elapsed_s in (("a", 0.1), ("b", 0.3), ("c", 0.5), ("a", 0.1)):
+        stats.record(shape, elapsed_s)
+
+    assert [s.shape for s in stats.slowest(10)] == ["b", "a"]
+    assert stats.untracked == 1
+
+
+def test_repeated_statements_exceed_the_budget(engine: Engine) -> None:
+    budget = QueryBudget(max_statements=10, max_repeats=2)
+
+    with pytest.raises(QueryBudgetExceededError, match="3x SELECT"):
+        with engine.connect() as connection, query_budget(budget, where="test"):
+            for user_id in range(3):
+                connection.execute(text("SELECT :id"), {"id": user_id})
+
+
+def test_endpoint_budgets_override_the_statement_ceiling() -> None:
+    budgets = QueryBudgets(
+        default=QueryBudget(max_statements=30, max_repeats=5),
+        endpoints={"GET /api/v1/account/me": 3},
+    )
+
+    assert budgets.for_endpoint("GET /api/v1/account/me") == QueryBudget(3, 5)
+    assert budgets.for_endpoint("GET /api/v1/other") == budgets.default
@@ -0,0 +1,66 @@
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.persistence_sqla.schema_version import (
+    ALEMBIC_DIR_PATH,
+    SchemaVersionMismatchError,
+    ensure_heads_match,
+    get_packaged_heads,
+    stamp_packaged_heads,
+)
+
+
+def test_accepts_database_at_packaged_head() -> None:
+    heads = frozenset({"abc123"})
+
+    ensure_heads_match(database_heads=heads, packaged_heads=heads)
+
+
+@pytest.mark.parametrize(
+    "database_heads",
+    [
+        pytest.param(frozenset(), id="never_migrated"),
+        pytest.param(frozenset({"old000"}), id="behind"),
+        pytest.param(frozenset({"abc123", "def456"}), id="extra_branch"),
+    ],
+)
+def test_rejects_database_not_at_packaged_head(
+    database_heads: frozenset[str],
+) -> None:
+    with pytest.raises(SchemaVersionMismatchError):
+        ensure_heads_match(
+            database_heads=database_heads,
+            packaged_heads=frozenset({"abc123"}),
+        )
+
+
+def test_packaged_heads_are_parsed_once() -> None:
+    assert get_packaged_heads() is get_packaged_heads()
+
+
+def test_migrations_start_from_a_baseline_that_creates_the_tables() -> None:
+    script = ScriptDirectory(str(ALEMBIC_DIR_PATH))
+
+    [base] = script.get_bases()
+    created = {name for name, _ in script.get_revision(base).module.TABLES}
+    partitioning = script.get_revision("3f1c2a9d7b40")
+
+    assert partitioning.down_revision == base
+    assert {layout.name for layout in partitioning.module.TABLES} <= created
+
+
+def test_create_all_schemas_are_stamped_only_when_never_migrated() -> None:
+    engine = create_engine("sqlite://")
+    read_heads = text("SELECT version_num FROM alembic_version")
+
+    with engine.begin() as conn:
+        stamp_packaged_heads(conn)
+        stamped = frozenset(conn.execute(read_heads).scalars())
+        conn.execute(text("UPDATE alembic_version SET version_num = 'old000'"))
+        stamp_packaged_heads(conn)
+        kept = frozenset(conn.execute(read_heads).scalars())
+    engine.dispose()
+
+    assert stamped == get_packaged_heads()
+    assert kept == {"old000"}
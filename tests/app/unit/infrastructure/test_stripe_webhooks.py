@@ -0,0 +1,288 @@
+import hashlib
+import hmac
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.application.subscription.ports import BillingEvent
+from app.infrastructure.adapters.types import MainAsyncSession
+from app.infrastructure.persistence_sqla.mappings.payment import map_payments_table
+from app.infrastructure.persistence_sqla.mappings.subscription_user import (
+    map_subscription_users_table,
+)
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+from app.infrastructure.subscription.billing_events_sqla import (
+    STRIPE_EVENT_MAX_ATTEMPTS,
+    SqlaBillingStateWriter,
+    StatusChange,
+    _failure_updates,
+    build_activate_subscription_user,
+    build_complete_checkout_payment,
+    build_insert_renewal_payment,
+    build_update_subscription_status,
+    fold_stripe_events,
+)
+from app.infrastructure.subscription.webhook_signature import (
+    StripeSignatureError,
+    verify_stripe_signature,
+)
+
+SECRET = "whsec_test"
+PAYLOAD = b'{"id": "evt_1", "type": "invoice.paid", "created": 1700000000}'
+
+
+def sign(payload: bytes, timestamp: int, secret: str = SECRET) -> str:
+    digest = hmac.new(
+        secret.encode(),
+        f"{timestamp}.".encode() + payload,
+        hashlib.sha256,
+    ).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def event(id_: int, type_: str, created: int | None = None, **obj) -> BillingEvent:
+    return BillingEvent(
+        id=id_,
+        type=type_,
+        customer_id="cus_1",
+        created=1700000000 + id_ if created is None else created,
+        object=obj,
+    )
+
+
+def compile_sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_valid_signature_is_accepted() -> None:
+    verify_stripe_signature(PAYLOAD, sign(PAYLOAD, 1000), secret=SECRET, now=1010)
+
+
+def test_rotated_secret_matches_any_v1_signature() -> None:
+    header = sign(PAYLOAD, 1000, "whsec_old") + "," + sign(PAYLOAD, 1000).split(",")[1]
+
+    verify_stripe_signature(PAYLOAD, header, secret=SECRET, now=1000)
+
+
+@pytest.mark.parametrize(
+    ("payload", "header", "now"),
+    [
+        (PAYLOAD + b" ", sign(PAYLOAD, 1000), 1000),
+        (PAYLOAD, sign(PAYLOAD, 1000, "whsec_other"), 1000),
+        (PAYLOAD, sign(PAYLOAD, 1000), 1000 + 301),
+        (PAYLOAD, "v1=abc", 1000),
+        (PAYLOAD, "t=soon,v1=abc", 1000),
+    ],
+    ids=["tampered", "wrong-secret", "replayed", "no-timestamp", "bad-timestamp"],
+)
+def test_invalid_signature_is_rejected(payload: bytes, header: str, now: int) -> None:
+    with pytest.raises(StripeSignatureError):
+        verify_stripe_signature(payload, header, secret=SECRET, now=now)
+
+
+def test_fold_keeps_the_last_status_per_subscription() -> None:
+    changes = fold_stripe_events(
+        [
+            event(1, "customer.subscription.updated", id="sub_1", status="past_due"),
+            event(2, "customer.subscription.updated", id="sub_1", status="active"),
+            event(3, "customer.subscription.deleted", id="sub_2", status="canceled"),
+            event(4, "customer.subscription.updated", id="sub_3", status="paused"),
+        ]
+    )
+
+    assert {key: change.status for key, change in changes.statuses.items()} == {
+        "sub_1": "active",
+        "sub_2": "cancelled",
+    }
+
+
+def test_fold_ignores_statuses_older_than_the_one_folded() -> None:
+    changes = fold_stripe_events(
+        [
+            event(1, "customer.subscription.deleted", created=200, id="sub_1"),
+            # A retried event that happened before the cancellation.
+            event(
+                2,
+                "customer.subscription.updated",
+                created=100,
+                id="sub_1",
+                status="active",
+            ),
+        ]
+    )
+
+    assert changes.statuses == {
+        "sub_1": StatusChange(event_created=200, status="cancelled")
+    }
+
+
+def test_status_updates_skip_events_older_than_the_applied_status() -> None:
+    map_subscription_users_table()
+    subscription_users = mapping_registry.metadata.tables["subscription_users"]
+
+    update = compile_sql(build_update_subscription_status(subscription_users))
+    activate = compile_sql(build_activate_subscription_user(subscription_users))
+
+    guard = (
+        "subscription_users.status_event_created IS NULL "
+        "OR subscription_users.status_event_created <= %(b_created)s"
+    )
+    assert guard in update
+    assert "status_event_created=%(b_created)s" in update
+    # A stale completion still records the Stripe ids.
+    assert f"status=CASE WHEN ({guard}) THEN %(param_1)s" in activate
+    assert "greatest(subscription_users.status_event_created, %(b_created)s)" in (
+        activate
+    )
+
+
+def test_fold_lets_checkout_completion_supersede_earlier_statuses() -> None:
+    changes = fold_stripe_events(
+        [
+            event(1, "customer.subscription.updated", id="sub_1", status="incomplete"),
+            event(2, "customer.subscription.updated", id="sub_1", status="past_due"),
+            event(
+                3,
+                "checkout.session.completed",
+                id="cs_1",
+                subscription="sub_1",
+                payment_intent={"id": "pi_1"},
+            ),
+        ]
+    )
+
+    assert changes.statuses == {}
+    completion = changes.completions["cs_1"]
+    assert completion.stripe_subscription_id == "sub_1"
+    assert completion.payment_intent_id == "pi_1"
+
+
+def test_fold_records_renewals_but_not_the_first_invoice() -> None:
+    changes = fold_stripe_events(
+        [
+            event(
+                1,
+                "invoice.paid",
+                id="in_1",
+                subscription="sub_1",
+                billing_reason="subscription_create",
+                amount_paid=999,
+                currency="usd",
+            ),
+            event(
+                2,
+                "invoice.paid",
+                id="in_2",
+                subscription="sub_1",
+                billing_reason="subscription_cycle",
+                amount_paid=999,
+                currency="usd",
+            ),
+        ]
+    )
+
+    assert list(changes.renewals) == ["in_2"]
+    assert changes.renewals["in_2"].amount == 9.99
+    assert changes.renewals["in_2"].currency == "USD"
+
+
+def test_renewal_payment_is_inserted_from_the_subscription_row() -> None:
+    map_subscription_users_table()
+    map_payments_table()
+    tables = mapping_registry.metadata.tables
+
+    sql = " ".join(
+        str(
+            build_insert_renewal_payment(
+                tables["payments"],
+                tables["subscription_users"],
+            ).compile(dialect=postgresql.dialect())
+        ).split()
+    )
+
+    assert sql.startswith("INSERT INTO payments (user_id, subscription_id, ")
+    assert "FROM subscription_users WHERE " in sql
+    assert "subscription_users.stripe_subscription_id = %(b_subscription_id)s" in sql
+    # Redeliveries are skipped through the GIN index on the payload.
+    assert "NOT (EXISTS (SELECT * FROM payments WHERE " in sql
+    assert "payments.data_json @> %(b_invoice_id)s::JSONB" in sql
+
+
+def test_checkout_payment_is_matched_on_the_indexed_expression() -> None:
+    map_payments_table()
+
+    sql = " ".join(
+        str(
+            build_complete_checkout_payment(
+                mapping_registry.metadata.tables["payments"],
+            ).compile(dialect=postgresql.dialect())
+        ).split()
+    )
+
+    # The key must be a literal, not a bind parameter, or the planner
+    # can't match it against ix_payments_checkout_session_id.
+    assert "(payments.data_json ->> 'checkout_session_id') = %(b_session_id)s" in sql
+
+
+def test_failed_events_are_delayed_then_dead_lettered() -> None:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    first_try = event(1, "invoice.paid")
+    last_try = BillingEvent(
+        id=2,
+        type="invoice.paid",
+        customer_id=None,
+        created=1700000000,
+        object={},
+        attempts=STRIPE_EVENT_MAX_ATTEMPTS - 1,
+    )
+
+    retried, dead = _failure_updates(
+        [(first_try, "deadlock"), (last_try, "bad payload")],
+        now,
+    )
+
+    assert retried["b_available_at"] == now + timedelta(seconds=5)
+    assert retried["b_dead_at"] is None
+    assert dead["b_dead_at"] == now
+
+
+class FailingOnInvoiceSession:
+    def __init__(self, invoice_id: str) -> None:
+        self.invoice_id = {"invoice_id": invoice_id}
+        self.savepoints = 0
+
+    def begin_nested(self) -> Any:
+        self.savepoints += 1
+        return nullcontext()
+
+    async def execute(self, stmt: Any, params: list[dict[str, Any]]) -> None:
+        if any(row.get("b_invoice_id") == self.invoice_id for row in params):
+            raise SQLAlchemyError("value too long")
+
+
+def renewal(id_: int, invoice_id: str) -> BillingEvent:
+    return event(
+        id_,
+        "invoice.paid",
+        id=invoice_id,
+        subscription="sub_1",
+        billing_reason="subscription_cycle",
+        amount_paid=999,
+    )
+
+
+@pytest.mark.asyncio
+async def test_a_failing_event_does_not_hold_back_the_batch() -> None:
+    session = FailingOnInvoiceSession("in_bad")
+    writer = SqlaBillingStateWriter(cast(MainAsyncSession, session))
+    good, bad = renewal(1, "in_good"), renewal(2, "in_bad")
+
+    failures = await writer.apply([good, bad])
+
+    assert failures == [(bad, "value too long")]
+    # The batch, then each event on its own.
+    assert session.savepoints == 3
@@ -0,0 +1,78 @@
+from typing import Any
+
+import pytest
+
+from app.application.common.services.idempotency import IdempotencyService
+from app.infrastructure.subscription.handlers.customer_subscription import (
+    CreateSubscriptionHandler,
+    CreateSubscriptionRequest,
+)
+from tests.app.unit.application.idempotency.test_idempotency_service import (
+    FakeIdempotencyStore,
+    FakeTransactionManager,
+)
+from tests.app.unit.infrastructure.test_account_me import (
+    FakeCurrentUserService,
+    make_user,
+)
+
+
+class FakePlans:
+    async def read_by_id(self, id_: int) -> dict[str, Any] | None:
+        return {"id": id_, "price": 9.0, "currency": "EUR", "stripe_price_id": "price_1"}
+
+
+class FakeRows:
+    def __init__(self) -> None:
+        self.added: list[dict[str, Any]] = []
+
+    async def add(self, **values: Any) -> int:
+        self.added.append(values)
+        return len(self.added)
+
+    async def update_data_json(self, *, id_: int, data_json: dict) -> None:
+        pass
+
+
+class FakeBillingGateway:
+    is_configured = True
+
+    def __init__(self) -> None:
+        self.sessions = 0
+
+    async def create_checkout_session(self, **_: str) -> str:
+        self.sessions += 1
+        return f"cs_{self.sessions}"
+
+
+def make_handler() -> tuple[
+    CreateSubscriptionHandler,
+    FakeIdempotencyStore,
+    FakeBillingGateway,
+]:
+    store = FakeIdempotencyStore()
+    billing = FakeBillingGateway()
+    handler = CreateSubscriptionHandler(
+        current_user_service=FakeCurrentUserService(make_user()),  # type: ignore
+        subscription_repo=FakePlans(),  # type: ignore
+        subscription_user_repo=FakeRows(),  # type: ignore
+        payment_repo=FakeRows(),  # type: ignore
+        notification_repo=None,  # type: ignore
+        billing_gateway=billing,  # type: ignore
+        idempotency_service=IdempotencyService(store, FakeTransactionManager()),
+    )
+    return handler, store, billing
+
+
+@pytest.mark.asyncio
+async def test_retried_subscribe_replays_the_first_checkout_session() -> None:
+    handler, store, billing = make_handler()
+    request = CreateSubscriptionRequest(subscription_id=3, idempotency_key="k-1")
+
+    first = await handler.execute(request)
+    second = await handler.execute(request)
+
+    assert first == second
+    assert first["checkout_session_id"] == "cs_1"
+    assert billing.sessions == 1
+    assert list(store.claims) == [(7, "subscription.subscribe", "k-1")]
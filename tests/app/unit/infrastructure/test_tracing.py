@@ -0,0 +1,235 @@
+import asyncio
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.infrastructure.celery.runtime import WorkerRuntime
+from app.infrastructure.celery.tracing import (
+    _end_publish_span,
+    _end_run_span,
+    _start_publish_span,
+    _start_run_span,
+)
+from app.infrastructure.tracing.exporters import InMemorySpanExporter, encode_otlp
+from app.infrastructure.tracing.instrument import trace_methods
+from app.infrastructure.tracing.sqla import install_query_tracing
+from app.infrastructure.tracing.tracer import (
+    TRACEPARENT_HEADER,
+    SpanContext,
+    SpanKind,
+    Tracer,
+    current_span_context,
+    format_traceparent,
+    parse_traceparent,
+    set_tracer,
+)
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    previous = set_tracer(Tracer(exporter, sample_ratio=1.0))
+    yield exporter
+    set_tracer(previous)
+
+
+def test_spans_nest_and_record_errors(exporter: InMemorySpanExporter) -> None:
+    tracer = Tracer(exporter, sample_ratio=1.0)
+
+    with pytest.raises(ValueError):
+        with tracer.span("outer") as outer:
+            with tracer.span("inner"):
+                raise ValueError("boom")
+
+    inner, outer_ = exporter.spans
+    assert outer_ is outer and outer.parent_id is None
+    assert inner.parent_id == outer.context.span_id
+    assert inner.context.trace_id == outer.context.trace_id
+    assert inner.error == outer.error == "ValueError: boom"
+    assert current_span_context() is None
+
+
+def test_sampling_is_decided_at_the_root() -> None:
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter, sample_ratio=0.0)
+
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            child.set_attribute("ignored", True)
+    sampled_parent = SpanContext(trace_id="1" * 32, span_id="2" * 16, sampled=True)
+    with tracer.span("continued", parent=sampled_parent):
+        pass
+
+    assert not root.context.sampled and not child.context.sampled
+    assert child.attributes == {}
+    assert [span.name for span in exporter.spans] == ["continued"]
+
+
+def test_nothing_is_sampled_without_an_exporter() -> None:
+    with Tracer(sample_ratio=1.0).span("root") as span:
+        assert not span.context.sampled
+
+
+def test_roughly_the_configured_share_of_traces_is_sampled() -> None:
+    tracer = Tracer(InMemorySpanExporter(), sample_ratio=0.25)
+
+    sampled = sum(tracer.start_span("root").context.sampled for _ in range(4000))
+
+    assert 800 < sampled < 1200
+
+
+@pytest.mark.parametrize("sampled", [True, False])
+def test_traceparent_round_trip(sampled: bool) -> None:
+    context = SpanContext(trace_id="a" * 32, span_id="b" * 16, sampled=sampled)
+
+    assert parse_traceparent(format_traceparent(context)) == context
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, "", "garbage", f"00-{'0' * 32}-{'b' * 16}-01", f"01-{'a' * 32}-{'b' * 16}"],
+)
+def test_invalid_traceparents_are_ignored(value: str | None) -> None:
+    assert parse_traceparent(value) is None
+
+
+class Gateway:
+    async def read(self, value: int) -> int:
+        return value * 2
+
+    async def _private(self) -> None:
+        pass
+
+    def sync(self) -> str:
+        return "untouched"
+
+
+@pytest.mark.asyncio
+async def test_coroutine_methods_are_traced_once(
+    exporter: InMemorySpanExporter,
+) -> None:
+    trace_methods(Gateway)
+    trace_methods(Gateway)
+
+    assert await Gateway().read(2) == 4
+    await Gateway()._private()
+    Gateway().sync()
+
+    assert [span.name for span in exporter.spans] == ["Gateway.read"]
+
+
+def test_statements_get_spans_inside_sampled_traces(
+    exporter: InMemorySpanExporter,
+) -> None:
+    engine = create_engine("sqlite://")
+    install_query_tracing(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with Tracer(exporter, sample_ratio=1.0).span("request") as request:
+            conn.execute(text("SELECT 2"))
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing"))
+    engine.dispose()
+
+    ok, failed, _ = exporter.spans
+    assert ok.kind == SpanKind.CLIENT and ok.parent_id == request.context.span_id
+    assert ok.attributes["db.statement"] == "SELECT ?"
+    assert ok.error is None and failed.error is not None
+
+
+class FakeTask:
+    name = "send_mail"
+
+    def __init__(self, headers: dict[str, Any]) -> None:
+        self.request = SimpleNamespace(get={**headers}.get)
+
+
+def test_task_runs_are_children_of_their_publish(
+    exporter: InMemorySpanExporter,
+) -> None:
+    headers: dict[str, Any] = {"id": "task-1"}
+    with Tracer(exporter, sample_ratio=1.0).span("request"):
+        _start_publish_span(sender="send_mail", headers=headers)
+        _end_publish_span(headers=headers)
+
+    task = FakeTask(headers)
+    _start_run_span(task_id="task-1", task=task)
+    runtime_context = current_span_context()
+    _end_run_span(task_id="task-1", state="SUCCESS")
+
+    publish, request = exporter.spans[:2]
+    [run] = exporter.named("celery.run send_mail")
+    assert publish.name == "celery.publish send_mail"
+    assert publish.parent_id == request.context.span_id
+    assert parse_traceparent(headers[TRACEPARENT_HEADER]) == publish.context
+    assert run.parent_id == publish.context.span_id
+    assert run.kind == SpanKind.CONSUMER
+    assert runtime_context == run.context
+    assert current_span_context() is None
+
+
+def test_relayed_tasks_continue_the_enqueuing_trace(
+    exporter: InMemorySpanExporter,
+) -> None:
+    enqueued = SpanContext(trace_id="a" * 32, span_id="b" * 16, sampled=True)
+    headers: dict[str, Any] = {
+        "id": "task-2",
+        TRACEPARENT_HEADER: format_traceparent(enqueued),
+    }
+
+    _start_publish_span(sender="send_mail", headers=headers)
+    _end_publish_span(headers=headers)
+
+    [publish] = exporter.spans
+    assert publish.context.trace_id == enqueued.trace_id
+    assert publish.parent_id == enqueued.span_id
+    assert parse_traceparent(headers[TRACEPARENT_HEADER]) == publish.context
+
+
+def test_worker_loop_continues_the_task_span(
+    exporter: InMemorySpanExporter,
+) -> None:
+    class FakeContainer:
+        def __call__(self) -> "FakeContainer":
+            return self
+
+        async def __aenter__(self) -> "FakeContainer":
+            return self
+
+        async def __aexit__(self, *_: Any) -> None:
+            pass
+
+        async def close(self) -> None:
+            pass
+
+    async def seen_context(_: Any) -> SpanContext | None:
+        await asyncio.sleep(0)
+        return current_span_context()
+
+    runtime = WorkerRuntime(container_factory=FakeContainer)  # type: ignore
+    try:
+        with Tracer(exporter, sample_ratio=1.0).span("celery.run") as span:
+            assert runtime.run(seen_context) == span.context
+    finally:
+        runtime.close()
+
+
+def test_otlp_encoding(exporter: InMemorySpanExporter) -> None:
+    with Tracer(exporter, sample_ratio=1.0).span("root", attributes={"n": 1}):
+        with Tracer(exporter, sample_ratio=1.0).span("child"):
+            pass
+
+    [resource] = encode_otlp(exporter.spans, "baseapi")["resourceSpans"]
+    child, root = resource["scopeSpans"][0]["spans"]
+
+    assert resource["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "baseapi"}},
+    ]
+    assert root["attributes"] == [{"key": "n", "value": {"intValue": "1"}}]
+    assert "parentSpanId" not in root
+    assert child["parentSpanId"] == root["spanId"]
+    assert child["status"] == {"code": 1}
@@ -0,0 +1,51 @@
+from sqlalchemy.dialects import postgresql
+
+from app.application.common.ports.user_command_gateway import UserSelection
+from app.domain.value_objects.email import Email
+from app.domain.value_objects.user_id import UserId
+from app.infrastructure.adapters.user_data_mapper_sqla import (
+    build_select_users,
+    build_update_users,
+)
+from app.infrastructure.auth.adapters.data_mapper_sqla import (
+    build_delete_sessions_of_users,
+)
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def compile_sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=postgresql.dialect())).split())
+
+
+def test_selected_users_are_locked_in_id_order() -> None:
+    map_users_table()
+    users = mapping_registry.metadata.tables["users"]
+
+    sql = compile_sql(
+        build_select_users(
+            users,
+            UserSelection(emails=[Email("a@example.com")]),
+            limit=10,
+            for_update=True,
+        )
+    )
+
+    assert "WHERE users.email = ANY (%(emails)s::VARCHAR[])" in sql
+    assert sql.endswith("ORDER BY users.id LIMIT %(param_1)s FOR UPDATE")
+
+
+def test_users_and_their_sessions_take_one_statement_each() -> None:
+    map_users_table()
+    users = mapping_registry.metadata.tables["users"]
+    user_ids = [UserId(id_) for id_ in range(1, 501)]
+
+    update_sql = compile_sql(build_update_users(users, user_ids, {"is_active": False}))
+    delete_sql = compile_sql(build_delete_sessions_of_users(user_ids))
+
+    # One array parameter, not one per user.
+    assert update_sql.endswith("WHERE users.id = ANY (%(user_ids)s::INTEGER[])")
+    assert delete_sql == (
+        "DELETE FROM auth_sessions "
+        "WHERE auth_sessions.user_id = ANY (%(user_ids)s::INTEGER[])"
+    )
@@ -0,0 +1,114 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.common.exceptions.query import FilteringError
+from app.application.common.query_params.pagination import Pagination
+from app.application.common.query_params.sorting import SortingOrder
+from app.application.common.query_params.user import (
+    UserListFilters,
+    UserListParams,
+    UserListSorting,
+)
+from app.infrastructure.adapters.user_reader_sqla import build_user_list
+from app.infrastructure.persistence_sqla.mappings.user import map_users_table
+from app.infrastructure.persistence_sqla.registry import mapping_registry
+
+
+def make_params(
+    filters: UserListFilters,
+    sorting_field: str = "email",
+) -> UserListParams:
+    return UserListParams(
+        Pagination(limit=20, offset=0),
+        UserListSorting(sorting_field=sorting_field, sorting_order=SortingOrder.ASC),
+        filters,
+    )
+
+
+def compile_list(params: UserListParams) -> tuple[str, dict]:
+    map_users_table()
+    stmt = build_user_list(mapping_registry.metadata.tables["users"], params)
+    assert stmt is not None
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    return " ".join(str(compiled).split()), compiled.params
+
+
+def test_search_filters_match_the_indexed_expressions() -> None:
+    sql, params = compile_list(
+        make_params(UserListFilters(email_prefix="Jo_n", name=" 100% Smith "))
+    )
+
+    assert "lower(users.email) LIKE %(lower_1)s ESCAPE '\\\\'" in sql
+    assert "((users.first_name || ' ') || users.last_name) ILIKE" in sql
+    # Wildcards typed by the admin are matched literally.
+    assert params["lower_1"] == "jo\\_n%"
+    assert "%100\\% Smith%" in params.values()
+
+
+def test_flags_and_ranges_become_plain_conditions() -> None:
+    sql, _ = compile_list(
+        make_params(
+            UserListFilters(
+                is_blocked=True,
+                country_id=7,
+                created_from=datetime(2026, 1, 1),
+                created_to=datetime(2026, 2, 1),
+            )
+        )
+    )
+
+    assert "users.is_blocked = true" in sql
+    assert "users.country_id = %(country_id_1)s" in sql
+    assert "users.created_at >= %(created_at_1)s" in sql
+    assert "users.created_at < %(created_at_2)s" in sql
+    assert "ORDER BY users.email ASC, users.id" in sql
+    assert "users.password" not in sql
+
+
+def test_the_password_hash_cannot_be_sorted_on() -> None:
+    map_users_table()
+
+    assert (
+        build_user_list(
+            mapping_registry.metadata.tables["users"],
+            make_params(UserListFilters(), sorting_field="password"),
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"name": "ab"},
+        {"email_prefix": ""},
+        {"created_from": datetime(2026, 2, 1), "created_to": datetime(2026, 1, 1)},
+        {
+            "last_login_from": datetime(2026, 1, 1, 1),
+            "last_login_to": datetime(2026, 1, 1, 1, tzinfo=timezone(timedelta(0))),
+        },
+    ],
+)
+def test_unusable_filters_are_rejected(filters: dict) -> None:
+    with pytest.raises(FilteringError):
+        UserListFilters(**filters)
+
+
+def test_range_bounds_match_each_column_timezone() -> None:
+    plus_two = timezone(timedelta(hours=2))
+    _, params = compile_list(
+        make_params(
+            UserListFilters(
+                created_from=datetime(2026, 1, 1, 2, tzinfo=plus_two),
+                last_login_from=datetime(2026, 1, 1, 2, tzinfo=plus_two),
+                last_login_to=datetime(2026, 1, 2),
+            )
+        )
+    )
+
+    # `created_at` is timestamptz, `last_login` a naive UTC timestamp.
+    assert params["created_at_1"] == datetime(2026, 1, 1, tzinfo=UTC)
+    assert params["last_login_1"] == datetime(2026, 1, 1)
+    assert params["last_login_2"] == datetime(2026, 1, 2)
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass(frozen=True, slots=True)
+class AsgiResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+async def asgi_get(
+    app: ASGIApp,
+    path: str,
+    headers: dict[str, str] | None = None,
+) -> AsgiResponse:
+    """Sends `GET path` straight to the ASGI callable."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    [start] = [m for m in sent if m["type"] == "http.response.start"]
+    bodies = [m for m in sent if m["type"] == "http.response.body"]
+    return AsgiResponse(
+        status=start["status"],
+        headers={k.decode(): v.decode() for k, v in start["headers"]},
+        body=b"".join(m.get("body", b"") for m in bodies),
+    )
@@ -0,0 +1,21 @@
+import pytest
+
+from app.presentation.http.etag import if_none_match, strong_etag
+
+ETAG = strong_etag("abc123")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"abc123"', True),
+        ('W/"abc123"', True),
+        ('"other", "abc123"', True),
+        ("*", True),
+        ('"other"', False),
+        ("abc123", False),
+    ],
+)
+def test_if_none_match(header: str | None, expected: bool) -> None:
+    assert if_none_match(header, ETAG) is expected
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator, Mapping
+from datetime import datetime
+from typing import Any
+
+import orjson
+import pytest
+
+from app.domain.enums.user_role import UserRole
+from app.presentation.http.export import encode_csv, encode_ndjson
+
+ROWS = [
+    {
+        "id": 1,
+        "email": "a@example.com",
+        "role": UserRole.ADMIN,
+        "created_at": datetime(2026, 1, 2, 3, 4, 5),
+        "address": None,
+    },
+    {
+        "id": 2,
+        "email": "b@example.com",
+        "role": UserRole.USER,
+        "created_at": datetime(2026, 1, 2, 3, 4, 6),
+        "address": 'Main St, "North"',
+    },
+]
+COLUMNS = ("id", "email", "role", "created_at", "address")
+
+
+async def rows_of(rows: list[Mapping[str, Any]]) -> AsyncIterator[Mapping[str, Any]]:
+    for row in rows:
+        yield row
+
+
+async def collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_is_one_object_per_line() -> None:
+    body = b"".join(await collect(encode_ndjson(rows_of(ROWS))))
+
+    lines = body.splitlines()
+    assert [orjson.loads(line)["id"] for line in lines] == [1, 2]
+    assert orjson.loads(lines[0])["role"] == "admin"
+    assert orjson.loads(lines[0])["created_at"] == "2026-01-02T03:04:05"
+
+
+@pytest.mark.asyncio
+async def test_csv_has_a_header_and_quotes_where_needed() -> None:
+    body = b"".join(await collect(encode_csv(rows_of(ROWS), COLUMNS))).decode()
+
+    assert body.split("\r\n") == [
+        "id,email,role,created_at,address",
+        "1,a@example.com,admin,2026-01-02T03:04:05,",
+        '2,b@example.com,user,2026-01-02T03:04:06,"Main St, ""North"""',
+        "",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_an_empty_csv_export_is_just_the_header() -> None:
+    chunks = await collect(encode_csv(rows_of([]), COLUMNS))
+
+    assert chunks == [b"id,email,role,created_at,address\r\n"]
+
+
+@pytest.mark.asyncio
+async def test_rows_are_sent_in_chunks_not_one_by_one() -> None:
+    rows = [dict(ROWS[0], id=id_) for id_ in range(1000)]
+
+    chunks = await collect(encode_ndjson(rows_of(rows), chunk_size=4096))
+
+    assert 1 < len(chunks) < 100
+    assert all(len(chunk) >= 4096 for chunk in chunks[:-1])
+    assert sum(chunk.count(b"\n") for chunk in chunks) == 1000
@@ -0,0 +1,55 @@
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from app.presentation.http.controllers.general.metrics import create_metrics_router
+from app.presentation.http.metrics import MetricsMiddleware
+from tests.app.unit.presentation.asgi import asgi_get
+
+
+def requests_seen(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    value = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels)
+    return value or 0.0
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(create_metrics_router())
+
+    @app.get("/metrics-test/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_latency_is_labelled_by_route_template() -> None:
+    app = make_app()
+    route = "/metrics-test/{item_id}"
+    before = requests_seen(route, "200")
+
+    await asgi_get(app, "/metrics-test/1")
+    await asgi_get(app, "/metrics-test/2")
+
+    assert requests_seen(route, "200") == before + 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_paths_share_one_series() -> None:
+    before = requests_seen("unmatched", "404")
+
+    await asgi_get(make_app(), "/no-such-path")
+
+    assert requests_seen("unmatched", "404") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_is_not_measured() -> None:
+    response = await asgi_get(make_app(), "/metrics")
+
+    assert response.status == 200
+    assert b"http_requests_in_flight" in response.body
+    assert requests_seen("/metrics", "200") == 0
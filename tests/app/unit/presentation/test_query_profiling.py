@@ -0,0 +1,76 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import Engine, create_engine, text
+
+from app.infrastructure.persistence_sqla.query_profiler import (
+    QueryBudget,
+    QueryBudgetExceededError,
+    QueryBudgets,
+    QueryStats,
+    install_query_profiler,
+)
+from app.presentation.http.query_profiling import QueryProfilingMiddleware
+from tests.app.unit.presentation.asgi import asgi_get
+
+BUDGETS = QueryBudgets(
+    default=QueryBudget(max_statements=10, max_repeats=5),
+    endpoints={"GET /items/{item_id}": 2},
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    install_query_profiler(engine, QueryStats(max_shapes=10))
+    yield engine
+    engine.dispose()
+
+
+def make_app(engine: Engine, **options: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        with engine.connect() as connection:
+            for _ in range(item_id):
+                connection.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    app.add_middleware(QueryProfilingMiddleware, budgets=BUDGETS, **options)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_the_statements(engine: Engine) -> None:
+    headers = (await asgi_get(make_app(engine, server_timing=True), "/items/2")).headers
+
+    assert headers["server-timing"].startswith("db;dur=")
+    assert headers["server-timing"].endswith('desc="2 queries, 1 distinct"')
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_off_by_default(engine: Engine) -> None:
+    headers = (await asgi_get(make_app(engine), "/items/2")).headers
+
+    assert "server-timing" not in headers
+
+
+@pytest.mark.asyncio
+async def test_enforced_budget_is_looked_up_by_route(engine: Engine) -> None:
+    app = make_app(engine, enforce_budgets=True)
+
+    await asgi_get(app, "/items/2")
+    with pytest.raises(QueryBudgetExceededError, match="GET /items/{item_id}"):
+        await asgi_get(app, "/items/3")
+
+
+@pytest.mark.asyncio
+async def test_unenforced_budget_is_only_logged(
+    engine: Engine,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    await asgi_get(make_app(engine), "/items/3")
+
+    assert "Query budget exceeded in GET /items/{item_id}" in caplog.text
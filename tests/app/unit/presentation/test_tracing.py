@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+
+from app.infrastructure.tracing.exporters import InMemorySpanExporter
+from app.infrastructure.tracing.tracer import (
+    TRACEPARENT_HEADER,
+    SpanKind,
+    Tracer,
+    set_tracer,
+)
+from app.presentation.http.tracing import TracingMiddleware
+from tests.app.unit.presentation.asgi import asgi_get
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    previous = set_tracer(Tracer(exporter, sample_ratio=1.0))
+    yield exporter
+    set_tracer(previous)
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/tracing-test/{item_id}")
+    async def read_item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    app.add_middleware(TracingMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_span_is_named_after_the_route(
+    exporter: InMemorySpanExporter,
+) -> None:
+    await asgi_get(make_app(), "/tracing-test/1")
+
+    [span] = exporter.spans
+    assert span.name == "GET /tracing-test/{item_id}"
+    assert span.kind == SpanKind.SERVER
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.parent_id is None
+
+
+@pytest.mark.asyncio
+async def test_request_continues_the_callers_trace(
+    exporter: InMemorySpanExporter,
+) -> None:
+    traceparent = f"00-{'a' * 32}-{'b' * 16}-01"
+
+    await asgi_get(
+        make_app(),
+        "/tracing-test/1",
+        headers={TRACEPARENT_HEADER: traceparent},
+    )
+
+    [span] = exporter.spans
+    assert span.context.trace_id == "a" * 32
+    assert span.parent_id == "b" * 16
+
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_keep_the_raw_path(
+    exporter: InMemorySpanExporter,
+) -> None:
+    await asgi_get(make_app(), "/no-such-path")
+
+    [span] = exporter.spans
+    assert span.name == "GET /no-such-path"
+    assert span.attributes["http.response.status_code"] == 404
@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.setup import app_factory
+from app.setup.app_factory import prepare_database_schema
+from app.setup.config.database import SchemaStartupMode
+
+
+@pytest.mark.asyncio
+async def test_failed_create_all_stops_the_boot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fail(_engine: AsyncEngine) -> None:
+        raise ConnectionRefusedError("database is down")
+
+    monkeypatch.setattr(app_factory, "init_database", fail)
+
+    with pytest.raises(ConnectionRefusedError):
+        await prepare_database_schema(
+            None,  # type: ignore[arg-type]
+            SchemaStartupMode.CREATE_ALL,
+        )
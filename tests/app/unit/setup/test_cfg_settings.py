@@ -0,0 +1,90 @@
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from app.setup.config.loader import DirContents, ValidEnvs
+from app.setup.config.settings import SettingsSnapshot
+
+
+def write_config(dir_path: Path, *, log_level: str) -> None:
+    config_text = textwrap.dedent(f"""\
+        [postgres]
+        USER = "user"
+        PASSWORD = "password"
+        DB = "db"
+        HOST = "localhost"
+        PORT = 5432
+        DRIVER = "psycopg"
+
+        [sqla]
+        ECHO = false
+        ECHO_POOL = false
+        POOL_SIZE = 5
+        MAX_OVERFLOW = 5
+
+        [security.auth]
+        JWT_SECRET = "secret"
+        JWT_ALGORITHM = "HS256"
+        SESSION_TTL_MIN = 5
+        SESSION_REFRESH_THRESHOLD = 0.2
+
+        [security.cookies]
+        SECURE = false
+
+        [security.password]
+        PEPPER = "pepper"
+
+        [logs]
+        LEVEL = "{log_level}"
+    """)
+    (dir_path / DirContents.CONFIG_NAME).write_text(config_text, encoding="utf-8")
+
+
+def bump_mtime(file_path: Path) -> None:
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def create_snapshot(dir_path: Path) -> SettingsSnapshot:
+    return SettingsSnapshot(env=ValidEnvs.DEV, dir_paths={ValidEnvs.DEV: dir_path})
+
+
+def test_snapshot_is_immutable(tmp_path: Path) -> None:
+    write_config(tmp_path, log_level="INFO")
+    sut = create_snapshot(tmp_path)
+
+    with pytest.raises(ValidationError):
+        sut.current.logs.level = "DEBUG"  # type: ignore[assignment]
+
+
+def test_snapshot_is_not_reloaded_when_files_unchanged(tmp_path: Path) -> None:
+    write_config(tmp_path, log_level="INFO")
+    sut = create_snapshot(tmp_path)
+    before = sut.current
+
+    assert not sut.reload_if_modified()
+    assert sut.current is before
+
+
+def test_snapshot_is_reloaded_when_file_modified(tmp_path: Path) -> None:
+    write_config(tmp_path, log_level="INFO")
+    sut = create_snapshot(tmp_path)
+
+    write_config(tmp_path, log_level="DEBUG")
+    bump_mtime(tmp_path / DirContents.CONFIG_NAME)
+
+    assert sut.reload_if_modified()
+    assert sut.current.logs.level == "DEBUG"
+
+
+def test_snapshot_reload_rereads_files(tmp_path: Path) -> None:
+    write_config(tmp_path, log_level="INFO")
+    sut = create_snapshot(tmp_path)
+
+    write_config(tmp_path, log_level="ERROR")
+    sut.reload()
+
+    assert sut.current.logs.level == "ERROR"